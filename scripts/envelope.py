@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Compute and plot the engagement envelope (Pk footprint) of a scenario."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import matplotlib
+
+from interceptor_sim.batch.envelope import compute_envelope
+from interceptor_sim.core.scenario import load_scenario
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("scenario", type=str, help="Path to scenario YAML file")
+    parser.add_argument("--max-range", type=float, default=8000.0, help="Outer range (m)")
+    parser.add_argument("--min-range", type=float, default=250.0, help="Inner range (m)")
+    parser.add_argument("--n-range", type=int, default=9, help="Coarse range nodes")
+    parser.add_argument("--n-bearing", type=int, default=16, help="Coarse bearing intervals")
+    parser.add_argument(
+        "--heading", type=float, action="append", default=None,
+        help="Target heading offset from inbound in degrees (repeatable; default 0)",
+    )
+    parser.add_argument("--seeds", type=int, default=8, help="Engagements per node")
+    parser.add_argument("--levels", type=int, default=2, help="Boundary refinement levels")
+    parser.add_argument("--threshold", type=float, default=0.5, help="Boundary Pk")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--save", type=str, default=None, help="Plot file prefix")
+    parser.add_argument("--no-plot", action="store_true", help="Skip plotting")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    envelope = compute_envelope(
+        load_scenario(args.scenario),
+        max_range=args.max_range,
+        min_range=args.min_range,
+        n_range=args.n_range,
+        n_bearing=args.n_bearing,
+        heading_offsets_deg=tuple(args.heading or [0.0]),
+        seeds_per_cell=args.seeds,
+        refine_levels=args.levels,
+        threshold=args.threshold,
+        seed=args.seed,
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"{envelope.n_engagements} engagements in {elapsed:.1f} s; "
+        f"{int(envelope.simulated.sum())}/{envelope.simulated.size} nodes simulated"
+    )
+
+    if args.no_plot:
+        return
+    if args.save:
+        matplotlib.use("Agg")
+    from interceptor_sim.visualization.post_analysis import plot_envelope
+
+    for k, offset in enumerate(args.heading or [0.0]):
+        save = f"{args.save}_hdg{offset:+.0f}.png" if args.save else None
+        plot_envelope(envelope, heading_index=k, save_path=save)
+
+
+if __name__ == "__main__":
+    main()
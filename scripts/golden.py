@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Check (or regenerate) the golden-trajectory regression fixtures."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from interceptor_sim.testing.golden import check_golden, record_golden
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scenario", default=ROOT / "scenarios" / "example_intercept.yaml",
+        help="Base scenario for the golden matrix",
+    )
+    parser.add_argument(
+        "--fixtures", default=ROOT / "tests" / "golden", help="Fixture directory"
+    )
+    parser.add_argument(
+        "--update", action="store_true",
+        help="Re-record fixtures (only after an intentional behavior change)",
+    )
+    parser.add_argument(
+        "--kernel", action="store_true", help="Check using the compiled kernel path"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.update:
+        for path in record_golden(args.fixtures, args.scenario):
+            print(f"wrote {path}")
+        return 0
+
+    divergences = check_golden(args.fixtures, args.scenario, use_kernel=args.kernel)
+    elapsed = time.perf_counter() - start
+    for div in divergences:
+        print(div)
+    status = "FAIL" if divergences else "OK"
+    print(f"{status}: {len(divergences)} divergent run(s) in {elapsed:.2f} s")
+    return 1 if divergences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Generate a fuzzed scenario corpus and report engine throughput / tail latency."""
+
+from __future__ import annotations
+
+import argparse
+
+from interceptor_sim.testing.load_test import run_load_test
+from interceptor_sim.testing.scenario_gen import FAMILIES, generate_corpus, write_corpus
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--family", action="append", choices=sorted(FAMILIES),
+        help="Scenario family to include (repeatable; default: all)",
+    )
+    parser.add_argument("--count", type=int, default=20, help="Scenarios per family")
+    parser.add_argument("--seeds", type=int, default=1, help="Seeds per scenario")
+    parser.add_argument("--corpus-seed", type=int, default=0, help="Generator seed")
+    parser.add_argument("--max-time", type=float, default=None, help="Override max_time")
+    parser.add_argument("--kernel", action="store_true", help="Use the compiled kernel")
+    parser.add_argument(
+        "--write", type=str, default=None, help="Also write the corpus as YAML to this dir"
+    )
+    args = parser.parse_args(argv)
+
+    overrides = {} if args.max_time is None else {"max_time": args.max_time}
+    corpus = list(generate_corpus(args.count, args.corpus_seed, args.family, **overrides))
+    if args.write:
+        paths = write_corpus(args.write, corpus)
+        print(f"Wrote {len(paths)} scenarios to {args.write}")
+
+    report = run_load_test(corpus, seeds=range(args.seeds), use_kernel=args.kernel)
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
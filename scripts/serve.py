@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Run the real-time simulation service on a Unix socket and/or WebSocket port."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from interceptor_sim.core.scenario import load_scenario
+from interceptor_sim.service.server import SimulationService
+
+
+async def serve(args: argparse.Namespace) -> None:
+    service = SimulationService()
+    if args.unix:
+        await service.serve_unix(args.unix)
+        print(f"Listening on unix:{args.unix}")
+    if args.port is not None:
+        await service.serve_websocket(args.host, args.port)
+        print(f"Listening on ws://{args.host}:{args.port}")
+    for path in args.scenario or []:
+        session = service.create_session(load_scenario(path), speed=args.speed)
+        print(f"Session {session.id}: {path}")
+
+    try:
+        while True:
+            await asyncio.sleep(args.report)
+            for s in service.status():
+                m = s["metrics"]
+                print(
+                    f"[{s['session']}] t={s['time']:7.1f}s {s['phase']:<9} "
+                    f"late={m['late_ticks']}/{m['ticks']} jitter={m['jitter_ms']:.2f}ms "
+                    f"max={m['max_lateness_ms']:.1f}ms cpu={100 * m['cpu_fraction']:.1f}%"
+                )
+    finally:
+        await service.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--unix", type=str, default=None, help="Unix socket path")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="WebSocket host")
+    parser.add_argument("--port", type=int, default=None, help="WebSocket port")
+    parser.add_argument(
+        "--scenario", action="append", help="Start a session for this scenario (repeatable)"
+    )
+    parser.add_argument("--speed", type=float, default=1.0, help="Real-time multiple")
+    parser.add_argument("--report", type=float, default=5.0, help="Metrics interval (s)")
+    args = parser.parse_args(argv)
+    if not args.unix and args.port is None:
+        parser.error("give --unix and/or --port")
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
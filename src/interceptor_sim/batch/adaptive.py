@@ -0,0 +1,342 @@
+"""Adaptive Monte Carlo campaigns that stop once the estimates are precise enough.
+
+Instead of fixing the number of seeds up front, :func:`run_adaptive` runs
+trials in rounds. After every round it updates, per sweep cell, a binomial
+confidence interval on Pk (Wilson score or exact Clopper–Pearson) and
+percentile-bootstrap intervals on the requested miss-distance percentiles,
+and retires cells whose intervals are narrow enough, or, with a decision
+``threshold``, whose Pk interval already lies on one side of it.
+
+Both binomial intervals stay honest near 0 and 1 (unlike the normal
+approximation), so a cell that hits every time or never is retired after
+its first batch. The next round's trials are split among the remaining
+cells in proportion to the trials each still needs (``z² p(1-p) / h²``
+for a half-width ``h``, or the distance to the threshold in place of
+``h``), which concentrates the budget on cells with Pk near 0.5 or near
+the threshold.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from interceptor_sim.batch.engine import BatchEngine, BatchResult
+from interceptor_sim.batch.qmc import normal_ppf
+from interceptor_sim.core.kernel import supports_engine
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario
+
+# Bisection steps for the Clopper–Pearson bounds (interval error ~2**-60)
+_BISECTION_STEPS = 60
+
+
+def _z(confidence: float) -> float:
+    return float(normal_ppf(np.array([0.5 + confidence / 2.0]))[0])
+
+
+def wilson_interval(hits: int, n: int, confidence: float = 0.95) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion; ``(0, 1)`` when *n* is 0."""
+    if n == 0:
+        return 0.0, 1.0
+    z = _z(confidence)
+    p = hits / n
+    denom = 1.0 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1.0 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def _log_binomial_pmf(n: int, p: float) -> np.ndarray:
+    j = np.arange(1, n + 1)
+    log_choose = np.concatenate([[0.0], np.cumsum(np.log((n - j + 1) / j))])
+    k = np.arange(n + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_pmf = log_choose + k * math.log(p) + (n - k) * math.log1p(-p)
+    return log_pmf
+
+
+def _binomial_cdf(k: int, n: int, p: float) -> float:
+    """P(X <= k) for X ~ Binomial(n, p), 0 < p < 1."""
+    log_pmf = _log_binomial_pmf(n, p)[: k + 1]
+    peak = log_pmf.max()
+    return min(1.0, math.exp(peak) * float(np.exp(log_pmf - peak).sum()))
+
+
+def clopper_pearson_interval(hits: int, n: int, confidence: float = 0.95) -> tuple[float, float]:
+    """Exact (Clopper–Pearson) binomial interval; ``(0, 1)`` when *n* is 0."""
+    if n == 0:
+        return 0.0, 1.0
+    alpha = 1.0 - confidence
+
+    def solve(decreasing_tail, target: float) -> float:
+        lo, hi = 0.0, 1.0
+        for _ in range(_BISECTION_STEPS):
+            mid = 0.5 * (lo + hi)
+            if decreasing_tail(mid) > target:
+                lo = mid
+            else:
+                hi = mid
+        return 0.5 * (lo + hi)
+
+    # P(X >= hits | p_low) = alpha/2 and P(X <= hits | p_high) = alpha/2
+    low = 0.0 if hits == 0 else solve(lambda p: _binomial_cdf(hits - 1, n, p), 1.0 - alpha / 2)
+    high = 1.0 if hits == n else solve(lambda p: _binomial_cdf(hits, n, p), alpha / 2)
+    return low, high
+
+
+BINOMIAL_INTERVALS = {"wilson": wilson_interval, "clopper_pearson": clopper_pearson_interval}
+
+
+def bootstrap_percentile_interval(
+    values: np.ndarray,
+    percentile: float,
+    confidence: float = 0.95,
+    n_resamples: int = 1000,
+    rng: np.random.Generator | None = None,
+) -> tuple[float, float]:
+    """Percentile-bootstrap interval for a percentile of *values* (NaN if empty)."""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return float("nan"), float("nan")
+    rng = rng or np.random.default_rng()
+    resamples = values[rng.integers(0, len(values), size=(n_resamples, len(values)))]
+    estimates = np.percentile(resamples, percentile, axis=1)
+    tail = 50.0 * (1.0 - confidence)
+    low, high = np.percentile(estimates, [tail, 100.0 - tail])
+    return float(low), float(high)
+
+
+@dataclass
+class CellEstimate:
+    """Accumulated trials and intervals of one campaign cell.
+
+    Attributes:
+        overrides: The cell's scenario overrides.
+        outcomes: Every trial run for the cell so far.
+        pk_interval: Confidence interval on Pk.
+        miss_intervals: Miss-distance percentile → bootstrap interval (m),
+            over engagements that launched.
+        status: ``"running"``, ``"precise"`` (intervals narrow enough),
+            ``"decided"`` (Pk interval excludes the threshold) or
+            ``"budget"`` (``max_trials`` reached first).
+    """
+
+    overrides: dict[str, Any]
+    outcomes: BatchResult | None = None
+    pk_interval: tuple[float, float] = (0.0, 1.0)
+    miss_intervals: dict[float, tuple[float, float]] = field(default_factory=dict)
+    status: str = "running"
+
+    @property
+    def n(self) -> int:
+        return 0 if self.outcomes is None else len(self.outcomes)
+
+    @property
+    def hits(self) -> int:
+        return 0 if self.outcomes is None else int(self.outcomes.hit.sum())
+
+    @property
+    def pk(self) -> float:
+        return self.hits / self.n if self.n else float("nan")
+
+    @property
+    def active(self) -> bool:
+        return self.status == "running"
+
+
+@dataclass
+class AdaptiveResult:
+    """Outcome of an adaptive campaign.
+
+    Attributes:
+        cells: Per-cell estimates, in the order the cells were given.
+        rounds: Rounds run.
+        trials_per_round: Trials run in each round.
+    """
+
+    cells: list[CellEstimate]
+    rounds: int
+    trials_per_round: list[int]
+
+    @property
+    def total_trials(self) -> int:
+        return sum(cell.n for cell in self.cells)
+
+    def pk(self) -> np.ndarray:
+        return np.array([cell.pk for cell in self.cells])
+
+
+def _run_trials(scenarios: list[dict], rng: np.random.Generator, use_batch: bool) -> BatchResult:
+    if use_batch:
+        return BatchEngine.from_scenarios(scenarios, seed=rng).run()
+    seeds = rng.integers(2**63, size=len(scenarios))
+    engines = []
+    for i, sc in enumerate(scenarios):
+        engine, _ = build_from_scenario(sc, seed=int(seeds[i]), trial=i)
+        engine.run()
+        engines.append(engine)
+    return BatchResult.from_runs(engines)
+
+
+def run_adaptive(
+    scenario: dict,
+    cells: Sequence[dict[str, Any]] | None = None,
+    pk_half_width: float = 0.05,
+    miss_percentiles: Sequence[float] = (),
+    miss_half_width: float | None = None,
+    threshold: float | None = None,
+    confidence: float = 0.95,
+    interval: str = "wilson",
+    batch_size: int = 64,
+    max_trials: int = 4096,
+    n_resamples: int = 1000,
+    seed: int | None = None,
+    use_batch: bool | None = None,
+) -> AdaptiveResult:
+    """Run trials in rounds until every cell's estimates reach the requested precision.
+
+    Args:
+        scenario: Base scenario dictionary.
+        cells: Per-cell overrides by dotted scenario key; one cell with the
+            base scenario when None.
+        pk_half_width: Target half-width of the Pk interval.
+        miss_percentiles: Miss-distance percentiles (0–100) to estimate.
+        miss_half_width: Target half-width (m) of their bootstrap intervals;
+            None tracks them without stopping on them.
+        threshold: Decision Pk; a cell also stops once its interval lies
+            entirely above or below it.
+        confidence: Confidence level of every interval.
+        interval: ``"wilson"`` or ``"clopper_pearson"``.
+        batch_size: First-round trials per cell, and the average per active
+            cell in later rounds.
+        max_trials: Trial budget per cell.
+        n_resamples: Bootstrap resamples.
+        seed: Seed for trials and bootstrap resampling.
+        use_batch: Run on :class:`BatchEngine`; by default whenever it
+            supports the scenario.
+
+    Returns:
+        Per-cell trials, intervals and stopping reasons.
+    """
+    if interval not in BINOMIAL_INTERVALS:
+        raise ValueError(f"unknown interval {interval!r}; use one of {sorted(BINOMIAL_INTERVALS)}")
+    binomial_interval = BINOMIAL_INTERVALS[interval]
+    cells = [dict(cell) for cell in cells] if cells is not None else [{}]
+    scenarios = [apply_overrides(scenario, cell) for cell in cells]
+    if use_batch is None:
+        use_batch = all(
+            supports_engine(build_from_scenario(sc)[0], allow_streams=True) for sc in scenarios
+        )
+    rng = np.random.default_rng(seed)
+    z = _z(confidence)
+    estimates = [CellEstimate(cell) for cell in cells]
+    allocation = {c: min(batch_size, max_trials) for c in range(len(cells))}
+    trials_per_round = []
+
+    while allocation:
+        order = sorted(allocation)
+        batch = [scenarios[c] for c in order for _ in range(allocation[c])]
+        outcomes = _run_trials(batch, rng, use_batch)
+        trials_per_round.append(len(batch))
+
+        start = 0
+        needs = {}
+        for c in order:
+            cell = estimates[c]
+            new = outcomes.take(np.arange(start, start + allocation[c]))
+            start += allocation[c]
+            if cell.outcomes is not None:
+                new = BatchResult.concatenate([cell.outcomes, new])
+            cell.outcomes = new
+            needs[c] = _update(
+                cell,
+                binomial_interval,
+                z,
+                confidence,
+                pk_half_width,
+                miss_percentiles,
+                miss_half_width,
+                threshold,
+                n_resamples,
+                rng,
+            )
+            if cell.active and cell.n >= max_trials:
+                cell.status = "budget"
+
+        active = [c for c in order if estimates[c].active]
+        allocation = _allocate(
+            {c: needs[c] for c in active},
+            {c: max_trials - estimates[c].n for c in active},
+            batch_size * len(active),
+            max(1, batch_size // 8),
+        )
+
+    return AdaptiveResult(estimates, len(trials_per_round), trials_per_round)
+
+
+def _update(
+    cell: CellEstimate,
+    binomial_interval,
+    z: float,
+    confidence: float,
+    pk_half_width: float,
+    miss_percentiles: Sequence[float],
+    miss_half_width: float | None,
+    threshold: float | None,
+    n_resamples: int,
+    rng: np.random.Generator,
+) -> float:
+    """Refresh *cell*'s intervals and status; return its estimated remaining trials."""
+    n, hits = cell.n, cell.hits
+    low, high = cell.pk_interval = binomial_interval(hits, n, confidence)
+    miss = cell.outcomes.miss_distance
+    launched = miss[~np.isnan(miss)]
+    cell.miss_intervals = {
+        q: bootstrap_percentile_interval(launched, q, confidence, n_resamples, rng)
+        for q in miss_percentiles
+    }
+
+    # Trials for the Pk interval to reach the target width (or clear the threshold)
+    p = (hits + 0.5) / (n + 1.0)
+    target = pk_half_width
+    if threshold is not None:
+        target = max(target, abs(p - threshold))
+    need = z * z * p * (1.0 - p) / (target * target) - n
+
+    pk_done = (high - low) / 2.0 <= pk_half_width
+    decided = threshold is not None and (low > threshold or high < threshold)
+    miss_done = True
+    # A cell that has never launched has no miss distances to wait for once its
+    # Pk is settled; more trials would only run it into max_trials
+    if miss_half_width is not None and (len(launched) or not (pk_done or decided)):
+        for q_low, q_high in cell.miss_intervals.values():
+            half = (q_high - q_low) / 2.0
+            if not half <= miss_half_width:  # NaN (nothing launched yet) counts as wide
+                miss_done = False
+                ratio = half / miss_half_width if np.isfinite(half) else 2.0
+                need = max(need, n * (ratio * ratio - 1.0))
+    if decided and miss_done:
+        cell.status = "decided"
+    elif pk_done and miss_done:
+        cell.status = "precise"
+    return max(need, 1.0)
+
+
+def _allocate(
+    needs: dict[int, float], room: dict[int, int], budget: int, min_trials: int
+) -> dict[int, int]:
+    """Split *budget* trials across cells in proportion to *needs*.
+
+    Each cell gets at most its need (but at least *min_trials*, to keep
+    rounds efficient) and never more than its remaining *room*.
+    """
+    total = sum(needs.values())
+    allocation = {}
+    for c, need in needs.items():
+        share = min(math.ceil(budget * need / total), math.ceil(need))
+        allocation[c] = int(max(1, min(max(share, min_trials), room[c])))
+    return allocation
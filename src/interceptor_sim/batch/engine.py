@@ -0,0 +1,629 @@
+"""Vectorized, history-free batch engine for many independent engagements.
+
+Every lane is one engagement. Lanes are packed with the same state layout
+as the array kernel (:mod:`interceptor_sim.core.kernel`), transposed so that
+each state field is one contiguous array over lanes, and stepped in
+lockstep with NumPy. Lanes may differ in every parameter, including ``dt``
+and ``max_time``; finished lanes are compacted out so cost tracks the live
+lane count. Only outcomes are kept: result, miss distance, phase entry
+times and run length.
+
+With ``precision="float32"`` lane state, parameters and target paths are
+stored as float32 (integer state as int32), which roughly halves memory
+and bandwidth per lane. Quantities that accumulate over thousands of ticks
+(simulation time, flight time, arc length along the target path) and the
+limits they are compared against (``dt``, ``max_time``,
+``max_flight_time``) stay float64 in separate ``clock`` / ``limits`` rows
+in both modes, so tick counts and timeouts do not drift.
+
+The per-lane logic matches the scalar engine, but random draws come from
+one shared generator in lane order, so individual lanes do not reproduce
+scalar runs with the same seed draw for draw. Lanes built from engines with
+counter-based streams (``simulation.counter_rng``) draw from their own
+streams instead (:mod:`interceptor_sim.core.streams`) and see exactly the
+noise of the scalar run.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from interceptor_sim.core import kernel as K
+from interceptor_sim.core.engine import SimulationEngine
+from interceptor_sim.core.scenario import build_from_scenario
+from interceptor_sim.core.streams import (
+    Quantity,
+    stream_words,
+    tick_index,
+    words_to_normal,
+    words_to_uniform,
+)
+from interceptor_sim.engagement.kill_chain import EngagementResult, Phase
+from interceptor_sim.engagement.reachability import (
+    CHECK_INTERVAL,
+    intercept_reachable,
+    remaining_moves,
+)
+from interceptor_sim.models.interceptor import InterceptorState
+
+N_PHASES = len(Phase)
+
+# Counter-stream quantity drawn in each phase (by phase code); -1 = no draws
+_PHASE_QUANTITY = np.full(N_PHASES + 1, -1, dtype=np.int64)
+_PHASE_QUANTITY[[K.SEARCH, K.TRACK]] = Quantity.DETECTION
+_PHASE_QUANTITY[K.CLASSIFY] = Quantity.CLASSIFICATION
+_PHASE_QUANTITY[K.MIDCOURSE] = Quantity.MEASUREMENT
+
+
+def phase_times_from_log(
+    phase_log: list[tuple[float, Phase]], out: np.ndarray | None = None
+) -> np.ndarray:
+    """First entry time of each phase from ``EngagementManager.phase_log``.
+
+    Indexed by ``phase.value - 1`` like :attr:`BatchResult.phase_times`.
+    """
+    times = np.empty(N_PHASES) if out is None else out
+    times[:] = np.nan
+    times[Phase.SEARCH.value - 1] = 0.0
+    for t, phase in phase_log:
+        if np.isnan(times[phase.value - 1]):
+            times[phase.value - 1] = t
+    return times
+
+
+def history_miss_distance(history_arrays: dict[str, np.ndarray]) -> float:
+    """Closest approach after launch in ``SimHistory.as_arrays()``; NaN if never launched."""
+    h = history_arrays
+    sep = h["target_pos"] - h["interceptor_pos"]
+    launched = h["phase"] >= Phase.MIDCOURSE.value
+    if not launched.any():
+        return float("nan")
+    return float(np.hypot(sep[launched, 0], sep[launched, 1]).min())
+
+
+@dataclass
+class BatchResult:
+    """Per-lane outcomes of a batch run.
+
+    Attributes:
+        result: ``EngagementResult`` codes (int8).
+        miss_distance: Closest target–interceptor approach after launch (m);
+            NaN if the interceptor never launched.
+        end_time: Simulation time at which the lane finished (s).
+        ticks: Number of timesteps simulated.
+        phase_times: ``(N, len(Phase))`` entry time of each phase, indexed by
+            ``phase.value - 1``; NaN if never entered (SEARCH is 0).
+    """
+
+    result: np.ndarray
+    miss_distance: np.ndarray
+    end_time: np.ndarray
+    ticks: np.ndarray
+    phase_times: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.result)
+
+    @property
+    def hit(self) -> np.ndarray:
+        return self.result == EngagementResult.HIT.value
+
+    def pk(self) -> float:
+        """Fraction of lanes that ended in a hit."""
+        return float(self.hit.mean()) if len(self) else float("nan")
+
+    def phase_time(self, phase: Phase) -> np.ndarray:
+        return self.phase_times[:, phase.value - 1]
+
+    def take(self, index: np.ndarray) -> BatchResult:
+        """Subset of lanes."""
+        return BatchResult(
+            result=self.result[index],
+            miss_distance=self.miss_distance[index],
+            end_time=self.end_time[index],
+            ticks=self.ticks[index],
+            phase_times=self.phase_times[index],
+        )
+
+    @classmethod
+    def from_runs(cls, engines: Sequence[SimulationEngine]) -> BatchResult:
+        """Outcomes of finished scalar engines (from their histories and phase logs)."""
+        arrays = [engine.history.as_arrays() for engine in engines]
+        return cls(
+            result=np.array([e.engagement.result.value for e in engines], dtype=np.int8),
+            miss_distance=np.array([history_miss_distance(a) for a in arrays]),
+            end_time=np.array([a["time"][-1] for a in arrays], dtype=np.float64),
+            ticks=np.array([len(a["time"]) - 1 for a in arrays], dtype=np.int64),
+            phase_times=np.array(
+                [phase_times_from_log(e.engagement.phase_log) for e in engines]
+            ).reshape(len(engines), N_PHASES),
+        )
+
+    @classmethod
+    def concatenate(cls, results: list[BatchResult]) -> BatchResult:
+        return cls(
+            result=np.concatenate([r.result for r in results]),
+            miss_distance=np.concatenate([r.miss_distance for r in results]),
+            end_time=np.concatenate([r.end_time for r in results]),
+            ticks=np.concatenate([r.ticks for r in results]),
+            phase_times=np.concatenate([r.phase_times for r in results]),
+        )
+
+
+# Storage precisions for lane state
+PRECISIONS = ("float64", "float32")
+
+# Float64 accumulators ("clock" rows) and the parameters compared against them ("limits" rows)
+_CLOCK_FIELDS = [K.F_TIME, K.F_FLIGHT_TIME, K.F_TGT_PATH_S]
+C_TIME, C_FLIGHT_TIME, C_PATH_S = range(3)
+_LIMIT_PARAMS = [K.P_DT, K.P_MAX_TIME, K.P_MAX_FLIGHT_TIME]
+L_DT, L_MAX_TIME, L_MAX_FLIGHT_TIME = range(3)
+
+
+def _wrap(angle: np.ndarray) -> np.ndarray:
+    return (angle + np.pi) % (2 * np.pi) - np.pi
+
+
+class BatchEngine:
+    """Lockstep NumPy simulation of many engagements without histories."""
+
+    def __init__(
+        self,
+        params: np.ndarray,
+        paths: np.ndarray,
+        fstate: np.ndarray,
+        istate: np.ndarray,
+        rng: np.random.Generator | None = None,
+        stream_keys: np.ndarray | None = None,
+        precision: str = "float64",
+        stream_sensors: np.ndarray | None = None,
+    ) -> None:
+        """
+        Args:
+            params: ``(N_PARAMS, N)`` kernel parameters, one column per lane.
+            paths: ``(N, L, 6)`` target path tables, padded by repeating the
+                final (exit) row.
+            fstate: ``(N_FSTATE, N)`` kernel float state.
+            istate: ``(N_ISTATE, N)`` kernel integer state.
+            rng: Generator for all lanes' random draws.
+            stream_keys: ``(N, 2)`` counter-based stream keys
+                (:attr:`RandomStreams.key`); when given, lanes draw from their
+                streams and *rng* is unused.
+            precision: ``"float64"`` or ``"float32"`` lane state.
+            stream_sensors: ``(N,)`` sensor id of each lane's radar in its
+                stream counters (``Sensor.sensor_id``); 0 when omitted.
+        """
+        if precision not in PRECISIONS:
+            raise ValueError(f"precision must be one of {PRECISIONS}")
+        self.precision = precision
+        dtype = np.dtype(precision)
+        self.limits = params[_LIMIT_PARAMS].astype(np.float64)
+        self.clock = fstate[_CLOCK_FIELDS].astype(np.float64)
+        self.params = params.astype(dtype, copy=False)
+        self.paths = paths.astype(dtype, copy=False)
+        self.fstate = fstate.astype(dtype, copy=False)
+        self.istate = istate.astype(np.int32, copy=False) if precision == "float32" else istate
+        self.rng = rng or np.random.default_rng()
+        self.stream_keys = stream_keys
+        self.n_lanes = params.shape[1]
+        if stream_sensors is None:
+            stream_sensors = np.zeros(self.n_lanes, dtype=np.uint64)
+        self.stream_sensors = np.asarray(stream_sensors, dtype=np.uint64)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the lane state, parameters and paths."""
+        arrays = (self.params, self.limits, self.fstate, self.clock, self.istate, self.paths)
+        return sum(a.nbytes for a in arrays)
+
+    @classmethod
+    def from_engines(
+        cls,
+        engines: list[SimulationEngine],
+        rng: np.random.Generator | None = None,
+        precision: str = "float64",
+    ) -> BatchEngine:
+        """Pack scalar engines (in their current state) into lanes."""
+        packed = []
+        streams = [engine.engagement.streams for engine in engines]
+        counter_rng = any(s is not None for s in streams)
+        if counter_rng and any(s is None for s in streams):
+            raise ValueError("either every engine or none must use counter-based streams")
+        for engine in engines:
+            if not K.supports_engine(engine, allow_streams=True):
+                raise ValueError(
+                    "BatchEngine supports only 'command' midcourse guidance, a single "
+                    "surveillance sensor and built-in terminal guidance laws"
+                )
+            packed.append(K.pack_engine(engine))
+        n_rows = max(path.shape[0] for _, path, _, _ in packed)
+        paths = np.empty((len(packed), n_rows, 6), dtype=np.float64)
+        for i, (_, path, _, _) in enumerate(packed):
+            paths[i, : path.shape[0]] = path
+            paths[i, path.shape[0]:] = path[-1]
+        return cls(
+            params=np.stack([p for p, _, _, _ in packed], axis=1),
+            paths=paths,
+            fstate=np.stack([fs for _, _, fs, _ in packed], axis=1),
+            istate=np.stack([ist for _, _, _, ist in packed], axis=1),
+            rng=rng,
+            stream_keys=np.stack([s.key for s in streams]) if counter_rng else None,
+            precision=precision,
+            stream_sensors=np.array(
+                [engine.engagement.surveillance_sensor.sensor_id or 0 for engine in engines],
+                dtype=np.uint64,
+            ),
+        )
+
+    @classmethod
+    def from_scenarios(
+        cls,
+        scenarios: list[dict],
+        seed: int | np.random.Generator | None = None,
+        precision: str = "float64",
+    ) -> BatchEngine:
+        """One lane per scenario dictionary; *seed* seeds (or is) the shared generator.
+
+        Lanes of ``simulation.counter_rng`` scenarios use streams keyed by
+        *seed* (an integer; drawn from the generator otherwise) and their
+        lane index as trial id, like ``build_from_scenario(sc, seed, trial=i)``.
+        """
+        rng = np.random.default_rng(seed)
+        stream_seed = int(seed) if isinstance(seed, (int, np.integer)) else None
+        if stream_seed is None and any(
+            sc.get("simulation", {}).get("counter_rng", False) for sc in scenarios
+        ):
+            stream_seed = int(rng.integers(2**63))
+        engines = [
+            build_from_scenario(sc, seed=stream_seed, trial=i)[0]
+            for i, sc in enumerate(scenarios)
+        ]
+        return cls.from_engines(engines, rng=rng, precision=precision)
+
+    def run(self) -> BatchResult:
+        """Run all lanes to completion and return their outcomes."""
+        n_total = self.n_lanes
+        out_result = np.zeros(n_total, dtype=np.int8)
+        out_miss = np.full(n_total, np.nan)
+        out_end = np.zeros(n_total)
+        out_ticks = np.zeros(n_total, dtype=np.int64)
+        out_phase = np.full((n_total, N_PHASES), np.nan)
+        out_phase[:, Phase.SEARCH.value - 1] = 0.0
+
+        p, limits = self.params.copy(), self.limits.copy()
+        fs, clock = self.fstate.copy(), self.clock.copy()
+        ist = self.istate.copy()
+        paths = self.paths
+        lane = np.arange(n_total)
+        keys, sensors = self.stream_keys, self.stream_sensors
+        miss = np.full(n_total, np.inf, dtype=fs.dtype)
+        ticks = np.zeros(n_total, dtype=np.int64)
+        rng = self.rng
+
+        while True:
+            done = (clock[C_TIME] >= limits[L_MAX_TIME]) | (ist[K.I_PHASE] == K.COMPLETE)
+            if done.any():
+                ids = lane[done]
+                out_result[ids] = ist[K.I_RESULT, done]
+                out_end[ids] = clock[C_TIME, done]
+                out_ticks[ids] = ticks[done]
+                out_miss[ids] = np.where(np.isfinite(miss[done]), miss[done], np.nan)
+                keep = ~done
+                p, limits, ist = p[:, keep], limits[:, keep], ist[:, keep]
+                fs, clock = fs[:, keep], clock[:, keep]
+                paths, lane, miss, ticks = paths[keep], lane[keep], miss[keep], ticks[keep]
+                if keys is not None:
+                    keys, sensors = keys[keep], sensors[keep]
+            if lane.size == 0:
+                break
+
+            dt = limits[L_DT]
+            t = clock[C_TIME].copy()
+            self._update_target(fs, clock, ist, paths, dt)
+            self._update_interceptor(limits, fs, clock, ist, dt)
+
+            flying = ist[K.I_INT_STATE] != InterceptorState.READY.value
+            if flying.any():
+                rng_now = np.hypot(fs[K.F_TGT_X] - fs[K.F_INT_X], fs[K.F_TGT_Y] - fs[K.F_INT_Y])
+                miss = np.where(flying, np.minimum(miss, rng_now), miss)
+
+            transitions = self._step_engagement(
+                p, limits, paths, fs, clock, ist, rng, t, dt, keys, sensors
+            )
+            for code, mask in transitions:
+                out_phase[lane[mask], code - 1] = t[mask]
+
+            clock[C_TIME] += dt
+            ticks += 1
+
+        return BatchResult(out_result, out_miss, out_end, out_ticks, out_phase)
+
+    @staticmethod
+    def _update_target(fs, clock, ist, paths, dt):
+        active = ist[K.I_TGT_ACTIVE] != 0
+        clock[C_PATH_S] = np.where(
+            active, clock[C_PATH_S] + fs[K.F_TGT_SPEED] * dt, clock[C_PATH_S]
+        )
+        s = clock[C_PATH_S]
+        rows = np.arange(paths.shape[0])
+        last = paths.shape[1] - 1
+        leg = ist[K.I_WP_IDX]
+        while True:
+            nxt = np.minimum(leg + 1, last)
+            adv = active & (leg < last) & (paths[rows, nxt, K.W_S] <= s)
+            if not adv.any():
+                break
+            leg = leg + adv
+        ist[K.I_WP_IDX] = leg
+        row = paths[rows, leg]
+        along = s - row[:, K.W_S]
+        fs[K.F_TGT_X] = np.where(active, row[:, K.W_X] + along * row[:, K.W_UX], fs[K.F_TGT_X])
+        fs[K.F_TGT_Y] = np.where(active, row[:, K.W_Y] + along * row[:, K.W_UY], fs[K.F_TGT_Y])
+        fs[K.F_TGT_HEADING] = np.where(active, row[:, K.W_HEADING], fs[K.F_TGT_HEADING])
+
+    @staticmethod
+    def _update_interceptor(limits, fs, clock, ist, dt):
+        state = ist[K.I_INT_STATE]
+        flying = (state == K.INT_LAUNCHED) | (state == K.INT_TERMINAL)
+        clock[C_FLIGHT_TIME] = np.where(flying, clock[C_FLIGHT_TIME] + dt, clock[C_FLIGHT_TIME])
+        missed = flying & (clock[C_FLIGHT_TIME] >= limits[L_MAX_FLIGHT_TIME])
+        ist[K.I_INT_STATE] = np.where(missed, K.INT_MISSED, state)
+        fs[K.F_INT_SPEED] = np.where(missed, 0.0, fs[K.F_INT_SPEED])
+        ist[K.I_INT_ACTIVE] = np.where(missed, 0, ist[K.I_INT_ACTIVE])
+        move = flying & ~missed & (ist[K.I_INT_ACTIVE] != 0)
+        speed = fs[K.F_INT_SPEED]
+        heading = fs[K.F_INT_HEADING]
+        step = dt.astype(fs.dtype, copy=False)
+        x, y = fs[K.F_INT_X], fs[K.F_INT_Y]
+        fs[K.F_INT_X] = np.where(move, x + speed * np.cos(heading) * step, x)
+        fs[K.F_INT_Y] = np.where(move, y + speed * np.sin(heading) * step, y)
+
+    @staticmethod
+    def _detect(p, fs, u, mask):
+        dx = fs[K.F_TGT_X] - p[K.P_SENSOR_X]
+        dy = fs[K.F_TGT_Y] - p[K.P_SENSOR_Y]
+        r = np.sqrt(dx * dx + dy * dy)
+        pd = np.where(
+            r > p[K.P_MAX_RANGE],
+            0.0,
+            1.0 - (r / p[K.P_MAX_RANGE]) * (1.0 - p[K.P_PD_AT_MAX_RANGE]),
+        )
+        offset = np.abs(_wrap(np.arctan2(dy, dx) - p[K.P_BORESIGHT]))
+        in_for = (p[K.P_FIELD_OF_REGARD] >= 2 * np.pi) | (offset <= p[K.P_FIELD_OF_REGARD] / 2)
+        return mask & in_for & (u < pd)
+
+    @staticmethod
+    def _apply_guidance(p, fs, cmd, mask, dt):
+        error = _wrap(cmd - fs[K.F_INT_HEADING])
+        max_delta = p[K.P_INT_MAX_TURN_RATE] * dt.astype(fs.dtype, copy=False)
+        new = _wrap(fs[K.F_INT_HEADING] + np.clip(error, -max_delta, max_delta))
+        fs[K.F_INT_HEADING] = np.where(mask, new, fs[K.F_INT_HEADING])
+
+    def _step_engagement(
+        self, p, limits, paths, fs, clock, ist, rng, t, dt, keys=None, sensors=None
+    ):
+        phase = ist[K.I_PHASE].copy()
+        n = phase.size
+        transitions: list[tuple[int, np.ndarray]] = []
+
+        def transition(mask, code):
+            if mask.any():
+                ist[K.I_PHASE] = np.where(mask, code, ist[K.I_PHASE])
+                transitions.append((code, mask))
+
+        words = None
+        if keys is None:
+            # One uniform per lane covers detection or classification this tick
+            u = rng.random(n)
+        else:
+            # This tick's stream for the phase's quantity, one Philox block per lane
+            quantity = _PHASE_QUANTITY[phase]
+            words = np.zeros((n, 4), dtype=np.uint64)
+            draw = quantity >= 0
+            if draw.any():
+                words[draw] = stream_words(
+                    keys[draw], tick_index(t[draw], dt[draw]), quantity[draw], sensors[draw]
+                )
+            u = words_to_uniform(words[:, 0])
+
+        # SEARCH / TRACK
+        looking = (phase == K.SEARCH) | (phase == K.TRACK)
+        if looking.any():
+            det = self._detect(p, fs, u, looking)
+            ist[K.I_DETECTION_COUNT] += det
+            ist[K.I_DETECTED] |= det
+            ist[K.I_CONFIRMED] |= det & (ist[K.I_DETECTION_COUNT] >= p[K.P_CONFIRM_THRESHOLD])
+            transition((phase == K.SEARCH) & (ist[K.I_DETECTED] != 0), K.TRACK)
+            transition((phase == K.TRACK) & (ist[K.I_CONFIRMED] != 0), K.CLASSIFY)
+
+        # CLASSIFY
+        classify = phase == K.CLASSIFY
+        if classify.any():
+            look = classify & (ist[K.I_CLASSIFIED] == 0)
+            ist[K.I_LOOKS] += look
+            conf = fs[K.F_CONFIDENCE]
+            correct = u < p[K.P_CLASSIFICATION_ACCURACY]
+            updated = np.where(correct, conf + (1.0 - conf) * 0.3, conf * 0.7)
+            fs[K.F_CONFIDENCE] = np.where(look, updated, conf)
+            ist[K.I_CLASSIFIED] |= look & (fs[K.F_CONFIDENCE] >= p[K.P_CLASSIFICATION_THRESHOLD])
+            transition(classify & (ist[K.I_CLASSIFIED] != 0), K.LAUNCH)
+
+        # LAUNCH
+        launch = phase == K.LAUNCH
+        if launch.any():
+            ist[K.I_INT_STATE] = np.where(launch, K.INT_LAUNCHED, ist[K.I_INT_STATE])
+            los = np.arctan2(fs[K.F_TGT_Y] - fs[K.F_INT_Y], fs[K.F_TGT_X] - fs[K.F_INT_X])
+            fs[K.F_INT_HEADING] = np.where(launch, los, fs[K.F_INT_HEADING])
+            fs[K.F_INT_SPEED] = np.where(launch, p[K.P_INT_MAX_SPEED], fs[K.F_INT_SPEED])
+            clock[C_FLIGHT_TIME] = np.where(launch, 0.0, clock[C_FLIGHT_TIME])
+            transition(launch, K.MIDCOURSE)
+
+        # MIDCOURSE
+        mid = phase == K.MIDCOURSE
+        if mid.any():
+            timed_out = mid & (ist[K.I_INT_STATE] == K.INT_MISSED)
+            ist[K.I_RESULT] = np.where(timed_out, K.RESULT_MISS, ist[K.I_RESULT])
+            unreachable = self._end_unreachable(
+                p, limits, paths, fs, clock, ist, mid & ~timed_out, dt
+            )
+            transition(timed_out | unreachable, K.COMPLETE)
+            guided = mid & ~timed_out & ~unreachable
+            self._measure(p, fs, rng, guided, words)
+            ist[K.I_HAS_ESTIMATE] |= guided
+            self._apply_guidance(p, fs, self._command_guidance(p, fs), guided, dt)
+            est_rng = np.hypot(fs[K.F_EST_X] - fs[K.F_INT_X], fs[K.F_EST_Y] - fs[K.F_INT_Y])
+            handover = guided & (est_rng <= p[K.P_HANDOVER_RANGE])
+            ist[K.I_INT_STATE] = np.where(handover, K.INT_TERMINAL, ist[K.I_INT_STATE])
+            transition(handover, K.TERMINAL)
+
+        # TERMINAL
+        term = phase == K.TERMINAL
+        if term.any():
+            rng_now = np.hypot(fs[K.F_TGT_X] - fs[K.F_INT_X], fs[K.F_TGT_Y] - fs[K.F_INT_Y])
+            hit = term & (rng_now <= p[K.P_KILL_RADIUS])
+            ist[K.I_INT_STATE] = np.where(hit, K.INT_DETONATED, ist[K.I_INT_STATE])
+            ist[K.I_TGT_ACTIVE] = np.where(hit, 0, ist[K.I_TGT_ACTIVE])
+            ist[K.I_RESULT] = np.where(hit, K.RESULT_HIT, ist[K.I_RESULT])
+            missed = term & ~hit & (ist[K.I_INT_STATE] == K.INT_MISSED)
+            ist[K.I_RESULT] = np.where(missed, K.RESULT_MISS, ist[K.I_RESULT])
+            unreachable = self._end_unreachable(
+                p, limits, paths, fs, clock, ist, term & ~hit & ~missed, dt
+            )
+            transition(hit | missed | unreachable, K.COMPLETE)
+            guided = term & ~hit & ~missed & ~unreachable
+            self._apply_guidance(p, fs, self._terminal_guidance(p, fs), guided, dt)
+
+        return transitions
+
+    @staticmethod
+    def _end_unreachable(p, limits, paths, fs, clock, ist, mask, dt):
+        """End *mask* lanes whose intercept is no longer possible; returns those lanes."""
+        due = mask & (p[K.P_EARLY_TERMINATION] != 0)
+        if not due.any():
+            return due
+        due &= np.floor(clock[C_FLIGHT_TIME] / dt + 0.5) % CHECK_INTERVAL == 0
+        m = np.nonzero(due)[0]
+        heading, speed = fs[K.F_INT_HEADING, m], fs[K.F_INT_SPEED, m]
+        tgt_heading, tgt_speed = fs[K.F_TGT_HEADING, m], fs[K.F_TGT_SPEED, m]
+        # Only worth testing while the range is opening
+        rx = fs[K.F_TGT_X, m] - fs[K.F_INT_X, m]
+        ry = fs[K.F_TGT_Y, m] - fs[K.F_INT_Y, m]
+        opening = (
+            rx * (tgt_speed * np.cos(tgt_heading) - speed * np.cos(heading))
+            + ry * (tgt_speed * np.sin(tgt_heading) - speed * np.sin(heading))
+        ) > 0.0
+        m, heading, speed = m[opening], heading[opening], speed[opening]
+        tgt_speed = tgt_speed[opening]
+        ended = np.zeros_like(mask)
+        if m.size == 0:
+            return ended
+        ended[m] = ~intercept_reachable(
+            np.stack([fs[K.F_INT_X, m], fs[K.F_INT_Y, m]], axis=1),
+            heading,
+            speed,
+            p[K.P_INT_MAX_TURN_RATE, m],
+            dt[m],
+            p[K.P_KILL_RADIUS, m],
+            remaining_moves(clock[C_FLIGHT_TIME, m], limits[L_MAX_FLIGHT_TIME, m], dt[m]),
+            paths[m],
+            clock[C_PATH_S, m],
+            tgt_speed,
+        )
+        ist[K.I_INT_STATE] = np.where(ended, K.INT_MISSED, ist[K.I_INT_STATE])
+        fs[K.F_INT_SPEED] = np.where(ended, 0.0, fs[K.F_INT_SPEED])
+        ist[K.I_INT_ACTIVE] = np.where(ended, 0, ist[K.I_INT_ACTIVE])
+        ist[K.I_RESULT] = np.where(ended, K.RESULT_UNREACHABLE, ist[K.I_RESULT])
+        return ended
+
+    @staticmethod
+    def _measure(p, fs, rng, mask, words=None):
+        m = np.nonzero(mask)[0]
+        if m.size == 0:
+            return
+        if words is None:
+            z = rng.standard_normal((4, m.size))
+        sx = p[K.P_SENSOR_X, m]
+        sy = p[K.P_SENSOR_Y, m]
+        dx = fs[K.F_TGT_X, m] - sx
+        dy = fs[K.F_TGT_Y, m] - sy
+        true_rng = np.sqrt(dx * dx + dy * dy)
+        true_brg = np.arctan2(dy, dx)
+        speed = fs[K.F_TGT_SPEED, m]
+        heading = fs[K.F_TGT_HEADING, m]
+
+        range_sigma = p[K.P_RANGE_NOISE, m] * true_rng
+        speed_sigma = p[K.P_SPEED_NOISE, m] * speed
+        if words is not None:
+            # Sensor.measure draws a normal only for each noisy channel, in order
+            normals = words_to_normal(words[m])
+            rows = np.arange(m.size)
+            used = np.zeros(m.size, dtype=np.int64)
+            z = np.empty((4, m.size))
+            for c, noisy in enumerate(
+                (range_sigma > 0, p[K.P_BEARING_NOISE, m] > 0, speed_sigma > 0,
+                 p[K.P_HEADING_NOISE, m] > 0)
+            ):
+                z[c] = normals[rows, used]
+                used += noisy
+        meas_range = np.where(
+            range_sigma > 0, np.maximum(0.0, true_rng + range_sigma * z[0]), true_rng
+        )
+        meas_bearing = true_brg + p[K.P_BEARING_NOISE, m] * z[1]
+        meas_speed = np.where(
+            speed_sigma > 0, np.maximum(0.0, speed + speed_sigma * z[2]), speed
+        )
+        meas_heading = heading + p[K.P_HEADING_NOISE, m] * z[3]
+
+        fs[K.F_EST_X, m] = sx + meas_range * np.cos(meas_bearing)
+        fs[K.F_EST_Y, m] = sy + meas_range * np.sin(meas_bearing)
+        fs[K.F_EST_VX, m] = meas_speed * np.cos(meas_heading)
+        fs[K.F_EST_VY, m] = meas_speed * np.sin(meas_heading)
+
+    @staticmethod
+    def _command_guidance(p, fs):
+        ix, iy = fs[K.F_INT_X], fs[K.F_INT_Y]
+        tx, ty = fs[K.F_EST_X], fs[K.F_EST_Y]
+        vx, vy = fs[K.F_EST_VX], fs[K.F_EST_VY]
+        stern_offset = p[K.P_STERN_OFFSET]
+        vel_norm = np.sqrt(vx * vx + vy * vy)
+        use_stern = (stern_offset > 0.0) & (vel_norm >= 1e-6)
+        safe_norm = np.where(use_stern, vel_norm, 1.0)
+        stern_x = tx - stern_offset * (vx / safe_norm)
+        stern_y = ty - stern_offset * (vy / safe_norm)
+        rng_to_target = np.sqrt((tx - ix) ** 2 + (ty - iy) ** 2)
+        blend = np.minimum(rng_to_target / p[K.P_BLEND_RANGE], 1.0)
+        aim_x = np.where(
+            rng_to_target >= p[K.P_BLEND_RANGE], stern_x, (1.0 - blend) * tx + blend * stern_x
+        )
+        aim_y = np.where(
+            rng_to_target >= p[K.P_BLEND_RANGE], stern_y, (1.0 - blend) * ty + blend * stern_y
+        )
+        aim_x = np.where(use_stern, aim_x, tx)
+        aim_y = np.where(use_stern, aim_y, ty)
+        return np.arctan2(aim_y - iy, aim_x - ix)
+
+    @staticmethod
+    def _terminal_guidance(p, fs):
+        ix, iy = fs[K.F_INT_X], fs[K.F_INT_Y]
+        tx, ty = fs[K.F_TGT_X], fs[K.F_TGT_Y]
+        los_angle = np.arctan2(ty - iy, tx - ix)
+        ivx = fs[K.F_INT_SPEED] * np.cos(fs[K.F_INT_HEADING])
+        ivy = fs[K.F_INT_SPEED] * np.sin(fs[K.F_INT_HEADING])
+        tvx = fs[K.F_TGT_SPEED] * np.cos(fs[K.F_TGT_HEADING])
+        tvy = fs[K.F_TGT_SPEED] * np.sin(fs[K.F_TGT_HEADING])
+        rx, ry = tx - ix, ty - iy
+        r_sq = rx * rx + ry * ry
+        safe_r_sq = np.where(r_sq < 1e-9, 1.0, r_sq)
+        los_rate = np.where(r_sq < 1e-9, 0.0, (rx * (tvy - ivy) - ry * (tvx - ivx)) / safe_r_sq)
+        los_dist = np.sqrt(r_sq)
+        safe_dist = np.where(los_dist < 1e-9, 1.0, los_dist)
+        vc = np.where(
+            los_dist < 1e-9,
+            0.0,
+            (ivx - tvx) * (rx / safe_dist) + (ivy - tvy) * (ry / safe_dist),
+        )
+        pn = np.where(np.abs(vc) < 1e-3, los_angle, los_angle + p[K.P_NAV_GAIN] * los_rate)
+        return np.where(p[K.P_TERMINAL_LAW] != 0, los_angle, pn)
@@ -0,0 +1,221 @@
+"""Engagement envelope (footprint) over target start position and heading.
+
+Target start positions are laid out on a polar grid (range, bearing)
+around the launch site; each target flies a straight line whose heading is
+the inbound bearing to the launch site plus a heading offset. Each grid
+node is run ``seeds_per_cell`` times. All nodes pending at one refinement
+level are simulated as a single :class:`BatchEngine` run.
+
+Refinement is a quadtree over (range, bearing): a cell whose corner Pk
+values straddle ``threshold`` is split in four, and the new corners are
+simulated at the next level. Leaves that were never split are filled by
+bilinear interpolation, so the output rasters are always on the finest
+lattice but only the envelope boundary is sampled densely.
+"""
+
+from __future__ import annotations
+
+import math
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+
+from interceptor_sim.batch.engine import BatchEngine
+from interceptor_sim.core.scenario import apply_overrides
+
+
+@dataclass
+class Envelope:
+    """Pk and miss-distance rasters on a polar grid around the launch site.
+
+    Attributes:
+        launch_site: Interceptor launch position.
+        ranges: Target start ranges from the launch site (m), ``(nr,)``.
+        bearings: Bearings of the start position from the launch site
+            (rad, 0 to 2*pi inclusive), ``(nb,)``.
+        heading_offsets: Target heading relative to inbound (rad), ``(nh,)``.
+        pk: Hit fraction, ``(nh, nr, nb)``.
+        miss_distance: Median closest approach (m), ``(nh, nr, nb)``; NaN
+            where the interceptor never launched.
+        simulated: True where the node was simulated rather than interpolated.
+        threshold: Pk level that defines the envelope boundary.
+        n_engagements: Total engagements simulated.
+    """
+
+    launch_site: np.ndarray
+    ranges: np.ndarray
+    bearings: np.ndarray
+    heading_offsets: np.ndarray
+    pk: np.ndarray
+    miss_distance: np.ndarray
+    simulated: np.ndarray
+    threshold: float
+    n_engagements: int
+
+    def grid_xy(self) -> tuple[np.ndarray, np.ndarray]:
+        """World coordinates of the grid nodes, each ``(nr, nb)``."""
+        r, b = np.meshgrid(self.ranges, self.bearings, indexing="ij")
+        return (
+            self.launch_site[0] + r * np.cos(b),
+            self.launch_site[1] + r * np.sin(b),
+        )
+
+
+def envelope_scenario(
+    scenario: dict, launch_site: np.ndarray, rng: float, brg: float, heading_offset: float
+) -> dict:
+    """Scenario with the target starting at (*rng*, *brg*) from the launch site.
+
+    The target heading is the inbound bearing plus *heading_offset*; a single
+    waypoint 1 km ahead sets it, and the target keeps that heading afterwards.
+    """
+    x = launch_site[0] + rng * math.cos(brg)
+    y = launch_site[1] + rng * math.sin(brg)
+    heading = brg + math.pi + heading_offset
+    waypoint = [x + 1000.0 * math.cos(heading), y + 1000.0 * math.sin(heading)]
+    return apply_overrides(
+        scenario, {"target.position": [x, y], "target.waypoints": [waypoint]}
+    )
+
+
+def compute_envelope(
+    scenario: dict,
+    max_range: float,
+    min_range: float = 0.0,
+    n_range: int = 9,
+    n_bearing: int = 16,
+    heading_offsets_deg: tuple[float, ...] = (0.0,),
+    seeds_per_cell: int = 8,
+    refine_levels: int = 2,
+    threshold: float = 0.5,
+    seed: int | None = None,
+) -> Envelope:
+    """Sweep target start position and heading, refining near the Pk boundary.
+
+    Args:
+        scenario: Base scenario dict; the interceptor position is the launch site.
+        max_range: Outer range of the polar grid (m).
+        min_range: Inner range of the polar grid (m).
+        n_range: Range nodes at the coarsest level.
+        n_bearing: Bearing intervals (around the full circle) at the coarsest level.
+        heading_offsets_deg: Target heading offsets from inbound (deg).
+        seeds_per_cell: Engagements per grid node.
+        refine_levels: Quadtree subdivisions near the boundary.
+        threshold: Pk that defines the envelope boundary.
+        seed: Seed for the batch generator.
+
+    Returns:
+        Envelope on the finest lattice: ``(n_range - 1) * 2**refine_levels + 1``
+        ranges by ``n_bearing * 2**refine_levels + 1`` bearings.
+    """
+    launch_site = np.asarray(scenario["interceptor"]["position"], dtype=np.float64)
+    step = 2**refine_levels
+    nr = (n_range - 1) * step + 1
+    nb = n_bearing * step + 1  # last column repeats bearing 0
+    ranges = np.linspace(min_range, max_range, nr)
+    bearings = np.linspace(0.0, 2 * np.pi, nb)
+    offsets = np.radians(np.asarray(heading_offsets_deg, dtype=np.float64))
+    nh = len(offsets)
+
+    pk = np.full((nh, nr, nb), np.nan)
+    miss = np.full((nh, nr, nb), np.nan)
+    simulated = np.zeros((nh, nr, nb), dtype=bool)
+    rng = np.random.default_rng(seed)
+    n_engagements = 0
+
+    cells = [
+        (h, i, j, step)
+        for h in range(nh)
+        for i in range(0, nr - 1, step)
+        for j in range(0, nb - 1, step)
+    ]
+    leaves = []
+    for level in range(refine_levels + 1):
+        nodes = sorted(
+            {
+                (h, i + di, (j + dj) % (nb - 1))
+                for h, i, j, size in cells
+                for di in (0, size)
+                for dj in (0, size)
+            }
+        )
+        nodes = [n for n in nodes if not simulated[n]]
+        if nodes:
+            n_engagements += _simulate_nodes(
+                scenario, launch_site, ranges, bearings, offsets, nodes,
+                seeds_per_cell, rng, pk, miss, simulated,
+            )
+            # Bearing 2*pi is bearing 0
+            pk[:, :, nb - 1] = pk[:, :, 0]
+            miss[:, :, nb - 1] = miss[:, :, 0]
+            simulated[:, :, nb - 1] = simulated[:, :, 0]
+
+        split = []
+        for h, i, j, size in cells:
+            corners = pk[h, [i, i, i + size, i + size], [j, j + size, j, j + size]]
+            straddles = corners.min() < threshold <= corners.max()
+            if straddles and level < refine_levels:
+                half = size // 2
+                split.extend(
+                    (h, i + di, j + dj, half) for di in (0, half) for dj in (0, half)
+                )
+            else:
+                leaves.append((h, i, j, size))
+        cells = split
+
+    for h, i, j, size in leaves:
+        _fill_cell(pk[h], simulated[h], i, j, size)
+        _fill_cell(miss[h], simulated[h], i, j, size)
+
+    return Envelope(
+        launch_site=launch_site,
+        ranges=ranges,
+        bearings=bearings,
+        heading_offsets=offsets,
+        pk=pk,
+        miss_distance=miss,
+        simulated=simulated,
+        threshold=threshold,
+        n_engagements=n_engagements,
+    )
+
+
+def _simulate_nodes(
+    scenario, launch_site, ranges, bearings, offsets, nodes, seeds_per_cell,
+    rng, pk, miss, simulated,
+) -> int:
+    """Run every (node, repeat) pair as one batch and store per-node statistics."""
+    scenarios = []
+    for h, i, j in nodes:
+        sc = envelope_scenario(scenario, launch_site, ranges[i], bearings[j], offsets[h])
+        scenarios.extend([sc] * seeds_per_cell)
+    result = BatchEngine.from_scenarios(scenarios, seed=rng).run()
+
+    hits = result.hit.reshape(len(nodes), seeds_per_cell)
+    miss_d = result.miss_distance.reshape(len(nodes), seeds_per_cell)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN: never launched
+        med = np.nanmedian(miss_d, axis=1)
+    idx = tuple(np.array(nodes).T)
+    pk[idx] = hits.mean(axis=1)
+    miss[idx] = med
+    simulated[idx] = True
+    return len(scenarios)
+
+
+def _fill_cell(grid: np.ndarray, simulated: np.ndarray, i: int, j: int, size: int) -> None:
+    """Bilinearly fill the interior and edges of a leaf cell from its corners."""
+    if size == 1:
+        return
+    f = np.linspace(0.0, 1.0, size + 1)
+    fu, fv = np.meshgrid(f, f, indexing="ij")
+    c00, c01 = grid[i, j], grid[i, j + size]
+    c10, c11 = grid[i + size, j], grid[i + size, j + size]
+    block = (c00 * (1 - fv) + c01 * fv) * (1 - fu) + (c10 * (1 - fv) + c11 * fv) * fu
+    # Keep nodes simulated by finer neighbouring cells
+    np.copyto(
+        grid[i : i + size + 1, j : j + size + 1],
+        block,
+        where=~simulated[i : i + size + 1, j : j + size + 1],
+    )
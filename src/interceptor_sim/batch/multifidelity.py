@@ -0,0 +1,218 @@
+"""Multi-fidelity Monte Carlo: coarse-dt screening, fine-dt re-runs of borderline trials.
+
+Most trials of a Pk study are clear misses that a coarse time step gets
+right. :func:`run_multifidelity` therefore simulates every trial at a
+coarse ``simulation.dt`` first, then re-runs at the fine ``dt`` only the
+trials the coarse run cannot settle:
+
+* every coarse hit, and every miss whose closest sampled approach is
+  within ``kill_radius + margin``. Range is only sampled once per tick, so
+  a coarse step overstates the miss distance by up to half a step of
+  closing motion, which is the default margin (at the largest closing
+  speed, interceptor ``max_speed`` + target ``speed``). Coarse hits are
+  re-run as well because guidance integrates differently near the capture
+  boundary;
+* trials that ended for any other reason than a miss (timeouts, aborts,
+  unreachable intercepts, never launched) keep their coarse outcome.
+
+Coarse and fine runs of a trial share its counter-based random streams
+(``simulation.counter_rng`` keyed by seed and trial id). The streams are
+keyed by tick, so the k-th detection or classification look rolls the same
+number at both time steps, but a fine run takes many more looks and
+measurements per second: an accepted coarse outcome says what is likely
+given the geometry, not what that trial does at the fine ``dt``.
+
+The screening therefore depends on the audit correction. A random
+``audit_fraction`` of the accepted coarse trials is re-run at fine ``dt``
+too. The mean fine-minus-coarse hit difference over the audit, scaled by
+the accepted fraction, corrects the combined Pk (which makes
+:meth:`MultiFidelityResult.pk_corrected` unbiased for the fine-``dt`` Pk),
+and its confidence interval says whether the screening threw away hits.
+Outcomes decided by geometry (target speed, crossing angle) survive the
+screening; when noise decides them, expect a detected bias and rely on the
+corrected Pk.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from interceptor_sim.batch.adaptive import _z
+from interceptor_sim.batch.engine import BatchEngine, BatchResult
+from interceptor_sim.core.kernel import supports_engine
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario
+from interceptor_sim.engagement.kill_chain import EngagementResult
+
+
+@dataclass
+class MultiFidelityResult:
+    """Combined outcomes of a multi-fidelity run.
+
+    Attributes:
+        outcomes: Per-trial outcomes, fine where re-run, coarse otherwise.
+        coarse: Coarse outcomes of every trial.
+        refined: Trials re-run at fine ``dt`` because they were borderline.
+        audited: Accepted trials re-run at fine ``dt`` for the bias check.
+        audit_difference: Fine minus coarse hit (-1, 0 or 1) per audited trial.
+        coarse_ticks, fine_ticks: Simulated ticks at each fidelity.
+        coarse_dt, fine_dt: The two time steps.
+        confidence: Confidence level of :meth:`bias_interval`.
+    """
+
+    outcomes: BatchResult
+    coarse: BatchResult
+    refined: np.ndarray
+    audited: np.ndarray
+    audit_difference: np.ndarray
+    coarse_ticks: int
+    fine_ticks: int
+    coarse_dt: float
+    fine_dt: float
+    confidence: float = 0.95
+
+    def pk(self) -> float:
+        """Pk of the combined outcomes (no audit correction)."""
+        return self.outcomes.pk()
+
+    @property
+    def accepted_fraction(self) -> float:
+        """Share of trials whose coarse outcome was kept."""
+        return 1.0 - float(self.refined.mean()) if len(self.refined) else 0.0
+
+    def bias(self) -> float:
+        """Estimated Pk lost (or gained) by accepting coarse outcomes."""
+        if len(self.audit_difference) == 0:
+            return 0.0
+        return self.accepted_fraction * float(self.audit_difference.mean())
+
+    def bias_interval(self) -> tuple[float, float]:
+        """Normal-approximation interval of :meth:`bias`."""
+        m = len(self.audit_difference)
+        if m < 2:
+            return -math.inf, math.inf
+        half = _z(self.confidence) * float(self.audit_difference.std(ddof=1)) / math.sqrt(m)
+        centre = self.bias()
+        return centre - self.accepted_fraction * half, centre + self.accepted_fraction * half
+
+    @property
+    def bias_detected(self) -> bool:
+        """Whether the bias interval excludes zero."""
+        low, high = self.bias_interval()
+        return low > 0.0 or high < 0.0
+
+    def pk_corrected(self) -> float:
+        """Combined Pk plus the audit correction: unbiased for the fine-``dt`` Pk."""
+        return min(1.0, max(0.0, self.pk() + self.bias()))
+
+    def speedup(self) -> float:
+        """Estimated fine-only ticks over the ticks actually simulated."""
+        fine_only = self.coarse_ticks * self.coarse_dt / self.fine_dt
+        return fine_only / (self.coarse_ticks + self.fine_ticks)
+
+
+def _run(scenarios: list[dict], trials: np.ndarray, seed: int, rng) -> BatchResult:
+    """Run *scenarios* with counter streams keyed by (*seed*, trial id)."""
+    engines = [
+        build_from_scenario(sc, seed=seed, trial=int(trial))[0]
+        for sc, trial in zip(scenarios, trials)
+    ]
+    if all(supports_engine(engine, allow_streams=True) for engine in engines):
+        return BatchEngine.from_engines(engines, rng=rng).run()
+    for engine in engines:
+        engine.run()
+    return BatchResult.from_runs(engines)
+
+
+def _default_margin(scenario: dict, dt: float) -> float:
+    closing = scenario["interceptor"].get("max_speed", 100.0) + scenario["target"]["speed"]
+    return 0.5 * closing * dt
+
+
+def run_multifidelity(
+    scenarios: dict | Sequence[dict],
+    n_trials: int | None = None,
+    coarse_dt: float = 0.5,
+    fine_dt: float = 0.01,
+    margin: float | None = None,
+    audit_fraction: float = 0.05,
+    confidence: float = 0.95,
+    seed: int | None = None,
+) -> MultiFidelityResult:
+    """Screen trials at *coarse_dt* and re-run borderline ones at *fine_dt*.
+
+    Args:
+        scenarios: One scenario (with *n_trials*) or one scenario per trial.
+        n_trials: Trials of a single scenario.
+        coarse_dt, fine_dt: Screening and reference time steps.
+        margin: Distance beyond ``kill_radius`` within which a coarse miss
+            is re-run (m); default half a coarse step of closing motion.
+        audit_fraction: Share of accepted trials re-run for the bias check.
+        confidence: Confidence level of the bias interval.
+        seed: Seed of the random streams and the audit sample.
+
+    Returns:
+        Combined outcomes, bias estimate and cost.
+    """
+    if isinstance(scenarios, dict):
+        if n_trials is None:
+            raise ValueError("n_trials is required with a single scenario")
+        scenarios = [scenarios] * n_trials
+    scenarios = list(scenarios)
+    if not 0 < fine_dt < coarse_dt:
+        raise ValueError("need 0 < fine_dt < coarse_dt")
+    if not 0.0 <= audit_fraction <= 1.0:
+        raise ValueError("audit_fraction must be in [0, 1]")
+    n = len(scenarios)
+    rng = np.random.default_rng(seed)
+    stream_seed = int(rng.integers(2**63))
+    trials = np.arange(n)
+
+    def at(dt: float, index: np.ndarray) -> list[dict]:
+        return [
+            apply_overrides(scenarios[i], {"simulation.dt": dt, "simulation.counter_rng": True})
+            for i in index
+        ]
+
+    coarse = _run(at(coarse_dt, trials), trials, stream_seed, rng)
+
+    limits = np.array(
+        [
+            sc["interceptor"].get("kill_radius", 5.0)
+            + (_default_margin(sc, coarse_dt) if margin is None else margin)
+            for sc in scenarios
+        ]
+    )
+    near_miss = (coarse.result == EngagementResult.MISS.value) & (coarse.miss_distance <= limits)
+    refined = coarse.hit | near_miss
+
+    accepted = np.flatnonzero(~refined)
+    n_audit = min(len(accepted), math.ceil(audit_fraction * len(accepted)))
+    audited = np.sort(rng.choice(accepted, size=n_audit, replace=False))
+    rerun = np.concatenate([np.flatnonzero(refined), audited])
+    fine = (
+        _run(at(fine_dt, rerun), rerun, stream_seed, rng)
+        if len(rerun)
+        else coarse.take(np.array([], dtype=np.int64))
+    )
+
+    n_refined = int(refined.sum())
+    combined = coarse.take(trials)
+    for name in ("result", "miss_distance", "end_time", "ticks", "phase_times"):
+        getattr(combined, name)[rerun[:n_refined]] = getattr(fine, name)[:n_refined]
+    audit_difference = fine.hit[n_refined:].astype(np.int64) - coarse.hit[audited]
+    return MultiFidelityResult(
+        outcomes=combined,
+        coarse=coarse,
+        refined=refined,
+        audited=audited,
+        audit_difference=audit_difference,
+        coarse_ticks=int(coarse.ticks.sum()),
+        fine_ticks=int(fine.ticks.sum()),
+        coarse_dt=coarse_dt,
+        fine_dt=fine_dt,
+        confidence=confidence,
+    )
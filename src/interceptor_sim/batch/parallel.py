@@ -0,0 +1,248 @@
+"""Multi-process trial runner writing into shared-memory columnar buffers.
+
+The parent allocates one ``multiprocessing.shared_memory`` block per output
+column, sized for every trial: outcomes, phase entry times and trajectories
+decimated to a fixed number of samples. Workers attach to the blocks once,
+run ``build_from_scenario`` + ``engine.run()`` for their trials and write
+straight into their rows, so only the small task tuples cross the process
+boundary; no ``SimHistory`` is ever pickled.
+
+With ``precision="float32"`` miss distances and trajectory positions are
+stored as float32 (times stay float64), which cuts the trajectory columns
+to about 60 % of their float64 size.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from interceptor_sim.batch.engine import (
+    N_PHASES,
+    PRECISIONS,
+    BatchResult,
+    history_miss_distance,
+    phase_times_from_log,
+)
+from interceptor_sim.core.scenario import build_from_scenario
+from interceptor_sim.engagement.kill_chain import Phase
+
+
+def _columns(
+    n_trials: int, trajectory_length: int, precision: str = "float64"
+) -> dict[str, tuple[tuple[int, ...], str]]:
+    """Shape and dtype of every output column."""
+    if precision not in PRECISIONS:
+        raise ValueError(f"precision must be one of {PRECISIONS}")
+    n, m = n_trials, trajectory_length
+    real = "f4" if precision == "float32" else "f8"
+    return {
+        "result": ((n,), "i1"),
+        "miss_distance": ((n,), real),
+        "end_time": ((n,), "f8"),
+        "ticks": ((n,), "i8"),
+        "phase_times": ((n, N_PHASES), "f8"),
+        "time": ((n, m), "f8"),
+        "target_pos": ((n, m, 2), real),
+        "interceptor_pos": ((n, m, 2), real),
+        "phase": ((n, m), "i1"),
+    }
+
+
+class SharedResults:
+    """Columnar per-trial output arrays backed by shared memory.
+
+    The creating process owns the blocks and must :meth:`unlink` them (or use
+    the instance as a context manager). Other processes attach with
+    :meth:`attach` using :attr:`spec` and only :meth:`close`. Views into
+    :attr:`arrays` must be dropped (or copied via :meth:`outcomes` /
+    :meth:`trajectories`) before closing.
+
+    Attributes:
+        arrays: Column name → NumPy view onto the shared block.
+        spec: Picklable ``(column, block name, shape, dtype)`` tuples.
+    """
+
+    def __init__(self, spec: list[tuple[str, str, tuple[int, ...], str]], blocks) -> None:
+        self.spec = spec
+        self._blocks = blocks
+        self.arrays: dict[str, np.ndarray] = {
+            col: np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            for (col, _, shape, dtype), shm in zip(spec, blocks)
+        }
+
+    @classmethod
+    def create(
+        cls, n_trials: int, trajectory_length: int = 200, precision: str = "float64"
+    ) -> SharedResults:
+        spec, blocks = [], []
+        for col, (shape, dtype) in _columns(n_trials, trajectory_length, precision).items():
+            nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+            shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            spec.append((col, shm.name, shape, dtype))
+            blocks.append(shm)
+        results = cls(spec, blocks)
+        results.reset()
+        return results
+
+    @classmethod
+    def attach(cls, spec: list[tuple[str, str, tuple[int, ...], str]]) -> SharedResults:
+        return cls(spec, [shared_memory.SharedMemory(name=name) for _, name, _, _ in spec])
+
+    def reset(self) -> None:
+        """Fill float columns with NaN and integer columns with 0."""
+        for arr in self.arrays.values():
+            arr.fill(np.nan if arr.dtype.kind == "f" else 0)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(arr.nbytes for arr in self.arrays.values())
+
+    @property
+    def n_trials(self) -> int:
+        return len(self.arrays["result"])
+
+    @property
+    def trajectory_length(self) -> int:
+        return self.arrays["time"].shape[1]
+
+    def outcomes(self) -> BatchResult:
+        """Copy of the outcome columns as a :class:`BatchResult`."""
+        a = self.arrays
+        return BatchResult(
+            result=a["result"].copy(),
+            miss_distance=a["miss_distance"].astype(np.float64),
+            end_time=a["end_time"].copy(),
+            ticks=a["ticks"].copy(),
+            phase_times=a["phase_times"].copy(),
+        )
+
+    def trajectories(self) -> dict[str, np.ndarray]:
+        """Copy of the decimated trajectory columns (time, positions, phase)."""
+        return {
+            col: self.arrays[col].copy()
+            for col in ("time", "target_pos", "interceptor_pos", "phase")
+        }
+
+    def write_trial(
+        self,
+        index: int,
+        history_arrays: dict[str, np.ndarray],
+        phase_log: list[tuple[float, Phase]],
+        result: int,
+    ) -> None:
+        """Store one finished run in row *index*.
+
+        Args:
+            index: Trial row.
+            history_arrays: ``SimHistory.as_arrays()`` of the run.
+            phase_log: ``EngagementManager.phase_log`` of the run.
+            result: ``EngagementResult`` code.
+        """
+        a = self.arrays
+        h = history_arrays
+        n = len(h["time"])
+        a["miss_distance"][index] = history_miss_distance(h)
+        a["end_time"][index] = h["time"][-1]
+        a["ticks"][index] = n - 1
+        a["result"][index] = result
+        phase_times_from_log(phase_log, out=a["phase_times"][index])
+
+        idx = np.linspace(0, n - 1, self.trajectory_length).round().astype(np.intp)
+        a["time"][index] = h["time"][idx]
+        a["target_pos"][index] = h["target_pos"][idx]
+        a["interceptor_pos"][index] = h["interceptor_pos"][idx]
+        a["phase"][index] = h["phase"][idx]
+
+    def close(self) -> None:
+        self.arrays = {}
+        for shm in self._blocks:
+            shm.close()
+
+    def unlink(self) -> None:
+        self.close()
+        for shm in self._blocks:
+            shm.unlink()
+
+    def __enter__(self) -> SharedResults:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.unlink()
+
+
+_WORKER_RESULTS: SharedResults | None = None
+
+
+def _init_worker(spec) -> None:
+    global _WORKER_RESULTS
+    _WORKER_RESULTS = SharedResults.attach(spec)
+
+
+def _run_trials(
+    results: SharedResults, tasks: Sequence[tuple[int, dict, int | None]], use_kernel: bool
+) -> int:
+    for index, scenario, seed in tasks:
+        engine, meta = build_from_scenario(scenario, seed=seed)
+        engine.use_kernel = use_kernel
+        arrays = engine.run().as_arrays()
+        engagement = meta["engagement"]
+        results.write_trial(index, arrays, engagement.phase_log, engagement.result.value)
+    return len(tasks)
+
+
+def _worker_chunk(tasks, use_kernel: bool) -> int:
+    return _run_trials(_WORKER_RESULTS, tasks, use_kernel)
+
+
+def run_trials(
+    scenarios: Sequence[dict],
+    seeds: Sequence[int | None],
+    workers: int | None = None,
+    trajectory_length: int = 200,
+    use_kernel: bool = False,
+    chunk_size: int = 16,
+    out: SharedResults | None = None,
+    precision: str = "float64",
+) -> SharedResults:
+    """Run ``scenarios[i]`` with ``seeds[i]`` for every trial across processes.
+
+    Args:
+        scenarios: Scenario dict per trial.
+        seeds: Seed per trial.
+        workers: Process count (default ``os.cpu_count()``); 1 runs in-process.
+        trajectory_length: Samples per decimated trajectory.
+        use_kernel: Run each engine on the compiled kernel when possible.
+        chunk_size: Trials per task sent to a worker.
+        out: Existing buffers to fill; allocated when omitted.
+        precision: Storage precision of newly allocated buffers.
+
+    Returns:
+        The shared buffers (the caller owns them and must unlink them).
+    """
+    if len(scenarios) != len(seeds):
+        raise ValueError("scenarios and seeds must have the same length")
+    results = out or SharedResults.create(len(scenarios), trajectory_length, precision)
+    tasks = [(i, sc, seed) for i, (sc, seed) in enumerate(zip(scenarios, seeds))]
+    workers = workers or os.cpu_count() or 1
+    try:
+        if workers == 1:
+            _run_trials(results, tasks, use_kernel)
+            return results
+
+        chunks = [tasks[k : k + chunk_size] for k in range(0, len(tasks), chunk_size)]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(results.spec,)
+        ) as pool:
+            for _ in pool.map(_worker_chunk, chunks, [use_kernel] * len(chunks)):
+                pass
+    except BaseException:
+        # Buffers allocated here have no owner yet; release them before re-raising
+        if out is None:
+            results.unlink()
+        raise
+    return results
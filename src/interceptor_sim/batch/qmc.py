@@ -0,0 +1,439 @@
+"""Quasi-Monte Carlo (scrambled Sobol) studies over scenario and noise inputs.
+
+Plain Monte Carlo estimates of Pk and miss distance converge as
+``O(N^-1/2)``. Driving the random inputs of each engagement from a
+low-discrepancy Sobol point set instead spreads the N runs evenly over the
+input space, which converges faster for inputs the outcome depends on
+smoothly. :func:`run_qmc` assigns point coordinates to
+
+* scenario-level uncertainties (:class:`UncertainInput`, e.g. target start
+  position and speed), uniform or normal via an inverse-normal transform;
+* optionally, the first ``noise_dims`` measurement-noise normals drawn by
+  ``Sensor.measure`` (range, bearing, speed, heading, in draw order). Later
+  noise draws and detection / classification rolls stay pseudo-random
+  ("padding"); most measurement ticks only matter through their sum, so
+  QMC gains come mainly from the scenario-level inputs.
+
+Each of ``replicates`` runs uses an independently scrambled point set
+(random linear matrix scramble plus digital shift), so the replicate means
+are independent unbiased estimates and their spread gives the standard
+error, exactly as for plain Monte Carlo with ``method="random"``.
+
+Direction numbers are the first dimensions of Joe & Kuo's
+``new-joe-kuo-6.21201`` table.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from interceptor_sim.batch.engine import BatchEngine, BatchResult
+from interceptor_sim.core.kernel import supports_engine
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario
+
+# (degree s, coefficients a, initial direction numbers m_1..m_s) of
+# dimensions 2, 3, ... (dimension 1 is the van der Corput sequence)
+_JOE_KUO = (
+    (1, 0, (1,)), (2, 1, (1, 3)), (3, 1, (1, 3, 1)), (3, 2, (1, 1, 1)), (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)), (5, 2, (1, 1, 5, 5, 17)), (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)), (5, 11, (1, 1, 5, 1, 1)), (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)), (6, 1, (1, 3, 3, 9, 7, 49)), (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)), (6, 19, (1, 1, 1, 15, 7, 5)), (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)), (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)), (7, 7, (1, 1, 3, 13, 7, 35, 63)),
+    (7, 8, (1, 3, 5, 9, 1, 25, 53)), (7, 14, (1, 3, 1, 13, 9, 35, 107)),
+    (7, 19, (1, 3, 1, 5, 27, 61, 31)), (7, 21, (1, 1, 5, 11, 19, 41, 61)),
+    (7, 28, (1, 3, 5, 3, 3, 13, 69)), (7, 31, (1, 1, 7, 13, 1, 19, 1)),
+    (7, 32, (1, 3, 7, 5, 13, 19, 59)), (7, 37, (1, 1, 3, 9, 25, 29, 41)),
+    (7, 41, (1, 3, 5, 13, 23, 1, 55)), (7, 42, (1, 3, 7, 3, 13, 59, 17)),
+    (7, 50, (1, 3, 1, 3, 5, 53, 69)), (7, 55, (1, 1, 5, 5, 23, 33, 13)),
+    (7, 56, (1, 1, 7, 7, 1, 61, 123)), (7, 59, (1, 1, 7, 9, 13, 61, 49)),
+    (7, 62, (1, 3, 3, 5, 3, 55, 33)), (8, 14, (1, 3, 1, 15, 31, 13, 49, 245)),
+    (8, 21, (1, 3, 5, 15, 31, 59, 63, 97)), (8, 22, (1, 3, 1, 11, 11, 11, 77, 249)),
+    (8, 38, (1, 3, 1, 11, 27, 43, 71, 9)), (8, 47, (1, 1, 7, 15, 21, 11, 81, 45)),
+    (8, 49, (1, 3, 7, 3, 25, 31, 65, 79)), (8, 50, (1, 3, 1, 1, 19, 11, 3, 205)),
+    (8, 52, (1, 1, 5, 9, 19, 21, 29, 157)), (8, 56, (1, 3, 7, 11, 1, 33, 89, 185)),
+    (8, 67, (1, 3, 3, 3, 15, 9, 79, 71)), (8, 70, (1, 3, 7, 11, 15, 39, 119, 27)),
+    (8, 84, (1, 1, 3, 1, 11, 31, 97, 225)), (8, 97, (1, 1, 1, 3, 23, 43, 57, 177)),
+    (8, 103, (1, 3, 7, 7, 17, 17, 37, 71)), (8, 115, (1, 3, 1, 5, 27, 63, 123, 213)),
+    (8, 122, (1, 1, 3, 5, 11, 43, 53, 133)), (9, 8, (1, 3, 5, 5, 29, 17, 47, 173, 479)),
+    (9, 13, (1, 3, 3, 11, 3, 1, 109, 9, 69)), (9, 16, (1, 1, 1, 5, 17, 39, 23, 5, 343)),
+    (9, 22, (1, 3, 1, 5, 25, 15, 31, 103, 499)), (9, 25, (1, 1, 1, 11, 11, 17, 63, 105, 183)),
+    (9, 44, (1, 1, 5, 11, 9, 29, 97, 231, 363)), (9, 47, (1, 1, 5, 15, 19, 45, 41, 7, 383)),
+    (9, 52, (1, 3, 7, 7, 31, 19, 83, 137, 221)), (9, 55, (1, 1, 1, 3, 23, 15, 111, 223, 83)),
+    (9, 59, (1, 1, 5, 13, 31, 15, 55, 25, 161)), (9, 62, (1, 1, 3, 13, 25, 47, 39, 87, 257)),
+)
+SOBOL_MAX_DIMS = len(_JOE_KUO) + 1
+SOBOL_BITS = 32
+
+# Acklam's rational approximation of the standard normal quantile
+_PPF_A = (
+    -3.969683028665376e01,
+    2.209460984245205e02,
+    -2.759285104469687e02,
+    1.383577518672690e02,
+    -3.066479806614716e01,
+    2.506628277459239e00,
+)
+_PPF_B = (
+    -5.447609879822406e01,
+    1.615858368580409e02,
+    -1.556989798598866e02,
+    6.680131188771972e01,
+    -1.328068155288572e01,
+)
+_PPF_C = (
+    -7.784894002430293e-03,
+    -3.223964580411365e-01,
+    -2.400758277161838e00,
+    -2.549732539343734e00,
+    4.374664141464968e00,
+    2.938163982698783e00,
+)
+_PPF_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e00, 3.754408661907416e00)
+_PPF_LOW = 0.02425
+
+_INDEXED_PATH = re.compile(r"^(.*)\[(\d+)\]$")
+
+
+def _direction_numbers(d: int) -> np.ndarray:
+    """``(d, SOBOL_BITS)`` direction numbers as integers (bit 31 = 1/2)."""
+    v = np.zeros((d, SOBOL_BITS), dtype=np.uint64)
+    v[0] = [1 << (SOBOL_BITS - 1 - k) for k in range(SOBOL_BITS)]
+    for j in range(1, d):
+        s, a, m = _JOE_KUO[j - 1]
+        row = [m[k] << (SOBOL_BITS - 1 - k) for k in range(s)]
+        for k in range(s, SOBOL_BITS):
+            value = row[k - s] ^ (row[k - s] >> s)
+            for i in range(1, s):
+                if (a >> (s - 1 - i)) & 1:
+                    value ^= row[k - i]
+            row.append(value)
+        v[j] = row
+    return v
+
+
+def _parity(x: np.ndarray) -> np.ndarray:
+    for shift in (32, 16, 8, 4, 2, 1):
+        x = x ^ (x >> np.uint64(shift))
+    return x & np.uint64(1)
+
+
+def _scramble(v: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Left-multiply each dimension's generator matrix by a random unit lower-triangular one."""
+    d, bits = v.shape
+    out = np.zeros_like(v)
+    for i in range(bits):
+        # Output bit i (from the top) mixes input bit i with the bits above it
+        position = bits - 1 - i
+        above = rng.integers(0, 1 << i, size=d, dtype=np.uint64)
+        mask = (above << np.uint64(position + 1)) | np.uint64(1 << position)
+        out |= _parity(v & mask[:, None]) << np.uint64(position)
+    return out
+
+
+def sobol_points(
+    n: int, d: int, scramble: bool = True, rng: np.random.Generator | None = None
+) -> np.ndarray:
+    """First *n* points of a *d*-dimensional Sobol sequence, ``(n, d)`` in (0, 1).
+
+    Points are centred in their ``2**-32`` cells, so none is exactly 0 or 1.
+
+    Args:
+        n: Number of points; a power of two keeps every dimension balanced.
+        d: Dimensions, at most :data:`SOBOL_MAX_DIMS`.
+        scramble: Apply a random linear matrix scramble and digital shift
+            (Owen-style randomization preserving the net structure).
+        rng: Generator for the scramble.
+    """
+    if not 1 <= d <= SOBOL_MAX_DIMS:
+        raise ValueError(f"Sobol dimensions must be between 1 and {SOBOL_MAX_DIMS}, got {d}")
+    if n > 1 << SOBOL_BITS:
+        raise ValueError(f"at most 2**{SOBOL_BITS} Sobol points are available")
+    v = _direction_numbers(d)
+    shift = np.zeros(d, dtype=np.uint64)
+    if scramble:
+        rng = rng or np.random.default_rng()
+        v = _scramble(v, rng)
+        shift = rng.integers(0, 1 << SOBOL_BITS, size=d, dtype=np.uint64)
+
+    index = np.arange(n, dtype=np.uint64)
+    x = np.broadcast_to(shift, (n, d)).copy()
+    for k in range(max(int(n - 1).bit_length(), 0)):
+        bit = ((index >> np.uint64(k)) & np.uint64(1)).astype(bool)
+        x[bit] ^= v[:, k]
+    return (x + 0.5) / float(1 << SOBOL_BITS)
+
+
+def normal_ppf(u: np.ndarray) -> np.ndarray:
+    """Standard normal quantile of *u* in (0, 1) (relative error below 1.2e-9)."""
+    u = np.asarray(u, dtype=np.float64)
+    z = np.empty_like(u)
+    a, b, c, d = _PPF_A, _PPF_B, _PPF_C, _PPF_D
+
+    tail = np.minimum(u, 1.0 - u) < _PPF_LOW
+    q = np.sqrt(-2.0 * np.log(np.minimum(u[tail], 1.0 - u[tail])))
+    x = (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / (
+        (((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0
+    )
+    z[tail] = np.where(u[tail] < 0.5, x, -x)
+
+    q = u[~tail] - 0.5
+    r = q * q
+    z[~tail] = (
+        (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5])
+        * q
+        / (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0)
+    )
+    return z
+
+
+@dataclass(frozen=True)
+class UncertainInput:
+    """A scalar scenario value drawn per engagement.
+
+    Either normal (``std``, centred on ``mean`` or the scenario's nominal
+    value) or uniform on ``[low, high]``.
+
+    Attributes:
+        path: Dotted scenario key, optionally indexing a list component
+            (``"target.position[1]"``).
+        std: Standard deviation of a normal input.
+        mean: Normal mean; the scenario's value when None.
+        low, high: Bounds of a uniform input.
+    """
+
+    path: str
+    std: float | None = None
+    mean: float | None = None
+    low: float | None = None
+    high: float | None = None
+
+    def __post_init__(self) -> None:
+        if (self.std is None) == (self.low is None or self.high is None):
+            raise ValueError(f"{self.path}: give either std or both low and high")
+
+    def values(self, u: np.ndarray, scenario: dict) -> np.ndarray:
+        """Input values for uniforms *u*."""
+        if self.std is None:
+            return self.low + (self.high - self.low) * u
+        mean = self.mean if self.mean is not None else _get_value(scenario, self.path)
+        return mean + self.std * normal_ppf(u)
+
+
+def _split_path(path: str) -> tuple[str, int | None]:
+    match = _INDEXED_PATH.match(path)
+    return (match.group(1), int(match.group(2))) if match else (path, None)
+
+
+def _get_value(scenario: dict, path: str) -> float:
+    key, index = _split_path(path)
+    value = scenario
+    try:
+        for name in key.split("."):
+            value = value[name]
+        return float(value if index is None else value[index])
+    except (KeyError, IndexError, TypeError):
+        raise ValueError(f"scenario has no value at {path!r}") from None
+
+
+def uncertain_inputs(scenario: dict) -> list[UncertainInput]:
+    """Inputs declared in the scenario's optional ``uncertainty`` section.
+
+    Example: ``uncertainty: {target.speed: {std: 3.0},
+    "target.position[0]": {low: 2500, high: 3500}}``.
+    """
+    return [UncertainInput(path, **spec) for path, spec in scenario.get("uncertainty", {}).items()]
+
+
+def _overrides(scenario: dict, inputs: Sequence[UncertainInput], values: np.ndarray) -> dict:
+    """Scenario overrides setting every input (list components replace whole lists)."""
+    overrides: dict = {}
+    for spec, value in zip(inputs, values):
+        key, index = _split_path(spec.path)
+        if index is None:
+            overrides[key] = float(value)
+            continue
+        if key not in overrides:
+            section = scenario
+            for name in key.split("."):
+                section = section[name]
+            overrides[key] = list(section)
+        overrides[key][index] = float(value)
+    return overrides
+
+
+class QmcNoise:
+    """Generator stand-in whose first normal draws are fixed QMC values.
+
+    ``normal`` / ``standard_normal`` return *normals* in order, then continue
+    with *rng*; ``random`` always uses *rng*.
+    """
+
+    def __init__(self, normals: np.ndarray, rng: np.random.Generator) -> None:
+        self._normals = np.asarray(normals, dtype=np.float64)
+        self._next = 0
+        self._rng = rng
+
+    def random(self, size: int | tuple[int, ...] | None = None) -> float | np.ndarray:
+        return self._rng.random(size)
+
+    def standard_normal(self, size: int | tuple[int, ...] | None = None) -> float | np.ndarray:
+        n = 1 if size is None else int(np.prod(size))
+        z = self._normals[self._next : self._next + n]
+        self._next += len(z)
+        if len(z) < n:
+            z = np.concatenate([z, self._rng.standard_normal(n - len(z))])
+        return float(z[0]) if size is None else z.reshape(size)
+
+    def normal(
+        self,
+        loc: float = 0.0,
+        scale: float = 1.0,
+        size: int | tuple[int, ...] | None = None,
+    ) -> float | np.ndarray:
+        return loc + scale * self.standard_normal(size)
+
+
+@dataclass
+class QmcEstimate:
+    """A replicated estimate.
+
+    Attributes:
+        mean: Mean of the replicate estimates.
+        std_error: Standard error of :attr:`mean` from the replicate spread.
+        replicates: Per-replicate estimates.
+    """
+
+    mean: float
+    std_error: float
+    replicates: np.ndarray
+
+    @classmethod
+    def from_replicates(cls, values: np.ndarray) -> QmcEstimate:
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) < 2:
+            return cls(float(values.mean()), float("nan"), values)
+        return cls(
+            float(values.mean()), float(values.std(ddof=1) / math.sqrt(len(values))), values
+        )
+
+
+@dataclass
+class QmcResult:
+    """Outcomes of a replicated QMC (or plain Monte Carlo) study.
+
+    Attributes:
+        inputs: Scenario-level inputs varied.
+        values: ``(replicates, n_points, len(inputs))`` input values used.
+        outcomes: Per-run outcomes, row ``r * n_points + i``.
+        n_points: Runs per replicate.
+        method: ``"sobol"`` or ``"random"``.
+    """
+
+    inputs: list[UncertainInput]
+    values: np.ndarray
+    outcomes: BatchResult
+    n_points: int
+    method: str
+
+    @property
+    def replicates(self) -> int:
+        return len(self.outcomes) // self.n_points
+
+    def _per_replicate(self, column: np.ndarray) -> np.ndarray:
+        return column.reshape(self.replicates, self.n_points)
+
+    def pk(self) -> QmcEstimate:
+        """Probability of kill."""
+        return QmcEstimate.from_replicates(self._per_replicate(self.outcomes.hit).mean(axis=1))
+
+    def mean_miss_distance(self) -> QmcEstimate:
+        """Mean closest approach over launched engagements (m)."""
+        miss = self._per_replicate(self.outcomes.miss_distance)
+        launched = ~np.isnan(miss)
+        sums = np.where(launched, miss, 0.0).sum(axis=1)
+        counts = launched.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return QmcEstimate.from_replicates(sums / counts)
+
+
+def run_qmc(
+    scenario: dict,
+    n_points: int,
+    replicates: int = 8,
+    inputs: Sequence[UncertainInput] | None = None,
+    noise_dims: int = 0,
+    method: str = "sobol",
+    seed: int | None = None,
+    use_batch: bool | None = None,
+) -> QmcResult:
+    """Estimate Pk and miss distance from ``replicates`` randomized point sets.
+
+    Args:
+        scenario: Base scenario dictionary.
+        n_points: Engagements per replicate (a power of two for Sobol).
+        replicates: Independent scramblings; at least 2 for a standard error.
+        inputs: Scenario-level inputs; the scenario's ``uncertainty`` section
+            when None.
+        noise_dims: Leading measurement-noise normals per engagement taken
+            from the point set (needs the sequential generator, not
+            ``simulation.counter_rng``).
+        method: ``"sobol"`` or ``"random"`` (plain Monte Carlo, same layout).
+        seed: Seed for scrambles and the pseudo-random remainder.
+        use_batch: Run on :class:`BatchEngine`; by default whenever
+            ``noise_dims`` is 0 and the batch engine supports the scenario.
+
+    Returns:
+        Per-run outcomes and the input values used.
+    """
+    inputs = list(uncertain_inputs(scenario) if inputs is None else inputs)
+    if method not in ("sobol", "random"):
+        raise ValueError(f"unknown method {method!r}")
+    if method == "sobol" and n_points & (n_points - 1):
+        raise ValueError("Sobol point sets need a power-of-two n_points")
+    if noise_dims and scenario.get("simulation", {}).get("counter_rng", False):
+        raise ValueError("QMC measurement noise needs the sequential generator")
+    n_dims = len(inputs) + noise_dims
+    if n_dims == 0:
+        raise ValueError("nothing to sample: give inputs or noise_dims")
+    if use_batch is None:
+        use_batch = noise_dims == 0 and supports_engine(
+            build_from_scenario(scenario)[0], allow_streams=True
+        )
+    elif use_batch and noise_dims:
+        raise ValueError("the batch engine draws its own noise; use noise_dims=0")
+
+    rng = np.random.default_rng(seed)
+    if method == "sobol":
+        u = np.stack([sobol_points(n_points, n_dims, rng=rng) for _ in range(replicates)])
+    else:
+        u = (rng.integers(0, 1 << SOBOL_BITS, size=(replicates, n_points, n_dims)) + 0.5) / float(
+            1 << SOBOL_BITS
+        )
+    values = np.empty((replicates, n_points, len(inputs)))
+    for k, spec in enumerate(inputs):
+        values[..., k] = spec.values(u[..., k], scenario)
+    flat_values = values.reshape(replicates * n_points, len(inputs))
+    scenarios = [apply_overrides(scenario, _overrides(scenario, inputs, v)) for v in flat_values]
+
+    if use_batch:
+        outcomes = BatchEngine.from_scenarios(scenarios, seed=rng).run()
+    else:
+        noise = normal_ppf(u[..., len(inputs) :]).reshape(len(scenarios), noise_dims)
+        run_seeds = rng.integers(2**63, size=len(scenarios))
+        engines = []
+        for i, sc in enumerate(scenarios):
+            engine, _ = build_from_scenario(sc, seed=int(run_seeds[i]), trial=i)
+            if noise_dims:
+                em = engine.engagement
+                em.rng = QmcNoise(noise[i], em.rng)
+            engine.run()
+            engines.append(engine)
+        outcomes = BatchResult.from_runs(engines)
+    return QmcResult(inputs, values, outcomes, n_points, method)
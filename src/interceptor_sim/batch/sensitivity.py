@@ -0,0 +1,201 @@
+"""Variance-based global sensitivity analysis (Sobol indices) of engagement outcomes.
+
+For d uncertain scenario parameters (:class:`~interceptor_sim.batch.qmc.UncertainInput`
+over dotted scenario paths), :func:`sobol_indices` draws two ``N x d``
+sample matrices A and B from one scrambled 2d-dimensional Sobol set and
+forms the d matrices ``AB_i`` (A with column i taken from B). All
+``N (d + 2)`` engagements run in one history-free :class:`BatchEngine`
+pass, and every index is estimated from those same runs:
+
+* first order (Saltelli 2010): ``S_i = mean(f(B) (f(AB_i) - f(A))) / V``;
+* total (Jansen 1999): ``ST_i = mean((f(A) - f(AB_i))**2) / (2 V)``;
+
+with ``V`` the variance of ``f(A)`` and ``f(B)`` together. Confidence
+intervals come from bootstrapping the N sample rows, reusing the
+evaluations, so the cost stays ``N (d + 2)`` runs for any number of
+resamples; 15 parameters at ``N = 256`` are 4352 engagements.
+
+The simulation itself is random. With ``common_random_numbers`` (the
+default) runs use counter-based streams keyed by their sample row, so
+A, B and every ``AB_i`` run of a row see the same sensor noise and
+detection rolls, and index differences reflect the parameters rather than
+fresh noise.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from interceptor_sim.batch.engine import BatchEngine, BatchResult
+from interceptor_sim.batch.qmc import SOBOL_MAX_DIMS, UncertainInput, _overrides, sobol_points
+from interceptor_sim.core.kernel import supports_engine
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario
+
+OUTPUTS: dict[str, Callable[[BatchResult], np.ndarray]] = {
+    "miss_distance": lambda outcomes: outcomes.miss_distance,
+    "hit": lambda outcomes: outcomes.hit.astype(np.float64),
+}
+
+
+def saltelli_matrices(
+    n: int, d: int, rng: np.random.Generator | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Uniform Saltelli design: ``A``, ``B`` (``(n, d)``) and ``AB`` (``(d, n, d)``)."""
+    if 2 * d > SOBOL_MAX_DIMS:
+        raise ValueError(f"at most {SOBOL_MAX_DIMS // 2} parameters are supported")
+    points = sobol_points(n, 2 * d, rng=rng)
+    a, b = points[:, :d], points[:, d:]
+    ab = np.repeat(a[None], d, axis=0)
+    for i in range(d):
+        ab[i, :, i] = b[:, i]
+    return a, b, ab
+
+
+def _estimates(
+    f_a: np.ndarray, f_b: np.ndarray, f_ab: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """First-order and total indices over the last axis (rows); NaN runs are skipped."""
+    variance = np.nanvar(np.concatenate([f_a, f_b], axis=-1), axis=-1)[..., None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        first = np.nanmean(f_b[..., None, :] * (f_ab - f_a[..., None, :]), axis=-1) / variance
+        total = 0.5 * np.nanmean((f_a[..., None, :] - f_ab) ** 2, axis=-1) / variance
+    return first, total
+
+
+@dataclass
+class SobolIndices:
+    """First-order and total Sobol indices with bootstrap intervals.
+
+    Attributes:
+        names: Parameter paths, in input order.
+        first_order: ``(d,)`` first-order indices (share of output variance
+            explained by each parameter alone).
+        total: ``(d,)`` total indices (share including all interactions).
+        first_order_ci, total_ci: ``(d, 2)`` bootstrap intervals.
+        variance: Output variance.
+        n_samples: Sample rows N.
+        n_runs: Engagements simulated, ``N (d + 2)``.
+    """
+
+    names: list[str]
+    first_order: np.ndarray
+    total: np.ndarray
+    first_order_ci: np.ndarray
+    total_ci: np.ndarray
+    variance: float
+    n_samples: int
+    n_runs: int
+
+    def ranking(self) -> list[str]:
+        """Parameter paths by decreasing total index."""
+        return [self.names[i] for i in np.argsort(-self.total, kind="stable")]
+
+    def table(self) -> str:
+        """Plain-text summary, one parameter per row, most influential first."""
+
+        def cell(value: float, ci: np.ndarray) -> str:
+            return f"{value:.3f} [{ci[0]:.3f}, {ci[1]:.3f}]"
+
+        rows = [f"{'parameter':<44} {'S1':>22} {'ST':>22}"]
+        for name in self.ranking():
+            i = self.names.index(name)
+            s1 = cell(self.first_order[i], self.first_order_ci[i])
+            st = cell(self.total[i], self.total_ci[i])
+            rows.append(f"{name:<44} {s1:>22} {st:>22}")
+        return "\n".join(rows)
+
+
+def _run(scenarios: list[dict], rows: np.ndarray, rng: np.random.Generator) -> BatchResult:
+    """Run *scenarios*; counter-stream runs use their sample row as trial id.
+
+    Batch lanes without counter streams share *rng*; scalar runs without them
+    get a seed each, so they do not all replay one noise realization.
+    """
+    stream_seed = int(rng.integers(2**63))
+    engines = [
+        build_from_scenario(sc, seed=stream_seed, trial=int(row))[0]
+        for sc, row in zip(scenarios, rows)
+    ]
+    if all(supports_engine(engine, allow_streams=True) for engine in engines):
+        return BatchEngine.from_engines(engines, rng=rng).run()
+    seeds = rng.integers(2**63, size=len(engines))
+    for i, engine in enumerate(engines):
+        if engine.engagement.streams is None:
+            engine = engines[i] = build_from_scenario(scenarios[i], seed=int(seeds[i]))[0]
+        engine.run()
+    return BatchResult.from_runs(engines)
+
+
+def sobol_indices(
+    scenario: dict,
+    inputs: Sequence[UncertainInput],
+    n_samples: int = 256,
+    output: str | Callable[[BatchResult], np.ndarray] = "miss_distance",
+    n_bootstrap: int = 500,
+    confidence: float = 0.95,
+    common_random_numbers: bool = True,
+    seed: int | None = None,
+) -> SobolIndices:
+    """Estimate first-order and total Sobol indices of an engagement output.
+
+    Args:
+        scenario: Base scenario dictionary.
+        inputs: Parameters and their ranges (uniform ``low``/``high`` or
+            normal ``std``) by dotted scenario path.
+        n_samples: Sample rows N (a power of two).
+        output: ``"miss_distance"`` (runs that never launched are skipped),
+            ``"hit"``, or a function of the :class:`BatchResult` giving one
+            value per run.
+        n_bootstrap: Bootstrap resamples of the rows.
+        confidence: Interval confidence level.
+        common_random_numbers: Give every run of a sample row the same
+            counter-based random streams.
+        seed: Seed for the design, the simulation and the bootstrap.
+
+    Returns:
+        Indices and intervals in input order.
+    """
+    inputs = list(inputs)
+    if not inputs:
+        raise ValueError("sensitivity analysis needs at least one input")
+    if n_samples & (n_samples - 1):
+        raise ValueError("Sobol designs need a power-of-two n_samples")
+    evaluate = OUTPUTS[output] if isinstance(output, str) else output
+    d, n = len(inputs), n_samples
+    rng = np.random.default_rng(seed)
+
+    a, b, ab = saltelli_matrices(n, d, rng)
+    u = np.concatenate([a[None], b[None], ab])  # (d + 2, N, d)
+    values = np.empty_like(u)
+    for k, spec in enumerate(inputs):
+        values[..., k] = spec.values(u[..., k], scenario)
+    base = (
+        apply_overrides(scenario, {"simulation.counter_rng": True})
+        if common_random_numbers
+        else scenario
+    )
+    scenarios = [
+        apply_overrides(base, _overrides(scenario, inputs, v)) for v in values.reshape(-1, d)
+    ]
+    rows = np.tile(np.arange(n), d + 2)
+    f = np.asarray(evaluate(_run(scenarios, rows, rng)), dtype=np.float64).reshape(d + 2, n)
+    f_a, f_b, f_ab = f[0], f[1], f[2:]
+
+    first, total = _estimates(f_a, f_b, f_ab)
+    index = rng.integers(0, n, size=(n_bootstrap, n))
+    boot_first, boot_total = _estimates(f_a[index], f_b[index], f_ab[:, index].transpose(1, 0, 2))
+    tail = 50.0 * (1.0 - confidence)
+    quantiles = [tail, 100.0 - tail]
+    return SobolIndices(
+        names=[spec.path for spec in inputs],
+        first_order=first,
+        total=total,
+        first_order_ci=np.nanpercentile(boot_first, quantiles, axis=0).T,
+        total_ci=np.nanpercentile(boot_total, quantiles, axis=0).T,
+        variance=float(np.nanvar(np.concatenate([f_a, f_b]))),
+        n_samples=n,
+        n_runs=f.size,
+    )
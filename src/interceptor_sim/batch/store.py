@@ -0,0 +1,458 @@
+"""SQLite store of Monte Carlo run outcomes across campaigns.
+
+Runs are grouped into *configs*: one base scenario (by content hash), one
+set of parameter overrides (dotted paths as for
+:func:`~interceptor_sim.core.scenario.apply_overrides`) and one code
+version. Each config row keeps running totals (runs, hits, miss-distance
+sums) updated by every insert, and its parameters are indexed by name and
+value, so aggregate questions such as "Pk vs ``engagement.nav_gain`` for
+scenario X" scan configs rather than runs and stay in the millisecond range
+however many runs are stored. Individual runs (seed, result, miss distance,
+end time, phase entry times) remain queryable as NumPy arrays.
+
+The database uses WAL journaling so readers are not blocked by a campaign
+writing in bulk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import subprocess
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+import interceptor_sim
+from interceptor_sim.batch.engine import BatchResult
+from interceptor_sim.engagement.kill_chain import EngagementResult, Phase
+
+SCHEMA_VERSION = 1
+
+PHASE_COLUMNS = tuple(f"t_{phase.name.lower()}" for phase in Phase)
+RUN_COLUMNS = ("seed", "result", "miss_distance", "end_time") + PHASE_COLUMNS
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value);
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE,
+    name TEXT,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS campaigns (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    code_version TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS configs (
+    id INTEGER PRIMARY KEY,
+    scenario_id INTEGER NOT NULL REFERENCES scenarios(id),
+    params_hash TEXT NOT NULL,
+    params TEXT NOT NULL,
+    code_version TEXT NOT NULL,
+    n_runs INTEGER NOT NULL DEFAULT 0,
+    n_hit INTEGER NOT NULL DEFAULT 0,
+    n_miss_distance INTEGER NOT NULL DEFAULT 0,
+    miss_sum REAL NOT NULL DEFAULT 0,
+    miss_sumsq REAL NOT NULL DEFAULT 0,
+    UNIQUE (scenario_id, params_hash, code_version)
+);
+CREATE TABLE IF NOT EXISTS config_params (
+    config_id INTEGER NOT NULL REFERENCES configs(id),
+    name TEXT NOT NULL,
+    value,
+    PRIMARY KEY (config_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS config_params_by_value ON config_params (name, value, config_id);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    config_id INTEGER NOT NULL REFERENCES configs(id),
+    campaign_id INTEGER NOT NULL REFERENCES campaigns(id),
+    seed INTEGER,
+    result INTEGER NOT NULL,
+    miss_distance REAL,
+    end_time REAL,
+    {", ".join(f"{c} REAL" for c in PHASE_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS runs_by_config ON runs (config_id);
+CREATE INDEX IF NOT EXISTS runs_by_campaign ON runs (campaign_id);
+"""
+
+
+def _jsonable(obj: Any) -> Any:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Cannot store {type(obj).__name__} in a scenario or parameter")
+
+
+def _canonical(obj: Any) -> str:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=_jsonable)
+
+
+def scenario_hash(scenario: dict) -> str:
+    """Content hash of a scenario dict (key order and NumPy types do not matter)."""
+    return hashlib.sha256(_canonical(scenario).encode()).hexdigest()
+
+
+def _param_value(value: Any) -> Any:
+    """SQLite value for a parameter: numbers and strings as-is, anything else as JSON."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    return _canonical(value)
+
+
+def code_version() -> str:
+    """Package version plus the git commit of the source tree when available."""
+    version = interceptor_sim.__version__
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(interceptor_sim.__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return version
+    return f"{version}+g{sha}" if sha else version
+
+
+class ResultsStore:
+    """Run outcomes in an SQLite database.
+
+    Args:
+        path: Database file (created if missing); ``":memory:"`` for a
+            throwaway store.
+        version: Code version recorded with new runs (default
+            :func:`code_version`).
+    """
+
+    def __init__(self, path: str | Path, version: str | None = None) -> None:
+        self.path = str(path)
+        self.version = version if version is not None else code_version()
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            row = self.conn.execute("SELECT value FROM meta WHERE key='schema'").fetchone()
+            if row is None:
+                self.conn.execute("INSERT INTO meta VALUES ('schema', ?)", (SCHEMA_VERSION,))
+            elif row[0] != SCHEMA_VERSION:
+                raise ValueError(f"Unsupported results schema version {row[0]} in {path}")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> ResultsStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- writing ----------------------------------------------------------
+
+    def _scenario_id(self, scenario: dict) -> int:
+        digest = scenario_hash(scenario)
+        self.conn.execute(
+            "INSERT OR IGNORE INTO scenarios (hash, name, body) VALUES (?, ?, ?)",
+            (digest, scenario.get("name"), _canonical(scenario)),
+        )
+        return self.conn.execute("SELECT id FROM scenarios WHERE hash=?", (digest,)).fetchone()[0]
+
+    def _config_id(self, scenario_id: int, params: Mapping[str, Any]) -> int:
+        values = {name: _param_value(v) for name, v in params.items()}
+        text = _canonical(values)
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        key = (scenario_id, digest, self.version)
+        cur = self.conn.execute(
+            "INSERT OR IGNORE INTO configs (scenario_id, params_hash, params, code_version) "
+            "VALUES (?, ?, ?, ?)",
+            (scenario_id, digest, text, self.version),
+        )
+        if cur.rowcount:
+            config_id = cur.lastrowid
+            self.conn.executemany(
+                "INSERT INTO config_params VALUES (?, ?, ?)",
+                [(config_id, name, v) for name, v in values.items()],
+            )
+            return config_id
+        return self.conn.execute(
+            "SELECT id FROM configs WHERE scenario_id=? AND params_hash=? AND code_version=?", key
+        ).fetchone()[0]
+
+    def add_runs(
+        self,
+        scenario: dict,
+        seeds: Sequence[int | None],
+        outcomes: BatchResult,
+        params: Mapping[str, Any] | Sequence[Mapping[str, Any]] | None = None,
+        campaign: str | None = None,
+    ) -> int:
+        """Record a batch of runs in one transaction.
+
+        Args:
+            scenario: Base scenario the runs were built from (before overrides).
+            seeds: Seed of each run.
+            outcomes: Outcomes of the runs (``BatchEngine.run()``,
+                ``SharedResults.outcomes()`` or ``BatchResult.from_runs``).
+            params: Overrides applied to *scenario*: one dict for every run,
+                or one per run.
+            campaign: Optional campaign label.
+
+        Returns:
+            The campaign id the runs were recorded under.
+        """
+        n = len(outcomes)
+        if len(seeds) != n:
+            raise ValueError("need one seed per outcome")
+        if params is None or isinstance(params, Mapping):
+            per_run = None
+            shared = dict(params or {})
+        else:
+            if len(params) != n:
+                raise ValueError("need one parameter dict per outcome")
+            per_run = params
+
+        with self.conn:
+            scenario_id = self._scenario_id(scenario)
+            campaign_id = self.conn.execute(
+                "INSERT INTO campaigns (name, code_version, created) VALUES (?, ?, ?)",
+                (campaign, self.version, time.time()),
+            ).lastrowid
+            if per_run is None:
+                config_of_run = np.full(n, self._config_id(scenario_id, shared))
+            else:
+                cache: dict[str, int] = {}
+                config_of_run = np.empty(n, dtype=np.int64)
+                for k, p in enumerate(per_run):
+                    key = _canonical({name: _param_value(v) for name, v in p.items()})
+                    if key not in cache:
+                        cache[key] = self._config_id(scenario_id, p)
+                    config_of_run[k] = cache[key]
+
+            miss = np.asarray(outcomes.miss_distance, dtype=np.float64)
+            rows = zip(
+                config_of_run.tolist(),
+                [campaign_id] * n,
+                [None if s is None else int(s) for s in seeds],
+                np.asarray(outcomes.result).astype(np.int64).tolist(),
+                *(
+                    np.where(np.isnan(col), None, col).tolist()
+                    for col in (
+                        miss,
+                        np.asarray(outcomes.end_time, dtype=np.float64),
+                        *np.asarray(outcomes.phase_times, dtype=np.float64).T,
+                    )
+                ),
+            )
+            columns = ("config_id", "campaign_id") + RUN_COLUMNS
+            self.conn.executemany(
+                f"INSERT INTO runs ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})",
+                rows,
+            )
+
+            # Running totals per config
+            configs, inverse = np.unique(config_of_run, return_inverse=True)
+            hit = np.asarray(outcomes.result) == EngagementResult.HIT.value
+            valid = ~np.isnan(miss)
+            miss0 = np.where(valid, miss, 0.0)
+            self.conn.executemany(
+                "UPDATE configs SET n_runs = n_runs + ?, n_hit = n_hit + ?, "
+                "n_miss_distance = n_miss_distance + ?, miss_sum = miss_sum + ?, "
+                "miss_sumsq = miss_sumsq + ? WHERE id = ?",
+                zip(
+                    np.bincount(inverse).tolist(),
+                    np.bincount(inverse, weights=hit).astype(np.int64).tolist(),
+                    np.bincount(inverse, weights=valid).astype(np.int64).tolist(),
+                    np.bincount(inverse, weights=miss0).tolist(),
+                    np.bincount(inverse, weights=miss0 * miss0).tolist(),
+                    configs.tolist(),
+                ),
+            )
+        return campaign_id
+
+    # --- queries ----------------------------------------------------------
+
+    def _filters(
+        self,
+        scenario: dict | str | None,
+        where: Mapping[str, Any] | None,
+        code_version: str | None,
+    ) -> tuple[str, list[Any]]:
+        clauses, args = [], []
+        if scenario is not None:
+            digest = scenario if isinstance(scenario, str) else scenario_hash(scenario)
+            clauses.append("c.scenario_id = (SELECT id FROM scenarios WHERE hash = ?)")
+            args.append(digest)
+        if code_version is not None:
+            clauses.append("c.code_version = ?")
+            args.append(code_version)
+        for name, value in (where or {}).items():
+            clauses.append(
+                "EXISTS (SELECT 1 FROM config_params w "
+                "WHERE w.config_id = c.id AND w.name = ? AND w.value = ?)"
+            )
+            args += [name, _param_value(value)]
+        return (" AND ".join(clauses) or "1"), args
+
+    def pk_by(
+        self,
+        param: str,
+        scenario: dict | str | None = None,
+        where: Mapping[str, Any] | None = None,
+        code_version: str | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Pk and miss-distance statistics grouped by the value of *param*.
+
+        Args:
+            param: Dotted parameter name, e.g. ``"engagement.nav_gain"``.
+            scenario: Base scenario dict or its :func:`scenario_hash`.
+            where: Other parameters to hold fixed, ``{name: value}``.
+            code_version: Restrict to runs recorded by one code version.
+
+        Returns:
+            Dict of arrays sorted by value: ``value``, ``n`` (runs), ``hits``,
+            ``pk``, ``mean_miss`` and ``std_miss`` (over launched runs).
+        """
+        clause, args = self._filters(scenario, where, code_version)
+        rows = self.conn.execute(
+            "SELECT p.value, SUM(c.n_runs), SUM(c.n_hit), SUM(c.n_miss_distance), "
+            "SUM(c.miss_sum), SUM(c.miss_sumsq) "
+            "FROM configs c JOIN config_params p ON p.config_id = c.id AND p.name = ? "
+            f"WHERE {clause} GROUP BY p.value ORDER BY p.value",
+            [param, *args],
+        ).fetchall()
+        values = [r[0] for r in rows]
+        n, hits, n_miss, s1, s2 = (
+            np.array([r[k] for r in rows], dtype=np.float64).reshape(len(rows))
+            for k in range(1, 6)
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = s1 / n_miss
+            std = np.sqrt(np.maximum(s2 / n_miss - mean * mean, 0.0))
+            pk = hits / n
+        is_number = all(isinstance(v, (int, float)) for v in values)
+        return {
+            "value": np.array(values, dtype=np.float64 if is_number else object),
+            "n": n.astype(np.int64),
+            "hits": hits.astype(np.int64),
+            "pk": pk,
+            "mean_miss": mean,
+            "std_miss": std,
+        }
+
+    def configs(
+        self,
+        scenario: dict | str | None = None,
+        where: Mapping[str, Any] | None = None,
+        code_version: str | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Run totals per stored configuration, without reading individual runs.
+
+        Returns:
+            Dict of arrays over configurations with runs: ``params`` (override
+            dicts; non-scalar values are JSON text, as in :meth:`runs`), ``n``,
+            ``hits``, ``n_miss`` (launched runs) and ``miss_sum`` /
+            ``miss_sumsq`` over their miss distances.
+        """
+        clause, args = self._filters(scenario, where, code_version)
+        rows = self.conn.execute(
+            "SELECT c.params, c.n_runs, c.n_hit, c.n_miss_distance, c.miss_sum, c.miss_sumsq "
+            f"FROM configs c WHERE {clause} AND c.n_runs > 0 ORDER BY c.id",
+            args,
+        ).fetchall()
+        params = np.empty(len(rows), dtype=object)
+        params[:] = [json.loads(r[0]) for r in rows]
+        n, hits, n_miss = (
+            np.array([r[k] for r in rows], dtype=np.int64).reshape(len(rows)) for k in (1, 2, 3)
+        )
+        s1, s2 = (
+            np.array([r[k] for r in rows], dtype=np.float64).reshape(len(rows)) for k in (4, 5)
+        )
+        return {
+            "params": params,
+            "n": n,
+            "hits": hits,
+            "n_miss": n_miss,
+            "miss_sum": s1,
+            "miss_sumsq": s2,
+        }
+
+    def runs(
+        self,
+        scenario: dict | str | None = None,
+        where: Mapping[str, Any] | None = None,
+        params: Sequence[str] = (),
+        code_version: str | None = None,
+        campaign: int | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Individual runs as columns.
+
+        Returns ``seed``, ``result``, ``miss_distance``, ``end_time`` and
+        ``phase_times`` (``(N, len(Phase))``, like ``BatchResult``), plus one
+        array per name in *params*.
+        """
+        clause, args = self._filters(scenario, where, code_version)
+        if campaign is not None:
+            clause += " AND r.campaign_id = ?"
+            args.append(campaign)
+        selects = [f"r.{c}" for c in RUN_COLUMNS]
+        joins = []
+        for k, name in enumerate(params):
+            joins.append(
+                f"LEFT JOIN config_params p{k} ON p{k}.config_id = c.id AND p{k}.name = ?"
+            )
+            selects.append(f"p{k}.value")
+        rows = self.conn.execute(
+            f"SELECT {', '.join(selects)} FROM runs r JOIN configs c ON c.id = r.config_id "
+            f"{' '.join(joins)} WHERE {clause} ORDER BY r.id",
+            [*params, *args],
+        ).fetchall()
+        columns = list(zip(*rows)) if rows else [()] * len(selects)
+
+        def floats(col):
+            return np.array(col, dtype=np.float64)  # None -> NaN
+
+        out = {
+            "seed": np.array([-1 if v is None else v for v in columns[0]], dtype=np.int64),
+            "result": np.array(columns[1], dtype=np.int8),
+            "miss_distance": floats(columns[2]),
+            "end_time": floats(columns[3]),
+            "phase_times": np.stack(
+                [floats(columns[4 + k]) for k in range(len(PHASE_COLUMNS))], axis=-1
+            ),
+        }
+        for k, name in enumerate(params):
+            col = columns[len(RUN_COLUMNS) + k]
+            is_number = all(isinstance(v, (int, float)) for v in col)
+            out[name] = np.array(col, dtype=np.float64 if is_number else object)
+        return out
+
+    def scenarios(self) -> list[dict[str, Any]]:
+        """Stored scenarios with their run counts."""
+        rows = self.conn.execute(
+            "SELECT s.hash, s.name, COALESCE(SUM(c.n_runs), 0) FROM scenarios s "
+            "LEFT JOIN configs c ON c.scenario_id = s.id GROUP BY s.id ORDER BY s.id"
+        ).fetchall()
+        return [{"hash": h, "name": name, "n_runs": n} for h, name, n in rows]
+
+    def scenario(self, digest: str) -> dict:
+        """The stored scenario dict for a hash."""
+        row = self.conn.execute("SELECT body FROM scenarios WHERE hash = ?", (digest,)).fetchone()
+        if row is None:
+            raise KeyError(digest)
+        return json.loads(row[0])
@@ -0,0 +1,453 @@
+"""Gaussian-process surrogates of Pk and miss distance for instant what-if queries.
+
+A :class:`Surrogate` is trained on Monte Carlo outcomes over a few scenario
+parameters (:class:`~interceptor_sim.batch.qmc.UncertainInput` ranges over
+dotted paths), typically read from a
+:class:`~interceptor_sim.batch.store.ResultsStore`. Runs are grouped by
+parameter configuration; each configuration contributes its hit fraction
+and mean miss distance, with their sampling variances (binomial for Pk,
+``s²/n`` for miss distance) as per-point noise, so configurations backed
+by many runs pin the model down more than single runs do.
+
+Each output is modelled by a :class:`GaussianProcess` with an ARD
+squared-exponential kernel on inputs scaled to [0, 1]; hyperparameters
+maximize the marginal likelihood. Prediction needs one kernel row and two
+dot products per output, so a query takes tens of microseconds.
+
+Active learning (:meth:`Surrogate.refine`, or ``query(...,
+max_pk_std=...)``) simulates new configurations where the Pk prediction
+is least certain, through :func:`~interceptor_sim.core.scenario.build_from_scenario`,
+records them in the store and refits.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from interceptor_sim.batch.engine import BatchEngine, BatchResult
+from interceptor_sim.batch.qmc import (
+    UncertainInput,
+    _get_value,
+    _overrides,
+    _split_path,
+    sobol_points,
+)
+from interceptor_sim.batch.store import ResultsStore
+from interceptor_sim.core.kernel import supports_engine
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario
+
+# Multipliers tried per hyperparameter in each coordinate-search sweep
+_SEARCH_STEPS = (0.25, 0.5, 0.8, 1.25, 2.0, 4.0)
+_SEARCH_SWEEPS = 6
+# Jitter added to the kernel diagonal (standardized units)
+_JITTER = 1e-8
+
+
+class GaussianProcess:
+    """GP regression with an ARD squared-exponential kernel and known per-point noise.
+
+    Inputs should be scaled to roughly [0, 1]; targets are standardized
+    internally.
+    """
+
+    def __init__(self) -> None:
+        self.length_scales: np.ndarray | None = None
+        self.signal_variance = 1.0
+
+    def _kernel(self, a: np.ndarray, b: np.ndarray, length_scales: np.ndarray, variance: float):
+        d = (a[:, None, :] - b[None, :, :]) / length_scales
+        return variance * np.exp(-0.5 * np.einsum("ijk,ijk->ij", d, d))
+
+    def _log_likelihood(self, length_scales: np.ndarray, variance: float) -> float:
+        k = self._kernel(self._x, self._x, length_scales, variance)
+        k[np.diag_indices_from(k)] += self._noise + _JITTER
+        try:
+            chol = np.linalg.cholesky(k)
+        except np.linalg.LinAlgError:
+            return -math.inf
+        alpha = np.linalg.solve(chol.T, np.linalg.solve(chol, self._y))
+        return float(-0.5 * self._y @ alpha - np.log(np.diag(chol)).sum())
+
+    def fit(self, x: np.ndarray, y: np.ndarray, noise_variance: np.ndarray) -> GaussianProcess:
+        """Fit to targets *y* observed with variances *noise_variance* at inputs *x*."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        self._mean = float(y.mean())
+        self._scale = float(y.std()) or 1.0
+        self._x = x
+        self._y = (y - self._mean) / self._scale
+        self._noise = np.asarray(noise_variance, dtype=np.float64) / self._scale**2
+
+        # Coordinate search on log length scales and signal variance
+        params = np.append(np.full(x.shape[1], 0.3), 1.0)
+        best = self._log_likelihood(params[:-1], params[-1])
+        for _ in range(_SEARCH_SWEEPS):
+            improved = False
+            for j in range(len(params)):
+                for step in _SEARCH_STEPS:
+                    trial = params.copy()
+                    trial[j] *= step
+                    value = self._log_likelihood(trial[:-1], trial[-1])
+                    if value > best + 1e-9:
+                        best, params, improved = value, trial, True
+            if not improved:
+                break
+        self.length_scales, self.signal_variance = params[:-1], float(params[-1])
+
+        k = self._kernel(x, x, self.length_scales, self.signal_variance)
+        k[np.diag_indices_from(k)] += self._noise + _JITTER
+        k_inv = np.linalg.inv(k)
+        self._alpha = k_inv @ self._y
+        self._k_inv = k_inv
+        self._x_scaled = x / self.length_scales
+        return self
+
+    def predict(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Predictive mean and standard deviation (excluding observation noise)."""
+        x = np.atleast_2d(np.asarray(x, dtype=np.float64)) / self.length_scales
+        d = x[:, None, :] - self._x_scaled[None, :, :]
+        k = self.signal_variance * np.exp(-0.5 * np.einsum("ijk,ijk->ij", d, d))
+        mean = k @ self._alpha
+        var = self.signal_variance - np.einsum("ij,jk,ik->i", k, self._k_inv, k)
+        std = np.sqrt(np.maximum(var, 0.0))
+        return self._mean + self._scale * mean, self._scale * std
+
+
+@dataclass
+class TrainingSet:
+    """Monte Carlo outcomes aggregated per parameter configuration.
+
+    Attributes:
+        x: ``(M, d)`` parameter values.
+        n: Runs per configuration.
+        hits: Hits per configuration.
+        n_miss: Runs with a miss distance (launched).
+        miss_mean, miss_var: Mean and sample variance of their miss distance.
+    """
+
+    x: np.ndarray
+    n: np.ndarray
+    hits: np.ndarray
+    n_miss: np.ndarray
+    miss_mean: np.ndarray
+    miss_var: np.ndarray
+
+    @classmethod
+    def from_runs(cls, x: np.ndarray, outcomes: BatchResult) -> TrainingSet:
+        """Group per-run parameter rows *x* (``(N, d)``) and their outcomes."""
+        miss = np.asarray(outcomes.miss_distance, dtype=np.float64)
+        launched = ~np.isnan(miss)
+        miss0 = np.where(launched, miss, 0.0)
+        return cls.from_totals(
+            x, np.ones(len(miss)), outcomes.hit, launched, miss0, miss0 * miss0
+        )
+
+    @classmethod
+    def from_totals(
+        cls,
+        x: np.ndarray,
+        n: np.ndarray,
+        hits: np.ndarray,
+        n_miss: np.ndarray,
+        miss_sum: np.ndarray,
+        miss_sumsq: np.ndarray,
+    ) -> TrainingSet:
+        """Group rows of run totals at parameter rows *x* (rows with equal *x* are pooled)."""
+        x = np.asarray(x, dtype=np.float64)
+        configs, inverse = np.unique(x, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        def total(values):
+            return np.bincount(inverse, weights=values, minlength=len(configs))
+
+        pooled_n = total(n_miss)
+        s1, s2 = total(miss_sum), total(miss_sumsq)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = s1 / pooled_n
+            var = (s2 - pooled_n * mean * mean) / (pooled_n - 1.0)
+        return cls(
+            x=configs,
+            n=total(n).astype(np.int64),
+            hits=total(hits),
+            n_miss=pooled_n,
+            miss_mean=mean,
+            miss_var=np.where(pooled_n > 1, np.maximum(var, 0.0), np.nan),
+        )
+
+    def merged(self, other: TrainingSet) -> TrainingSet:
+        """Both sets' runs, re-grouped (configurations present in both are pooled)."""
+        x = np.concatenate([self.x, other.x])
+        configs, inverse = np.unique(x, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        def total(values):
+            return np.bincount(inverse, weights=values, minlength=len(configs))
+
+        n_miss = np.concatenate([self.n_miss, other.n_miss])
+        mean = np.nan_to_num(np.concatenate([self.miss_mean, other.miss_mean]))
+        var = np.nan_to_num(np.concatenate([self.miss_var, other.miss_var]))
+        s1 = total(n_miss * mean)
+        s2 = total((n_miss - 1.0).clip(0.0) * var + n_miss * mean * mean)
+        pooled_n = total(n_miss)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pooled_mean = s1 / pooled_n
+            pooled_var = (s2 - pooled_n * pooled_mean**2) / (pooled_n - 1.0)
+        return TrainingSet(
+            x=configs,
+            n=total(np.concatenate([self.n, other.n])).astype(np.int64),
+            hits=total(np.concatenate([self.hits, other.hits])),
+            n_miss=pooled_n,
+            miss_mean=pooled_mean,
+            miss_var=np.where(pooled_n > 1, np.maximum(pooled_var, 0.0), np.nan),
+        )
+
+
+@dataclass
+class SurrogatePrediction:
+    """Surrogate answer for one query (standard deviations are of the model mean)."""
+
+    pk: float
+    pk_std: float
+    miss_distance: float
+    miss_distance_std: float
+
+
+class Surrogate:
+    """Pk and mean-miss-distance model over scenario parameters.
+
+    Args:
+        scenario: Base scenario the parameters override.
+        inputs: Modelled parameters with their ``low``/``high`` ranges.
+        store: Results store to read training runs from and record new
+            simulations in (optional).
+        trials_per_point: Runs per configuration simulated by active learning.
+        seed: Seed for active-learning candidates and simulations.
+    """
+
+    def __init__(
+        self,
+        scenario: dict,
+        inputs: Sequence[UncertainInput],
+        store: ResultsStore | None = None,
+        trials_per_point: int = 32,
+        seed: int | None = None,
+    ) -> None:
+        self.scenario = scenario
+        self.inputs = list(inputs)
+        if any(spec.low is None for spec in self.inputs):
+            raise ValueError("surrogate inputs need low/high ranges")
+        self.names = [spec.path for spec in self.inputs]
+        self.low = np.array([spec.low for spec in self.inputs], dtype=np.float64)
+        self.high = np.array([spec.high for spec in self.inputs], dtype=np.float64)
+        self.store = store
+        self.trials_per_point = trials_per_point
+        self.rng = np.random.default_rng(seed)
+        self.data: TrainingSet | None = None
+        self.pk_model = GaussianProcess()
+        self.miss_model = GaussianProcess()
+        self.simulated_runs = 0
+
+    # --- training data ---------------------------------------------------
+
+    def load_store(self, code_version: str | None = None) -> TrainingSet:
+        """Add the store's runs of this scenario and refit.
+
+        Only configurations that override nothing but the modelled inputs
+        are used, so runs of other campaigns (a ``nav_gain`` sweep, say) are
+        not pooled in at the nominal values. Runs are read as per-config
+        totals.
+
+        Args:
+            code_version: Code version whose runs to use; the store's own
+                version by default.
+        """
+        if self.store is None:
+            raise ValueError("no results store attached")
+        version = self.store.version if code_version is None else code_version
+        stats = self.store.configs(scenario=self.scenario, code_version=version)
+        rows = [self._config_row(params) for params in stats["params"]]
+        keep = np.array([row is not None for row in rows], dtype=bool)
+        x = np.array([row for row in rows if row is not None], dtype=np.float64)
+        data = TrainingSet.from_totals(
+            x.reshape(-1, len(self.names)),
+            *(stats[k][keep] for k in ("n", "hits", "n_miss", "miss_sum", "miss_sumsq")),
+        )
+        self.data = data if self.data is None else self.data.merged(data)
+        self.fit()
+        return self.data
+
+    def _config_row(self, params: Mapping) -> list[float] | None:
+        """Input values of a stored configuration; None if it sets anything else."""
+        modelled: dict[str, set[int | None]] = {}
+        for name in self.names:
+            key, index = _split_path(name)
+            modelled.setdefault(key, set()).add(index)
+        decoded = {}
+        for key, value in params.items():
+            if key not in modelled:
+                return None
+            if isinstance(value, str):
+                value = json.loads(value)
+            # A list override: its unmodelled components must be nominal
+            if None not in modelled[key] and any(
+                float(v) != _get_value(self.scenario, f"{key}[{i}]")
+                for i, v in enumerate(value)
+                if i not in modelled[key]
+            ):
+                return None
+            decoded[key] = value
+        row = []
+        for name in self.names:
+            key, index = _split_path(name)
+            if key not in decoded:
+                row.append(float(_get_value(self.scenario, name)))
+            else:
+                value = decoded[key]
+                row.append(float(value if index is None else value[index]))
+        return row
+
+    def add(
+        self,
+        x: np.ndarray,
+        outcomes: BatchResult,
+        seeds: Sequence[int | None] | None = None,
+        record: bool = True,
+    ) -> TrainingSet:
+        """Add runs at parameter rows *x* (recording them in the store) and refit."""
+        x = np.asarray(x, dtype=np.float64).reshape(len(outcomes), len(self.names))
+        if record and self.store is not None and len(outcomes):
+            params = [_overrides(self.scenario, self.inputs, row) for row in x]
+            seeds = [None] * len(outcomes) if seeds is None else seeds
+            self.store.add_runs(self.scenario, seeds, outcomes, params=params, campaign="surrogate")
+        new = TrainingSet.from_runs(x, outcomes)
+        self.data = new if self.data is None else self.data.merged(new)
+        self.fit()
+        return self.data
+
+    def fit(self) -> None:
+        """Refit both models to the current training set."""
+        data = self.data
+        if data is None or len(data.n) == 0:
+            raise ValueError("no training data")
+        u = self._scaled(data.x)
+        # Laplace-smoothed binomial variance keeps all-hit / no-hit configs informative
+        p = (data.hits + 1.0) / (data.n + 2.0)
+        self.pk_model.fit(u, data.hits / data.n, p * (1.0 - p) / data.n)
+
+        launched = data.n_miss > 0
+        if launched.any():
+            var = data.miss_var[launched]
+            fallback = np.nanmedian(var) if np.isfinite(var).any() else 1.0
+            var = np.where(np.isfinite(var), var, fallback)
+            self.miss_model.fit(
+                u[launched], data.miss_mean[launched], var / data.n_miss[launched]
+            )
+
+    def _scaled(self, x: np.ndarray) -> np.ndarray:
+        return (np.asarray(x, dtype=np.float64) - self.low) / (self.high - self.low)
+
+    def _row(self, values: Mapping[str, float]) -> np.ndarray:
+        unknown = set(values) - set(self.names)
+        if unknown:
+            raise KeyError(f"not a surrogate input: {sorted(unknown)}")
+        return np.array(
+            [values.get(name, _get_value(self.scenario, name)) for name in self.names],
+            dtype=np.float64,
+        )
+
+    # --- queries ----------------------------------------------------------
+
+    def predict(self, x: np.ndarray) -> tuple[np.ndarray, ...]:
+        """Vectorized predictions at ``(n, d)`` parameter rows.
+
+        Returns:
+            ``(pk, pk_std, miss_distance, miss_distance_std)`` arrays; Pk is
+            clipped to [0, 1].
+        """
+        u = self._scaled(np.atleast_2d(x))
+        pk, pk_std = self.pk_model.predict(u)
+        if self.miss_model.length_scales is None:
+            miss = miss_std = np.full(len(u), np.nan)
+        else:
+            miss, miss_std = self.miss_model.predict(u)
+        return np.clip(pk, 0.0, 1.0), pk_std, miss, miss_std
+
+    def query(
+        self, values: Mapping[str, float], max_pk_std: float | None = None
+    ) -> SurrogatePrediction:
+        """Predict at one configuration (missing inputs take the scenario's value).
+
+        With *max_pk_std*, an answer less certain than that triggers
+        simulations at the queried point (repeated while it stays uncertain,
+        at most four times) before answering.
+        """
+        row = self._row(values)
+        pk, pk_std, miss, miss_std = self.predict(row[None])
+        for _ in range(4 if max_pk_std is not None else 0):
+            if pk_std[0] <= max_pk_std:
+                break
+            self.simulate(row[None])
+            pk, pk_std, miss, miss_std = self.predict(row[None])
+        return SurrogatePrediction(
+            float(pk[0]), float(pk_std[0]), float(miss[0]), float(miss_std[0])
+        )
+
+    # --- active learning --------------------------------------------------
+
+    def simulate(self, x: np.ndarray) -> BatchResult:
+        """Run ``trials_per_point`` engagements at each parameter row and add them."""
+        x = np.repeat(np.atleast_2d(np.asarray(x, dtype=np.float64)), self.trials_per_point, axis=0)
+        seeds = self.rng.integers(2**63, size=len(x))
+        engines = [
+            build_from_scenario(
+                apply_overrides(self.scenario, _overrides(self.scenario, self.inputs, row)),
+                seed=int(seed),
+                trial=i,
+            )[0]
+            for i, (row, seed) in enumerate(zip(x, seeds))
+        ]
+        if all(supports_engine(engine, allow_streams=True) for engine in engines):
+            # Batch lanes draw from the shared generator, so per-run seeds don't apply
+            outcomes = BatchEngine.from_engines(engines, rng=self.rng).run()
+            run_seeds = None
+        else:
+            for engine in engines:
+                engine.run()
+            outcomes = BatchResult.from_runs(engines)
+            run_seeds = [int(seed) for seed in seeds]
+        self.simulated_runs += len(x)
+        self.add(x, outcomes, seeds=run_seeds)
+        return outcomes
+
+    def refine(
+        self, rounds: int = 4, points_per_round: int = 4, n_candidates: int = 512
+    ) -> np.ndarray:
+        """Simulate the most uncertain configurations, *rounds* times.
+
+        Each round scores a scrambled Sobol candidate set over the input
+        ranges by Pk predictive standard deviation and simulates the
+        *points_per_round* highest (or a space-filling start when the model
+        has no data yet).
+
+        Returns:
+            Largest Pk standard deviation among the candidates after each round.
+        """
+        d = len(self.names)
+        history = []
+        for _ in range(rounds):
+            candidates = self.low + (self.high - self.low) * sobol_points(
+                n_candidates, d, rng=self.rng
+            )
+            if self.data is None:
+                chosen = candidates[:points_per_round]
+            else:
+                _, pk_std, _, _ = self.predict(candidates)
+                chosen = candidates[np.argsort(-pk_std)[:points_per_round]]
+            self.simulate(chosen)
+            history.append(float(self.predict(candidates)[1].max()))
+        return np.array(history)
@@ -0,0 +1,183 @@
+"""Parameter sweeps that simulate the shared engagement prefix once per seed.
+
+Most guidance parameters are only read from some phase on: ``nav_gain``
+first matters in TERMINAL, ``terminal_handover_range`` in MIDCOURSE. With a
+fixed seed every sweep cell therefore replays an identical
+SEARCH → TRACK → CLASSIFY → LAUNCH (and, for terminal-only sweeps,
+MIDCOURSE) prefix, RNG draws included. :func:`run_sweep` runs that prefix
+once per seed, stops the engine where the first swept field is read,
+forks it (:meth:`SimulationEngine.fork` copies the RNG state) and applies
+each cell's values to its branch. Every cell's outcome is identical to an
+independent run of the cell's scenario with the same seed.
+
+With ``engagement.early_termination`` set, the MIDCOURSE reachability check
+also reads the fields in :data:`REACHABILITY_FIELDS`, which then matter
+from MIDCOURSE on.
+
+Fields missing from :data:`FIRST_PHASE` are assumed to matter from SEARCH
+on, which disables sharing rather than risk a wrong result.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from interceptor_sim.batch.engine import BatchResult
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario
+from interceptor_sim.engagement.kill_chain import Phase
+
+# Scenario key -> first phase whose logic reads it. Each key is also the
+# engine attribute path set on a fork (scenario values are used unconverted).
+FIRST_PHASE: dict[str, Phase] = {
+    "engagement.nav_gain": Phase.TERMINAL,
+    "engagement.terminal_guidance": Phase.TERMINAL,
+    "interceptor.kill_radius": Phase.TERMINAL,
+    "engagement.terminal_handover_range": Phase.MIDCOURSE,
+    "engagement.stern_offset": Phase.MIDCOURSE,
+    "engagement.approach_blend_range": Phase.MIDCOURSE,
+    "interceptor.max_flight_time": Phase.MIDCOURSE,
+}
+
+# Fields the early-termination reachability check reads in MIDCOURSE. The
+# others it reads (speed, turn rate, flight time, target path) are set before
+# MIDCOURSE or missing from FIRST_PHASE.
+REACHABILITY_FIELDS: tuple[str, ...] = ("interceptor.kill_radius",)
+
+
+def first_affected_phase(keys: Sequence[str], early_termination: bool = False) -> Phase:
+    """Earliest phase influenced by any of the scenario *keys*."""
+    table = FIRST_PHASE
+    if early_termination:
+        table = {**FIRST_PHASE, **dict.fromkeys(REACHABILITY_FIELDS, Phase.MIDCOURSE)}
+    phases = [table.get(key, Phase.SEARCH) for key in keys]
+    return min(phases, key=lambda phase: phase.value, default=Phase.COMPLETE)
+
+
+def _get_dotted(root: Any, path: str) -> Any:
+    for name in path.split("."):
+        root = getattr(root, name)
+    return root
+
+
+@dataclass
+class SweepResult:
+    """Outcomes of a sweep, one row per (cell, seed) in cell-major order.
+
+    Attributes:
+        cells: Override dict per cell.
+        seeds: Seeds run for every cell.
+        outcomes: Per-run outcomes; row ``c * len(seeds) + s``.
+        fork_phase: Phase at which runs were forked (SEARCH = no sharing).
+        simulated_ticks: Ticks actually simulated, shared prefixes once.
+    """
+
+    cells: list[dict[str, Any]]
+    seeds: list[int | None]
+    outcomes: BatchResult
+    fork_phase: Phase
+    simulated_ticks: int
+
+    @property
+    def total_ticks(self) -> int:
+        """Ticks independent runs of every cell would have simulated."""
+        return int(self.outcomes.ticks.sum())
+
+    @property
+    def saved_fraction(self) -> float:
+        return 1.0 - self.simulated_ticks / self.total_ticks if self.total_ticks else 0.0
+
+    def pk(self) -> np.ndarray:
+        """Probability of kill per cell."""
+        return self.outcomes.hit.reshape(len(self.cells), len(self.seeds)).mean(axis=1)
+
+    def cell(self, index: int) -> BatchResult:
+        n = len(self.seeds)
+        return self.outcomes.take(np.arange(index * n, (index + 1) * n))
+
+
+def run_sweep(
+    scenario: dict,
+    cells: Sequence[dict[str, Any]],
+    seeds: Sequence[int | None],
+    use_kernel: bool | None = None,
+    share_prefix: bool = True,
+) -> SweepResult:
+    """Run every cell of a parameter sweep for every seed.
+
+    Args:
+        scenario: Base scenario dictionary.
+        cells: Per-cell overrides by dotted scenario key (see
+            :func:`~interceptor_sim.core.scenario.apply_overrides`).
+        seeds: Seeds; each cell runs once per seed.
+        use_kernel: Override the scenario's ``simulation.use_kernel``.
+        share_prefix: Set False to run every (cell, seed) independently.
+
+    Returns:
+        Outcomes and tick accounting.
+    """
+    cells = [dict(cell) for cell in cells]
+    seeds = list(seeds)
+    if not cells:
+        raise ValueError("a sweep needs at least one cell")
+
+    keys = sorted({key for cell in cells for key in cell})
+    base = apply_overrides(scenario, cells[0])
+    defaults, _ = build_from_scenario(scenario)
+    swept = [
+        key
+        for key in keys
+        if any(key not in cell or cell[key] != cells[0].get(key) for cell in cells)
+    ]
+    early_termination = any(
+        apply_overrides(scenario, cell)["engagement"].get("early_termination", False)
+        for cell in cells
+    )
+    fork_phase = (
+        first_affected_phase(swept, early_termination) if share_prefix else Phase.SEARCH
+    )
+
+    runs: list = [None] * (len(cells) * len(seeds))
+    simulated = 0
+    for s, seed in enumerate(seeds):
+        if fork_phase == Phase.SEARCH:
+            for c, cell in enumerate(cells):
+                engine, _ = build_from_scenario(apply_overrides(scenario, cell), seed=seed)
+                if use_kernel is not None:
+                    engine.use_kernel = use_kernel
+                engine.run()
+                simulated += len(engine.history) - 1
+                runs[c * len(seeds) + s] = engine
+            continue
+
+        prefix, _ = build_from_scenario(base, seed=seed)
+        if use_kernel is not None:
+            prefix.use_kernel = use_kernel
+        alive = prefix.run_until(fork_phase)
+        prefix_ticks = len(prefix.history) - (0 if alive else 1)
+        simulated += prefix_ticks
+        if not alive:
+            # Finished before any swept field was read: one outcome for all cells
+            for c in range(len(cells)):
+                runs[c * len(seeds) + s] = prefix
+            continue
+
+        params = [
+            {key: cell[key] if key in cell else _get_dotted(defaults, key) for key in swept}
+            for cell in cells
+        ]
+        for c, branch in enumerate(prefix.fork(len(cells), params=params)):
+            branch.run()
+            simulated += len(branch.history) - 1 - prefix_ticks
+            runs[c * len(seeds) + s] = branch
+
+    return SweepResult(
+        cells=cells,
+        seeds=seeds,
+        outcomes=BatchResult.from_runs(runs),
+        fork_phase=fork_phase,
+        simulated_ticks=simulated,
+    )
@@ -0,0 +1,131 @@
+"""Snapshot / restore / fork of a running engine.
+
+A checkpoint deep-copies the mutable simulation state (target, interceptor
+and the engagement manager with its track, classification, phase log,
+estimates and RNG bit-generator state). Read-only configuration is shared
+rather than copied: sensors, sensor networks, intercept tables, counter-based
+random streams and the target's path table.
+
+Per-branch ``params`` overrides that reach into shared configuration first
+give the branch shallow copies of the shared objects along the path, so an
+override never leaks into sibling branches or the parent.
+
+The recorded history is not copied either: a checkpoint keeps the list of
+``SimState`` references recorded so far, and every restored engine or fork
+starts from a new list holding those same objects. Appending to one branch
+never touches another, so branching costs only the post-fork ticks.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from interceptor_sim.core.streams import RandomStreams
+
+if TYPE_CHECKING:
+    from interceptor_sim.core.engine import SimState, SimulationEngine
+
+
+def _shared_config(engine: SimulationEngine) -> list[Any]:
+    """Objects branches may share because the simulation never mutates them."""
+    em = engine.engagement
+    shared = [
+        em.surveillance_sensor,
+        engine.interceptor.seeker,
+        engine.target.path,
+        *engine.target.waypoints,
+    ]
+    if em.intercept_table is not None:
+        shared.append(em.intercept_table)
+    if em.sensor_network is not None:
+        shared.append(em.sensor_network)
+    if em.streams is not None:
+        # Stateless between draws: every stream resets the bit generator
+        shared.append(em.streams)
+    return shared
+
+
+def _deepcopy_state(engine: SimulationEngine, state: tuple) -> tuple:
+    memo = {id(obj): obj for obj in _shared_config(engine)}
+    return copy.deepcopy(state, memo)
+
+
+@dataclass(frozen=True)
+class EngineCheckpoint:
+    """Frozen copy of an engine's state at one tick.
+
+    Attributes:
+        time: Simulation time of the checkpoint.
+        states: History recorded up to the checkpoint (shared references).
+    """
+
+    time: float
+    states: tuple[SimState, ...]
+    _objects: tuple  # (target, interceptor, engagement), private copies
+
+    @classmethod
+    def capture(cls, engine: SimulationEngine) -> EngineCheckpoint:
+        objects = _deepcopy_state(engine, (engine.target, engine.interceptor, engine.engagement))
+        return cls(time=engine.time, states=tuple(engine.history.states), _objects=objects)
+
+    def objects(self, template: SimulationEngine) -> tuple:
+        """Fresh copies of (target, interceptor, engagement) for one branch."""
+        return _deepcopy_state(template, self._objects)
+
+
+def set_dotted(root: Any, path: str, value: Any) -> None:
+    """Set an attribute by dotted path, e.g. ``"engagement.nav_gain"``."""
+    *parents, leaf = path.split(".")
+    obj = root
+    for name in parents:
+        obj = getattr(obj, name)
+    if not hasattr(obj, leaf):
+        raise AttributeError(f"{type(obj).__name__} has no attribute {leaf!r} ({path})")
+    setattr(obj, leaf, value)
+
+
+def _unshare_path(root: Any, path: str, shared: set[int]) -> None:
+    """Give *root* private copies of the shared objects along dotted *path*."""
+    obj, copying = root, False
+    for name in path.split(".")[:-1]:
+        child = getattr(obj, name)
+        # Everything reached through a shared object is shared as well
+        copying = copying or id(child) in shared
+        if copying:
+            child = copy.copy(child)
+            setattr(obj, name, child)
+        obj = child
+
+
+def fork_engine(
+    engine: SimulationEngine,
+    n: int,
+    seeds: Sequence[int | None] | None = None,
+    params: Sequence[dict[str, Any]] | None = None,
+) -> list[SimulationEngine]:
+    """Branch *engine* into *n* independent continuations (see ``SimulationEngine.fork``)."""
+    if seeds is not None and len(seeds) != n:
+        raise ValueError("seeds must have one entry per branch")
+    if params is not None and len(params) != n:
+        raise ValueError("params must have one entry per branch")
+
+    checkpoint = EngineCheckpoint.capture(engine)
+    shared = {id(obj) for obj in _shared_config(engine)}
+    branches = []
+    for k in range(n):
+        branch = engine.restored(checkpoint)
+        if seeds is not None:
+            em = branch.engagement
+            em.rng = np.random.default_rng(seeds[k])
+            if em.streams is not None:
+                em.streams = RandomStreams(seeds[k], em.streams.trial)
+        for path, value in (params[k] if params is not None else {}).items():
+            _unshare_path(branch, path, shared)
+            set_dotted(branch, path, value)
+        branches.append(branch)
+    return branches
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 
 import numpy as np
 
+from interceptor_sim.core import frames
+from interceptor_sim.core.checkpoint import EngineCheckpoint, fork_engine
 from interceptor_sim.engagement.kill_chain import EngagementManager, Phase
 from interceptor_sim.models.interceptor import Interceptor
 from interceptor_sim.models.target import Target
@@ -25,43 +30,169 @@ class SimState:
     estimated_target_vel: np.ndarray | None = None
 
 
-@dataclass
 class SimHistory:
-    """Time history of all simulation states."""
+    """Time history of all simulation states.
+
+    States recorded one at a time are kept as :class:`SimState` objects.
+    Column blocks added with :meth:`extend_arrays` (the compiled kernel's
+    output) stay columnar until :attr:`states` is first read, so runs that
+    are only inspected through the array accessors never build per-tick
+    objects.
+    """
 
-    states: list[SimState] = field(default_factory=list)
+    def __init__(self, states: list[SimState] | None = None) -> None:
+        self._states: list[SimState] = [] if states is None else states
+        self._blocks: list[dict[str, np.ndarray]] = []
+
+    @property
+    def states(self) -> list[SimState]:
+        if self._blocks:
+            for block in self._blocks:
+                self._states.extend(_block_states(block))
+            self._blocks = []
+        return self._states
+
+    def __len__(self) -> int:
+        return len(self._states) + sum(len(block["time"]) for block in self._blocks)
 
     def record(self, state: SimState) -> None:
         self.states.append(state)
 
+    def extend_arrays(self, columns: dict[str, np.ndarray]) -> None:
+        """Append a block of states given as columns (see :meth:`as_arrays`)."""
+        self._blocks.append(columns)
+
+    def _column(self, name: str) -> np.ndarray:
+        parts = [block[name] for block in self._blocks]
+        if self._states or not parts:
+            parts.insert(0, _state_column(self._states, name))
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
     @property
     def times(self) -> list[float]:
-        return [s.time for s in self.states]
+        return self._column("time").tolist()
 
     @property
     def target_positions(self) -> np.ndarray:
-        return np.array([s.target_pos for s in self.states])
+        return self._column("target_pos")
 
     @property
     def interceptor_positions(self) -> np.ndarray:
-        return np.array([s.interceptor_pos for s in self.states])
+        return self._column("interceptor_pos")
 
     @property
     def estimated_target_positions(self) -> np.ndarray:
         """Estimated target positions; NaN where no estimate is available."""
-        result = []
-        for s in self.states:
-            if s.estimated_target_pos is not None:
-                result.append(s.estimated_target_pos)
-            else:
-                result.append(np.array([np.nan, np.nan]))
-        return np.array(result)
+        return self._column("estimated_target_pos")
+
+    def as_arrays(self) -> dict[str, np.ndarray]:
+        """Columnar view of the history: one array per SimState field.
+
+        Phases are stored as integer codes (``Phase.value``); missing
+        estimates are NaN.
+        """
+        n = len(self)
+        arrays = {name: self._column(name) for name in _COLUMNS}
+        arrays["target_pos"] = arrays["target_pos"].reshape(n, 2)
+        arrays["interceptor_pos"] = arrays["interceptor_pos"].reshape(n, 2)
+        return arrays
+
+    def to_records(self, compact: bool = False) -> np.ndarray:
+        """Structured array of state frames (see :mod:`interceptor_sim.core.frames`)."""
+        return frames.history_to_records(self, compact)
+
+    def to_bytes(self, compact: bool = False, compress: bool = False) -> bytes:
+        """Versioned binary block of state frames."""
+        return frames.encode_records(self.to_records(compact), compress)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> SimHistory:
+        return frames.records_to_history(frames.decode_records(data))
+
+    def dump(self, path: str | Path, compact: bool = False, compress: bool = False) -> None:
+        """Write the history as a binary state-frame file.
+
+        Args:
+            path: Output file.
+            compact: Store positions, estimates and speed as float32.
+            compress: Byte-shuffle and deflate the record block.
+        """
+        frames.dump_history(self, path, compact, compress)
+
+    @classmethod
+    def load(cls, path: str | Path) -> SimHistory:
+        return frames.load_history(path)
+
+
+_COLUMNS = (
+    "time",
+    "target_pos",
+    "interceptor_pos",
+    "phase",
+    "target_active",
+    "interceptor_speed",
+    "estimated_target_pos",
+    "estimated_target_vel",
+)
+_COLUMN_DTYPES = {
+    "time": np.float64,
+    "phase": np.int8,
+    "target_active": bool,
+    "interceptor_speed": np.float64,
+}
+_PHASES = {phase.value: phase for phase in Phase}
+
+
+def _state_column(states: list[SimState], name: str) -> np.ndarray:
+    """One :meth:`SimHistory.as_arrays` column built from state objects."""
+    if name in ("estimated_target_pos", "estimated_target_vel"):
+        column = np.full((len(states), 2), np.nan)
+        for i, s in enumerate(states):
+            value = getattr(s, name)
+            if value is not None:
+                column[i] = value
+        return column
+    if name == "phase":
+        return np.array([s.phase.value for s in states], dtype=np.int8)
+    return np.array([getattr(s, name) for s in states], dtype=_COLUMN_DTYPES.get(name))
+
+
+def _block_states(block: dict[str, np.ndarray]) -> list[SimState]:
+    """State objects for a column block; positions are views of its arrays."""
+    tgt = block["target_pos"]
+    itc = block["interceptor_pos"]
+    est_pos = block["estimated_target_pos"]
+    est_vel = block["estimated_target_vel"]
+    has_pos = (~np.isnan(est_pos[:, 0])).tolist()
+    has_vel = (~np.isnan(est_vel[:, 0])).tolist()
+    speed = block["interceptor_speed"].tolist()
+    active = block["target_active"].tolist()
+    phases = [_PHASES[code] for code in block["phase"].tolist()]
+    return [
+        SimState(
+            time=t,
+            target_pos=tgt[i],
+            interceptor_pos=itc[i],
+            phase=phases[i],
+            target_active=active[i],
+            interceptor_speed=speed[i],
+            estimated_target_pos=est_pos[i] if has_pos[i] else None,
+            estimated_target_vel=est_vel[i] if has_vel[i] else None,
+        )
+        for i, t in enumerate(block["time"].tolist())
+    ]
 
 
 class SimulationEngine:
     """Fixed-timestep simulation loop.
 
     Each tick: update entities → run engagement logic → record state.
+
+    With ``use_kernel=True``, :meth:`run` executes the whole engagement in the
+    compiled array kernel (:mod:`interceptor_sim.core.kernel`) when numba is
+    installed and the kernel supports the configured models, and falls back
+    to the object path otherwise. Both paths
+    produce identical histories.
     """
 
     def __init__(
@@ -71,17 +202,19 @@ class SimulationEngine:
         engagement: EngagementManager,
         dt: float = 0.1,
         max_time: float = 120.0,
+        use_kernel: bool = False,
     ) -> None:
         self.target = target
         self.interceptor = interceptor
         self.engagement = engagement
         self.dt = dt
         self.max_time = max_time
+        self.use_kernel = use_kernel
         self.history = SimHistory()
         self.time = 0.0
 
-    def _record_state(self) -> None:
-        """Record current simulation state including estimated target position."""
+    def snapshot(self) -> SimState:
+        """Current simulation state, including the estimated target track."""
         est_pos = None
         est_vel = None
         if self.engagement.estimated_target_pos is not None:
@@ -89,19 +222,70 @@ class SimulationEngine:
         if self.engagement.estimated_target_vel is not None:
             est_vel = self.engagement.estimated_target_vel.copy()
 
-        self.history.record(
-            SimState(
-                time=self.time,
-                target_pos=self.target.position.copy(),
-                interceptor_pos=self.interceptor.position.copy(),
-                phase=self.engagement.phase,
-                target_active=self.target.active,
-                interceptor_speed=self.interceptor.speed,
-                estimated_target_pos=est_pos,
-                estimated_target_vel=est_vel,
-            )
+        return SimState(
+            time=self.time,
+            target_pos=self.target.position.copy(),
+            interceptor_pos=self.interceptor.position.copy(),
+            phase=self.engagement.phase,
+            target_active=self.target.active,
+            interceptor_speed=self.interceptor.speed,
+            estimated_target_pos=est_pos,
+            estimated_target_vel=est_vel,
         )
 
+    def _record_state(self) -> None:
+        """Record current simulation state including estimated target position."""
+        self.history.record(self.snapshot())
+
+    def checkpoint(self) -> EngineCheckpoint:
+        """Snapshot the full simulation state, including the RNG, at the current tick."""
+        return EngineCheckpoint.capture(self)
+
+    def restore(self, checkpoint: EngineCheckpoint) -> None:
+        """Return this engine to *checkpoint*; the checkpoint stays reusable.
+
+        Entity and engagement objects are replaced, so references obtained
+        before the restore (e.g. from ``build_from_scenario`` metadata) no
+        longer point at the live state.
+        """
+        self.target, self.interceptor, self.engagement = checkpoint.objects(self)
+        self.time = checkpoint.time
+        self.history = SimHistory(list(checkpoint.states))
+
+    def restored(self, checkpoint: EngineCheckpoint) -> SimulationEngine:
+        """New engine with this engine's settings, started from *checkpoint*."""
+        target, interceptor, engagement = checkpoint.objects(self)
+        engine = SimulationEngine(
+            target, interceptor, engagement,
+            dt=self.dt, max_time=self.max_time, use_kernel=self.use_kernel,
+        )
+        engine.time = checkpoint.time
+        engine.history = SimHistory(list(checkpoint.states))
+        return engine
+
+    def fork(
+        self,
+        n: int,
+        seeds: Sequence[int | None] | None = None,
+        params: Sequence[dict[str, Any]] | None = None,
+    ) -> list[SimulationEngine]:
+        """Branch the engagement into *n* continuations from the current tick.
+
+        Branches share the already-recorded ``SimState`` objects and only
+        record their own ticks from here on; this engine is left untouched.
+
+        Args:
+            n: Number of branches.
+            seeds: Per-branch RNG seeds. By default every branch continues
+                from a copy of the current RNG state (common random numbers).
+            params: Per-branch attribute overrides by dotted path, e.g.
+                ``{"engagement.nav_gain": 3.0}``.
+
+        Returns:
+            The branch engines.
+        """
+        return fork_engine(self, n, seeds=seeds, params=params)
+
     def step(self) -> bool:
         """Run one simulation timestep. Returns False when sim is complete."""
         if self.time >= self.max_time:
@@ -122,8 +306,50 @@ class SimulationEngine:
         self.time += self.dt
         return True
 
+    def run_until(self, phase: Phase) -> bool:
+        """Advance until the engagement reaches *phase* or a later one.
+
+        The engine stops before the first tick spent in *phase*, so forks
+        taken there (see :meth:`fork`) replay none of the earlier phases.
+
+        Returns:
+            True if the engagement is in *phase* or later and can continue;
+            False if the run finished first (the final state is then recorded
+            as by :meth:`run`).
+        """
+        if self.use_kernel:
+            from interceptor_sim.core.kernel import (
+                NUMBA_AVAILABLE,
+                run_engine_kernel,
+                supports_engine,
+            )
+
+            if NUMBA_AVAILABLE and supports_engine(self):
+                run_engine_kernel(self, stop_phase=phase)
+                return self._can_continue()
+
+        while self.engagement.phase.value < phase.value and self.step():
+            pass
+        if self._can_continue():
+            return True
+        self._record_state()
+        return False
+
+    def _can_continue(self) -> bool:
+        return self.time < self.max_time and self.engagement.phase != Phase.COMPLETE
+
     def run(self) -> SimHistory:
         """Run simulation to completion."""
+        if self.use_kernel:
+            from interceptor_sim.core.kernel import (
+                NUMBA_AVAILABLE,
+                run_engine_kernel,
+                supports_engine,
+            )
+
+            if NUMBA_AVAILABLE and supports_engine(self):
+                return run_engine_kernel(self)
+
         while self.step():
             pass
 
@@ -0,0 +1,726 @@
+"""Array-based kill-chain kernel — optional compiled fast path for one engagement.
+
+The kernel runs the full SEARCH → COMPLETE loop of :class:`SimulationEngine`
+over plain float arrays and integer phase codes instead of entity objects.
+It mirrors ``Target.update``, ``Interceptor.update``, ``EngagementManager.step``
+and the guidance laws operation for operation, so its results are
+bit-identical to the object path. When numba is installed the loop is
+JIT-compiled; otherwise :data:`NUMBA_AVAILABLE` is False and the engine keeps
+using the object path.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from interceptor_sim.engagement.kill_chain import EngagementResult, Phase
+from interceptor_sim.engagement.reachability import (
+    CHECK_INTERVAL,
+    DIRECTION_OFFSETS,
+    N_DIRECTIONS,
+    TOLERANCE,
+    min_advance,
+)
+from interceptor_sim.guidance.registry import is_custom_terminal_guidance
+from interceptor_sim.models.interceptor import InterceptorState
+from interceptor_sim.models.sensor import SensorMeasurement
+
+if TYPE_CHECKING:
+    from interceptor_sim.core.engine import SimHistory, SimulationEngine
+
+try:
+    import numba
+    from numba.extending import register_jitable as _jitable
+except ImportError:  # pragma: no cover - depends on environment
+    numba = None
+
+    def _jitable(func):
+        return func
+
+NUMBA_AVAILABLE = numba is not None
+
+# Integer phase / result / interceptor-state codes (the enum values)
+SEARCH = Phase.SEARCH.value
+TRACK = Phase.TRACK.value
+CLASSIFY = Phase.CLASSIFY.value
+LAUNCH = Phase.LAUNCH.value
+MIDCOURSE = Phase.MIDCOURSE.value
+TERMINAL = Phase.TERMINAL.value
+COMPLETE = Phase.COMPLETE.value
+
+RESULT_HIT = EngagementResult.HIT.value
+RESULT_MISS = EngagementResult.MISS.value
+RESULT_UNREACHABLE = EngagementResult.UNREACHABLE.value
+
+INT_LAUNCHED = InterceptorState.LAUNCHED.value
+INT_TERMINAL = InterceptorState.TERMINAL.value
+INT_DETONATED = InterceptorState.DETONATED.value
+INT_MISSED = InterceptorState.MISSED.value
+
+# Constant parameters (float64 array)
+P_DT = 0
+P_MAX_TIME = 1
+P_INT_MAX_SPEED = 2
+P_INT_MAX_TURN_RATE = 3
+P_KILL_RADIUS = 4
+P_MAX_FLIGHT_TIME = 5
+P_SENSOR_X = 6
+P_SENSOR_Y = 7
+P_MAX_RANGE = 8
+P_FIELD_OF_REGARD = 9
+P_BORESIGHT = 10
+P_PD_AT_MAX_RANGE = 11
+P_CLASSIFICATION_ACCURACY = 12
+P_RANGE_NOISE = 13
+P_BEARING_NOISE = 14
+P_SPEED_NOISE = 15
+P_HEADING_NOISE = 16
+P_CLASSIFICATION_THRESHOLD = 17
+P_NAV_GAIN = 18
+P_HANDOVER_RANGE = 19
+P_STERN_OFFSET = 20
+P_BLEND_RANGE = 21
+P_CONFIRM_THRESHOLD = 22
+P_TERMINAL_LAW = 23  # 0 = proportional nav, 1 = pure pursuit
+P_EARLY_TERMINATION = 24
+N_PARAMS = 25
+
+# Mutable float state
+F_TIME = 0
+F_TGT_X = 1
+F_TGT_Y = 2
+F_TGT_HEADING = 3
+F_TGT_SPEED = 4
+F_INT_X = 5
+F_INT_Y = 6
+F_INT_HEADING = 7
+F_INT_SPEED = 8
+F_FLIGHT_TIME = 9
+F_CONFIDENCE = 10
+F_EST_X = 11
+F_EST_Y = 12
+F_EST_VX = 13
+F_EST_VY = 14
+F_MEAS_RANGE = 15
+F_MEAS_BEARING = 16
+F_MEAS_SPEED = 17
+F_MEAS_HEADING = 18
+F_TRUE_RANGE = 19
+F_TRUE_BEARING = 20
+F_TGT_PATH_S = 21
+N_FSTATE = 22
+
+# Mutable integer state
+I_PHASE = 0
+I_RESULT = 1
+I_INT_STATE = 2
+I_TGT_ACTIVE = 3
+I_INT_ACTIVE = 4
+I_WP_IDX = 5
+I_DETECTION_COUNT = 6
+I_DETECTED = 7
+I_CONFIRMED = 8
+I_LOOKS = 9
+I_CLASSIFIED = 10
+I_HAS_ESTIMATE = 11
+I_MEASURED = 12
+I_N_LOG = 13
+N_ISTATE = 14
+
+# Target path table columns (see Target.path)
+W_X = 0
+W_Y = 1
+W_S = 2
+W_UX = 3
+W_UY = 4
+W_HEADING = 5
+
+# History columns
+H_TIME = 0
+H_TGT_X = 1
+H_TGT_Y = 2
+H_INT_X = 3
+H_INT_Y = 4
+H_PHASE = 5
+H_TGT_ACTIVE = 6
+H_INT_SPEED = 7
+H_EST_X = 8
+H_EST_Y = 9
+H_EST_VX = 10
+H_EST_VY = 11
+N_HIST = 12
+
+_TWO_PI = 2 * math.pi
+
+_min_advance = _jitable(min_advance)
+
+
+@_jitable
+def _wrap(angle):
+    return (angle + math.pi) % _TWO_PI - math.pi
+
+
+@_jitable
+def _record(fs, ist, hist, n):
+    hist[n, H_TIME] = fs[F_TIME]
+    hist[n, H_TGT_X] = fs[F_TGT_X]
+    hist[n, H_TGT_Y] = fs[F_TGT_Y]
+    hist[n, H_INT_X] = fs[F_INT_X]
+    hist[n, H_INT_Y] = fs[F_INT_Y]
+    hist[n, H_PHASE] = ist[I_PHASE]
+    hist[n, H_TGT_ACTIVE] = ist[I_TGT_ACTIVE]
+    hist[n, H_INT_SPEED] = fs[F_INT_SPEED]
+    if ist[I_HAS_ESTIMATE]:
+        hist[n, H_EST_X] = fs[F_EST_X]
+        hist[n, H_EST_Y] = fs[F_EST_Y]
+        hist[n, H_EST_VX] = fs[F_EST_VX]
+        hist[n, H_EST_VY] = fs[F_EST_VY]
+    else:
+        hist[n, H_EST_X] = np.nan
+        hist[n, H_EST_Y] = np.nan
+        hist[n, H_EST_VX] = np.nan
+        hist[n, H_EST_VY] = np.nan
+
+
+@_jitable
+def _transition(ist, log_t, log_phase, new_phase, t):
+    k = ist[I_N_LOG]
+    log_t[k] = t
+    log_phase[k] = new_phase
+    ist[I_N_LOG] = k + 1
+    ist[I_PHASE] = new_phase
+
+
+@_jitable
+def _detect(p, fs, rng):
+    sx = p[P_SENSOR_X]
+    sy = p[P_SENSOR_Y]
+    dx = fs[F_TGT_X] - sx
+    dy = fs[F_TGT_Y] - sy
+    if p[P_FIELD_OF_REGARD] < _TWO_PI:
+        offset = abs(_wrap(math.atan2(dy, dx) - p[P_BORESIGHT]))
+        if not offset <= p[P_FIELD_OF_REGARD] / 2:
+            return False
+    r = math.sqrt(dx * dx + dy * dy)
+    if r > p[P_MAX_RANGE]:
+        pd = 0.0
+    else:
+        pd = 1.0 - (r / p[P_MAX_RANGE]) * (1.0 - p[P_PD_AT_MAX_RANGE])
+    return rng.random() < pd
+
+
+@_jitable
+def _process_detection(p, ist, detected):
+    if detected:
+        ist[I_DETECTION_COUNT] += 1
+        ist[I_DETECTED] = 1
+        if ist[I_DETECTION_COUNT] >= p[P_CONFIRM_THRESHOLD]:
+            ist[I_CONFIRMED] = 1
+
+
+@_jitable
+def _apply_guidance(p, fs, cmd_heading, dt):
+    error = _wrap(cmd_heading - fs[F_INT_HEADING])
+    max_delta = p[P_INT_MAX_TURN_RATE] * dt
+    clamped = min(max(error, -max_delta), max_delta)
+    fs[F_INT_HEADING] = _wrap(fs[F_INT_HEADING] + clamped)
+
+
+@_jitable
+def _measure(p, fs, rng):
+    sx = p[P_SENSOR_X]
+    sy = p[P_SENSOR_Y]
+    dx = fs[F_TGT_X] - sx
+    dy = fs[F_TGT_Y] - sy
+    true_rng = math.sqrt(dx * dx + dy * dy)
+    true_brg = math.atan2(dy, dx)
+    speed = fs[F_TGT_SPEED]
+    heading = fs[F_TGT_HEADING]
+
+    range_sigma = p[P_RANGE_NOISE] * true_rng
+    bearing_sigma = p[P_BEARING_NOISE]
+    speed_sigma = p[P_SPEED_NOISE] * speed
+    heading_sigma = p[P_HEADING_NOISE]
+
+    meas_range = true_rng
+    if range_sigma > 0:
+        meas_range = max(0.0, true_rng + rng.normal(0.0, range_sigma))
+    meas_bearing = true_brg
+    if bearing_sigma > 0:
+        meas_bearing = true_brg + rng.normal(0.0, bearing_sigma)
+    meas_speed = speed
+    if speed_sigma > 0:
+        meas_speed = max(0.0, speed + rng.normal(0.0, speed_sigma))
+    meas_heading = heading
+    if heading_sigma > 0:
+        meas_heading = heading + rng.normal(0.0, heading_sigma)
+
+    fs[F_EST_X] = sx + meas_range * math.cos(meas_bearing)
+    fs[F_EST_Y] = sy + meas_range * math.sin(meas_bearing)
+    fs[F_EST_VX] = meas_speed * math.cos(meas_heading)
+    fs[F_EST_VY] = meas_speed * math.sin(meas_heading)
+    fs[F_MEAS_RANGE] = meas_range
+    fs[F_MEAS_BEARING] = meas_bearing
+    fs[F_MEAS_SPEED] = meas_speed
+    fs[F_MEAS_HEADING] = meas_heading
+    fs[F_TRUE_RANGE] = true_rng
+    fs[F_TRUE_BEARING] = true_brg
+
+
+@_jitable
+def _command_guidance(p, fs):
+    ix = fs[F_INT_X]
+    iy = fs[F_INT_Y]
+    tx = fs[F_EST_X]
+    ty = fs[F_EST_Y]
+    stern_offset = p[P_STERN_OFFSET]
+    if stern_offset <= 0.0:
+        return math.atan2(ty - iy, tx - ix)
+    vx = fs[F_EST_VX]
+    vy = fs[F_EST_VY]
+    vel_norm = math.sqrt(vx * vx + vy * vy)
+    if vel_norm < 1e-6:
+        return math.atan2(ty - iy, tx - ix)
+    stern_x = tx - stern_offset * (vx / vel_norm)
+    stern_y = ty - stern_offset * (vy / vel_norm)
+    dx = tx - ix
+    dy = ty - iy
+    rng_to_target = math.sqrt(dx * dx + dy * dy)
+    if rng_to_target >= p[P_BLEND_RANGE]:
+        aim_x = stern_x
+        aim_y = stern_y
+    else:
+        blend = rng_to_target / p[P_BLEND_RANGE]
+        aim_x = (1.0 - blend) * tx + blend * stern_x
+        aim_y = (1.0 - blend) * ty + blend * stern_y
+    return math.atan2(aim_y - iy, aim_x - ix)
+
+
+@_jitable
+def _terminal_guidance(p, fs):
+    ix = fs[F_INT_X]
+    iy = fs[F_INT_Y]
+    tx = fs[F_TGT_X]
+    ty = fs[F_TGT_Y]
+    los_angle = math.atan2(ty - iy, tx - ix)
+    if p[P_TERMINAL_LAW] != 0:
+        return los_angle
+
+    ivx = fs[F_INT_SPEED] * math.cos(fs[F_INT_HEADING])
+    ivy = fs[F_INT_SPEED] * math.sin(fs[F_INT_HEADING])
+    tvx = fs[F_TGT_SPEED] * math.cos(fs[F_TGT_HEADING])
+    tvy = fs[F_TGT_SPEED] * math.sin(fs[F_TGT_HEADING])
+
+    rx = tx - ix
+    ry = ty - iy
+    rvx = tvx - ivx
+    rvy = tvy - ivy
+    r_sq = rx * rx + ry * ry
+    los_rate = 0.0
+    if not r_sq < 1e-9:
+        los_rate = (rx * rvy - ry * rvx) / r_sq
+
+    los_dist = math.sqrt(rx * rx + ry * ry)
+    vc = 0.0
+    if not los_dist < 1e-9:
+        vc = (ivx - tvx) * (rx / los_dist) + (ivy - tvy) * (ry / los_dist)
+    if abs(vc) < 1e-3:
+        return los_angle
+    return los_angle + p[P_NAV_GAIN] * los_rate
+
+
+@_jitable
+def _update_target(fs, ist, path, dt):
+    if not ist[I_TGT_ACTIVE]:
+        return
+    fs[F_TGT_PATH_S] = fs[F_TGT_PATH_S] + fs[F_TGT_SPEED] * dt
+    s = fs[F_TGT_PATH_S]
+    leg = ist[I_WP_IDX]
+    last = path.shape[0] - 1
+    while leg < last and path[leg + 1, W_S] <= s:
+        leg += 1
+    ist[I_WP_IDX] = leg
+    along = s - path[leg, W_S]
+    fs[F_TGT_X] = path[leg, W_X] + along * path[leg, W_UX]
+    fs[F_TGT_Y] = path[leg, W_Y] + along * path[leg, W_UY]
+    fs[F_TGT_HEADING] = path[leg, W_HEADING]
+
+
+@_jitable
+def _update_interceptor(p, fs, ist, dt):
+    state = ist[I_INT_STATE]
+    if state != INT_LAUNCHED and state != INT_TERMINAL:
+        return
+    fs[F_FLIGHT_TIME] += dt
+    if fs[F_FLIGHT_TIME] >= p[P_MAX_FLIGHT_TIME]:
+        ist[I_INT_STATE] = INT_MISSED
+        fs[F_INT_SPEED] = 0.0
+        ist[I_INT_ACTIVE] = 0
+        return
+    if ist[I_INT_ACTIVE]:
+        speed = fs[F_INT_SPEED]
+        fs[F_INT_X] = fs[F_INT_X] + speed * math.cos(fs[F_INT_HEADING]) * dt
+        fs[F_INT_Y] = fs[F_INT_Y] + speed * math.sin(fs[F_INT_HEADING]) * dt
+
+
+@_jitable
+def _intercept_unreachable(p, fs, path, dt):
+    # Scalar form of reachability.intercept_reachable for one lane, negated
+    if p[P_EARLY_TERMINATION] == 0.0:
+        return False
+    if int(math.floor(fs[F_FLIGHT_TIME] / dt + 0.5)) % CHECK_INTERVAL != 0:
+        return False
+    ix = fs[F_INT_X]
+    iy = fs[F_INT_Y]
+    heading = fs[F_INT_HEADING]
+    speed = fs[F_INT_SPEED]
+    target_speed = fs[F_TGT_SPEED]
+    ivx = speed * math.cos(heading)
+    ivy = speed * math.sin(heading)
+    tvx = target_speed * math.cos(fs[F_TGT_HEADING])
+    tvy = target_speed * math.sin(fs[F_TGT_HEADING])
+    if (fs[F_TGT_X] - ix) * (tvx - ivx) + (fs[F_TGT_Y] - iy) * (tvy - ivy) <= 0.0:
+        return False
+
+    moves = math.ceil(max(p[P_MAX_FLIGHT_TIME] - fs[F_FLIGHT_TIME], 0.0) / dt) + 1.0
+    last_k = math.ceil(moves / CHECK_INTERVAL) * CHECK_INTERVAL
+    step_length = speed * dt
+    turn_step = p[P_INT_MAX_TURN_RATE] * dt
+    slack = p[P_KILL_RADIUS] + (speed + target_speed) * dt * (CHECK_INTERVAL / 2.0) + TOLERANCE
+    n_rows = path.shape[0]
+    j = 0
+    while True:
+        k = float(CHECK_INTERVAL * j)
+        if k > last_k:
+            return True
+        j += 1
+        s = fs[F_TGT_PATH_S] + k * (target_speed * dt)
+        leg = 0
+        for row in range(n_rows):
+            if path[row, W_S] <= s:
+                leg = row
+        along = s - path[leg, W_S]
+        rx = path[leg, W_X] + along * path[leg, W_UX] - ix
+        ry = path[leg, W_Y] + along * path[leg, W_UY] - iy
+        possible = True
+        for d in range(N_DIRECTIONS):
+            offset = DIRECTION_OFFSETS[d]
+            angle = heading + offset
+            proj = rx * math.cos(angle) + ry * math.sin(angle)
+            if not proj >= _min_advance(step_length, turn_step, offset, k) - slack:
+                possible = False
+                break
+        if possible:
+            return False
+
+
+@_jitable
+def _end_unreachable(fs, ist, log_t, log_phase, t):
+    ist[I_INT_STATE] = INT_MISSED
+    fs[F_INT_SPEED] = 0.0
+    ist[I_INT_ACTIVE] = 0
+    ist[I_RESULT] = RESULT_UNREACHABLE
+    _transition(ist, log_t, log_phase, COMPLETE, t)
+
+
+@_jitable
+def _step_engagement(p, path, fs, ist, rng, log_t, log_phase, t, dt):
+    phase = ist[I_PHASE]
+    if phase == SEARCH:
+        _process_detection(p, ist, _detect(p, fs, rng))
+        if ist[I_DETECTED]:
+            _transition(ist, log_t, log_phase, TRACK, t)
+    elif phase == TRACK:
+        _process_detection(p, ist, _detect(p, fs, rng))
+        if ist[I_CONFIRMED]:
+            _transition(ist, log_t, log_phase, CLASSIFY, t)
+    elif phase == CLASSIFY:
+        if not ist[I_CLASSIFIED]:
+            ist[I_LOOKS] += 1
+            if rng.random() < p[P_CLASSIFICATION_ACCURACY]:
+                fs[F_CONFIDENCE] = fs[F_CONFIDENCE] + (1.0 - fs[F_CONFIDENCE]) * 0.3
+            else:
+                fs[F_CONFIDENCE] = fs[F_CONFIDENCE] * 0.7
+            if fs[F_CONFIDENCE] >= p[P_CLASSIFICATION_THRESHOLD]:
+                ist[I_CLASSIFIED] = 1
+        if ist[I_CLASSIFIED]:
+            _transition(ist, log_t, log_phase, LAUNCH, t)
+    elif phase == LAUNCH:
+        ist[I_INT_STATE] = INT_LAUNCHED
+        fs[F_INT_HEADING] = math.atan2(
+            fs[F_TGT_Y] - fs[F_INT_Y], fs[F_TGT_X] - fs[F_INT_X]
+        )
+        fs[F_INT_SPEED] = p[P_INT_MAX_SPEED]
+        fs[F_FLIGHT_TIME] = 0.0
+        _transition(ist, log_t, log_phase, MIDCOURSE, t)
+    elif phase == MIDCOURSE:
+        if ist[I_INT_STATE] == INT_MISSED:
+            ist[I_RESULT] = RESULT_MISS
+            _transition(ist, log_t, log_phase, COMPLETE, t)
+            return
+        if _intercept_unreachable(p, fs, path, dt):
+            _end_unreachable(fs, ist, log_t, log_phase, t)
+            return
+        _measure(p, fs, rng)
+        ist[I_HAS_ESTIMATE] = 1
+        ist[I_MEASURED] = 1
+        _apply_guidance(p, fs, _command_guidance(p, fs), dt)
+        dx = fs[F_EST_X] - fs[F_INT_X]
+        dy = fs[F_EST_Y] - fs[F_INT_Y]
+        if math.sqrt(dx * dx + dy * dy) <= p[P_HANDOVER_RANGE]:
+            ist[I_INT_STATE] = INT_TERMINAL
+            _transition(ist, log_t, log_phase, TERMINAL, t)
+    elif phase == TERMINAL:
+        dx = fs[F_TGT_X] - fs[F_INT_X]
+        dy = fs[F_TGT_Y] - fs[F_INT_Y]
+        if math.sqrt(dx * dx + dy * dy) <= p[P_KILL_RADIUS]:
+            ist[I_INT_STATE] = INT_DETONATED
+            ist[I_TGT_ACTIVE] = 0
+            ist[I_RESULT] = RESULT_HIT
+            _transition(ist, log_t, log_phase, COMPLETE, t)
+            return
+        if ist[I_INT_STATE] == INT_MISSED:
+            ist[I_RESULT] = RESULT_MISS
+            _transition(ist, log_t, log_phase, COMPLETE, t)
+            return
+        if _intercept_unreachable(p, fs, path, dt):
+            _end_unreachable(fs, ist, log_t, log_phase, t)
+            return
+        _apply_guidance(p, fs, _terminal_guidance(p, fs), dt)
+
+
+def engagement_loop_py(p, path, fs, ist, rng, hist, log_t, log_phase, stop_phase=COMPLETE):
+    """Run the engine loop until completion or until *hist* is full.
+
+    Returns ``(rows_written, finished)``. When *finished* is False the
+    history buffer ran out of rows; the state arrays are left consistent so
+    the caller can supply a fresh buffer and call again. With *stop_phase*
+    below COMPLETE the loop also finishes, without the final record, as soon
+    as the engagement reaches that phase.
+    """
+    dt = p[P_DT]
+    n = 0
+    cap = hist.shape[0]
+    while True:
+        if fs[F_TIME] >= p[P_MAX_TIME] or ist[I_PHASE] == COMPLETE:
+            if n < cap:
+                # Final state, as recorded by SimulationEngine.run
+                _record(fs, ist, hist, n)
+                return n + 1, True
+            return n, False
+        if ist[I_PHASE] >= stop_phase:
+            return n, True
+        if n >= cap:
+            return n, False
+
+        _record(fs, ist, hist, n)
+        n += 1
+        _update_target(fs, ist, path, dt)
+        _update_interceptor(p, fs, ist, dt)
+        _step_engagement(p, path, fs, ist, rng, log_t, log_phase, fs[F_TIME], dt)
+        fs[F_TIME] += dt
+
+
+if NUMBA_AVAILABLE:  # pragma: no cover - depends on environment
+    engagement_loop = numba.njit(cache=True)(engagement_loop_py)
+else:
+    engagement_loop = engagement_loop_py
+
+
+def supports_engine(engine: SimulationEngine, allow_streams: bool = False) -> bool:
+    """Whether the kernel implements every model option *engine* uses.
+
+    Counter-based random streams are only accepted with *allow_streams*
+    (the batch engine draws them itself; the kernel does not), and the
+    kernel needs a real ``np.random.Generator`` (not a QMC stand-in).
+    """
+    em = engine.engagement
+    return (
+        isinstance(em.rng, np.random.Generator)
+        and em.midcourse_guidance == "command"
+        and em.sensor_network is None
+        and (allow_streams or em.streams is None)
+        and not is_custom_terminal_guidance(em.terminal_guidance)
+    )
+
+
+def pack_engine(engine: SimulationEngine) -> tuple[np.ndarray, ...]:
+    """Pack the engine's current state into ``(params, path, fstate, istate)``."""
+    target = engine.target
+    interceptor = engine.interceptor
+    em = engine.engagement
+    sensor = em.surveillance_sensor
+
+    p = np.zeros(N_PARAMS, dtype=np.float64)
+    p[P_DT] = engine.dt
+    p[P_MAX_TIME] = engine.max_time
+    p[P_INT_MAX_SPEED] = interceptor.max_speed
+    p[P_INT_MAX_TURN_RATE] = interceptor.max_turn_rate
+    p[P_KILL_RADIUS] = interceptor.kill_radius
+    p[P_MAX_FLIGHT_TIME] = interceptor.max_flight_time
+    p[P_SENSOR_X], p[P_SENSOR_Y] = em.sensor_position
+    p[P_MAX_RANGE] = sensor.max_range
+    p[P_FIELD_OF_REGARD] = sensor.field_of_regard
+    p[P_BORESIGHT] = sensor.boresight
+    p[P_PD_AT_MAX_RANGE] = sensor.pd_at_max_range
+    p[P_CLASSIFICATION_ACCURACY] = sensor.classification_accuracy
+    p[P_RANGE_NOISE] = sensor.range_noise_fraction
+    p[P_BEARING_NOISE] = sensor.bearing_noise_rad
+    p[P_SPEED_NOISE] = sensor.speed_noise_fraction
+    p[P_HEADING_NOISE] = sensor.heading_noise_rad
+    p[P_CLASSIFICATION_THRESHOLD] = em.classification.threshold
+    p[P_NAV_GAIN] = em.nav_gain
+    p[P_HANDOVER_RANGE] = em.terminal_handover_range
+    p[P_STERN_OFFSET] = em.stern_offset
+    p[P_BLEND_RANGE] = em.approach_blend_range
+    p[P_CONFIRM_THRESHOLD] = em.track.confirm_threshold
+    p[P_TERMINAL_LAW] = 0.0 if em.terminal_guidance == "proportional_nav" else 1.0
+    p[P_EARLY_TERMINATION] = float(em.early_termination)
+
+    path = np.ascontiguousarray(target.path, dtype=np.float64)
+
+    fs = np.zeros(N_FSTATE, dtype=np.float64)
+    fs[F_TIME] = engine.time
+    fs[F_TGT_X], fs[F_TGT_Y] = target.position
+    fs[F_TGT_HEADING] = target.heading
+    fs[F_TGT_SPEED] = target.speed
+    fs[F_TGT_PATH_S] = target.path_distance
+    fs[F_INT_X], fs[F_INT_Y] = interceptor.position
+    fs[F_INT_HEADING] = interceptor.heading
+    fs[F_INT_SPEED] = interceptor.speed
+    fs[F_FLIGHT_TIME] = interceptor.flight_time
+    fs[F_CONFIDENCE] = em.classification.confidence
+
+    ist = np.zeros(N_ISTATE, dtype=np.int64)
+    ist[I_PHASE] = em.phase.value
+    ist[I_RESULT] = em.result.value
+    ist[I_INT_STATE] = interceptor.state.value
+    ist[I_TGT_ACTIVE] = int(target.active)
+    ist[I_INT_ACTIVE] = int(interceptor.active)
+    ist[I_WP_IDX] = target.current_waypoint_idx
+    ist[I_DETECTION_COUNT] = em.track.detection_count
+    ist[I_DETECTED] = int(em.track.detected)
+    ist[I_CONFIRMED] = int(em.track.track_confirmed)
+    ist[I_LOOKS] = em.classification.looks
+    ist[I_CLASSIFIED] = int(em.classification.classified)
+    if em.estimated_target_pos is not None and em.estimated_target_vel is not None:
+        ist[I_HAS_ESTIMATE] = 1
+        fs[F_EST_X], fs[F_EST_Y] = em.estimated_target_pos
+        fs[F_EST_VX], fs[F_EST_VY] = em.estimated_target_vel
+
+    return p, path, fs, ist
+
+
+def unpack_engine(
+    engine: SimulationEngine,
+    fs: np.ndarray,
+    ist: np.ndarray,
+    log_t: np.ndarray,
+    log_phase: np.ndarray,
+) -> None:
+    """Write kernel state back into the engine's entities and engagement manager."""
+    target = engine.target
+    interceptor = engine.interceptor
+    em = engine.engagement
+
+    engine.time = float(fs[F_TIME])
+
+    target.position = np.array([fs[F_TGT_X], fs[F_TGT_Y]])
+    target.heading = float(fs[F_TGT_HEADING])
+    target.active = bool(ist[I_TGT_ACTIVE])
+    target.current_waypoint_idx = int(ist[I_WP_IDX])
+    target.path_distance = float(fs[F_TGT_PATH_S])
+
+    interceptor.position = np.array([fs[F_INT_X], fs[F_INT_Y]])
+    interceptor.heading = float(fs[F_INT_HEADING])
+    interceptor.speed = float(fs[F_INT_SPEED])
+    interceptor.flight_time = float(fs[F_FLIGHT_TIME])
+    interceptor.state = InterceptorState(int(ist[I_INT_STATE]))
+    interceptor.active = bool(ist[I_INT_ACTIVE])
+
+    em.phase = Phase(int(ist[I_PHASE]))
+    em.result = EngagementResult(int(ist[I_RESULT]))
+    for k in range(int(ist[I_N_LOG])):
+        em.phase_log.append((float(log_t[k]), Phase(int(log_phase[k]))))
+
+    em.track.detection_count = int(ist[I_DETECTION_COUNT])
+    em.track.detected = bool(ist[I_DETECTED])
+    em.track.track_confirmed = bool(ist[I_CONFIRMED])
+    em.classification.looks = int(ist[I_LOOKS])
+    em.classification.confidence = float(fs[F_CONFIDENCE])
+    em.classification.classified = bool(ist[I_CLASSIFIED])
+
+    if ist[I_HAS_ESTIMATE]:
+        em.estimated_target_pos = np.array([fs[F_EST_X], fs[F_EST_Y]])
+        em.estimated_target_vel = np.array([fs[F_EST_VX], fs[F_EST_VY]])
+    if ist[I_MEASURED]:
+        em.latest_measurement = SensorMeasurement(
+            measured_range=float(fs[F_MEAS_RANGE]),
+            measured_bearing=float(fs[F_MEAS_BEARING]),
+            measured_speed=float(fs[F_MEAS_SPEED]),
+            measured_heading=float(fs[F_MEAS_HEADING]),
+            estimated_position=em.estimated_target_pos.copy(),
+            estimated_velocity=em.estimated_target_vel.copy(),
+            true_range=float(fs[F_TRUE_RANGE]),
+            true_bearing=float(fs[F_TRUE_BEARING]),
+            true_speed=target.speed,
+            true_heading=target.heading,
+        )
+
+
+def run_engine_kernel(
+    engine: SimulationEngine, loop=None, stop_phase: Phase | None = None
+) -> SimHistory:
+    """Run *engine* to completion through the array kernel.
+
+    Equivalent to ``engine.run()`` on the object path: the history is
+    appended to ``engine.history`` and all entity / engagement state is
+    written back afterwards, so the engine can be inspected as usual. The
+    new ticks are appended as one column block (see
+    :meth:`SimHistory.extend_arrays`); ``SimState`` objects are only built if
+    ``history.states`` is read.
+
+    Args:
+        engine: Engine to run (from any point, not only t=0).
+        loop: Kernel loop to use; defaults to the compiled loop when numba is
+            available. Pass :func:`engagement_loop_py` to force pure Python.
+        stop_phase: Stop as soon as the engagement reaches this phase, as
+            ``engine.run_until(stop_phase)`` does (no final record unless the
+            run completed).
+    """
+    loop = loop or engagement_loop
+    stop = COMPLETE if stop_phase is None else stop_phase.value
+    p, path, fs, ist = pack_engine(engine)
+    log_t = np.zeros(len(Phase), dtype=np.float64)
+    log_phase = np.zeros(len(Phase), dtype=np.int64)
+
+    chunks = []
+    capacity = max(16, int((engine.max_time - engine.time) / engine.dt) + 3)
+    finished = False
+    while not finished:
+        hist = np.empty((capacity, N_HIST), dtype=np.float64)
+        n, finished = loop(
+            p, path, fs, ist, engine.engagement.rng, hist, log_t, log_phase, stop
+        )
+        chunks.append(hist[:n])
+
+    unpack_engine(engine, fs, ist, log_t, log_phase)
+
+    rows = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+    est_pos = rows[:, H_EST_X:H_EST_Y + 1].copy()
+    est_vel = rows[:, H_EST_VX:H_EST_VY + 1].copy()
+    est_vel[np.isnan(est_pos[:, 0])] = np.nan
+    engine.history.extend_arrays({
+        "time": rows[:, H_TIME].copy(),
+        "target_pos": rows[:, H_TGT_X:H_TGT_Y + 1].copy(),
+        "interceptor_pos": rows[:, H_INT_X:H_INT_Y + 1].copy(),
+        "phase": rows[:, H_PHASE].astype(np.int8),
+        "target_active": rows[:, H_TGT_ACTIVE] != 0.0,
+        "interceptor_speed": rows[:, H_INT_SPEED].copy(),
+        "estimated_target_pos": est_pos,
+        "estimated_target_vel": est_vel,
+    })
+    return engine.history
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import yaml
 
 from interceptor_sim.core.engine import SimHistory, SimulationEngine
+from interceptor_sim.core.streams import RandomStreams
 from interceptor_sim.engagement.kill_chain import EngagementManager
 from interceptor_sim.models.interceptor import Interceptor
 from interceptor_sim.models.sensor import Sensor
+from interceptor_sim.models.sensor_network import SensorNetwork
 from interceptor_sim.models.target import Target
 
 
@@ -20,11 +24,49 @@ def load_scenario(path: str | Path) -> dict:
         return yaml.safe_load(f)
 
 
+def apply_overrides(scenario: dict, overrides: dict[str, Any]) -> dict:
+    """Return a deep copy of *scenario* with dotted-path overrides applied.
+
+    Example: ``{"engagement.nav_gain": 3.0, "target.position": [4000, 0]}``.
+    Intermediate sections are created if missing.
+    """
+    result = copy.deepcopy(scenario)
+    for path, value in overrides.items():
+        *parents, leaf = path.split(".")
+        section = result
+        for key in parents:
+            section = section.setdefault(key, {})
+        section[leaf] = copy.deepcopy(value)
+    return result
+
+
+def _build_sensor(cfg: dict, default_id: int = 0) -> Sensor:
+    noise_cfg = cfg.get("noise", {})
+    return Sensor(
+        max_range=cfg["max_range"],
+        field_of_regard=np.radians(cfg.get("field_of_regard_deg", 360)),
+        boresight=np.radians(cfg.get("boresight_deg", 0.0)),
+        pd_at_max_range=cfg.get("pd_at_max_range", 0.3),
+        classification_accuracy=cfg.get("classification_accuracy", 0.8),
+        range_noise_fraction=noise_cfg.get("range_noise_fraction", 0.0),
+        bearing_noise_deg=noise_cfg.get("bearing_noise_deg", 0.0),
+        speed_noise_fraction=noise_cfg.get("speed_noise_fraction", 0.0),
+        heading_noise_deg=noise_cfg.get("heading_noise_deg", 0.0),
+        sensor_id=cfg.get("id", default_id),
+    )
+
+
 def build_from_scenario(
-    scenario: dict, seed: int | None = None
+    scenario: dict, seed: int | None = None, trial: int = 0
 ) -> tuple[SimulationEngine, dict]:
     """Build simulation components from a scenario dictionary.
 
+    Args:
+        scenario: Scenario dictionary.
+        seed: RNG seed.
+        trial: Trial id; keys the counter-based streams together with
+            *seed* when ``simulation.counter_rng`` is set, ignored otherwise.
+
     Returns:
         Tuple of (engine, metadata dict with references to components).
     """
@@ -40,22 +82,19 @@ def build_from_scenario(
         name=tgt_cfg.get("name", "target"),
     )
 
-    # Surveillance sensor
-    sensor_cfg = scenario["surveillance_sensor"]
-    noise_cfg = sensor_cfg.get("noise", {})
-    surveillance_sensor = Sensor(
-        max_range=sensor_cfg["max_range"],
-        field_of_regard=np.radians(sensor_cfg.get("field_of_regard_deg", 360)),
-        pd_at_max_range=sensor_cfg.get("pd_at_max_range", 0.3),
-        classification_accuracy=sensor_cfg.get("classification_accuracy", 0.8),
-        range_noise_fraction=noise_cfg.get("range_noise_fraction", 0.0),
-        bearing_noise_deg=noise_cfg.get("bearing_noise_deg", 0.0),
-        speed_noise_fraction=noise_cfg.get("speed_noise_fraction", 0.0),
-        heading_noise_deg=noise_cfg.get("heading_noise_deg", 0.0),
-    )
-    sensor_position = np.array(
-        sensor_cfg.get("position", [0.0, 0.0]), dtype=np.float64
-    )
+    # Surveillance sensor(s): ``surveillance_sensor`` and/or a ``surveillance_sensors``
+    # list; more than one sensor in total are fused as a network. Sensor ids
+    # (keying counter-based streams) default to the position in that order
+    sensor_cfgs = [scenario["surveillance_sensor"]] if "surveillance_sensor" in scenario else []
+    sensor_cfgs += scenario.get("surveillance_sensors", [])
+    if not sensor_cfgs:
+        raise KeyError("scenario needs surveillance_sensor or surveillance_sensors")
+    sensors = [_build_sensor(cfg, k) for k, cfg in enumerate(sensor_cfgs)]
+    positions = [
+        np.array(cfg.get("position", [0.0, 0.0]), dtype=np.float64) for cfg in sensor_cfgs
+    ]
+    surveillance_sensor, sensor_position = sensors[0], positions[0]
+    sensor_network = SensorNetwork(sensors, positions) if len(sensors) > 1 else None
 
     # Interceptor
     int_cfg = scenario["interceptor"]
@@ -80,6 +119,8 @@ def build_from_scenario(
 
     # Engagement manager
     eng_cfg = scenario.get("engagement", {})
+    sim_cfg = scenario.get("simulation", {})
+    streams = RandomStreams(seed, trial) if sim_cfg.get("counter_rng", False) else None
     engagement = EngagementManager(
         target=target,
         interceptor=interceptor,
@@ -90,17 +131,21 @@ def build_from_scenario(
         terminal_handover_range=eng_cfg.get("terminal_handover_range", 100.0),
         stern_offset=eng_cfg.get("stern_offset", 0.0),
         approach_blend_range=eng_cfg.get("approach_blend_range", 500.0),
+        midcourse_guidance=eng_cfg.get("midcourse_guidance", "command"),
+        sensor_network=sensor_network,
+        early_termination=eng_cfg.get("early_termination", False),
+        streams=streams,
         rng=rng,
     )
 
     # Simulation engine
-    sim_cfg = scenario.get("simulation", {})
     engine = SimulationEngine(
         target=target,
         interceptor=interceptor,
         engagement=engagement,
         dt=sim_cfg.get("dt", 0.1),
         max_time=sim_cfg.get("max_time", 120.0),
+        use_kernel=sim_cfg.get("use_kernel", False),
     )
 
     metadata = {
@@ -108,6 +153,7 @@ def build_from_scenario(
         "interceptor": interceptor,
         "surveillance_sensor": surveillance_sensor,
         "sensor_position": sensor_position,
+        "sensor_network": sensor_network,
         "engagement": engagement,
         "engine": engine,
         "launch_position": launch_position,
@@ -0,0 +1,296 @@
+"""Counter-based random streams keyed by (trial, tick, sensor, quantity).
+
+The default engine draws every random number from one sequential
+``np.random.Generator``, so anything that changes the order of draws (an
+extra sensor, batching lanes, skipping ticks) reshuffles all later noise.
+With counter-based streams each draw is instead a pure function of where it
+happens: Philox4x64-10 is evaluated with key ``(seed, trial)`` and counter
+``(block + 1, tick, quantity, sensor)``, and the resulting 64-bit words are
+turned into uniforms (``word >> 11`` scaled to [0, 1)) or, pairwise,
+standard normals (Box–Muller). Draws are random access, so the scalar
+engine, :class:`~interceptor_sim.batch.engine.BatchEngine` lanes and any
+parallel split of trials see identical noise.
+
+:class:`RandomStreams` hands out :class:`CounterStream` objects that provide
+the ``random`` / ``normal`` / ``standard_normal`` subset of
+``np.random.Generator`` used by the sensor models, so models need no changes.
+Scalar streams come from ``np.random.Philox`` with an explicit key and
+counter; :func:`philox4x64` is the same bijection vectorized over lanes.
+"""
+
+from __future__ import annotations
+
+import math
+from enum import IntEnum
+
+import numpy as np
+
+try:
+    import numba
+    from numba.extending import register_jitable as _jitable
+except ImportError:  # pragma: no cover - depends on environment
+    numba = None
+
+    def _jitable(func):
+        return func
+
+NUMBA_AVAILABLE = numba is not None
+
+_MASK64 = (1 << 64) - 1
+_MASK32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+# Philox4x64 round multipliers and Weyl key increments (Salmon et al., 2011)
+_M0 = np.uint64(0xD2E7470EE14C6C93)
+_M1 = np.uint64(0xCA5A826395121157)
+_W0 = np.uint64(0x9E3779B97F4A7C15)
+_W1 = np.uint64(0xBB67AE8584CAA73B)
+PHILOX_ROUNDS = 10
+_UNIFORM_SCALE = 1.0 / 9007199254740992.0  # 2**-53
+_TWO_PI = 2.0 * math.pi
+
+
+class Quantity(IntEnum):
+    """What a stream's draws are used for (the counter's quantity word)."""
+
+    DETECTION = 0
+    CLASSIFICATION = 1
+    MEASUREMENT = 2
+
+
+def tick_index(t: float | np.ndarray, dt: float | np.ndarray) -> int | np.ndarray:
+    """Integer tick of simulation time *t* (robust to accumulated rounding)."""
+    if np.ndim(t) == 0 and np.ndim(dt) == 0:
+        return int(math.floor(t / dt + 0.5))
+    return np.floor(np.asarray(t) / dt + 0.5).astype(np.uint64)
+
+
+@_jitable
+def _mulhilo(m, x):
+    # 64 x 64 -> 128-bit product from 32-bit halves (no uint128 in NumPy / numba)
+    m_lo, m_hi = m & _MASK32, m >> _SHIFT32
+    x_lo, x_hi = x & _MASK32, x >> _SHIFT32
+    lh = m_lo * x_hi
+    hl = m_hi * x_lo
+    mid = ((m_lo * x_lo) >> _SHIFT32) + (lh & _MASK32) + (hl & _MASK32)
+    hi = m_hi * x_hi + (lh >> _SHIFT32) + (hl >> _SHIFT32) + (mid >> _SHIFT32)
+    return hi, m * x
+
+
+def philox4x64_numpy(counter: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """Philox4x64-10 vectorized over rows of ``(N, 4)`` counters and ``(N, 2)`` keys."""
+    c0, c1, c2, c3 = counter[:, 0], counter[:, 1], counter[:, 2], counter[:, 3]
+    k0, k1 = key[:, 0], key[:, 1]
+    with np.errstate(over="ignore"):
+        for _ in range(PHILOX_ROUNDS):
+            hi0, lo0 = _mulhilo(_M0, c0)
+            hi1, lo1 = _mulhilo(_M1, c2)
+            c0, c1, c2, c3 = hi1 ^ c1 ^ k0, lo1, hi0 ^ c3 ^ k1, lo0
+            k0 = k0 + _W0
+            k1 = k1 + _W1
+    return np.stack([c0, c1, c2, c3], axis=1)
+
+
+def philox4x64_loop(counter: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """Row-by-row Philox4x64-10 for numba (same results as the NumPy version)."""
+    out = np.empty_like(counter)
+    for i in range(counter.shape[0]):
+        c0, c1, c2, c3 = counter[i, 0], counter[i, 1], counter[i, 2], counter[i, 3]
+        k0, k1 = key[i, 0], key[i, 1]
+        for _ in range(PHILOX_ROUNDS):
+            hi0, lo0 = _mulhilo(_M0, c0)
+            hi1, lo1 = _mulhilo(_M1, c2)
+            c0, c1, c2, c3 = hi1 ^ c1 ^ k0, lo1, hi0 ^ c3 ^ k1, lo0
+            k0 = k0 + _W0
+            k1 = k1 + _W1
+        out[i, 0] = c0
+        out[i, 1] = c1
+        out[i, 2] = c2
+        out[i, 3] = c3
+    return out
+
+
+if NUMBA_AVAILABLE:  # pragma: no cover - depends on environment
+    _philox_rows = numba.njit(cache=True)(philox4x64_loop)
+else:
+    _philox_rows = philox4x64_numpy
+
+
+def philox4x64(counter: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """Philox4x64-10 over ``(..., 4)`` counters and ``(..., 2)`` keys (uint64).
+
+    ``np.random.Philox(counter=c, key=k)`` emits ``philox4x64(c + 1, k)`` as
+    its first four words.
+    """
+    counter = np.asarray(counter, dtype=np.uint64)
+    key = np.asarray(key, dtype=np.uint64)
+    shape = np.broadcast_shapes(counter.shape[:-1], key.shape[:-1])
+    rows = int(np.prod(shape))
+    c = np.ascontiguousarray(np.broadcast_to(counter, shape + (4,))).reshape(rows, 4)
+    k = np.ascontiguousarray(np.broadcast_to(key, shape + (2,))).reshape(rows, 2)
+    return _philox_rows(c, k).reshape(shape + (4,))
+
+
+def words_to_uniform(words: np.ndarray) -> np.ndarray:
+    """Uniforms in [0, 1) with 53 random bits, as ``Generator.random`` scales them."""
+    return (np.asarray(words, dtype=np.uint64) >> np.uint64(11)) * _UNIFORM_SCALE
+
+
+def words_to_normal(words: np.ndarray) -> np.ndarray:
+    """Standard normals from consecutive word pairs along the last axis (Box–Muller).
+
+    Normal ``2j`` uses the cosine and ``2j + 1`` the sine branch of pair ``j``.
+    """
+    u = words_to_uniform(words)
+    u1, u2 = u[..., 0::2], u[..., 1::2]
+    radius = np.sqrt(-2.0 * np.log1p(-u1))
+    angle = _TWO_PI * u2
+    z = np.empty(u.shape)
+    z[..., 0::2] = radius * np.cos(angle)
+    z[..., 1::2] = radius * np.sin(angle)
+    return z
+
+
+def stream_words(
+    key: np.ndarray,
+    tick: np.ndarray,
+    quantity: int | np.ndarray,
+    sensor: int | np.ndarray = 0,
+    n_blocks: int = 1,
+) -> np.ndarray:
+    """First ``4 * n_blocks`` words of many streams at once.
+
+    Args:
+        key: ``(N, 2)`` stream keys (see :attr:`RandomStreams.key`).
+        tick, quantity, sensor: Per-stream counter fields (broadcast to ``N``).
+        n_blocks: Philox blocks to generate per stream.
+
+    Returns:
+        ``(N, 4 * n_blocks)`` uint64 words, equal to ``CounterStream`` words.
+    """
+    key = np.asarray(key, dtype=np.uint64)
+    n = key.shape[0]
+    counter = np.empty((n_blocks, n, 4), dtype=np.uint64)
+    counter[..., 0] = np.arange(1, n_blocks + 1, dtype=np.uint64)[:, None]
+    counter[..., 1] = tick
+    counter[..., 2] = quantity
+    counter[..., 3] = sensor
+    keys = np.empty((n_blocks, n, 2), dtype=np.uint64)
+    keys[:] = key
+    # Rows are already aligned, so skip philox4x64's broadcasting
+    words = _philox_rows(counter.reshape(-1, 4), keys.reshape(-1, 2)).reshape(n_blocks, n, 4)
+    return words.transpose(1, 0, 2).reshape(n, 4 * n_blocks)
+
+
+def _uniform(word: int) -> float:
+    return (word >> 11) * _UNIFORM_SCALE
+
+
+def _normal_pair(w1: int, w2: int) -> tuple[float, float]:
+    # Scalar twin of words_to_normal with the same rounding: NumPy's log1p
+    # can differ from libm's by an ulp, sqrt / cos / sin agree
+    radius = math.sqrt(-2.0 * float(np.log1p(-_uniform(w1))))
+    angle = _TWO_PI * _uniform(w2)
+    return radius * math.cos(angle), radius * math.sin(angle)
+
+
+class CounterStream:
+    """Generator-like view of the draws of one (trial, tick, sensor, quantity).
+
+    Successive ``random`` calls return the stream's uniforms in order, and
+    successive ``normal`` / ``standard_normal`` calls its normals in order.
+    Each stream is meant for one kind of draw; both kinds read the same
+    underlying words.
+    """
+
+    __slots__ = ("_streams", "_counter", "_words", "_normals", "_n_uniform", "_n_normal")
+
+    def __init__(self, streams: RandomStreams, tick: int, quantity: int, sensor: int) -> None:
+        self._streams = streams
+        self._counter = (tick, int(quantity), sensor)
+        self._words: list[int] = []
+        self._normals: list[float] = []
+        self._n_uniform = 0
+        self._n_normal = 0
+
+    def words(self, n: int) -> list[int]:
+        """The stream's first *n* raw 64-bit words."""
+        if n > len(self._words):
+            self._words = self._streams._raw_words(self._counter, -(-n // 4)).tolist()
+        return self._words[:n]
+
+    def _uniforms(self, n: int) -> list[float]:
+        start = self._n_uniform
+        self._n_uniform += n
+        return [_uniform(w) for w in self.words(start + n)[start:]]
+
+    def _standard_normals(self, n: int) -> list[float]:
+        start = self._n_normal
+        end = self._n_normal = start + n
+        if end > len(self._normals):
+            words = self.words(end + end % 2)
+            self._normals = [
+                z for i in range(0, len(words), 2) for z in _normal_pair(words[i], words[i + 1])
+            ]
+        return self._normals[start:end]
+
+    def random(self, size: int | tuple[int, ...] | None = None) -> float | np.ndarray:
+        if size is None:
+            return self._uniforms(1)[0]
+        return np.array(self._uniforms(int(np.prod(size)))).reshape(size)
+
+    def standard_normal(self, size: int | tuple[int, ...] | None = None) -> float | np.ndarray:
+        if size is None:
+            return self._standard_normals(1)[0]
+        return np.array(self._standard_normals(int(np.prod(size)))).reshape(size)
+
+    def normal(
+        self,
+        loc: float = 0.0,
+        scale: float = 1.0,
+        size: int | tuple[int, ...] | None = None,
+    ) -> float | np.ndarray:
+        return loc + scale * self.standard_normal(size)
+
+
+class RandomStreams:
+    """Source of counter-based streams for one trial.
+
+    Args:
+        seed: Study seed (key word 0); fresh OS entropy when None.
+        trial: Trial id (key word 1).
+    """
+
+    def __init__(self, seed: int | None = None, trial: int = 0) -> None:
+        if seed is None:
+            seed = int(np.random.SeedSequence().entropy) & _MASK64
+        self.seed = int(seed) & _MASK64
+        self.trial = int(trial)
+        self.key = np.array([self.seed, self.trial], dtype=np.uint64)
+        self._bit_generator = np.random.Philox(key=self.key)
+        self._state = self._bit_generator.state
+
+    def stream(self, tick: int, quantity: Quantity | int, sensor: int = 0) -> CounterStream:
+        """The draws for *quantity* from *sensor* at *tick*."""
+        return CounterStream(self, tick, quantity, sensor)
+
+    def sensor_words(
+        self, tick: int, quantity: Quantity | int, sensors: np.ndarray, n_blocks: int = 1
+    ) -> np.ndarray:
+        """Words of several sensors' streams at *tick* in one vectorized call.
+
+        Row ``k`` equals ``self.stream(tick, quantity, sensors[k]).words(4 * n_blocks)``.
+        """
+        sensors = np.asarray(sensors, dtype=np.uint64)
+        key = np.broadcast_to(self.key, (len(sensors), 2))
+        return stream_words(key, tick, int(quantity), sensors, n_blocks)
+
+    def _raw_words(self, counter: tuple[int, int, int], n_blocks: int) -> np.ndarray:
+        # Philox increments its counter before each block: block b is (b + 1, *counter)
+        state = self._state
+        state["state"]["counter"][:] = (0, *counter)
+        state["buffer_pos"] = 4
+        self._bit_generator.state = state
+        return self._bit_generator.random_raw(4 * n_blocks)
+
+    def __repr__(self) -> str:
+        return f"RandomStreams(seed={self.seed}, trial={self.trial})"
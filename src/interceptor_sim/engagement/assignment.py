@@ -0,0 +1,376 @@
+"""Weapon-target assignment: which ready interceptor engages which track.
+
+The problem is a rectangular linear assignment over a cost matrix of
+interceptors (rows) by tracks (columns). Every interceptor also has a
+private *hold* column costing ``hold_cost``, so an interceptor is left on
+the ground when no track is worth more than holding, and every row can
+always be assigned. Entries may be ``inf`` (no intercept possible).
+
+The solver is the shortest-augmenting-path method (Jonker-Volgenant, in
+the rectangular form of Crouse 2016), seeded by row reduction. The
+augmentation loop is JIT-compiled when numba is installed; otherwise each
+Dijkstra relaxation is vectorized over all columns. Dual column prices are
+kept between calls: a re-solve after tracks appear, disappear or move
+reuses the previous pairing of every interceptor that is still optimal
+(within ``tolerance``) under those prices and only augments the rest.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from interceptor_sim.guidance.intercept_point import straight_line_intercept_times
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depends on environment
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+UNASSIGNED = -1
+
+
+def engagement_costs(
+    interceptor_pos: np.ndarray,
+    interceptor_speed: float | np.ndarray,
+    track_pos: np.ndarray,
+    track_vel: np.ndarray,
+    pk: float | np.ndarray = 1.0,
+    threat_value: float | np.ndarray = 1.0,
+    time_weight: float = 0.01,
+    max_flight_time: float | np.ndarray = np.inf,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Cost of every interceptor/track pairing.
+
+    ``cost = time_weight * tgo - pk * threat_value``, where ``tgo`` is the
+    straight-line time to intercept at the interceptor's speed. Pairings
+    with no intercept, or one later than the interceptor's flight time,
+    cost ``inf``.
+
+    Args:
+        interceptor_pos: ``(n, 2)`` interceptor positions.
+        interceptor_speed: Scalar or ``(n,)`` interceptor speeds.
+        track_pos: ``(m, 2)`` estimated track positions.
+        track_vel: ``(m, 2)`` estimated track velocities.
+        pk: Kill probability, scalar or broadcastable to ``(n, m)``.
+        threat_value: Value of killing each track, scalar or ``(m,)``.
+        time_weight: Cost per second of time-to-go.
+        max_flight_time: Scalar or ``(n,)`` flight-time limit.
+
+    Returns:
+        Tuple of ``(cost, tgo)`` arrays of shape ``(n, m)``; tgo is NaN
+        where no intercept exists.
+    """
+    ipos = np.asarray(interceptor_pos, dtype=np.float64).reshape(-1, 2)
+    tpos = np.asarray(track_pos, dtype=np.float64).reshape(-1, 2)
+    tvel = np.asarray(track_vel, dtype=np.float64).reshape(-1, 2)
+    speed = np.broadcast_to(np.asarray(interceptor_speed, dtype=np.float64), len(ipos))
+    max_time = np.broadcast_to(np.asarray(max_flight_time, dtype=np.float64), len(ipos))
+
+    tgo = straight_line_intercept_times(
+        tpos[None, :, :] - ipos[:, None, :], tvel[None, :, :], speed[:, None]
+    )
+    cost = time_weight * tgo - np.asarray(pk) * np.asarray(threat_value)
+    reachable = tgo <= max_time[:, None]  # False for NaN
+    return np.where(reachable, cost, np.inf), tgo
+
+
+def augment_rows_loop(
+    cost: np.ndarray,
+    u: np.ndarray,
+    v: np.ndarray,
+    col4row: np.ndarray,
+    row4col: np.ndarray,
+    pending: np.ndarray,
+) -> int:
+    """Assign each row in *pending* along a shortest augmenting path.
+
+    Scalar loops for numba; updates the duals and assignment in place.
+    Returns the first row with no feasible column, or -1.
+    """
+    n, m = cost.shape
+    dist = np.empty(m)
+    path = np.empty(m, dtype=np.int64)
+    scanned = np.empty(m, dtype=np.bool_)
+    scanned_cols = np.empty(m, dtype=np.int64)
+    path_rows = np.empty(n + 1, dtype=np.int64)
+    for cur in pending:
+        dist[:] = np.inf
+        path[:] = UNASSIGNED
+        scanned[:] = False
+        n_cols = 0
+        n_rows = 0
+        min_val = 0.0
+        i = cur
+        sink = UNASSIGNED
+        while sink == UNASSIGNED:
+            path_rows[n_rows] = i
+            n_rows += 1
+            best = np.inf
+            j_best = UNASSIGNED
+            for j in range(m):
+                if scanned[j]:
+                    continue
+                r = min_val + cost[i, j] - u[i] - v[j]
+                if r < dist[j]:
+                    dist[j] = r
+                    path[j] = i
+                # Among equally short columns prefer a free one
+                if dist[j] < best or (dist[j] == best and row4col[j] == UNASSIGNED):
+                    best = dist[j]
+                    j_best = j
+            if best == np.inf:
+                return cur
+            min_val = best
+            scanned[j_best] = True
+            scanned_cols[n_cols] = j_best
+            n_cols += 1
+            if row4col[j_best] == UNASSIGNED:
+                sink = j_best
+            else:
+                i = row4col[j_best]
+
+        u[cur] += min_val
+        for k in range(1, n_rows):
+            r = path_rows[k]
+            u[r] += min_val - dist[col4row[r]]
+        for k in range(n_cols):
+            j = scanned_cols[k]
+            v[j] -= min_val - dist[j]
+
+        j = sink
+        while True:
+            i = path[j]
+            row4col[j] = i
+            nxt = col4row[i]
+            col4row[i] = j
+            j = nxt
+            if i == cur:
+                break
+    return UNASSIGNED
+
+
+def augment_rows_numpy(
+    cost: np.ndarray,
+    u: np.ndarray,
+    v: np.ndarray,
+    col4row: np.ndarray,
+    row4col: np.ndarray,
+    pending: np.ndarray,
+) -> int:
+    """:func:`augment_rows_loop` with each Dijkstra relaxation vectorized over columns."""
+    m = cost.shape[1]
+    for cur in pending:
+        cur = int(cur)
+        dist = np.full(m, np.inf)  # tentative path lengths of unscanned columns
+        path = np.full(m, UNASSIGNED)
+        # Scanned columns get price -inf so their reduced cost is +inf from then on
+        price = v.copy()
+        scanned_cols = []
+        scanned_dist = []
+        rows = []
+        min_val = 0.0
+        i = cur
+        while True:
+            rows.append(i)
+            reduced = cost[i] - price
+            reduced += min_val - u[i]
+            better = reduced < dist
+            np.putmask(path, better, i)
+            np.minimum(dist, reduced, out=dist)
+            j = int(dist.argmin())
+            min_val = dist[j]
+            if min_val == np.inf:
+                return cur
+            scanned_cols.append(j)
+            scanned_dist.append(min_val)
+            dist[j] = np.inf
+            price[j] = -np.inf
+            if row4col[j] == UNASSIGNED:
+                break
+            i = int(row4col[j])
+
+        cols = np.array(scanned_cols)
+        col_dist = np.array(scanned_dist)
+        u[cur] += min_val
+        # Row k > 0 of the path was reached through column k - 1
+        u[rows[1:]] += min_val - col_dist[:-1]
+        v[cols] -= min_val - col_dist
+
+        while True:
+            i = int(path[j])
+            row4col[j] = i
+            col4row[i], j = j, col4row[i]
+            if i == cur:
+                break
+    return UNASSIGNED
+
+
+if NUMBA_AVAILABLE:
+    augment_rows = numba.njit(cache=True)(augment_rows_loop)
+else:
+    augment_rows = augment_rows_numpy
+
+
+def solve_assignment(
+    cost: np.ndarray,
+    v: np.ndarray | None = None,
+    col4row: np.ndarray | None = None,
+    tolerance: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """Minimum-cost assignment of every row to a distinct column (rows <= columns).
+
+    Args:
+        cost: ``(n, m)`` cost matrix, ``n <= m``; ``inf`` forbids a pairing.
+        v: Optional warm-start column prices (``<= 0``) from a previous solve.
+        col4row: Optional warm-start assignment (``UNASSIGNED`` for none).
+            Pairings that are no longer within *tolerance* of optimal under
+            the warm prices are dropped and re-augmented.
+        tolerance: Reduced-cost slack allowed when keeping a warm pairing;
+            the result is then within ``n * tolerance`` of optimal.
+
+    Returns:
+        Tuple of ``(col4row, v, n_augmented)``: the column of each row,
+        the column prices for the next warm start and how many rows had to
+        be augmented.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    n, m = cost.shape
+    if n > m:
+        raise ValueError("cost matrix must have at least as many columns as rows")
+    v = np.zeros(m) if v is None else np.minimum(np.array(v, dtype=np.float64), 0.0)
+    col4row = (
+        np.full(n, UNASSIGNED) if col4row is None else np.array(col4row, dtype=np.int64)
+    )
+    if n == 0:
+        # Nothing to assign (e.g. no interceptors ready at the end of a raid)
+        return col4row, v, 0
+    row4col = np.full(m, UNASSIGNED)
+
+    rows = np.arange(n)
+    assigned = col4row != UNASSIGNED
+    if assigned.any():
+        if len(np.unique(col4row[assigned])) != assigned.sum():
+            raise ValueError("warm-start assignment reuses a column")
+        # Drop warm pairings that are no longer (near-)tight. Freed columns must
+        # have zero price, which can loosen other rows, so repeat to a fixpoint.
+        while True:
+            row4col[:] = UNASSIGNED
+            row4col[col4row[assigned]] = rows[assigned]
+            v[row4col == UNASSIGNED] = 0.0
+            u = np.min(cost - v, axis=1)
+            slack = np.where(assigned, cost[rows, col4row] - v[col4row] - u, 0.0)
+            # Allow for rounding in prices accumulated over earlier solves
+            stale = assigned & ~(slack <= tolerance + 1e-12 * (1.0 + np.abs(u)))
+            if not stale.any():
+                break
+            col4row[stale] = UNASSIGNED
+            assigned &= ~stale
+    else:
+        # Cold start: with zero prices each row's cheapest column is tight, so
+        # the first row to claim a column keeps it (JV row reduction)
+        v[:] = 0.0
+        u = np.min(cost, axis=1)
+        best = np.argmin(cost, axis=1)
+        claims, first = np.unique(best, return_index=True)
+        finite = np.isfinite(u[first])
+        col4row[first[finite]] = claims[finite]
+        assigned = col4row != UNASSIGNED
+    row4col[:] = UNASSIGNED
+    row4col[col4row[assigned]] = rows[assigned]
+
+    pending = np.flatnonzero(~assigned)
+    u[pending] = 0.0
+    infeasible = augment_rows(cost, u, v, col4row, row4col, pending)
+    if infeasible != UNASSIGNED:
+        raise ValueError(f"row {infeasible} has no feasible assignment")
+    return col4row, v, len(pending)
+
+
+@dataclass
+class Assignment:
+    """Result of one weapon-target assignment pass.
+
+    Attributes:
+        pairs: Interceptor id to assigned track id.
+        held: Interceptor ids left unassigned this pass.
+        cost: Total cost of the engaged pairings.
+        augmented: Interceptors re-planned from scratch (0 when the previous
+            plan was still optimal).
+        changed: Interceptor ids whose track differs from the previous pass.
+    """
+
+    pairs: dict[Hashable, Hashable]
+    held: list[Hashable]
+    cost: float
+    augmented: int
+    changed: list[Hashable] = field(default_factory=list)
+
+
+class WeaponTargetAssigner:
+    """Re-solves interceptor-to-track assignment as the raid evolves.
+
+    Call :meth:`assign` each tick (or on track/inventory events) with the
+    ready interceptors and the confirmed, classified tracks. Column prices
+    and the last plan are remembered by id, so successive calls warm-start
+    from the previous solution.
+    """
+
+    def __init__(self, hold_cost: float = 0.0, tolerance: float = 0.0) -> None:
+        self.hold_cost = hold_cost
+        self.tolerance = tolerance
+        self._track_price: dict[Hashable, float] = {}
+        self._hold_price: dict[Hashable, float] = {}
+        self._plan: dict[Hashable, Hashable] = {}
+
+    def reset(self) -> None:
+        self._track_price.clear()
+        self._hold_price.clear()
+        self._plan.clear()
+
+    def assign(
+        self,
+        interceptor_ids: Sequence[Hashable],
+        track_ids: Sequence[Hashable],
+        cost: np.ndarray,
+    ) -> Assignment:
+        """Assign interceptors to tracks given an ``(n_interceptors, n_tracks)`` cost matrix."""
+        n, m = len(interceptor_ids), len(track_ids)
+        cost = np.asarray(cost, dtype=np.float64).reshape(n, m)
+        hold = np.full((n, n), np.inf)
+        np.fill_diagonal(hold, self.hold_cost)
+        full_cost = np.hstack([cost, hold])
+
+        track_col = {tid: j for j, tid in enumerate(track_ids)}
+        v = np.empty(m + n)
+        v[:m] = [self._track_price.get(tid, 0.0) for tid in track_ids]
+        v[m:] = [self._hold_price.get(iid, 0.0) for iid in interceptor_ids]
+        warm = np.full(n, UNASSIGNED)
+        for i, iid in enumerate(interceptor_ids):
+            if iid in self._plan:
+                warm[i] = track_col.get(self._plan[iid], UNASSIGNED)
+            elif iid in self._hold_price:
+                warm[i] = m + i
+
+        col4row, v, augmented = solve_assignment(full_cost, v, warm, self.tolerance)
+
+        pairs = {}
+        held = []
+        for i, iid in enumerate(interceptor_ids):
+            j = int(col4row[i])
+            if j < m:
+                pairs[iid] = track_ids[j]
+            else:
+                held.append(iid)
+        changed = [iid for iid in interceptor_ids if pairs.get(iid) != self._plan.get(iid)]
+        engaged = col4row < m
+        total = float(cost[np.flatnonzero(engaged), col4row[engaged]].sum())
+
+        self._track_price = dict(zip(track_ids, v[:m].tolist()))
+        self._hold_price = dict(zip(interceptor_ids, v[m:].tolist()))
+        self._plan = pairs
+        return Assignment(pairs, held, total, augmented, changed)
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
 
 from interceptor_sim.models.sensor import Sensor
 
+if TYPE_CHECKING:
+    from interceptor_sim.models.sensor_network import SensorNetwork
+
 
 class ClassificationState:
     """Accumulates classification confidence over multiple sensor looks."""
@@ -17,7 +22,7 @@ class ClassificationState:
         self.looks = 0
 
     def process_look(
-        self, sensor: Sensor, rng: np.random.Generator | None = None
+        self, sensor: Sensor | SensorNetwork, rng: np.random.Generator | None = None
     ) -> None:
         """Process one classification look and update confidence.
 
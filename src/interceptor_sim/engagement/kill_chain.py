@@ -6,15 +6,34 @@ from enum import Enum, auto
 
 import numpy as np
 
+from interceptor_sim.core.streams import (
+    CounterStream,
+    Quantity,
+    RandomStreams,
+    tick_index,
+    words_to_normal,
+    words_to_uniform,
+)
 from interceptor_sim.engagement.classification import ClassificationState
 from interceptor_sim.engagement.detection import TrackState, attempt_detection
+from interceptor_sim.engagement.reachability import (
+    check_due,
+    intercept_reachable,
+    remaining_moves,
+)
+from interceptor_sim.guidance.context import RelativeGeometry, entity_velocity
+from interceptor_sim.guidance.intercept_point import (
+    InterceptTimeTable,
+    get_intercept_table,
+    predicted_intercept_guidance,
+)
 from interceptor_sim.guidance.midcourse import command_guidance
-from interceptor_sim.guidance.proportional_nav import proportional_navigation
-from interceptor_sim.guidance.pure_pursuit import pure_pursuit
+from interceptor_sim.guidance.registry import get_terminal_guidance
 from interceptor_sim.models.interceptor import Interceptor, InterceptorState
 from interceptor_sim.models.sensor import Sensor, SensorMeasurement
+from interceptor_sim.models.sensor_network import SensorNetwork
 from interceptor_sim.models.target import Target
-from interceptor_sim.utils.geometry import Vec2, bearing, distance
+from interceptor_sim.utils.geometry import Vec2, bearing
 
 
 class Phase(Enum):
@@ -32,12 +51,37 @@ class EngagementResult(Enum):
     HIT = auto()
     MISS = auto()
     TIMEOUT = auto()
+    ABORTED = auto()
+    UNREACHABLE = auto()  # ended early: no future tick could be a kill
 
 
 class EngagementManager:
     """Drives the engagement through discrete kill-chain phases.
 
     Phases: SEARCH → TRACK → CLASSIFY → LAUNCH → MIDCOURSE → TERMINAL → COMPLETE
+
+    With a ``sensor_network`` the network replaces the single surveillance
+    sensor for detection, classification and midcourse measurement;
+    ``sensor_position`` still anchors command guidance.
+
+    In MIDCOURSE and TERMINAL each tick builds one :class:`RelativeGeometry`
+    (``self.geometry``) from the interceptor to the target — the estimated
+    track in midcourse, the true target in terminal — shared by the guidance
+    law and the handover / intercept checks. ``terminal_guidance`` names a
+    law in :mod:`interceptor_sim.guidance.registry`, where custom laws can be
+    registered.
+
+    With ``early_termination`` the manager checks every
+    :data:`~interceptor_sim.engagement.reachability.CHECK_INTERVAL` flight
+    ticks whether a kill is still kinematically possible and, when it is
+    not, ends the engagement with ``EngagementResult.UNREACHABLE`` instead
+    of flying out the remaining flight time. Hits are unaffected, so Pk is
+    unchanged; runs that end this way would otherwise have been misses.
+
+    Detection, classification and measurement noise come from ``rng`` in
+    call order, or, when ``streams`` is given, from counter-based streams
+    keyed by tick, sensor and quantity (see :mod:`interceptor_sim.core.streams`),
+    which makes every draw independent of what else was drawn.
     """
 
     def __init__(
@@ -51,6 +95,11 @@ class EngagementManager:
         terminal_handover_range: float = 100.0,
         stern_offset: float = 0.0,
         approach_blend_range: float = 500.0,
+        midcourse_guidance: str = "command",
+        intercept_table: InterceptTimeTable | None = None,
+        sensor_network: SensorNetwork | None = None,
+        early_termination: bool = False,
+        streams: RandomStreams | None = None,
         rng: np.random.Generator | None = None,
     ) -> None:
         self.target = target
@@ -62,7 +111,14 @@ class EngagementManager:
         self.terminal_handover_range = terminal_handover_range
         self.stern_offset = stern_offset
         self.approach_blend_range = approach_blend_range
+        self.midcourse_guidance = midcourse_guidance
+        # Loaded (or built and cached) on the first predicted-intercept tick
+        self.intercept_table = intercept_table
+        self.sensor_network = sensor_network
+        self.early_termination = early_termination
+        self.streams = streams
         self.rng = rng or np.random.default_rng()
+        self._tick = 0
 
         self.phase = Phase.SEARCH
         self.result = EngagementResult.PENDING
@@ -76,11 +132,15 @@ class EngagementManager:
         self.estimated_target_pos: Vec2 | None = None
         self.estimated_target_vel: Vec2 | None = None
         self.latest_measurement: SensorMeasurement | None = None
+        # Interceptor-to-target geometry of the current guided tick
+        self.geometry: RelativeGeometry | None = None
 
     def step(self, t: float, dt: float) -> None:
         """Advance engagement logic by one timestep."""
         if self.phase == Phase.COMPLETE:
             return
+        if self.streams is not None:
+            self._tick = tick_index(t, dt)
 
         if self.phase == Phase.SEARCH:
             self._step_search(t)
@@ -95,34 +155,116 @@ class EngagementManager:
         elif self.phase == Phase.TERMINAL:
             self._step_terminal(t, dt)
 
+    def manual_launch(self, t: float) -> bool:
+        """Operator override: skip remaining search/track/classify and launch next tick.
+
+        Returns False if the interceptor is already committed or the engagement is over.
+        """
+        if self.phase not in (Phase.SEARCH, Phase.TRACK, Phase.CLASSIFY):
+            return False
+        self._transition(Phase.LAUNCH, t)
+        return True
+
+    def abort(self, t: float) -> bool:
+        """Operator abort: end the engagement, disarming an interceptor in flight.
+
+        Returns False if the engagement had already completed.
+        """
+        if self.phase == Phase.COMPLETE:
+            return False
+        if self.interceptor.state in (InterceptorState.LAUNCHED, InterceptorState.TERMINAL):
+            self.interceptor.state = InterceptorState.MISSED
+            self.interceptor.speed = 0.0
+            self.interceptor.active = False
+        self.result = EngagementResult.ABORTED
+        self._transition(Phase.COMPLETE, t)
+        return True
+
     def _transition(self, new_phase: Phase, t: float) -> None:
         self.phase_log.append((t, new_phase))
         self.phase = new_phase
 
-    def _step_search(self, t: float) -> None:
-        detected = attempt_detection(
+    def _draws(self, quantity: Quantity) -> np.random.Generator | CounterStream | np.ndarray:
+        """Random source for this tick's *quantity* draws.
+
+        With counter-based streams and a sensor network, detection and
+        measurement draws of every sensor come from one vectorized call:
+        ``(K,)`` uniforms or ``(K, 2, 2)`` normals, one row per sensor's
+        stream. Classification looks only use the classifier's stream.
+        """
+        if self.streams is None:
+            return self.rng
+        network = self.sensor_network
+        if network is None:
+            sensor_id = self.surveillance_sensor.sensor_id
+            return self.streams.stream(self._tick, quantity, sensor_id or 0)
+        if quantity == Quantity.CLASSIFICATION:
+            return self.streams.stream(self._tick, quantity, network.classifier_id)
+        words = self.streams.sensor_words(self._tick, quantity, network.sensor_ids)
+        if quantity == Quantity.DETECTION:
+            return words_to_uniform(words[:, 0])
+        return words_to_normal(words).reshape(len(network), 2, 2)
+
+    def _attempt_detection(self) -> bool:
+        rng = self._draws(Quantity.DETECTION)
+        if self.sensor_network is not None:
+            return self.sensor_network.try_detect(self.target.position, rng=rng)
+        return attempt_detection(
             self.surveillance_sensor,
             self.sensor_position,
             self.target.position,
-            rng=self.rng,
+            rng=rng,
         )
+
+    def _intercept_unreachable(self, dt: float) -> bool:
+        """Periodic reachability check (see :mod:`interceptor_sim.engagement.reachability`)."""
+        interceptor = self.interceptor
+        if not self.early_termination or not check_due(interceptor.flight_time, dt):
+            return False
+        # Only worth testing while the range is opening
+        target = self.target
+        ivx, ivy = entity_velocity(interceptor)
+        tvx, tvy = entity_velocity(target)
+        rx = target.position[0] - interceptor.position[0]
+        ry = target.position[1] - interceptor.position[1]
+        if rx * (tvx - ivx) + ry * (tvy - ivy) <= 0.0:
+            return False
+        one = np.ones(1)
+        return not intercept_reachable(
+            interceptor.position[None, :],
+            interceptor.heading * one,
+            interceptor.speed * one,
+            interceptor.max_turn_rate * one,
+            dt * one,
+            interceptor.kill_radius * one,
+            remaining_moves(interceptor.flight_time, interceptor.max_flight_time, dt) * one,
+            target.path[None],
+            target.path_distance * one,
+            target.speed * one,
+        )[0]
+
+    def _end_unreachable(self, t: float) -> None:
+        self.interceptor.state = InterceptorState.MISSED
+        self.interceptor.speed = 0.0
+        self.interceptor.active = False
+        self.result = EngagementResult.UNREACHABLE
+        self._transition(Phase.COMPLETE, t)
+
+    def _step_search(self, t: float) -> None:
+        detected = self._attempt_detection()
         self.track.process_detection(detected)
         if self.track.detected:
             self._transition(Phase.TRACK, t)
 
     def _step_track(self, t: float) -> None:
-        detected = attempt_detection(
-            self.surveillance_sensor,
-            self.sensor_position,
-            self.target.position,
-            rng=self.rng,
-        )
+        detected = self._attempt_detection()
         self.track.process_detection(detected)
         if self.track.track_confirmed:
             self._transition(Phase.CLASSIFY, t)
 
     def _step_classify(self, t: float) -> None:
-        self.classification.process_look(self.surveillance_sensor, rng=self.rng)
+        sensor = self.sensor_network or self.surveillance_sensor
+        self.classification.process_look(sensor, rng=self._draws(Quantity.CLASSIFICATION))
         if self.classification.classified:
             self._transition(Phase.LAUNCH, t)
 
@@ -137,39 +279,70 @@ class EngagementManager:
             self.result = EngagementResult.MISS
             self._transition(Phase.COMPLETE, t)
             return
+        if self._intercept_unreachable(dt):
+            self._end_unreachable(t)
+            return
 
-        # Noisy measurement from surveillance sensor
-        measurement = self.surveillance_sensor.measure(
-            self.sensor_position,
-            self.target.position,
-            self.target.speed,
-            self.target.heading,
-            rng=self.rng,
-        )
+        # Noisy measurement from surveillance sensor(s)
+        rng = self._draws(Quantity.MEASUREMENT)
+        if self.sensor_network is not None:
+            measurement = self.sensor_network.measure(
+                self.target.position, self.target.speed, self.target.heading, rng=rng
+            )
+        else:
+            measurement = self.surveillance_sensor.measure(
+                self.sensor_position,
+                self.target.position,
+                self.target.speed,
+                self.target.heading,
+                rng=rng,
+            )
         self.latest_measurement = measurement
         self.estimated_target_pos = measurement.estimated_position.copy()
         self.estimated_target_vel = measurement.estimated_velocity.copy()
-
-        # Command guidance with stern attack
-        cmd_heading = command_guidance(
-            self.sensor_position,
-            self.estimated_target_pos,
-            self.interceptor.position,
-            estimated_target_vel=self.estimated_target_vel,
-            stern_offset=self.stern_offset,
-            approach_blend_range=self.approach_blend_range,
+        geometry = self.geometry = RelativeGeometry.between(
+            self.interceptor, self.estimated_target_pos, self.estimated_target_vel
         )
+
+        if self.midcourse_guidance == "predicted_intercept":
+            # Lead toward the predicted intercept point
+            if self.intercept_table is None:
+                self.intercept_table = get_intercept_table(
+                    self.interceptor.max_speed, self.interceptor.max_turn_rate
+                )
+            cmd_heading = predicted_intercept_guidance(
+                self.interceptor.position,
+                self.estimated_target_pos,
+                self.estimated_target_vel,
+                self.intercept_table,
+                geometry=geometry,
+            )
+        else:
+            # Command guidance with stern attack
+            cmd_heading = command_guidance(
+                self.sensor_position,
+                self.estimated_target_pos,
+                self.interceptor.position,
+                estimated_target_vel=self.estimated_target_vel,
+                stern_offset=self.stern_offset,
+                approach_blend_range=self.approach_blend_range,
+                geometry=geometry,
+            )
         self.interceptor.apply_guidance(cmd_heading, dt)
 
         # Deterministic handover: transition when estimated range <= threshold
-        est_range = distance(self.interceptor.position, self.estimated_target_pos)
-        if est_range <= self.terminal_handover_range:
+        # (steering does not move the interceptor, so the tick's range holds)
+        if geometry.range <= self.terminal_handover_range:
             self.interceptor.state = InterceptorState.TERMINAL
             self._transition(Phase.TERMINAL, t)
 
     def _step_terminal(self, t: float, dt: float) -> None:
+        geometry = self.geometry = RelativeGeometry.between(
+            self.interceptor, self.target.position, entity_velocity(self.target)
+        )
+
         # Check for intercept
-        if self.interceptor.check_intercept(self.target.position):
+        if geometry.range <= self.interceptor.kill_radius:
             self.interceptor.state = InterceptorState.DETONATED
             self.target.active = False
             self.result = EngagementResult.HIT
@@ -181,19 +354,10 @@ class EngagementManager:
             self.result = EngagementResult.MISS
             self._transition(Phase.COMPLETE, t)
             return
+        if self._intercept_unreachable(dt):
+            self._end_unreachable(t)
+            return
 
         # Apply terminal guidance
-        if self.terminal_guidance == "proportional_nav":
-            cmd_heading = proportional_navigation(
-                self.interceptor.position,
-                self.interceptor.velocity,
-                self.target.position,
-                self.target.velocity,
-                nav_gain=self.nav_gain,
-            )
-        else:
-            cmd_heading = pure_pursuit(
-                self.interceptor.position, self.target.position
-            )
-
-        self.interceptor.apply_guidance(cmd_heading, dt)
+        law = get_terminal_guidance(self.terminal_guidance)
+        self.interceptor.apply_guidance(law(geometry, self), dt)
@@ -0,0 +1,128 @@
+"""Conservative test for whether an intercept is still kinematically possible.
+
+A launched interceptor flies at constant ``speed`` and turns at most
+``turn_rate * dt`` per tick; the target follows its known waypoint path.
+For any direction at angle ``b`` (|b| <= pi) from the current heading, the
+interceptor's heading on its j-th future move is within ``j * turn_rate * dt``
+of the current one, so its displacement along that direction after k moves is
+at least
+
+    min_advance(k) = speed * dt * sum_{j=1..k} cos(min(|b| + j * turn_rate * dt, pi))
+
+(a closed-form sum). A kill at tick k needs the target within ``kill_radius``
+of a point satisfying that bound in every direction; eight directions give an
+octagonal superset of the true reachable set.
+
+The horizon (remaining flight time) is sampled every ``interval`` ticks. The
+target moves at most ``target_speed * dt`` and each bound at most
+``speed * dt`` per tick, so widening the kill radius by
+``(speed + target_speed) * dt * interval / 2`` makes the samples cover every
+tick in between. When no sample passes, no future tick can score a kill and
+the engagement can end early without changing its outcome (apart from the
+result code).
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from interceptor_sim.models.target import Target
+
+# Directions tested, evenly spaced around the heading
+N_DIRECTIONS = 8
+# Ticks between reachability checks and between horizon samples
+CHECK_INTERVAL = 10
+# Slack (m) absorbing rounding differences between the simulation and the test
+TOLERANCE = 1e-6
+
+DIRECTION_OFFSETS = -math.pi + 2.0 * math.pi * np.arange(N_DIRECTIONS) / N_DIRECTIONS
+
+
+def min_advance(
+    step_length: float | np.ndarray,
+    turn_step: float | np.ndarray,
+    offset: float | np.ndarray,
+    k: float | np.ndarray,
+) -> np.ndarray:
+    """Least distance moved along a direction *offset* rad off the heading in *k* ticks.
+
+    Args:
+        step_length: Distance flown per tick (``speed * dt``).
+        turn_step: Largest heading change per tick (``turn_rate * dt``).
+        offset: Direction relative to the current heading, in ``[-pi, pi]``.
+        k: Number of moves.
+    """
+    a = np.abs(offset)
+    c = np.maximum(turn_step, 1e-12)
+    # Moves before the heading can have turned fully away (cos term saturates at -1)
+    n = np.minimum(k, np.maximum(np.floor((math.pi - a) / c), 0.0))
+    turning = np.sin(n * c / 2.0) / np.sin(c / 2.0) * np.cos(a + (n + 1.0) * c / 2.0)
+    return step_length * (turning - (k - n))
+
+
+def check_due(flight_time: float, dt: float) -> bool:
+    """Whether the flight tick at *flight_time* is a reachability-check tick."""
+    return int(math.floor(flight_time / dt + 0.5)) % CHECK_INTERVAL == 0
+
+
+def remaining_moves(flight_time: float | np.ndarray, max_flight_time, dt) -> np.ndarray:
+    """Upper bound on the number of moves before the flight time runs out."""
+    return np.ceil(np.maximum(max_flight_time - flight_time, 0.0) / dt) + 1.0
+
+
+def intercept_reachable(
+    position: np.ndarray,
+    heading: np.ndarray,
+    speed: np.ndarray,
+    turn_rate: np.ndarray,
+    dt: np.ndarray,
+    kill_radius: np.ndarray,
+    moves: np.ndarray,
+    paths: np.ndarray,
+    path_distance: np.ndarray,
+    target_speed: np.ndarray,
+    interval: int = CHECK_INTERVAL,
+) -> np.ndarray:
+    """Whether a kill is still possible, for M engagements at once.
+
+    Args:
+        position: ``(M, 2)`` interceptor positions.
+        heading, speed, turn_rate, dt, kill_radius: ``(M,)`` interceptor
+            state and limits.
+        moves: ``(M,)`` moves left (see :func:`remaining_moves`).
+        paths: ``(M, L, 6)`` target path tables (:attr:`Target.path` layout),
+            padded by repeating the last row.
+        path_distance: ``(M,)`` arc length flown by each target so far.
+        target_speed: ``(M,)`` target speeds.
+        interval: Horizon sample spacing in ticks.
+
+    Returns:
+        ``(M,)`` bool; False only where no future tick can be a kill.
+    """
+    n_samples = int(np.max(np.ceil(moves / interval))) + 1
+    k = interval * np.arange(n_samples, dtype=np.float64)  # (J,)
+    valid = k[None, :] <= np.ceil(moves / interval)[:, None] * interval  # (M, J)
+
+    # Target positions at the sampled ticks
+    s = path_distance[:, None] + k[None, :] * (target_speed * dt)[:, None]
+    knots = paths[:, :, Target.PATH_S]
+    leg = np.maximum((knots[:, None, :] <= s[:, :, None]).sum(axis=2) - 1, 0)
+    rows = paths[np.arange(len(paths))[:, None], leg]  # (M, J, 6)
+    along = s - rows[..., Target.PATH_S]
+    rx = rows[..., Target.PATH_X] + along * rows[..., Target.PATH_UX] - position[:, 0:1]
+    ry = rows[..., Target.PATH_Y] + along * rows[..., Target.PATH_UY] - position[:, 1:2]
+
+    # Projection on each test direction vs. the least advance along it
+    angle = heading[:, None] + DIRECTION_OFFSETS[None, :]  # (M, D)
+    proj = rx[..., None] * np.cos(angle)[:, None, :] + ry[..., None] * np.sin(angle)[:, None, :]
+    bound = min_advance(
+        (speed * dt)[:, None, None],
+        (turn_rate * dt)[:, None, None],
+        DIRECTION_OFFSETS[None, None, :],
+        k[None, :, None],
+    )
+    slack = kill_radius + (speed + target_speed) * dt * (interval / 2.0) + TOLERANCE
+    possible = np.all(proj >= bound - slack[:, None, None], axis=2) & valid
+    return possible.any(axis=1)
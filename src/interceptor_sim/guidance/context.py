@@ -0,0 +1,107 @@
+"""Per-tick relative geometry shared by guidance laws and engagement checks."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from interceptor_sim.utils.geometry import Vec2
+
+if TYPE_CHECKING:
+    from interceptor_sim.core.entity import Entity
+
+
+def _xy(v: Vec2 | tuple[float, float]) -> tuple[float, float]:
+    # Python floats: scalar arithmetic on them is several times cheaper than
+    # on NumPy scalars and rounds identically
+    if isinstance(v, np.ndarray):
+        return tuple(v.tolist())
+    return float(v[0]), float(v[1])
+
+
+def entity_velocity(entity: Entity) -> tuple[float, float]:
+    """``entity.velocity`` as a tuple, without allocating an array."""
+    return entity.speed * math.cos(entity.heading), entity.speed * math.sin(entity.heading)
+
+
+class RelativeGeometry:
+    """Relative kinematics of a target seen from an interceptor, computed once.
+
+    Every guidance law needs some of range, line-of-sight angle, LOS rate and
+    closing speed, and the handover and intercept checks need the range. The
+    engagement manager builds one context per interceptor-target pair per
+    tick and hands it to whichever law runs, so the relative vectors and the
+    ``sqrt`` / ``atan2`` behind them are evaluated once instead of once per
+    helper call. Values match :mod:`interceptor_sim.utils.geometry` exactly
+    (same formulas and degenerate-case thresholds).
+
+    Attributes:
+        own_pos, target_pos: Positions the context was built from, as
+            ``(x, y)`` tuples.
+        own_vel, target_vel: Velocities as ``(x, y)`` tuples (zero when not
+            supplied).
+        rx, ry: Relative position (target minus own).
+        vx, vy: Relative velocity (target minus own).
+        range_sq, range: Squared and plain separation (m², m).
+        los_angle: Bearing from own position to the target (rad, CCW from +x).
+        los_rate: Line-of-sight angular rate (rad/s); 0 when co-located.
+        closing_speed: Closing speed along the LOS (m/s, positive = closing);
+            0 when co-located.
+    """
+
+    __slots__ = (
+        "own_pos",
+        "own_vel",
+        "target_pos",
+        "target_vel",
+        "rx",
+        "ry",
+        "vx",
+        "vy",
+        "range_sq",
+        "range",
+        "los_angle",
+        "los_rate",
+        "closing_speed",
+    )
+
+    def __init__(
+        self,
+        own_pos: Vec2,
+        target_pos: Vec2,
+        own_vel: Vec2 | None = None,
+        target_vel: Vec2 | None = None,
+    ) -> None:
+        self.own_pos = ox, oy = _xy(own_pos)
+        self.target_pos = tx, ty = _xy(target_pos)
+        self.own_vel = ovx, ovy = (0.0, 0.0) if own_vel is None else _xy(own_vel)
+        self.target_vel = tvx, tvy = (0.0, 0.0) if target_vel is None else _xy(target_vel)
+
+        self.rx = rx = tx - ox
+        self.ry = ry = ty - oy
+        self.vx = vx = tvx - ovx
+        self.vy = vy = tvy - ovy
+        self.range_sq = r_sq = rx * rx + ry * ry
+        self.range = rng = math.sqrt(r_sq)
+        self.los_angle = math.atan2(ry, rx)
+        self.los_rate = (rx * vy - ry * vx) / r_sq if r_sq >= 1e-9 else 0.0
+        if rng >= 1e-9:
+            self.closing_speed = (ovx - tvx) * (rx / rng) + (ovy - tvy) * (ry / rng)
+        else:
+            self.closing_speed = 0.0
+
+    @classmethod
+    def between(
+        cls, own: Entity, target_pos: Vec2, target_vel: Vec2 | None = None
+    ) -> RelativeGeometry:
+        """Context from entity *own* to a target position (and velocity)."""
+        return cls(own.position, target_pos, entity_velocity(own), target_vel)
+
+    def __repr__(self) -> str:
+        return (
+            f"RelativeGeometry(range={self.range:.1f}, "
+            f"los={math.degrees(self.los_angle):.1f}°, "
+            f"los_rate={self.los_rate:.4f}, vc={self.closing_speed:.1f})"
+        )
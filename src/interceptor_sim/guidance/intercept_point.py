@@ -0,0 +1,311 @@
+"""Predicted-intercept-point (PIP) midcourse guidance backed by a time-to-go table.
+
+The intercept triangle is solved with a precomputed table of time-to-go
+over (range, target aspect, speed ratio) for one interceptor type
+(``max_speed``, ``max_turn_rate``). The table is built once by a batched,
+turn-rate-limited simulation of every grid cell and cached on disk, so
+per-tick guidance is an O(1) trilinear lookup followed by a bearing to
+``target_pos + target_vel * tgo``.
+
+Aspect is the angle between the target velocity and the line of sight from
+interceptor to target: 0 for a target flying directly away, pi for head-on.
+Table cells assume the interceptor starts pointed along the line of sight.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+from interceptor_sim.guidance.context import RelativeGeometry
+from interceptor_sim.utils.geometry import Vec2, bearing, wrap_angle
+
+TABLE_VERSION = 1
+
+
+def default_cache_dir() -> Path:
+    """Cache directory for precomputed tables (``$INTERCEPTOR_SIM_CACHE`` overrides)."""
+    env = os.environ.get("INTERCEPTOR_SIM_CACHE")
+    return Path(env) if env else Path.home() / ".cache" / "interceptor_sim"
+
+
+def wrap_angle_array(angle: float | np.ndarray) -> np.ndarray:
+    """Vectorized :func:`wrap_angle`."""
+    return (np.asarray(angle, dtype=np.float64) + np.pi) % (2 * np.pi) - np.pi
+
+
+def straight_line_intercept_time(
+    rel_pos: Vec2, target_vel: Vec2, interceptor_speed: float
+) -> float | None:
+    """Smallest positive t with ``|rel_pos + target_vel * t| = interceptor_speed * t``.
+
+    Returns None when no intercept exists (target too fast and opening).
+    """
+    a = target_vel[0] * target_vel[0] + target_vel[1] * target_vel[1]
+    a -= interceptor_speed * interceptor_speed
+    b = 2.0 * (rel_pos[0] * target_vel[0] + rel_pos[1] * target_vel[1])
+    c = rel_pos[0] * rel_pos[0] + rel_pos[1] * rel_pos[1]
+    if abs(a) < 1e-9:
+        return -c / b if b < 0 else None
+    disc = b * b - 4.0 * a * c
+    if disc < 0:
+        return None
+    root = math.sqrt(disc)
+    candidates = [t for t in ((-b - root) / (2 * a), (-b + root) / (2 * a)) if t > 0]
+    return min(candidates) if candidates else None
+
+
+def straight_line_intercept_times(
+    rel_pos: np.ndarray, target_vel: np.ndarray, interceptor_speed: float | np.ndarray
+) -> np.ndarray:
+    """Vectorized :func:`straight_line_intercept_time` over ``(..., 2)`` inputs.
+
+    Returns NaN where no intercept exists.
+    """
+    rel_pos = np.asarray(rel_pos, dtype=np.float64)
+    target_vel = np.asarray(target_vel, dtype=np.float64)
+    s = np.asarray(interceptor_speed, dtype=np.float64)
+    a = target_vel[..., 0] ** 2 + target_vel[..., 1] ** 2 - s * s
+    b = 2.0 * (rel_pos[..., 0] * target_vel[..., 0] + rel_pos[..., 1] * target_vel[..., 1])
+    c = rel_pos[..., 0] ** 2 + rel_pos[..., 1] ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root = np.sqrt(b * b - 4.0 * a * c)
+        t1 = (-b - root) / (2 * a)
+        t2 = (-b + root) / (2 * a)
+        t1 = np.where(t1 > 0, t1, np.inf)
+        t2 = np.where(t2 > 0, t2, np.inf)
+        t = np.minimum(t1, t2)
+        linear = np.where(b < 0, -c / b, np.inf)
+    t = np.where(np.abs(a) < 1e-9, linear, t)
+    return np.where(np.isfinite(t), t, np.nan)
+
+
+class InterceptTimeTable:
+    """Time-to-go lookup over (range, aspect, speed ratio) on a uniform grid.
+
+    Unreachable cells hold NaN, and so do lookups beyond the range or speed
+    ratio axes; callers fall back to the straight-line solution there.
+    """
+
+    def __init__(
+        self,
+        max_speed: float,
+        max_turn_rate: float,
+        ranges: np.ndarray,
+        aspects: np.ndarray,
+        ratios: np.ndarray,
+        tgo: np.ndarray,
+    ) -> None:
+        self.max_speed = max_speed
+        self.max_turn_rate = max_turn_rate
+        self.ranges = ranges
+        self.aspects = aspects
+        self.ratios = ratios
+        self.tgo = tgo
+
+    @classmethod
+    def build(
+        cls,
+        max_speed: float,
+        max_turn_rate: float,
+        max_range: float = 10000.0,
+        n_range: int = 41,
+        n_aspect: int = 19,
+        max_ratio: float = 1.0,
+        n_ratio: int = 11,
+        dt: float = 0.1,
+        max_time: float = 300.0,
+    ) -> InterceptTimeTable:
+        """Simulate every grid cell at once and record time-to-capture."""
+        ranges = np.linspace(0.0, max_range, n_range)
+        aspects = np.linspace(0.0, np.pi, n_aspect)
+        ratios = np.linspace(0.0, max_ratio, n_ratio)
+        rg, asp, rat = np.meshgrid(ranges, aspects, ratios, indexing="ij")
+
+        # Interceptor at origin heading +x; target at (range, 0)
+        ix = np.zeros(rg.size)
+        iy = np.zeros(rg.size)
+        heading = np.zeros(rg.size)
+        tx = rg.ravel().copy()
+        ty = np.zeros(rg.size)
+        tvx = rat.ravel() * max_speed * np.cos(asp.ravel())
+        tvy = rat.ravel() * max_speed * np.sin(asp.ravel())
+        tgo = np.full(rg.size, np.nan)
+        capture = max_speed * dt
+        tgo[tx <= capture] = 0.0
+        live = np.isnan(tgo)
+        max_delta = max_turn_rate * dt
+        tv_sq = tvx * tvx + tvy * tvy
+
+        t = 0.0
+        while t < max_time and live.any():
+            rx = tx - ix
+            ry = ty - iy
+            # Straight-line PIP from the current state (pursuit if none exists)
+            a = tv_sq - max_speed * max_speed
+            b = 2.0 * (rx * tvx + ry * tvy)
+            c = rx * rx + ry * ry
+            with np.errstate(divide="ignore", invalid="ignore"):
+                disc = b * b - 4.0 * a * c
+                root = np.sqrt(np.maximum(disc, 0.0))
+                t1 = (-b - root) / (2 * a)
+                t2 = (-b + root) / (2 * a)
+                t_lin = np.where(b < 0, -c / b, np.nan)
+            t1 = np.where(t1 > 0, t1, np.inf)
+            t2 = np.where(t2 > 0, t2, np.inf)
+            t_hit = np.where(np.abs(a) < 1e-9, t_lin, np.minimum(t1, t2))
+            t_hit = np.where((disc >= 0) & np.isfinite(t_hit), t_hit, 0.0)
+            aim_x = rx + tvx * t_hit
+            aim_y = ry + tvy * t_hit
+            error = (np.arctan2(aim_y, aim_x) - heading + np.pi) % (2 * np.pi) - np.pi
+            heading = heading + np.clip(error, -max_delta, max_delta)
+
+            ix = ix + max_speed * np.cos(heading) * dt
+            iy = iy + max_speed * np.sin(heading) * dt
+            tx = tx + tvx * dt
+            ty = ty + tvy * dt
+            t += dt
+
+            hit = live & ((tx - ix) ** 2 + (ty - iy) ** 2 <= capture * capture)
+            tgo[hit] = t
+            live &= ~hit
+
+        return cls(max_speed, max_turn_rate, ranges, aspects, ratios, tgo.reshape(rg.shape))
+
+    def lookup(
+        self, rng: float | np.ndarray, aspect: float | np.ndarray, ratio: float | np.ndarray
+    ) -> float | np.ndarray:
+        """Trilinear interpolation of time-to-go.
+
+        Aspect is folded into [0, pi]. NaN outside the reachable set and for
+        ranges or speed ratios beyond the grid.
+        """
+        scalar = np.ndim(rng) == 0 and np.ndim(aspect) == 0 and np.ndim(ratio) == 0
+        coords = []
+        outside = False
+        for value, axis in (
+            (rng, self.ranges),
+            (np.abs(wrap_angle_array(aspect)), self.aspects),
+            (ratio, self.ratios),
+        ):
+            step = axis[1] - axis[0]
+            u = (np.asarray(value, dtype=np.float64) - axis[0]) / step
+            outside = outside | (u < 0) | (u > len(axis) - 1)
+            u = np.clip(u, 0, len(axis) - 1)
+            i0 = np.minimum(u.astype(np.int64), len(axis) - 2)
+            coords.append((i0, u - i0))
+        (i, fi), (j, fj), (k, fk) = coords
+        g = self.tgo
+        result = 0.0
+        for di, wi in ((0, 1 - fi), (1, fi)):
+            for dj, wj in ((0, 1 - fj), (1, fj)):
+                for dk, wk in ((0, 1 - fk), (1, fk)):
+                    w = wi * wj * wk
+                    # Skip zero-weight corners so unreachable neighbours don't leak NaN
+                    result = result + np.where(w > 0, w * g[i + di, j + dj, k + dk], 0.0)
+        result = np.where(outside, np.nan, result)
+        return float(result) if scalar else result
+
+    def cache_key(self) -> str:
+        return table_cache_key(self.max_speed, self.max_turn_rate)
+
+    def save(self, path: str | Path) -> None:
+        np.savez_compressed(
+            path,
+            version=TABLE_VERSION,
+            max_speed=self.max_speed,
+            max_turn_rate=self.max_turn_rate,
+            ranges=self.ranges,
+            aspects=self.aspects,
+            ratios=self.ratios,
+            tgo=self.tgo,
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> InterceptTimeTable:
+        with np.load(path) as data:
+            if int(data["version"]) != TABLE_VERSION:
+                raise ValueError(f"Stale intercept table version in {path}")
+            return cls(
+                float(data["max_speed"]),
+                float(data["max_turn_rate"]),
+                data["ranges"],
+                data["aspects"],
+                data["ratios"],
+                data["tgo"],
+            )
+
+
+def table_cache_key(max_speed: float, max_turn_rate: float) -> str:
+    spec = f"v{TABLE_VERSION}:{max_speed!r}:{max_turn_rate!r}"
+    return hashlib.sha1(spec.encode()).hexdigest()[:16]
+
+
+_TABLES: dict[str, InterceptTimeTable] = {}
+
+
+def get_intercept_table(
+    max_speed: float, max_turn_rate: float, cache_dir: str | Path | None = None
+) -> InterceptTimeTable:
+    """Return the table for an interceptor type: memory cache → disk cache → build."""
+    key = table_cache_key(max_speed, max_turn_rate)
+    if key in _TABLES:
+        return _TABLES[key]
+
+    path = Path(cache_dir or default_cache_dir()) / f"pip_table_{key}.npz"
+    table = None
+    if path.exists():
+        try:
+            table = InterceptTimeTable.load(path)
+        except (ValueError, OSError, KeyError):
+            table = None
+    if table is None:
+        table = InterceptTimeTable.build(max_speed, max_turn_rate)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table.save(path)
+    _TABLES[key] = table
+    return table
+
+
+def predicted_intercept_guidance(
+    interceptor_pos: Vec2,
+    target_pos: Vec2,
+    target_vel: Vec2,
+    table: InterceptTimeTable,
+    geometry: RelativeGeometry | None = None,
+) -> float:
+    """Return commanded heading toward the predicted intercept point.
+
+    Time-to-go comes from *table*; where the table has no solution the
+    straight-line intercept triangle is used, and pure pursuit when the
+    target cannot be caught at all.
+
+    Args:
+        interceptor_pos: Current interceptor position.
+        target_pos: Estimated target position.
+        target_vel: Estimated target velocity vector.
+        table: Time-to-go table for this interceptor type.
+        geometry: Precomputed interceptor-to-*target_pos* geometry for this tick.
+
+    Returns:
+        Commanded heading (radians).
+    """
+    g = geometry or RelativeGeometry(interceptor_pos, target_pos)
+    rel_x, rel_y, rng, los = g.rx, g.ry, g.range, g.los_angle
+    target_speed = math.sqrt(target_vel[0] * target_vel[0] + target_vel[1] * target_vel[1])
+    if target_speed < 1e-6:
+        return los
+
+    aspect = abs(wrap_angle(math.atan2(target_vel[1], target_vel[0]) - los))
+    tgo = table.lookup(rng, aspect, target_speed / table.max_speed)
+    if math.isnan(tgo):
+        tgo = straight_line_intercept_time((rel_x, rel_y), target_vel, table.max_speed)
+        if tgo is None:
+            return los
+
+    aim = (target_pos[0] + target_vel[0] * tgo, target_pos[1] + target_vel[1] * tgo)
+    return bearing(interceptor_pos, aim)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import numpy as np
+import math
 
-from interceptor_sim.utils.geometry import Vec2, bearing, distance
+from interceptor_sim.guidance.context import RelativeGeometry
+from interceptor_sim.utils.geometry import Vec2, magnitude
 
 
 def command_guidance(
@@ -14,6 +15,7 @@ def command_guidance(
     estimated_target_vel: Vec2 | None = None,
     stern_offset: float = 0.0,
     approach_blend_range: float = 500.0,
+    geometry: RelativeGeometry | None = None,
 ) -> float:
     """Return commanded heading for midcourse guidance.
 
@@ -32,26 +34,32 @@ def command_guidance(
         estimated_target_vel: Estimated target velocity vector (optional).
         stern_offset: Distance behind target for stern aim point (m).
         approach_blend_range: Range at which blend begins (m).
+        geometry: Precomputed interceptor-to-*target_pos* geometry for this
+            tick; supplies the pursuit bearing and the blend range.
 
     Returns:
         Commanded heading (radians).
     """
+    g = geometry or RelativeGeometry(interceptor_pos, target_pos)
     if estimated_target_vel is None or stern_offset <= 0.0:
-        return bearing(interceptor_pos, target_pos)
+        return g.los_angle
 
-    vel_norm = np.linalg.norm(estimated_target_vel)
+    vel_norm = magnitude(estimated_target_vel)
     if vel_norm < 1e-6:
-        return bearing(interceptor_pos, target_pos)
+        return g.los_angle
 
-    vel_unit = estimated_target_vel / vel_norm
-    stern_point = target_pos - stern_offset * vel_unit
+    # Scalar arithmetic on the context's floats (same rounding as the vector form)
+    tx, ty = g.target_pos
+    stern_x = tx - stern_offset * (float(estimated_target_vel[0]) / vel_norm)
+    stern_y = ty - stern_offset * (float(estimated_target_vel[1]) / vel_norm)
 
-    rng = distance(interceptor_pos, target_pos)
-    if rng >= approach_blend_range:
-        aim_point = stern_point
+    if g.range >= approach_blend_range:
+        aim_x, aim_y = stern_x, stern_y
     else:
         # Linearly blend: at range=0 aim at target, at range=blend_range aim at stern_point
-        blend = rng / approach_blend_range
-        aim_point = (1.0 - blend) * target_pos + blend * stern_point
+        blend = g.range / approach_blend_range
+        aim_x = (1.0 - blend) * tx + blend * stern_x
+        aim_y = (1.0 - blend) * ty + blend * stern_y
 
-    return bearing(interceptor_pos, aim_point)
+    ix, iy = g.own_pos
+    return math.atan2(aim_y - iy, aim_x - ix)
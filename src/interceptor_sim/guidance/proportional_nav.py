@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from interceptor_sim.utils.geometry import Vec2, bearing, closing_speed, line_of_sight_rate
+from interceptor_sim.guidance.context import RelativeGeometry
+from interceptor_sim.utils.geometry import Vec2
 
 
 def proportional_navigation(
@@ -11,6 +12,7 @@ def proportional_navigation(
     target_pos: Vec2,
     target_vel: Vec2,
     nav_gain: float = 4.0,
+    geometry: RelativeGeometry | None = None,
 ) -> float:
     """Return commanded heading using proportional navigation.
 
@@ -24,20 +26,18 @@ def proportional_navigation(
         target_pos: Target position.
         target_vel: Target velocity vector.
         nav_gain: Navigation constant (typically 3–5).
+        geometry: Precomputed interceptor-to-target geometry for this tick;
+            when given, the state arguments are not read.
 
     Returns:
         Commanded heading (radians).
     """
-    los_angle = bearing(interceptor_pos, target_pos)
-    los_rate = line_of_sight_rate(
-        interceptor_pos, interceptor_vel, target_pos, target_vel
-    )
-    vc = closing_speed(interceptor_pos, interceptor_vel, target_pos, target_vel)
+    g = geometry or RelativeGeometry(interceptor_pos, target_pos, interceptor_vel, target_vel)
 
     # Avoid division by zero when not closing
-    if abs(vc) < 1e-3:
-        return los_angle
+    if abs(g.closing_speed) < 1e-3:
+        return g.los_angle
 
     # PN lateral acceleration mapped to heading correction
-    heading_correction = nav_gain * los_rate
-    return los_angle + heading_correction
+    heading_correction = nav_gain * g.los_rate
+    return g.los_angle + heading_correction
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+from interceptor_sim.guidance.context import RelativeGeometry
 from interceptor_sim.utils.geometry import Vec2, bearing
 
 
-def pure_pursuit(interceptor_pos: Vec2, target_pos: Vec2) -> float:
+def pure_pursuit(
+    interceptor_pos: Vec2, target_pos: Vec2, geometry: RelativeGeometry | None = None
+) -> float:
     """Return commanded heading that points directly at the target.
 
     Args:
         interceptor_pos: Current interceptor position.
         target_pos: Current target position.
+        geometry: Precomputed interceptor-to-target geometry for this tick.
 
     Returns:
         Commanded heading (radians, CCW from +x).
     """
+    if geometry is not None:
+        return geometry.los_angle
     return bearing(interceptor_pos, target_pos)
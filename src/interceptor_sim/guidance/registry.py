@@ -0,0 +1,71 @@
+"""Terminal guidance law registry for built-in and custom laws."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from interceptor_sim.guidance.context import RelativeGeometry
+from interceptor_sim.guidance.proportional_nav import proportional_navigation
+from interceptor_sim.guidance.pure_pursuit import pure_pursuit
+
+if TYPE_CHECKING:
+    from interceptor_sim.engagement.kill_chain import EngagementManager
+
+# law(geometry, manager) -> commanded heading (radians). *geometry* is the
+# tick's interceptor-to-true-target context; *manager* exposes the rest of
+# the engagement (interceptor, target, nav_gain, estimates, rng, ...).
+TerminalGuidanceLaw = Callable[[RelativeGeometry, "EngagementManager"], float]
+
+
+def _proportional_nav(geometry: RelativeGeometry, manager: EngagementManager) -> float:
+    return proportional_navigation(
+        geometry.own_pos,
+        geometry.own_vel,
+        geometry.target_pos,
+        geometry.target_vel,
+        nav_gain=manager.nav_gain,
+        geometry=geometry,
+    )
+
+
+def _pure_pursuit(geometry: RelativeGeometry, manager: EngagementManager) -> float:
+    return pure_pursuit(geometry.own_pos, geometry.target_pos, geometry=geometry)
+
+
+BUILTIN_TERMINAL_GUIDANCE: dict[str, TerminalGuidanceLaw] = {
+    "proportional_nav": _proportional_nav,
+    "pure_pursuit": _pure_pursuit,
+}
+_terminal_guidance: dict[str, TerminalGuidanceLaw] = dict(BUILTIN_TERMINAL_GUIDANCE)
+
+
+def register_terminal_guidance(name: str, law: TerminalGuidanceLaw) -> TerminalGuidanceLaw:
+    """Make *law* selectable as ``engagement.terminal_guidance: <name>``.
+
+    Custom laws run only in the scalar engine; the compiled kernel and
+    :class:`~interceptor_sim.batch.engine.BatchEngine` reject engines that
+    use them. Re-registering a custom name replaces it.
+
+    Raises:
+        ValueError: If *name* is a built-in law.
+    """
+    if name in BUILTIN_TERMINAL_GUIDANCE:
+        raise ValueError(f"cannot replace built-in terminal guidance {name!r}")
+    _terminal_guidance[name] = law
+    return law
+
+
+def unregister_terminal_guidance(name: str) -> None:
+    """Remove a custom law registered under *name* (no-op if absent)."""
+    if name not in BUILTIN_TERMINAL_GUIDANCE:
+        _terminal_guidance.pop(name, None)
+
+
+def get_terminal_guidance(name: str) -> TerminalGuidanceLaw:
+    """Look up a terminal law; unknown names fall back to pure pursuit."""
+    return _terminal_guidance.get(name, _pure_pursuit)
+
+
+def is_custom_terminal_guidance(name: str) -> bool:
+    """Whether *name* selects a registered custom (non built-in) law."""
+    return name in _terminal_guidance and name not in BUILTIN_TERMINAL_GUIDANCE
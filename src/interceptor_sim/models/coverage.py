@@ -0,0 +1,91 @@
+"""Rasterized sensor coverage (Pd) maps with bilinear lookup."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from interceptor_sim.utils.geometry import Vec2
+
+if TYPE_CHECKING:
+    from interceptor_sim.models.sensor import Sensor
+
+
+class CoverageMap:
+    """Pd raster for one sensor at one position.
+
+    The grid spans the bounding box of the sensor's coverage sector (max
+    range within the field of regard) with nodes every *resolution* metres.
+    Lookups are bilinear; positions outside the grid have Pd 0. Use
+    :meth:`Sensor.coverage_map` to get a cached instance.
+
+    Attributes:
+        pd: Pd at grid nodes, shape ``(ny, nx)``; row j is ``y0 + j*resolution``.
+        x0, y0: World coordinates of node (0, 0).
+        signature: Sensor parameters the map was built from.
+    """
+
+    def __init__(self, sensor: Sensor, sensor_pos: Vec2, resolution: float = 25.0) -> None:
+        self.sensor_pos = np.asarray(sensor_pos, dtype=np.float64)
+        self.resolution = float(resolution)
+        self.signature = sensor.coverage_signature()
+
+        # Bounding box of the coverage sector
+        r = sensor.max_range
+        if sensor.field_of_regard >= 2 * np.pi:
+            angles = np.linspace(-np.pi, np.pi, 5)
+        else:
+            half = sensor.field_of_regard / 2
+            angles = sensor.boresight + np.linspace(-half, half, 181)
+        xs = np.concatenate([[0.0], r * np.cos(angles)]) + self.sensor_pos[0]
+        ys = np.concatenate([[0.0], r * np.sin(angles)]) + self.sensor_pos[1]
+        self.x0 = float(xs.min()) - self.resolution
+        self.y0 = float(ys.min()) - self.resolution
+        self.nx = int(math.ceil((xs.max() - self.x0) / self.resolution)) + 2
+        self.ny = int(math.ceil((ys.max() - self.y0) / self.resolution)) + 2
+
+        gx = self.x0 + self.resolution * np.arange(self.nx)
+        gy = self.y0 + self.resolution * np.arange(self.ny)
+        nodes = np.stack(np.meshgrid(gx, gy), axis=-1)
+        self.pd = sensor.pd_at(self.sensor_pos, nodes)
+        self._flat = self.pd.ravel()
+        self._corners = np.array([0, 1, self.nx, self.nx + 1])
+
+    @property
+    def extent(self) -> tuple[float, float, float, float]:
+        """``(xmin, xmax, ymin, ymax)`` for ``imshow(..., origin="lower")``."""
+        return (
+            self.x0,
+            self.x0 + self.resolution * (self.nx - 1),
+            self.y0,
+            self.y0 + self.resolution * (self.ny - 1),
+        )
+
+    def lookup(self, positions: Vec2 | np.ndarray) -> np.ndarray:
+        """Bilinear Pd at one position ``(2,)`` or a batch ``(N, 2)``.
+
+        All four corners of every query are fetched with one gather.
+        """
+        p = np.asarray(positions, dtype=np.float64)
+        u = (p[..., 0] - self.x0) / self.resolution
+        v = (p[..., 1] - self.y0) / self.resolution
+        inside = (u >= 0) & (u <= self.nx - 1) & (v >= 0) & (v <= self.ny - 1)
+        i = np.clip(np.floor(u), 0, self.nx - 2).astype(np.intp)
+        j = np.clip(np.floor(v), 0, self.ny - 2).astype(np.intp)
+        fu = u - i
+        fv = v - j
+        c = self._flat[(j * self.nx + i)[..., None] + self._corners]
+        pd = (c[..., 0] * (1 - fu) + c[..., 1] * fu) * (1 - fv) + (
+            c[..., 2] * (1 - fu) + c[..., 3] * fu
+        ) * fv
+        return np.where(inside, pd, 0.0)
+
+
+def combined_pd(maps: list[CoverageMap], positions: np.ndarray) -> np.ndarray:
+    """Cumulative Pd of independent sensors: ``1 - prod(1 - Pd_i)``."""
+    miss = np.ones(np.shape(positions)[:-1])
+    for cov in maps:
+        miss = miss * (1.0 - cov.lookup(positions))
+    return 1.0 - miss
@@ -66,7 +66,7 @@ class Interceptor(Entity):
         """Steer toward commanded heading, limited by max turn rate."""
         heading_error = wrap_angle(commanded_heading - self.heading)
         max_delta = self.max_turn_rate * dt
-        clamped = np.clip(heading_error, -max_delta, max_delta)
+        clamped = max(-max_delta, min(heading_error, max_delta))
         self.heading = wrap_angle(self.heading + clamped)
 
     def check_intercept(self, target_pos: Vec2) -> bool:
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from interceptor_sim.models.coverage import CoverageMap
 from interceptor_sim.utils.geometry import Vec2, bearing, distance, unit_vector, wrap_angle
 
 
@@ -42,6 +43,7 @@ class Sensor:
         bearing_noise_deg: float = 0.0,
         speed_noise_fraction: float = 0.0,
         heading_noise_deg: float = 0.0,
+        sensor_id: int | None = None,
     ) -> None:
         self.max_range = max_range
         self.field_of_regard = field_of_regard  # total angular width (radians)
@@ -52,6 +54,9 @@ class Sensor:
         self.bearing_noise_rad = np.radians(bearing_noise_deg)
         self.speed_noise_fraction = speed_noise_fraction
         self.heading_noise_rad = np.radians(heading_noise_deg)
+        # Keys the sensor's counter-based random streams (0, or its network position, if None)
+        self.sensor_id = sensor_id
+        self._coverage_cache: dict[tuple, CoverageMap] = {}
 
     def detection_probability(self, rng: float) -> float:
         """Probability of detection as a function of range.
@@ -72,6 +77,39 @@ class Sensor:
         angular_offset = abs(wrap_angle(angle_to_target - self.boresight))
         return angular_offset <= self.field_of_regard / 2
 
+    def pd_at(self, sensor_pos: Vec2, positions: np.ndarray) -> np.ndarray:
+        """Vectorized Pd (range model and field of regard) at positions ``(..., 2)``."""
+        p = np.asarray(positions, dtype=np.float64)
+        dx = p[..., 0] - sensor_pos[0]
+        dy = p[..., 1] - sensor_pos[1]
+        rng = np.sqrt(dx * dx + dy * dy)
+        pd = np.where(
+            rng > self.max_range,
+            0.0,
+            1.0 - (rng / self.max_range) * (1.0 - self.pd_at_max_range),
+        )
+        if self.field_of_regard < 2 * np.pi:
+            offset = np.abs((np.arctan2(dy, dx) - self.boresight + np.pi) % (2 * np.pi) - np.pi)
+            pd = np.where(offset <= self.field_of_regard / 2, pd, 0.0)
+        return pd
+
+    def coverage_signature(self) -> tuple[float, ...]:
+        """Parameters that determine the coverage map."""
+        return (self.max_range, self.field_of_regard, self.boresight, self.pd_at_max_range)
+
+    def coverage_map(self, sensor_pos: Vec2, resolution: float = 25.0) -> CoverageMap:
+        """Cached Pd raster for this sensor at *sensor_pos*.
+
+        Rebuilt only when a coverage parameter (range, field of regard,
+        boresight, Pd at max range) has changed since it was built.
+        """
+        key = (float(sensor_pos[0]), float(sensor_pos[1]), float(resolution))
+        cov = self._coverage_cache.get(key)
+        if cov is None or cov.signature != self.coverage_signature():
+            cov = CoverageMap(self, sensor_pos, resolution)
+            self._coverage_cache[key] = cov
+        return cov
+
     def try_detect(
         self, sensor_pos: Vec2, target_pos: Vec2, rng: np.random.Generator | None = None
     ) -> bool:
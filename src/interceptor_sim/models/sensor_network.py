@@ -0,0 +1,223 @@
+"""Networked surveillance sensors with vectorized measurement and fusion."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+
+from interceptor_sim.models.sensor import Sensor, SensorMeasurement
+from interceptor_sim.utils.geometry import Vec2, bearing, distance
+
+# Variance floor (m², (m/s)²) keeping noise-free sensors' covariances invertible
+MIN_VARIANCE = 1e-6
+
+# A generator, or the per-sensor draws already taken (one row per sensor)
+Draws = Union[np.random.Generator, np.ndarray]
+
+
+@dataclass
+class FusedMeasurement(SensorMeasurement):
+    """Fused network measurement.
+
+    Polar fields are relative to the network's reference position (its first
+    sensor). Covariances are 2x2 in the world frame.
+    """
+
+    position_covariance: np.ndarray
+    velocity_covariance: np.ndarray
+    n_sensors: int
+
+
+def _fuse_polar(
+    estimates: np.ndarray, angle: np.ndarray, var_along: np.ndarray, var_cross: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Inverse-covariance fusion of estimates with errors along / across *angle*.
+
+    ``estimates`` is ``(Q, K, 2)`` for Q quantities measured by K sensors; the
+    rest are ``(Q, K)``. A covariance rotated to *angle* has as its inverse the
+    same rotation of the reciprocal variances, so the information matrices
+    are built directly. Returns fused ``(Q, 2)`` estimates and ``(Q, 2, 2)``
+    covariances.
+    """
+    c, s = np.cos(angle), np.sin(angle)
+    ia, ic = 1.0 / var_along, 1.0 / var_cross
+    ixx = ia * c * c + ic * s * s
+    iyy = ia * s * s + ic * c * c
+    ixy = (ia - ic) * c * s
+    x, y = estimates[..., 0], estimates[..., 1]
+    # Summed information matrix and information vector
+    sxx, syy, sxy = ixx.sum(axis=-1), iyy.sum(axis=-1), ixy.sum(axis=-1)
+    vx = (ixx * x + ixy * y).sum(axis=-1)
+    vy = (ixy * x + iyy * y).sum(axis=-1)
+    det = sxx * syy - sxy * sxy
+    cov = np.empty(sxx.shape + (2, 2))
+    cov[..., 0, 0] = syy / det
+    cov[..., 1, 1] = sxx / det
+    cov[..., 0, 1] = cov[..., 1, 0] = -sxy / det
+    fused = np.stack([(syy * vx - sxy * vy) / det, (sxx * vy - sxy * vx) / det], axis=-1)
+    return fused, cov
+
+
+class SensorNetwork:
+    """Several surveillance sensors fused into one track.
+
+    Sensor parameters are copied into per-sensor arrays at construction so
+    detection and measurement for every sensor are single NumPy operations;
+    per-tick cost grows with the array length, not with Python calls.
+
+    * Detection: each sensor rolls independently (one ``rng.random(K)``
+      draw); the network detects if any sensor does.
+    * Measurement: every sensor produces a noisy polar measurement (one
+      sensor-major ``rng.standard_normal((K, 2, 2))`` draw, so a sensor's
+      noise does not depend on how many sensors follow it) converted to
+      Cartesian position and velocity with covariances from its noise model. Sensors
+      with the target inside their range and field of regard are fused by
+      inverse-covariance weighting; if none cover it, all are fused, as the
+      single-sensor model measures at any range.
+    * Classification: looks are taken by the most accurate sensor.
+
+    ``try_detect`` and ``measure`` take a generator or the draws themselves:
+    ``(K,)`` uniforms or ``(K, 2, 2)`` standard normals, one row per sensor.
+    With counter-based streams the engagement draws those rows for every
+    sensor at once, keyed by :attr:`sensor_ids`, so adding or removing a
+    sensor leaves the other sensors' noise unchanged.
+
+    Attributes:
+        sensors: Sensor models, in order.
+        positions: ``(K, 2)`` sensor positions; the first is the reference.
+        sensor_ids: ``(K,)`` stable sensor ids: ``Sensor.sensor_id``, or the
+            sensor's position in the network when that is None.
+        classifier_id: Id of the sensor taking classification looks.
+    """
+
+    def __init__(self, sensors: Sequence[Sensor], positions: Sequence[Vec2]) -> None:
+        if len(sensors) == 0 or len(sensors) != len(positions):
+            raise ValueError("need one position per sensor and at least one sensor")
+        self.sensors = list(sensors)
+        self.sensor_ids = np.array(
+            [k if s.sensor_id is None else s.sensor_id for k, s in enumerate(sensors)],
+            dtype=np.int64,
+        )
+        if len(np.unique(self.sensor_ids)) != len(sensors):
+            raise ValueError("sensor ids must be unique within a network")
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(len(sensors), 2)
+        self.max_range = np.array([s.max_range for s in sensors], dtype=np.float64)
+        self.field_of_regard = np.array([s.field_of_regard for s in sensors], dtype=np.float64)
+        self.boresight = np.array([s.boresight for s in sensors], dtype=np.float64)
+        self.pd_at_max_range = np.array([s.pd_at_max_range for s in sensors], dtype=np.float64)
+        self.range_noise_fraction = np.array([s.range_noise_fraction for s in sensors])
+        self.bearing_noise_rad = np.array([s.bearing_noise_rad for s in sensors])
+        self.speed_noise_fraction = np.array([s.speed_noise_fraction for s in sensors])
+        self.heading_noise_rad = np.array([s.heading_noise_rad for s in sensors])
+        self._magnitude_noise = np.stack([self.range_noise_fraction, self.speed_noise_fraction])
+        self._angle_noise = np.stack([self.bearing_noise_rad, self.heading_noise_rad])
+        self._classifier_index = max(
+            range(len(sensors)), key=lambda k: sensors[k].classification_accuracy
+        )
+        self.classifier = self.sensors[self._classifier_index]
+        self.classifier_id = int(self.sensor_ids[self._classifier_index])
+
+    def __len__(self) -> int:
+        return len(self.sensors)
+
+    @property
+    def reference(self) -> np.ndarray:
+        return self.positions[0]
+
+    def _geometry(self, target_pos: Vec2) -> tuple[np.ndarray, np.ndarray]:
+        d = np.asarray(target_pos, dtype=np.float64) - self.positions
+        return np.hypot(d[:, 0], d[:, 1]), np.arctan2(d[:, 1], d[:, 0])
+
+    def _pd(self, rng_: np.ndarray, brg: np.ndarray) -> np.ndarray:
+        pd = np.where(
+            rng_ > self.max_range,
+            0.0,
+            1.0 - (rng_ / self.max_range) * (1.0 - self.pd_at_max_range),
+        )
+        offset = np.abs((brg - self.boresight + np.pi) % (2 * np.pi) - np.pi)
+        in_for = (self.field_of_regard >= 2 * np.pi) | (offset <= self.field_of_regard / 2)
+        return np.where(in_for, pd, 0.0)
+
+    def detection_probabilities(self, target_pos: Vec2) -> np.ndarray:
+        """Per-sensor Pd for a target at *target_pos*."""
+        return self._pd(*self._geometry(target_pos))
+
+    def try_detect(self, target_pos: Vec2, rng: Draws | None = None) -> bool:
+        """Roll every sensor at once; True if any detects."""
+        pd = self.detection_probabilities(target_pos)
+        if isinstance(rng, np.ndarray):
+            u = rng
+        else:
+            u = (rng or np.random.default_rng()).random(len(pd))
+        return bool(np.any(u < pd))
+
+    def try_classify(self, rng: np.random.Generator | None = None) -> bool:
+        """Roll for correct classification with the most accurate sensor."""
+        return self.classifier.try_classify(rng=rng)
+
+    def measure(
+        self,
+        target_pos: Vec2,
+        target_speed: float,
+        target_heading: float,
+        rng: Draws | None = None,
+    ) -> FusedMeasurement:
+        """Measure the target with every sensor and fuse the estimates."""
+        true_rng, true_brg = self._geometry(target_pos)
+        n = len(true_rng)
+        if isinstance(rng, np.ndarray):
+            z = rng
+        else:
+            z = (rng or np.random.default_rng()).standard_normal((n, 2, 2))
+
+        # Row 0 = position (range, bearing), row 1 = velocity (speed, heading)
+        true_mag = np.stack([true_rng, np.full(n, float(target_speed))])
+        true_ang = np.stack([true_brg, np.full(n, float(target_heading))])
+        z = z.transpose(1, 2, 0)
+        mag = np.maximum(true_mag * (1.0 + self._magnitude_noise * z[0]), 0.0)
+        ang = true_ang + self._angle_noise * z[1]
+
+        use = self._pd(true_rng, true_brg) > 0.0
+        if use.any() and not use.all():
+            mag, ang = mag[:, use], ang[:, use]
+            origin, mag_noise, ang_noise = (
+                self.positions[use],
+                self._magnitude_noise[:, use],
+                self._angle_noise[:, use],
+            )
+        else:
+            origin, mag_noise, ang_noise = self.positions, self._magnitude_noise, self._angle_noise
+
+        estimates = np.empty(mag.shape + (2,))
+        estimates[..., 0] = mag * np.cos(ang)
+        estimates[..., 1] = mag * np.sin(ang)
+        estimates[0] += origin
+        # Variances from the measured values (the true state is unknown to a filter)
+        fused, cov = _fuse_polar(
+            estimates,
+            ang,
+            np.maximum((mag_noise * mag) ** 2, MIN_VARIANCE),
+            np.maximum((ang_noise * mag) ** 2, MIN_VARIANCE),
+        )
+        est_pos, est_vel = fused
+
+        ref = self.reference
+        return FusedMeasurement(
+            measured_range=distance(ref, est_pos),
+            measured_bearing=bearing(ref, est_pos),
+            measured_speed=float(np.hypot(est_vel[0], est_vel[1])),
+            measured_heading=float(np.arctan2(est_vel[1], est_vel[0])),
+            estimated_position=est_pos,
+            estimated_velocity=est_vel,
+            true_range=float(true_rng[0]),
+            true_bearing=float(true_brg[0]),
+            true_speed=target_speed,
+            true_heading=target_heading,
+            position_covariance=cov[0],
+            velocity_covariance=cov[1],
+            n_sensors=mag.shape[1],
+        )
+
@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
 from interceptor_sim.core.entity import Entity
-from interceptor_sim.utils.geometry import Vec2, bearing, distance
+from interceptor_sim.utils.geometry import Vec2
 
 
 class Target(Entity):
     """Adversarial UAV that follows a sequence of waypoints.
 
+    The waypoint polyline is precomputed at construction: each row of
+    :attr:`path` holds a vertex, the cumulative arc length at that vertex and
+    the unit direction / heading of the leg that starts there. The final row
+    carries the exit direction, along which the target keeps flying once it
+    has passed the last waypoint. ``update`` advances by arc length along this
+    path, and :meth:`position_at` / :meth:`velocity_at` query any future time
+    in O(log n) without simulating.
+
     Attributes:
         waypoints: List of 2D positions the target flies through in order.
-        waypoint_threshold: Distance at which the target considers a waypoint reached.
+        waypoint_threshold: Kept for scenario compatibility; the path is
+            flown exactly, so waypoints are reached when passed.
         rcs: Radar cross-section (m², used for detection model scaling).
+        path_distance: Arc length flown along the path so far (m).
     """
 
+    # Columns of the precomputed path table
+    PATH_X, PATH_Y, PATH_S, PATH_UX, PATH_UY, PATH_HEADING = range(6)
+
     def __init__(
         self,
         position: Vec2 | tuple[float, float],
@@ -27,30 +42,105 @@ class Target(Entity):
         name: str = "target",
     ) -> None:
         super().__init__(position=position, speed=speed, name=name)
-        self.waypoints: list[Vec2] = [
-            np.asarray(wp, dtype=np.float64) for wp in (waypoints or [])
-        ]
-        self.current_waypoint_idx = 0
         self.waypoint_threshold = waypoint_threshold
         self.rcs = rcs
+        self.set_waypoints(waypoints or [])
 
-        # Set initial heading toward first waypoint if available
-        if self.waypoints:
-            self.heading = bearing(self.position, self.waypoints[0])
+    def set_waypoints(self, waypoints: list[Vec2 | tuple[float, float]]) -> None:
+        """Replace the route, starting a new path at the current position."""
+        self.waypoints: list[Vec2] = [np.asarray(wp, dtype=np.float64) for wp in waypoints]
+        self.current_waypoint_idx = 0
+        self.path_distance = 0.0
+
+        vertices = [self.position.copy()] + self.waypoints
+        n = len(vertices)
+        path = np.zeros((n, 6), dtype=np.float64)
+        leg_headings: list[float | None] = []
+        for i, v in enumerate(vertices):
+            path[i, self.PATH_X] = v[0]
+            path[i, self.PATH_Y] = v[1]
+            if i > 0:
+                dx = v[0] - vertices[i - 1][0]
+                dy = v[1] - vertices[i - 1][1]
+                path[i, self.PATH_S] = path[i - 1, self.PATH_S] + math.sqrt(dx * dx + dy * dy)
+                leg_headings.append(math.atan2(dy, dx) if dx or dy else None)
+
+        # Final row: exit direction (last real leg, or current heading if none).
+        # Zero-length legs take the direction of the next real leg.
+        heading = next((h for h in reversed(leg_headings) if h is not None), self.heading)
+        path[n - 1, self.PATH_HEADING] = heading
+        for i in range(n - 2, -1, -1):
+            if leg_headings[i] is not None:
+                heading = leg_headings[i]
+            path[i, self.PATH_HEADING] = heading
+        path[:, self.PATH_UX] = np.cos(path[:, self.PATH_HEADING])
+        path[:, self.PATH_UY] = np.sin(path[:, self.PATH_HEADING])
+
+        self.path = path
+        self._path_s = path[:, self.PATH_S].tolist()
+        self.heading = float(path[0, self.PATH_HEADING])
+
+    @property
+    def path_length(self) -> float:
+        """Total length of the waypoint polyline (m)."""
+        return self._path_s[-1]
+
+    def _rows_at(self, t: float | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Arc length and path row (binary search) for time(s) *t*."""
+        s = np.asarray(t, dtype=np.float64) * self.speed
+        leg = np.maximum(np.searchsorted(self.path[:, self.PATH_S], s, side="right") - 1, 0)
+        return s, self.path[leg]
+
+    def position_at(self, t: float | np.ndarray) -> Vec2:
+        """Position after flying *t* seconds from the start of the path.
+
+        Accepts a scalar or an array of times (returns shape ``(..., 2)``).
+        Beyond the last waypoint the target continues along the exit heading.
+        """
+        s, rows = self._rows_at(t)
+        along = s - rows[..., self.PATH_S]
+        return np.stack(
+            [
+                rows[..., self.PATH_X] + along * rows[..., self.PATH_UX],
+                rows[..., self.PATH_Y] + along * rows[..., self.PATH_UY],
+            ],
+            axis=-1,
+        )
+
+    def velocity_at(self, t: float | np.ndarray) -> Vec2:
+        """Velocity vector after flying *t* seconds from the start of the path."""
+        _, rows = self._rows_at(t)
+        return self.speed * np.stack(
+            [rows[..., self.PATH_UX], rows[..., self.PATH_UY]], axis=-1
+        )
+
+    @property
+    def path_time(self) -> float:
+        """Time flown along the current path at the current speed (s)."""
+        return self.path_distance / self.speed if self.speed > 0 else 0.0
 
     def update(self, dt: float) -> None:
-        """Advance target along its waypoint path."""
+        """Advance target by arc length along its waypoint path."""
         if not self.active:
             return
 
-        if self.waypoints and self.current_waypoint_idx < len(self.waypoints):
-            wp = self.waypoints[self.current_waypoint_idx]
-            self.heading = bearing(self.position, wp)
-
-            if distance(self.position, wp) < self.waypoint_threshold:
-                self.current_waypoint_idx += 1
+        self.path_distance = self.path_distance + self.speed * dt
+        s = self.path_distance
+        path = self.path
+        leg = self.current_waypoint_idx
+        last = len(self._path_s) - 1
+        while leg < last and self._path_s[leg + 1] <= s:
+            leg += 1
+        self.current_waypoint_idx = leg
 
-        super().update(dt)
+        along = s - path[leg, self.PATH_S]
+        self.position = np.array(
+            [
+                path[leg, self.PATH_X] + along * path[leg, self.PATH_UX],
+                path[leg, self.PATH_Y] + along * path[leg, self.PATH_UY],
+            ]
+        )
+        self.heading = float(path[leg, self.PATH_HEADING])
 
     @property
     def has_reached_final_waypoint(self) -> bool:
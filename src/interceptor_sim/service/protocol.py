@@ -0,0 +1,151 @@
+"""Wire protocol for the real-time simulation service.
+
+Clients send JSON commands and receive JSON replies/events plus binary tick
+frames. Each tick frame is one :data:`TICK_DTYPE` record: session id and
+tick index followed by the fields of
+:data:`~interceptor_sim.core.frames.STATE_DTYPE` (state-frame format
+version :data:`~interceptor_sim.core.frames.FRAME_VERSION`, reported in
+``create`` replies). Consumers decode a run of frames with a single
+``np.frombuffer(data, dtype=TICK_DTYPE)``.
+
+Two transports carry the same messages:
+
+* Unix socket: every message is ``<u4 length><u1 kind><payload>`` with
+  *kind* :data:`KIND_JSON` or :data:`KIND_FRAME`; *length* counts the kind
+  byte and payload.
+* WebSocket (RFC 6455, implemented here on asyncio streams): JSON in text
+  messages, tick frames in binary messages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+from typing import Any
+
+import numpy as np
+
+from interceptor_sim.core.engine import SimState
+from interceptor_sim.core.frames import STATE_DTYPE, fill_record
+
+KIND_JSON = 0
+KIND_FRAME = 1
+
+TICK_DTYPE = np.dtype([("session", "<u4"), ("tick", "<u4")] + STATE_DTYPE.descr)
+
+
+def encode_tick(session: int, tick: int, state: SimState) -> bytes:
+    """One :data:`TICK_DTYPE` record for *state*."""
+    rec = np.zeros((), dtype=TICK_DTYPE)
+    rec["session"] = session
+    rec["tick"] = tick
+    fill_record(rec, state)
+    return rec.tobytes()
+
+
+def decode_ticks(data: bytes) -> np.ndarray:
+    """Zero-copy view of one or more concatenated tick frames."""
+    return np.frombuffer(data, dtype=TICK_DTYPE)
+
+
+# --- Unix socket framing ----------------------------------------------------
+
+_HEADER = struct.Struct("<IB")
+
+
+def pack_message(kind: int, payload: bytes) -> bytes:
+    return _HEADER.pack(len(payload) + 1, kind) + payload
+
+
+async def read_message(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read one length-prefixed message; raises ``IncompleteReadError`` at EOF."""
+    header = await reader.readexactly(_HEADER.size)
+    length, kind = _HEADER.unpack(header)
+    return kind, await reader.readexactly(length - 1)
+
+
+def dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# --- WebSocket (RFC 6455) ---------------------------------------------------
+
+_WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_CONT, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+
+def websocket_accept(key: str) -> str:
+    return base64.b64encode(hashlib.sha1(key.encode() + _WS_GUID).digest()).decode()
+
+
+async def websocket_handshake(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> bool:
+    """Answer the client's HTTP upgrade request; False if it is not one."""
+    request = await reader.readuntil(b"\r\n\r\n")
+    headers = {}
+    for line in request.decode("latin-1").split("\r\n")[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    key = headers.get("sec-websocket-key")
+    if key is None or "websocket" not in headers.get("upgrade", "").lower():
+        writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+        await writer.drain()
+        return False
+    writer.write(
+        b"HTTP/1.1 101 Switching Protocols\r\n"
+        b"Upgrade: websocket\r\nConnection: Upgrade\r\n"
+        b"Sec-WebSocket-Accept: " + websocket_accept(key).encode() + b"\r\n\r\n"
+    )
+    await writer.drain()
+    return True
+
+
+def websocket_frame(opcode: int, payload: bytes, mask: bytes | None = None) -> bytes:
+    """Encode a single final frame (servers send unmasked, clients masked)."""
+    n = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, mask_bit | n)
+    elif n < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, mask_bit | 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, mask_bit | 127, n)
+    if mask:
+        return header + mask + _apply_mask(payload, mask)
+    return header + payload
+
+
+def _apply_mask(payload: bytes, mask: bytes) -> bytes:
+    data = np.frombuffer(payload, dtype=np.uint8)
+    key = np.resize(np.frombuffer(mask, dtype=np.uint8), data.size)
+    return (data ^ key).tobytes()
+
+
+async def read_websocket_message(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read one (possibly fragmented) message; control frames are returned as-is."""
+    opcode = None
+    chunks = []
+    while True:
+        b0, b1 = await reader.readexactly(2)
+        fin, op = b0 & 0x80, b0 & 0x0F
+        n = b1 & 0x7F
+        if n == 126:
+            (n,) = struct.unpack("!H", await reader.readexactly(2))
+        elif n == 127:
+            (n,) = struct.unpack("!Q", await reader.readexactly(8))
+        mask = await reader.readexactly(4) if b1 & 0x80 else None
+        payload = await reader.readexactly(n)
+        if mask:
+            payload = _apply_mask(payload, mask)
+        if op >= OP_CLOSE:
+            return op, payload
+        if op != OP_CONT:
+            opcode = op
+        chunks.append(payload)
+        if fin:
+            return opcode, b"".join(chunks)
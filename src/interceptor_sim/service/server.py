@@ -0,0 +1,285 @@
+"""Asyncio service hosting many real-time simulation sessions.
+
+Commands are JSON objects with an ``op`` field; every command gets a JSON
+reply ``{"op": ..., "ok": true, ...}`` or ``{"op": ..., "ok": false,
+"error": ...}``.
+
+========================  ==================================================
+op                        fields
+========================  ==================================================
+``create``                ``scenario`` (dict) or ``scenario_path``; optional
+                          ``speed`` (real-time multiple), ``seed``,
+                          ``subscribe`` (default true). Replies ``session``
+                          and ``frame_version``.
+``subscribe``             ``session``
+``unsubscribe``           ``session``
+``waypoints``             ``session``, ``waypoints`` (list of [x, y])
+``launch`` / ``abort``    ``session``
+``speed``                 ``session``, ``speed``
+``status``                optional ``session``; replies ``sessions`` list
+``close``                 ``session``
+========================  ==================================================
+
+Subscribed connections receive binary tick frames
+(:data:`~interceptor_sim.service.protocol.TICK_DTYPE`) and a JSON
+``{"event": "complete", ...}`` when a session ends. Finished sessions stay
+visible to ``status`` for ``retain_finished`` seconds and are then removed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from interceptor_sim.core.frames import FRAME_VERSION
+from interceptor_sim.core.scenario import build_from_scenario, load_scenario
+from interceptor_sim.service.protocol import (
+    KIND_FRAME,
+    KIND_JSON,
+    OP_BINARY,
+    OP_CLOSE,
+    OP_PING,
+    OP_PONG,
+    OP_TEXT,
+    dumps,
+    pack_message,
+    read_message,
+    read_websocket_message,
+    websocket_frame,
+    websocket_handshake,
+)
+from interceptor_sim.service.session import Session
+
+
+class _Connection(ABC):
+    """One client: decodes commands and writes replies/frames for a transport."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.forwarders: dict[int, tuple[asyncio.Queue, asyncio.Task]] = {}
+
+    @abstractmethod
+    async def recv(self) -> dict | None:
+        """Next command, or None once the client has gone."""
+
+    @abstractmethod
+    def encode(self, kind: int, payload: bytes) -> bytes:
+        """Wire encoding of one reply or frame."""
+
+    async def send(self, kind: int, payload: bytes) -> None:
+        self.writer.write(self.encode(kind, payload))
+        await self.writer.drain()
+
+
+class _UnixConnection(_Connection):
+    async def recv(self) -> dict | None:
+        while True:
+            try:
+                kind, payload = await read_message(self.reader)
+            except asyncio.IncompleteReadError:
+                return None
+            if kind == KIND_JSON:
+                return json.loads(payload)
+
+    def encode(self, kind: int, payload: bytes) -> bytes:
+        return pack_message(kind, payload)
+
+
+class _WebSocketConnection(_Connection):
+    async def recv(self) -> dict | None:
+        while True:
+            try:
+                opcode, payload = await read_websocket_message(self.reader)
+            except asyncio.IncompleteReadError:
+                return None
+            if opcode == OP_CLOSE:
+                self.writer.write(websocket_frame(OP_CLOSE, payload[:2]))
+                return None
+            if opcode == OP_PING:
+                self.writer.write(websocket_frame(OP_PONG, payload))
+            elif opcode == OP_TEXT:
+                return json.loads(payload)
+
+    def encode(self, kind: int, payload: bytes) -> bytes:
+        return websocket_frame(OP_BINARY if kind == KIND_FRAME else OP_TEXT, payload)
+
+
+class SimulationService:
+    """Hosts sessions and serves them over Unix-socket and WebSocket transports."""
+
+    def __init__(self, queue_size: int = 256, retain_finished: float = 60.0) -> None:
+        self.sessions: dict[int, Session] = {}
+        self.queue_size = queue_size
+        self.retain_finished = retain_finished
+        self._reapers: dict[int, asyncio.TimerHandle] = {}
+        self._next_id = 1
+        self._servers: list[asyncio.AbstractServer] = []
+        self._connections: set[_Connection] = set()
+
+    # --- sessions ---------------------------------------------------------
+
+    def create_session(
+        self, scenario: dict, speed: float = 1.0, seed: int | None = None
+    ) -> Session:
+        """Build an engine from *scenario* and start pacing it (needs a running loop)."""
+        engine, _ = build_from_scenario(scenario, seed=seed)
+        session = Session(self._next_id, engine, speed=speed, queue_size=self.queue_size)
+        self._next_id += 1
+        self.sessions[session.id] = session
+        session.start().add_done_callback(lambda _: self._schedule_reap(session.id))
+        return session
+
+    def _schedule_reap(self, session_id: int) -> None:
+        if session_id in self.sessions:
+            loop = asyncio.get_running_loop()
+            self._reapers[session_id] = loop.call_later(
+                self.retain_finished, self._reap, session_id
+            )
+
+    def _reap(self, session_id: int) -> None:
+        self._reapers.pop(session_id, None)
+        for conn in self._connections:
+            self._unsubscribe(conn, session_id)
+        self.sessions.pop(session_id, None)
+
+    async def close_session(self, session_id: int) -> None:
+        session = self.sessions.pop(session_id)
+        reaper = self._reapers.pop(session_id, None)
+        if reaper is not None:
+            reaper.cancel()
+        await session.stop()
+        for conn in self._connections:
+            self._unsubscribe(conn, session_id)
+
+    def status(self, session_id: int | None = None) -> list[dict[str, Any]]:
+        ids = [session_id] if session_id is not None else sorted(self.sessions)
+        return [self.sessions[i].status() for i in ids]
+
+    # --- commands ---------------------------------------------------------
+
+    def _subscribe(self, conn: _Connection, session: Session) -> None:
+        if session.id in conn.forwarders:
+            return
+        queue = session.subscribe()
+
+        async def forward() -> None:
+            while True:
+                kind, payload = await queue.get()
+                await conn.send(kind, payload)
+
+        conn.forwarders[session.id] = (queue, asyncio.get_running_loop().create_task(forward()))
+
+    def _unsubscribe(self, conn: _Connection, session_id: int) -> None:
+        entry = conn.forwarders.pop(session_id, None)
+        if entry is None:
+            return
+        queue, task = entry
+        task.cancel()
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.unsubscribe(queue)
+
+    async def handle_command(self, cmd: dict, conn: _Connection | None = None) -> dict:
+        """Execute one command and return its reply."""
+        op = cmd.get("op")
+        try:
+            reply = self._dispatch(op, cmd, conn)
+            if op == "close":
+                await self.close_session(int(cmd["session"]))
+        except (KeyError, ValueError, TypeError, OSError) as exc:
+            return {"op": op, "ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        return {"op": op, "ok": True, **reply}
+
+    def _dispatch(self, op: str | None, cmd: dict, conn: _Connection | None) -> dict:
+        if op == "create":
+            scenario = cmd.get("scenario") or load_scenario(cmd["scenario_path"])
+            session = self.create_session(
+                scenario, speed=float(cmd.get("speed", 1.0)), seed=cmd.get("seed")
+            )
+            if conn is not None and cmd.get("subscribe", True):
+                self._subscribe(conn, session)
+            return {"session": session.id, "frame_version": FRAME_VERSION}
+        if op == "status":
+            sid = cmd.get("session")
+            return {"sessions": self.status(None if sid is None else int(sid))}
+        if op not in ("subscribe", "unsubscribe", "waypoints", "launch", "abort", "speed",
+                      "close"):
+            raise ValueError(f"unknown op {op!r}")
+
+        session = self.sessions[int(cmd["session"])]
+        if op == "subscribe" and conn is not None:
+            self._subscribe(conn, session)
+        elif op == "unsubscribe" and conn is not None:
+            self._unsubscribe(conn, session.id)
+        elif op == "waypoints":
+            session.set_waypoints([[float(x), float(y)] for x, y in cmd["waypoints"]])
+        elif op == "launch":
+            session.launch()
+        elif op == "abort":
+            session.abort()
+        elif op == "speed":
+            session.set_speed(float(cmd["speed"]))
+        return {"session": session.id}
+
+    # --- transports -------------------------------------------------------
+
+    async def _serve_connection(self, conn: _Connection) -> None:
+        self._connections.add(conn)
+        try:
+            while (cmd := await conn.recv()) is not None:
+                reply = await self.handle_command(cmd, conn)
+                await conn.send(KIND_JSON, dumps(reply))
+        except (ConnectionError, json.JSONDecodeError):
+            pass
+        finally:
+            for session_id in list(conn.forwarders):
+                self._unsubscribe(conn, session_id)
+            self._connections.discard(conn)
+            conn.writer.close()
+            with contextlib.suppress(ConnectionError):
+                await conn.writer.wait_closed()
+
+    async def serve_unix(self, path: str | Path) -> asyncio.AbstractServer:
+        """Listen on a Unix socket (length-prefixed JSON / frame messages)."""
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+        async def handler(reader, writer):
+            await self._serve_connection(_UnixConnection(reader, writer))
+
+        server = await asyncio.start_unix_server(handler, path=str(path))
+        self._servers.append(server)
+        return server
+
+    async def serve_websocket(
+        self, host: str = "127.0.0.1", port: int = 8765
+    ) -> asyncio.AbstractServer:
+        """Listen for WebSocket clients (JSON text messages, binary tick frames)."""
+
+        async def handler(reader, writer):
+            if await websocket_handshake(reader, writer):
+                await self._serve_connection(_WebSocketConnection(reader, writer))
+            else:
+                writer.close()
+
+        server = await asyncio.start_server(handler, host=host, port=port)
+        self._servers.append(server)
+        return server
+
+    async def close(self) -> None:
+        """Stop listening, drop clients and cancel every session."""
+        for server in self._servers:
+            server.close()
+        for conn in list(self._connections):
+            conn.writer.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+        for session_id in list(self.sessions):
+            await self.close_session(session_id)
@@ -0,0 +1,220 @@
+"""One real-time paced engine inside the simulation service."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from interceptor_sim.core.engine import SimulationEngine
+from interceptor_sim.engagement.kill_chain import Phase
+from interceptor_sim.service.protocol import KIND_FRAME, KIND_JSON, dumps, encode_tick
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionMetrics:
+    """Pacing and cost statistics for one session.
+
+    Lateness is how far after its wall-clock deadline a tick started.
+    Jitter is the standard deviation of lateness. CPU time is thread time
+    spent stepping this session's engine and encoding its frames.
+    """
+
+    late_threshold: float
+    ticks: int = 0
+    late_ticks: int = 0
+    max_lateness: float = 0.0
+    cpu_time: float = 0.0
+    dropped_frames: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    _mean: float = 0.0
+    _m2: float = 0.0
+
+    def record_tick(self, lateness: float, cpu: float) -> None:
+        self.ticks += 1
+        self.cpu_time += cpu
+        if lateness > self.late_threshold:
+            self.late_ticks += 1
+        self.max_lateness = max(self.max_lateness, lateness)
+        # Welford running mean / variance
+        delta = lateness - self._mean
+        self._mean += delta / self.ticks
+        self._m2 += delta * (lateness - self._mean)
+
+    @property
+    def mean_lateness(self) -> float:
+        return self._mean
+
+    @property
+    def jitter(self) -> float:
+        return math.sqrt(self._m2 / self.ticks) if self.ticks > 1 else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        wall = time.perf_counter() - self.started
+        return {
+            "ticks": self.ticks,
+            "late_ticks": self.late_ticks,
+            "late_fraction": self.late_ticks / self.ticks if self.ticks else 0.0,
+            "mean_lateness_ms": self.mean_lateness * 1e3,
+            "max_lateness_ms": self.max_lateness * 1e3,
+            "jitter_ms": self.jitter * 1e3,
+            "cpu_time_s": self.cpu_time,
+            "cpu_fraction": self.cpu_time / wall if wall > 0 else 0.0,
+            "dropped_frames": self.dropped_frames,
+        }
+
+
+class Session:
+    """Steps one engine on wall-clock deadlines and fans frames out to subscribers.
+
+    Tick ``k`` is due at ``start + k * dt / speed``; a late tick runs
+    immediately and the schedule is not shifted, so a session that falls
+    behind catches up instead of drifting. Commands are queued and applied
+    at the start of the next tick.
+
+    A session whose loop raises is logged, marked finished with its
+    ``error`` set, and still sends subscribers the ``complete`` event.
+    """
+
+    def __init__(
+        self,
+        session_id: int,
+        engine: SimulationEngine,
+        speed: float = 1.0,
+        late_threshold: float | None = None,
+        queue_size: int = 256,
+    ) -> None:
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.id = session_id
+        self.engine = engine
+        self.speed = speed
+        self.queue_size = queue_size
+        self._late_threshold = late_threshold
+        self.metrics = SessionMetrics(late_threshold=self._default_late_threshold())
+        self.subscribers: set[asyncio.Queue] = set()
+        self.tick = 0
+        self.finished = False
+        self.error: str | None = None
+        self._pending: list[Callable[[], Any]] = []
+        self._task: asyncio.Task | None = None
+        self._rescheduled = False
+
+    @property
+    def period(self) -> float:
+        return self.engine.dt / self.speed
+
+    def _default_late_threshold(self) -> float:
+        # Half a tick period unless fixed by the caller
+        if self._late_threshold is not None:
+            return self._late_threshold
+        return 0.5 * self.period
+
+    def start(self) -> asyncio.Task:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        self._task.add_done_callback(self._on_done)
+        return self._task
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        if task.cancelled() or task.exception() is None:
+            return
+        exc = task.exception()
+        logger.error("session %d failed", self.id, exc_info=exc)
+        self.error = f"{type(exc).__name__}: {exc}"
+        self.finished = True
+        self._publish(KIND_JSON, dumps({"event": "complete", **self.status()}))
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self.subscribers.discard(queue)
+
+    # --- commands ---------------------------------------------------------
+
+    def set_waypoints(self, waypoints: list[list[float]]) -> None:
+        self._pending.append(lambda: self.engine.target.set_waypoints(waypoints))
+
+    def launch(self) -> None:
+        self._pending.append(lambda: self.engine.engagement.manual_launch(self.engine.time))
+
+    def abort(self) -> None:
+        self._pending.append(lambda: self.engine.engagement.abort(self.engine.time))
+
+    def set_speed(self, speed: float) -> None:
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self.metrics.late_threshold = self._default_late_threshold()
+        self._rescheduled = True
+
+    # --- loop -------------------------------------------------------------
+
+    def _publish(self, kind: int, payload: bytes) -> None:
+        for queue in self.subscribers:
+            if queue.full():
+                # Slow consumer: drop its oldest message rather than stall the clock
+                queue.get_nowait()
+                self.metrics.dropped_frames += 1
+            queue.put_nowait((kind, payload))
+
+    def status(self) -> dict[str, Any]:
+        engagement = self.engine.engagement
+        return {
+            "session": self.id,
+            "time": self.engine.time,
+            "tick": self.tick,
+            "speed": self.speed,
+            "phase": engagement.phase.name,
+            "result": engagement.result.name,
+            "finished": self.finished,
+            "error": self.error,
+            "metrics": self.metrics.as_dict(),
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        scheduled = 0  # tick index the current schedule is anchored at
+        engine = self.engine
+        while True:
+            if self._rescheduled:
+                start, scheduled = loop.time(), self.tick
+                self._rescheduled = False
+            deadline = start + (self.tick - scheduled) * self.period
+            delay = deadline - loop.time()
+            await asyncio.sleep(delay if delay > 0 else 0)
+            lateness = max(loop.time() - deadline, 0.0)
+
+            cpu_start = time.thread_time()
+            for command in self._pending:
+                command()
+            self._pending.clear()
+            if not engine.step():
+                break
+            frame = encode_tick(self.id, self.tick, engine.snapshot())
+            self.metrics.record_tick(lateness, time.thread_time() - cpu_start)
+
+            self._publish(KIND_FRAME, frame)
+            self.tick += 1
+            if engine.engagement.phase == Phase.COMPLETE:
+                break
+
+        self.finished = True
+        self._publish(KIND_JSON, dumps({"event": "complete", **self.status()}))
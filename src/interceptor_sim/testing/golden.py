@@ -0,0 +1,179 @@
+"""Golden-trajectory regression harness.
+
+Records seed-locked reference outputs (``SimHistory`` columns, phase log and
+result) for a matrix of scenario variants into compressed ``.npz`` fixtures,
+and compares fresh runs against them, reporting the first tick and field at
+which a run diverges. Intended to gate performance refactors of the engine,
+sensor and guidance code: the full matrix runs in well under a few seconds.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario, load_scenario
+
+# Scenario variants (dotted-path overrides on the base scenario)
+GOLDEN_MATRIX: dict[str, dict[str, Any]] = {
+    "baseline": {},
+    "pure_pursuit": {"engagement.terminal_guidance": "pure_pursuit"},
+    "no_stern": {"engagement.stern_offset": 0.0},
+    "high_noise": {
+        "surveillance_sensor.noise.range_noise_fraction": 0.05,
+        "surveillance_sensor.noise.bearing_noise_deg": 6.0,
+    },
+    "narrow_sensor": {
+        "surveillance_sensor.field_of_regard_deg": 90,
+        "surveillance_sensor.pd_at_max_range": 0.1,
+    },
+    "short_endurance": {"interceptor.max_flight_time": 25.0},
+    "coarse_dt": {"simulation.dt": 0.25},
+}
+GOLDEN_SEEDS: tuple[int, ...] = (0, 1, 2)
+
+# Per-field absolute tolerance; integer/bool fields must match exactly
+DEFAULT_TOLERANCES: dict[str, float] = {
+    "time": 1e-9,
+    "target_pos": 1e-6,
+    "interceptor_pos": 1e-6,
+    "interceptor_speed": 1e-9,
+    "estimated_target_pos": 1e-6,
+    "estimated_target_vel": 1e-6,
+    "phase_log_time": 1e-9,
+}
+
+
+@dataclass
+class Divergence:
+    """First point at which a run departs from its golden reference."""
+
+    case: str
+    seed: int
+    field: str
+    tick: int
+    expected: Any
+    actual: Any
+
+    def __str__(self) -> str:
+        return (
+            f"{self.case}[seed={self.seed}]: '{self.field}' diverges at tick {self.tick} "
+            f"(expected {self.expected}, got {self.actual})"
+        )
+
+
+def run_case(
+    scenario: dict, overrides: dict[str, Any], seed: int, use_kernel: bool = False
+) -> dict[str, np.ndarray]:
+    """Run one golden case and return its output arrays."""
+    variant = apply_overrides(scenario, overrides)
+    engine, meta = build_from_scenario(variant, seed=seed)
+    engine.use_kernel = use_kernel
+    history = engine.run()
+    engagement = meta["engagement"]
+
+    arrays = history.as_arrays()
+    arrays["phase_log_time"] = np.array([t for t, _ in engagement.phase_log], dtype=np.float64)
+    arrays["phase_log_phase"] = np.array(
+        [p.value for _, p in engagement.phase_log], dtype=np.int8
+    )
+    arrays["result"] = np.array(engagement.result.value, dtype=np.int8)
+    return arrays
+
+
+def _first_mismatch(expected: np.ndarray, actual: np.ndarray, atol: float) -> int | None:
+    """Index of the first row where *actual* departs from *expected*, else None."""
+    n = min(len(expected), len(actual))
+    exp = expected[:n].reshape(n, -1)
+    act = actual[:n].reshape(n, -1)
+    same = np.isclose(act, exp, rtol=0.0, atol=atol, equal_nan=True)
+    bad = np.nonzero(~same.all(axis=1))[0]
+    if len(bad):
+        return int(bad[0])
+    if len(expected) != len(actual):
+        return n
+    return None
+
+
+def compare_arrays(
+    case: str,
+    seed: int,
+    expected: dict[str, np.ndarray],
+    actual: dict[str, np.ndarray],
+    tolerances: dict[str, float] | None = None,
+) -> Divergence | None:
+    """Compare one run against its reference; return the earliest divergence."""
+    tol = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+    first: Divergence | None = None
+    for field in expected:
+        exp = np.atleast_1d(expected[field])
+        act = np.atleast_1d(actual[field])
+        tick = _first_mismatch(exp, act, tol.get(field, 0.0))
+        if tick is None or (first is not None and tick >= first.tick):
+            continue
+        first = Divergence(
+            case=case,
+            seed=seed,
+            field=field,
+            tick=tick,
+            expected=exp[tick] if tick < len(exp) else "<end of run>",
+            actual=act[tick] if tick < len(act) else "<end of run>",
+        )
+    return first
+
+
+def fixture_path(case: str, fixture_dir: str | Path) -> Path:
+    return Path(fixture_dir) / f"{case}.npz"
+
+
+def record_golden(
+    fixture_dir: str | Path,
+    scenario_path: str | Path,
+    matrix: dict[str, dict[str, Any]] | None = None,
+    seeds: tuple[int, ...] = GOLDEN_SEEDS,
+) -> list[Path]:
+    """Run the matrix and write one compressed fixture per case."""
+    scenario = load_scenario(scenario_path)
+    Path(fixture_dir).mkdir(parents=True, exist_ok=True)
+    written = []
+    for case, overrides in (matrix or GOLDEN_MATRIX).items():
+        payload = {}
+        for seed in seeds:
+            for field, arr in run_case(scenario, overrides, seed).items():
+                payload[f"{seed}/{field}"] = arr
+        path = fixture_path(case, fixture_dir)
+        np.savez_compressed(path, **payload)
+        written.append(path)
+    return written
+
+
+def load_golden(case: str, fixture_dir: str | Path) -> dict[int, dict[str, np.ndarray]]:
+    """Load a case fixture as ``{seed: {field: array}}``."""
+    out: dict[int, dict[str, np.ndarray]] = {}
+    with np.load(fixture_path(case, fixture_dir)) as data:
+        for key in data.files:
+            seed, field = key.split("/", 1)
+            out.setdefault(int(seed), {})[field] = data[key]
+    return out
+
+
+def check_golden(
+    fixture_dir: str | Path,
+    scenario_path: str | Path,
+    matrix: dict[str, dict[str, Any]] | None = None,
+    tolerances: dict[str, float] | None = None,
+    use_kernel: bool = False,
+) -> list[Divergence]:
+    """Re-run every recorded case/seed and return all divergences found."""
+    scenario = load_scenario(scenario_path)
+    divergences = []
+    for case, overrides in (matrix or GOLDEN_MATRIX).items():
+        for seed, expected in load_golden(case, fixture_dir).items():
+            actual = run_case(scenario, overrides, seed, use_kernel=use_kernel)
+            div = compare_arrays(case, seed, expected, actual, tolerances)
+            if div is not None:
+                divergences.append(div)
+    return divergences
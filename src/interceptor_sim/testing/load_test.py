@@ -0,0 +1,103 @@
+"""Load-test runner: throughput and tail latency per engagement over a corpus."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from interceptor_sim.core.scenario import build_from_scenario
+
+
+@dataclass
+class LoadTestRecord:
+    """Timing and outcome of one engagement."""
+
+    family: str
+    name: str
+    seed: int
+    wall_time: float
+    ticks: int
+    result: str
+
+
+@dataclass
+class LoadTestReport:
+    """Per-engagement latency records with summary statistics."""
+
+    records: list[LoadTestRecord] = field(default_factory=list)
+
+    def summary(self, family: str | None = None) -> dict[str, float]:
+        """Throughput and latency percentiles, optionally for one family."""
+        recs = [r for r in self.records if family is None or r.family == family]
+        if not recs:
+            return {}
+        wall = np.array([r.wall_time for r in recs])
+        ticks = np.array([r.ticks for r in recs])
+        total = float(wall.sum())
+        return {
+            "engagements": len(recs),
+            "total_time_s": total,
+            "engagements_per_s": len(recs) / total if total > 0 else float("inf"),
+            "ticks_per_s": float(ticks.sum()) / total if total > 0 else float("inf"),
+            "p50_ms": float(np.percentile(wall, 50)) * 1e3,
+            "p95_ms": float(np.percentile(wall, 95)) * 1e3,
+            "p99_ms": float(np.percentile(wall, 99)) * 1e3,
+            "max_ms": float(wall.max()) * 1e3,
+            "mean_ticks": float(ticks.mean()),
+            "hit_fraction": sum(r.result == "HIT" for r in recs) / len(recs),
+        }
+
+    @property
+    def families(self) -> list[str]:
+        return sorted({r.family for r in self.records})
+
+    def format(self) -> str:
+        """Fixed-width table of per-family summaries."""
+        header = (
+            f"{'family':<16}{'runs':>6}{'eng/s':>9}{'ticks/s':>11}"
+            f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'Pk':>6}"
+        )
+        lines = [header, "-" * len(header)]
+        for fam in self.families + [None]:
+            s = self.summary(fam)
+            lines.append(
+                f"{fam or 'ALL':<16}{s['engagements']:>6}{s['engagements_per_s']:>9.1f}"
+                f"{s['ticks_per_s']:>11.0f}{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}"
+                f"{s['p99_ms']:>9.1f}{s['max_ms']:>9.1f}{s['hit_fraction']:>6.2f}"
+            )
+        return "\n".join(lines)
+
+
+def run_load_test(
+    corpus: Iterable[tuple[str, dict]],
+    seeds: Iterable[int] = (0,),
+    use_kernel: bool = False,
+) -> LoadTestReport:
+    """Run every scenario in *corpus* once per seed and time each engagement.
+
+    Timing covers component construction plus ``engine.run()``, i.e. what a
+    caller of :func:`build_from_scenario` actually pays per engagement.
+    """
+    report = LoadTestReport()
+    seeds = list(seeds)
+    for family, scenario in corpus:
+        for seed in seeds:
+            start = time.perf_counter()
+            engine, meta = build_from_scenario(scenario, seed=seed)
+            engine.use_kernel = use_kernel
+            history = engine.run()
+            elapsed = time.perf_counter() - start
+            report.records.append(
+                LoadTestRecord(
+                    family=family,
+                    name=scenario.get("name", ""),
+                    seed=seed,
+                    wall_time=elapsed,
+                    ticks=len(history) - 1,  # the initial state is not a tick
+                    result=meta["engagement"].result.name,
+                )
+            )
+    return report
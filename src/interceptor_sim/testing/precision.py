@@ -0,0 +1,108 @@
+"""Accuracy check of reduced-precision batch runs against float64 references.
+
+:func:`check_precision` runs the same lanes through :class:`BatchEngine`
+twice, in float64 and in the reduced precision, and compares them lane by
+lane. Both runs use counter-based random streams (``simulation.counter_rng``)
+so every lane sees identical noise in both precisions; with the shared
+sequential generator, lanes finishing on different ticks would reshuffle
+the draws and only aggregate statistics would be comparable.
+
+Differences come from rounding in positions, headings and estimates. They
+are tiny on most lanes, but engagements decided by a few centimetres can
+flip, so the report gives outcome agreement and Pk difference alongside
+miss-distance error quantiles.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from interceptor_sim.batch.engine import BatchEngine
+from interceptor_sim.core.scenario import apply_overrides
+
+# Acceptance limits of :meth:`PrecisionReport.ok`
+DEFAULT_LIMITS: dict[str, float] = {
+    "outcome_agreement": 0.995,  # minimum share of lanes with the same result
+    "pk_error": 0.005,  # maximum |Pk difference|
+    "median_miss_error": 0.01,  # maximum median |miss distance difference| (m)
+}
+
+
+@dataclass
+class PrecisionReport:
+    """Lane-by-lane comparison of a reduced-precision run with float64.
+
+    Attributes:
+        precision: The reduced precision checked.
+        n_lanes: Lanes compared.
+        outcome_agreement: Share of lanes with the same result code.
+        pk_reference, pk: Pk in float64 and in the reduced precision.
+        miss_error: Median, 99th percentile and maximum absolute miss-distance
+            difference over lanes that launched in both runs (m).
+        end_time_error: Maximum absolute end-time difference (s).
+        memory_ratio: Lane-state memory relative to float64.
+        speedup: float64 run time over reduced-precision run time.
+    """
+
+    precision: str
+    n_lanes: int
+    outcome_agreement: float
+    pk_reference: float
+    pk: float
+    miss_error: tuple[float, float, float]
+    end_time_error: float
+    memory_ratio: float
+    speedup: float
+
+    def ok(self, limits: dict[str, float] | None = None) -> bool:
+        """Whether the run is within *limits* (see :data:`DEFAULT_LIMITS`)."""
+        limits = {**DEFAULT_LIMITS, **(limits or {})}
+        return (
+            self.outcome_agreement >= limits["outcome_agreement"]
+            and abs(self.pk - self.pk_reference) <= limits["pk_error"]
+            and self.miss_error[0] <= limits["median_miss_error"]
+        )
+
+    def summary(self) -> str:
+        median, p99, worst = self.miss_error
+        return (
+            f"{self.precision} vs float64 over {self.n_lanes} lanes: "
+            f"outcomes agree {self.outcome_agreement:.2%}, "
+            f"Pk {self.pk:.4f} vs {self.pk_reference:.4f}, "
+            f"miss error median {median:.2g} m / p99 {p99:.2g} m / max {worst:.2g} m, "
+            f"memory x{self.memory_ratio:.2f}, speed x{self.speedup:.2f}"
+        )
+
+
+def check_precision(
+    scenarios: list[dict], seed: int = 0, precision: str = "float32"
+) -> PrecisionReport:
+    """Run *scenarios* in float64 and *precision* and compare the lanes."""
+    scenarios = [apply_overrides(sc, {"simulation.counter_rng": True}) for sc in scenarios]
+    reference_engine = BatchEngine.from_scenarios(scenarios, seed=seed)
+    engine = BatchEngine.from_scenarios(scenarios, seed=seed, precision=precision)
+
+    start = time.perf_counter()
+    reference = reference_engine.run()
+    reference_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = engine.run()
+    run_time = time.perf_counter() - start
+
+    miss = np.abs(result.miss_distance - reference.miss_distance)
+    miss = miss[~np.isnan(miss)]
+    quantiles = np.percentile(miss, [50, 99, 100]) if miss.size else np.zeros(3)
+    return PrecisionReport(
+        precision=precision,
+        n_lanes=len(reference),
+        outcome_agreement=float(np.mean(result.result == reference.result)),
+        pk_reference=reference.pk(),
+        pk=result.pk(),
+        miss_error=tuple(float(q) for q in quantiles),
+        end_time_error=float(np.max(np.abs(result.end_time - reference.end_time), initial=0.0)),
+        memory_ratio=engine.nbytes / reference_engine.nbytes,
+        speedup=reference_time / run_time if run_time > 0 else float("nan"),
+    )
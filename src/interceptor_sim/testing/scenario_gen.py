@@ -0,0 +1,161 @@
+"""Randomized scenario generator for fuzzing and load testing.
+
+Produces scenario dictionaries in the same schema as
+``scenarios/example_intercept.yaml`` (the schema :func:`build_from_scenario`
+consumes), drawn from a :class:`ScenarioSpace` of parameter ranges. Named
+families in :data:`FAMILIES` stress specific parts of the engine: long
+waypoint lists, tiny time steps and extreme sensor noise.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+
+@dataclass(frozen=True)
+class ScenarioSpace:
+    """Parameter ranges for generated scenarios (uniform over each interval)."""
+
+    start_range: tuple[float, float] = (1500.0, 4800.0)  # m from protected asset
+    approach_bearing_deg: tuple[float, float] = (0.0, 360.0)
+    waypoint_count: tuple[int, int] = (1, 4)
+    path_jitter: float = 0.15  # lateral waypoint scatter, fraction of leg length
+    target_speed: tuple[float, float] = (15.0, 60.0)
+    sensor_max_range: tuple[float, float] = (5000.0, 6000.0)
+    pd_at_max_range: tuple[float, float] = (0.2, 0.6)
+    classification_accuracy: tuple[float, float] = (0.7, 0.95)
+    range_noise_fraction: tuple[float, float] = (0.0, 0.03)
+    bearing_noise_deg: tuple[float, float] = (0.0, 3.0)
+    speed_noise_fraction: tuple[float, float] = (0.0, 0.05)
+    heading_noise_deg: tuple[float, float] = (0.0, 5.0)
+    launch_standoff: tuple[float, float] = (0.0, 600.0)  # m from sensor
+    interceptor_speed: tuple[float, float] = (60.0, 110.0)
+    max_turn_rate_deg: tuple[float, float] = (15.0, 45.0)
+    stern_offset: tuple[float, float] = (0.0, 300.0)
+    terminal_handover_range: tuple[float, float] = (60.0, 200.0)
+    nav_gain: tuple[float, float] = (3.0, 5.0)
+    dt: tuple[float, float] = (0.05, 0.2)
+    max_time: float = 200.0
+
+
+FAMILIES: dict[str, ScenarioSpace] = {
+    "nominal": ScenarioSpace(),
+    "long_waypoints": ScenarioSpace(waypoint_count=(100, 500), path_jitter=0.5),
+    "tiny_dt": ScenarioSpace(dt=(0.002, 0.01)),
+    "extreme_noise": ScenarioSpace(
+        range_noise_fraction=(0.05, 0.2),
+        bearing_noise_deg=(5.0, 15.0),
+        speed_noise_fraction=(0.1, 0.3),
+        heading_noise_deg=(10.0, 45.0),
+    ),
+}
+
+
+def _uniform(rng: np.random.Generator, bounds: tuple[float, float]) -> float:
+    return float(rng.uniform(bounds[0], bounds[1]))
+
+
+def generate_scenario(
+    rng: np.random.Generator, space: ScenarioSpace | None = None, name: str = "generated"
+) -> dict:
+    """Draw one valid scenario dictionary from *space*."""
+    space = space or ScenarioSpace()
+
+    # Target approaches the protected asset at the origin from a random bearing
+    approach = np.radians(_uniform(rng, space.approach_bearing_deg))
+    start = _uniform(rng, space.start_range) * np.array([np.cos(approach), np.sin(approach)])
+    n_wp = int(rng.integers(space.waypoint_count[0], space.waypoint_count[1] + 1))
+    fractions = np.linspace(0.0, 1.0, n_wp + 1)[1:]
+    leg_length = np.linalg.norm(start) / n_wp
+    lateral = np.array([-np.sin(approach), np.cos(approach)])
+    waypoints = []
+    for i, frac in enumerate(fractions):
+        point = (1.0 - frac) * start
+        if i < n_wp - 1:
+            point = point + rng.normal(0.0, space.path_jitter * leg_length) * lateral
+        waypoints.append([round(float(v), 3) for v in point])
+
+    standoff_dir = rng.uniform(-np.pi, np.pi)
+    launch = _uniform(rng, space.launch_standoff) * np.array(
+        [np.cos(standoff_dir), np.sin(standoff_dir)]
+    )
+
+    return {
+        "name": name,
+        "target": {
+            "name": "hostile_uav",
+            "position": [round(float(v), 3) for v in start],
+            "speed": _uniform(rng, space.target_speed),
+            "rcs": 0.01,
+            "waypoints": waypoints,
+        },
+        "surveillance_sensor": {
+            "position": [0.0, 0.0],
+            "max_range": _uniform(rng, space.sensor_max_range),
+            "field_of_regard_deg": 360,
+            "pd_at_max_range": _uniform(rng, space.pd_at_max_range),
+            "classification_accuracy": _uniform(rng, space.classification_accuracy),
+            "noise": {
+                "range_noise_fraction": _uniform(rng, space.range_noise_fraction),
+                "bearing_noise_deg": _uniform(rng, space.bearing_noise_deg),
+                "speed_noise_fraction": _uniform(rng, space.speed_noise_fraction),
+                "heading_noise_deg": _uniform(rng, space.heading_noise_deg),
+            },
+        },
+        "interceptor": {
+            "name": "defender_1",
+            "position": [round(float(v), 3) for v in launch],
+            "max_speed": _uniform(rng, space.interceptor_speed),
+            "max_turn_rate_deg": _uniform(rng, space.max_turn_rate_deg),
+            "kill_radius": 5.0,
+            "max_flight_time": 90.0,
+        },
+        "engagement": {
+            "terminal_guidance": "proportional_nav",
+            "nav_gain": _uniform(rng, space.nav_gain),
+            "terminal_handover_range": _uniform(rng, space.terminal_handover_range),
+            "stern_offset": _uniform(rng, space.stern_offset),
+            "approach_blend_range": 500.0,
+        },
+        "simulation": {
+            "dt": _uniform(rng, space.dt),
+            "max_time": space.max_time,
+        },
+    }
+
+
+def generate_corpus(
+    count: int,
+    seed: int | None = None,
+    families: list[str] | None = None,
+    **space_overrides,
+) -> Iterator[tuple[str, dict]]:
+    """Yield ``(family, scenario)`` pairs, *count* per requested family.
+
+    Extra keyword arguments override :class:`ScenarioSpace` fields for every
+    family, e.g. ``max_time=60.0``.
+    """
+    rng = np.random.default_rng(seed)
+    for family in families or list(FAMILIES):
+        space = replace(FAMILIES[family], **space_overrides)
+        for i in range(count):
+            yield family, generate_scenario(rng, space, name=f"{family}_{i:04d}")
+
+
+def write_corpus(
+    directory: str | Path, corpus: Iterator[tuple[str, dict]]
+) -> list[Path]:
+    """Write a corpus as ``<directory>/<family>/<name>.yaml``."""
+    paths = []
+    for family, scenario in corpus:
+        path = Path(directory) / family / f"{scenario['name']}.yaml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            yaml.safe_dump(scenario, f, sort_keys=False)
+        paths.append(path)
+    return paths
@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 from numpy.typing import NDArray
 
 Vec2 = NDArray[np.floating]
 
 
+def magnitude(v: Vec2) -> float:
+    """Euclidean length of a 2D vector."""
+    return math.sqrt(v[0] * v[0] + v[1] * v[1])
+
+
 def distance(a: Vec2, b: Vec2) -> float:
     """Euclidean distance between two 2D points."""
-    return float(np.linalg.norm(b - a))
+    dx = b[0] - a[0]
+    dy = b[1] - a[1]
+    return math.sqrt(dx * dx + dy * dy)
 
 
 def bearing(from_pt: Vec2, to_pt: Vec2) -> float:
     """Bearing angle (radians) from *from_pt* to *to_pt*, measured CCW from +x."""
-    delta = to_pt - from_pt
-    return float(np.arctan2(delta[1], delta[0]))
+    return math.atan2(to_pt[1] - from_pt[1], to_pt[0] - from_pt[0])
 
 
 def unit_vector(angle: float) -> Vec2:
@@ -33,23 +41,27 @@ def closing_speed(
     pos_a: Vec2, vel_a: Vec2, pos_b: Vec2, vel_b: Vec2
 ) -> float:
     """Closing speed along the line of sight (positive = closing)."""
-    los = pos_b - pos_a
-    los_dist = np.linalg.norm(los)
+    los_x = pos_b[0] - pos_a[0]
+    los_y = pos_b[1] - pos_a[1]
+    los_dist = math.sqrt(los_x * los_x + los_y * los_y)
     if los_dist < 1e-9:
         return 0.0
-    los_unit = los / los_dist
-    return float(np.dot(vel_a - vel_b, los_unit))
+    return float(
+        (vel_a[0] - vel_b[0]) * (los_x / los_dist)
+        + (vel_a[1] - vel_b[1]) * (los_y / los_dist)
+    )
 
 
 def line_of_sight_rate(
     pos_a: Vec2, vel_a: Vec2, pos_b: Vec2, vel_b: Vec2
 ) -> float:
     """Line-of-sight angular rate (rad/s)."""
-    rel_pos = pos_b - pos_a
-    rel_vel = vel_b - vel_a
-    r_sq = np.dot(rel_pos, rel_pos)
+    rx = pos_b[0] - pos_a[0]
+    ry = pos_b[1] - pos_a[1]
+    vx = vel_b[0] - vel_a[0]
+    vy = vel_b[1] - vel_a[1]
+    r_sq = rx * rx + ry * ry
     if r_sq < 1e-9:
         return 0.0
     # LOS rate = (r x v) / |r|^2  (scalar in 2D)
-    cross = rel_pos[0] * rel_vel[1] - rel_pos[1] * rel_vel[0]
-    return float(cross / r_sq)
+    return float((rx * vy - ry * vx) / r_sq)
@@ -7,8 +7,10 @@ from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
 
+from interceptor_sim.batch.envelope import Envelope
 from interceptor_sim.core.engine import SimHistory
 from interceptor_sim.engagement.kill_chain import EngagementManager, Phase
+from interceptor_sim.models.coverage import CoverageMap
 from interceptor_sim.utils.geometry import distance
 
 
@@ -151,6 +153,86 @@ def plot_phase_timeline(
     plt.show()
 
 
+def plot_coverage(
+    coverage: CoverageMap,
+    history: SimHistory | None = None,
+    save_path: str | Path | None = None,
+) -> None:
+    """Plot a sensor Pd coverage map as a heat map, optionally with trajectories."""
+    fig, ax = plt.subplots(figsize=(9, 8))
+    ax.set_aspect("equal")
+
+    im = ax.imshow(
+        coverage.pd, origin="lower", extent=coverage.extent,
+        cmap="viridis", vmin=0.0, vmax=1.0,
+    )
+    fig.colorbar(im, ax=ax, label="Probability of detection")
+    ax.plot(
+        coverage.sensor_pos[0], coverage.sensor_pos[1],
+        "wD", markersize=8, label="Sensor",
+    )
+
+    if history is not None:
+        tgt_pos = history.target_positions
+        int_pos = history.interceptor_positions
+        ax.plot(tgt_pos[:, 0], tgt_pos[:, 1], "r-", linewidth=2, label="Target")
+        ax.plot(int_pos[:, 0], int_pos[:, 1], "w-", linewidth=2, label="Interceptor")
+
+    ax.set_xlabel("X (m)")
+    ax.set_ylabel("Y (m)")
+    ax.set_title("Sensor Coverage")
+    ax.legend()
+
+    if save_path:
+        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+    plt.show()
+
+
+def plot_envelope(
+    envelope: Envelope,
+    heading_index: int = 0,
+    save_path: str | Path | None = None,
+) -> None:
+    """Plot Pk and miss-distance rasters of an engagement envelope with Pk contours."""
+    fig, (ax_pk, ax_miss) = plt.subplots(1, 2, figsize=(16, 7))
+    x, y = envelope.grid_xy()
+    pk = envelope.pk[heading_index]
+    offset = np.degrees(envelope.heading_offsets[heading_index])
+
+    for ax in (ax_pk, ax_miss):
+        ax.set_aspect("equal")
+        ax.plot(
+            envelope.launch_site[0], envelope.launch_site[1],
+            "k^", markersize=10, label="Launch site",
+        )
+        ax.set_xlabel("X (m)")
+        ax.set_ylabel("Y (m)")
+
+    mesh = ax_pk.pcolormesh(x, y, pk, cmap="RdYlGn", vmin=0.0, vmax=1.0, shading="gouraud")
+    fig.colorbar(mesh, ax=ax_pk, label="Pk")
+    levels = sorted({0.1, envelope.threshold, 0.9})
+    widths = [2.0 if lvl == envelope.threshold else 0.8 for lvl in levels]
+    cs = ax_pk.contour(x, y, pk, levels=levels, colors="k", linewidths=widths)
+    ax_pk.clabel(cs, fmt="%.1f")
+    sim = envelope.simulated[heading_index]
+    ax_pk.plot(x[sim], y[sim], "k.", markersize=2, alpha=0.4, label="Simulated nodes")
+    ax_pk.set_title(f"Pk Envelope (heading offset {offset:.0f}°)")
+    ax_pk.legend(loc="upper right")
+
+    mesh = ax_miss.pcolormesh(
+        x, y, envelope.miss_distance[heading_index], cmap="viridis_r", shading="gouraud"
+    )
+    fig.colorbar(mesh, ax=ax_miss, label="Median miss distance (m)")
+    ax_miss.contour(x, y, pk, levels=[envelope.threshold], colors="w", linewidths=2.0)
+    ax_miss.set_title("Miss Distance")
+    ax_miss.legend(loc="upper right")
+
+    plt.tight_layout()
+    if save_path:
+        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+    plt.show()
+
+
 def print_summary(history: SimHistory, engagement: EngagementManager) -> None:
     """Print engagement summary metrics to console."""
     final = history.states[-1]
@@ -0,0 +1,120 @@
+"""Tests for adaptive Monte Carlo campaigns."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.adaptive import (
+    _allocate,
+    bootstrap_percentile_interval,
+    clopper_pearson_interval,
+    run_adaptive,
+    wilson_interval,
+)
+from interceptor_sim.core.scenario import apply_overrides, load_scenario
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    # Bearing noise makes the outcome random near the speed the interceptor can still catch
+    return apply_overrides(
+        load_scenario(SCENARIO), {"surveillance_sensor.noise.bearing_noise_deg": 2.0}
+    )
+
+
+class TestIntervals:
+    def test_wilson(self):
+        np.testing.assert_allclose(
+            wilson_interval(3, 10), (0.10779126731943314, 0.6032218527550438), rtol=1e-9
+        )
+        low, high = wilson_interval(0, 64)
+        assert low == 0.0 and high == pytest.approx(0.056624, abs=1e-6)
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+
+    @pytest.mark.parametrize(
+        "hits, n, expected",
+        [
+            (3, 10, (0.06673951117773447, 0.6524528500599973)),
+            (0, 10, (0.0, 0.3084971078187607)),
+            (999, 1000, (0.9944410757201734, 0.9999746825125088)),
+            (4000, 9000, (0.4341423149047826, 0.45478255630780345)),
+        ],
+    )
+    def test_clopper_pearson_matches_beta_quantiles(self, hits, n, expected):
+        np.testing.assert_allclose(clopper_pearson_interval(hits, n), expected, rtol=1e-9)
+
+    def test_clopper_pearson_is_wider_than_wilson(self):
+        for hits in (0, 5, 20):
+            cp, w = clopper_pearson_interval(hits, 40), wilson_interval(hits, 40)
+            assert cp[0] <= w[0] and cp[1] >= w[1]
+
+    def test_bootstrap_percentile(self):
+        values = np.random.default_rng(0).normal(10.0, 2.0, 400)
+        low, high = bootstrap_percentile_interval(values, 50, rng=np.random.default_rng(1))
+        assert low < np.median(values) < high
+        assert high - low < 1.0
+        assert np.isnan(bootstrap_percentile_interval(np.array([]), 90)[0])
+
+
+class TestAllocation:
+    def test_proportional_to_need(self):
+        allocation = _allocate({0: 1000.0, 1: 3000.0}, {0: 500, 1: 500}, 200, 8)
+        assert allocation == {0: 50, 1: 150}
+
+    def test_capped_by_need_and_room(self):
+        allocation = _allocate({0: 3.0, 1: 1000.0}, {0: 500, 1: 40}, 200, 8)
+        assert allocation == {0: 8, 1: 40}
+
+
+class TestRunAdaptive:
+    def test_clear_cells_stop_after_first_batch(self, scenario):
+        cells = [{"target.speed": s} for s in (30.0, 68.0, 90.0)]
+        result = run_adaptive(scenario, cells, pk_half_width=0.04, seed=0)
+        easy, hard, hopeless = result.cells
+        assert easy.n == hopeless.n == 64
+        assert (easy.pk, hopeless.pk) == (1.0, 0.0)
+        assert hard.n > 64
+        assert all(cell.status == "precise" for cell in result.cells)
+        low, high = hard.pk_interval
+        assert high - low <= 0.08
+        assert result.total_trials == sum(result.trials_per_round)
+
+    def test_threshold_decisions(self, scenario):
+        cells = [{"target.speed": s} for s in (30.0, 90.0)]
+        result = run_adaptive(scenario, cells, pk_half_width=0.001, threshold=0.5, seed=0)
+        assert [cell.status for cell in result.cells] == ["decided", "decided"]
+        assert result.rounds == 1
+
+    def test_miss_percentiles_and_budget(self, scenario):
+        result = run_adaptive(
+            scenario,
+            [{"target.speed": 68.0}],
+            pk_half_width=0.001,
+            miss_percentiles=(50, 90),
+            interval="clopper_pearson",
+            batch_size=32,
+            max_trials=96,
+            seed=0,
+        )
+        (cell,) = result.cells
+        assert cell.status == "budget"
+        assert cell.n == 96
+        assert set(cell.miss_intervals) == {50, 90}
+        assert cell.miss_intervals[50][0] <= cell.miss_intervals[90][1]
+
+    def test_cells_that_never_launch_stop_on_pk(self, scenario):
+        blind = {"surveillance_sensor.max_range": 1.0, "target.speed": 30.0}
+        result = run_adaptive(
+            scenario, [blind], miss_percentiles=(50,), miss_half_width=5.0, seed=0
+        )
+        (cell,) = result.cells
+        assert cell.status == "precise"
+        assert cell.n == 64
+        assert np.isnan(cell.outcomes.miss_distance).all()
+
+    def test_unknown_interval(self, scenario):
+        with pytest.raises(ValueError, match="interval"):
+            run_adaptive(scenario, interval="wald")
@@ -0,0 +1,157 @@
+"""Tests for weapon-target assignment."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from interceptor_sim.engagement.assignment import (
+    WeaponTargetAssigner,
+    augment_rows_loop,
+    augment_rows_numpy,
+    engagement_costs,
+    solve_assignment,
+)
+from interceptor_sim.guidance.intercept_point import straight_line_intercept_time
+
+
+def _brute_force(cost):
+    n, m = cost.shape
+    return min(cost[range(n), perm].sum() for perm in itertools.permutations(range(m), n))
+
+
+def _random_problems(seed, count=150):
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        n = int(rng.integers(1, 5))
+        m = int(rng.integers(n, 7))
+        cost = rng.integers(0, 10, (n, m)).astype(float)
+        cost[rng.random((n, m)) < 0.2] = np.inf
+        if np.isfinite(_brute_force(cost)):
+            yield rng, cost
+
+
+class TestSolveAssignment:
+    @pytest.mark.parametrize("augment", [augment_rows_loop, augment_rows_numpy])
+    def test_matches_brute_force(self, augment, monkeypatch):
+        monkeypatch.setattr("interceptor_sim.engagement.assignment.augment_rows", augment)
+        for _, cost in _random_problems(0):
+            col4row, v, _ = solve_assignment(cost)
+            assert len(set(col4row.tolist())) == len(col4row)
+            assert cost[range(len(cost)), col4row].sum() == _brute_force(cost)
+            assert np.all(v <= 0)
+
+    def test_warm_start_stays_optimal(self):
+        for rng, cost in _random_problems(1):
+            col4row, v, _ = solve_assignment(cost)
+            changed = cost + rng.integers(-2, 3, cost.shape) * (rng.random(cost.shape) < 0.3)
+            if not np.isfinite(_brute_force(changed)):
+                continue
+            warm, _, _ = solve_assignment(changed, v, col4row)
+            assert changed[range(len(cost)), warm].sum() == _brute_force(changed)
+
+    def test_unchanged_problem_needs_no_augmentation(self):
+        cost = np.random.default_rng(2).random((20, 60))
+        col4row, v, augmented = solve_assignment(cost)
+        assert augmented > 0
+        again, _, augmented = solve_assignment(cost, v, col4row)
+        assert augmented == 0
+        np.testing.assert_array_equal(again, col4row)
+
+    def test_rejects_bad_input(self):
+        with pytest.raises(ValueError):
+            solve_assignment(np.zeros((3, 2)))
+        with pytest.raises(ValueError):
+            solve_assignment(np.array([[np.inf, 1.0], [np.inf, 2.0]]))
+        with pytest.raises(ValueError):
+            solve_assignment(np.zeros((2, 2)), col4row=np.array([0, 0]))
+
+
+class TestEngagementCosts:
+    def test_time_to_go_matches_scalar_solution(self):
+        rng = np.random.default_rng(3)
+        ipos = rng.uniform(-500, 500, (4, 2))
+        tpos = rng.uniform(-4000, 4000, (6, 2))
+        tvel = rng.uniform(-60, 60, (6, 2))
+        _, tgo = engagement_costs(ipos, 50.0, tpos, tvel)
+        for i, j in itertools.product(range(4), range(6)):
+            expected = straight_line_intercept_time(tpos[j] - ipos[i], tvel[j], 50.0)
+            if expected is None:
+                assert np.isnan(tgo[i, j])
+            else:
+                assert tgo[i, j] == pytest.approx(expected)
+
+    def test_cost_and_reachability(self):
+        cost, tgo = engagement_costs(
+            [[0.0, 0.0]],
+            100.0,
+            [[1000.0, 0.0], [5000.0, 0.0], [1000.0, 0.0]],
+            [[0.0, 0.0], [0.0, 0.0], [200.0, 0.0]],
+            pk=0.9,
+            time_weight=0.01,
+            max_flight_time=20.0,
+        )
+        assert cost[0, 0] == pytest.approx(0.01 * 10.0 - 0.9)
+        assert cost[0, 1] == np.inf  # 50 s > flight time
+        assert cost[0, 2] == np.inf  # faster than the interceptor, opening
+        assert np.isnan(tgo[0, 2])
+
+
+class TestWeaponTargetAssigner:
+    def test_assigns_nearest_threats(self):
+        ipos = [[0.0, 0.0], [0.0, 3000.0]]
+        tpos = [[1000.0, 0.0], [8000.0, 8000.0], [1000.0, 3000.0]]
+        cost, _ = engagement_costs(ipos, 80.0, tpos, np.zeros((3, 2)), pk=0.8)
+        result = WeaponTargetAssigner().assign(["a", "b"], ["t1", "t2", "t3"], cost)
+        assert result.pairs == {"a": "t1", "b": "t3"}
+        assert result.held == []
+        assert result.cost == pytest.approx(cost[0, 0] + cost[1, 2])
+
+    def test_holds_when_nothing_is_worth_engaging(self):
+        cost = np.array([[0.5, np.inf], [-0.2, 0.3]])
+        result = WeaponTargetAssigner(hold_cost=0.0).assign([1, 2], ["x", "y"], cost)
+        assert result.pairs == {2: "x"}
+        assert result.held == [1]
+        assert result.cost == pytest.approx(-0.2)
+
+    def test_more_interceptors_than_tracks(self):
+        cost = -np.random.default_rng(4).random((6, 2))
+        result = WeaponTargetAssigner().assign(range(6), ["x", "y"], cost)
+        assert sorted(result.pairs.values()) == ["x", "y"]
+        assert len(result.held) == 4
+
+    def test_empty_raid(self):
+        wta = WeaponTargetAssigner()
+        for n, m in ((0, 0), (0, 3), (2, 0)):
+            result = wta.assign(list(range(n)), list("abc"[:m]), np.zeros((n, m)))
+            assert result.pairs == {}
+            assert result.held == list(range(n))
+            assert result.cost == 0.0
+        col4row, v, augmented = solve_assignment(np.zeros((0, 0)))
+        assert col4row.shape == (0,) and v.shape == (0,) and augmented == 0
+
+    def test_incremental_resolve(self):
+        rng = np.random.default_rng(5)
+        n, m = 30, 100
+        cost = -rng.random((n, m))
+        tracks = list(range(m))
+        wta = WeaponTargetAssigner()
+        first = wta.assign(range(n), tracks, cost)
+        assert first.changed == sorted(first.pairs)
+
+        # Kill two engaged tracks: the rest of the plan is reused
+        killed = {first.pairs[0], first.pairs[1]}
+        keep = [t for t in tracks if t not in killed]
+        second = wta.assign(range(n), keep, cost[:, keep])
+        cold = WeaponTargetAssigner().assign(range(n), keep, cost[:, keep])
+        assert second.cost == pytest.approx(cold.cost)
+        assert second.augmented < n
+        assert {0, 1} <= set(second.changed)
+
+        # A new, very attractive track pulls one interceptor onto it
+        extra = np.hstack([cost[:, keep], np.full((n, 1), -5.0)])
+        third = wta.assign(range(n), keep + ["new"], extra)
+        assert "new" in third.pairs.values()
+        assert third.cost == pytest.approx(
+            WeaponTargetAssigner().assign(range(n), keep + ["new"], extra).cost
+        )
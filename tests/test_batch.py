@@ -0,0 +1,212 @@
+"""Tests for the batch engine and engagement envelope."""
+
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.engine import BatchEngine
+from interceptor_sim.batch.envelope import compute_envelope, envelope_scenario
+from interceptor_sim.batch.parallel import SharedResults, run_trials
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario, load_scenario
+from interceptor_sim.engagement.kill_chain import EngagementResult, Phase
+from interceptor_sim.testing.precision import check_precision
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+@pytest.fixture(scope="module")
+def deterministic():
+    """Example scenario with Pd = 1, perfect classification and no noise."""
+    return apply_overrides(
+        load_scenario(SCENARIO),
+        {
+            "surveillance_sensor.pd_at_max_range": 1.0,
+            "surveillance_sensor.classification_accuracy": 1.0,
+            "surveillance_sensor.noise": {},
+        },
+    )
+
+
+class TestBatchEngine:
+    def test_matches_scalar_engine(self, deterministic):
+        """Without randomness every lane reproduces the scalar engine."""
+        scenarios = [
+            deterministic,
+            apply_overrides(deterministic, {"target.position": [4000.0, -2000.0],
+                                            "simulation.dt": 0.05}),
+            apply_overrides(deterministic, {"interceptor.max_flight_time": 10.0}),
+            apply_overrides(deterministic, {"simulation.max_time": 5.0}),
+        ]
+        result = BatchEngine.from_scenarios(scenarios, seed=0).run()
+
+        for k, scenario in enumerate(scenarios):
+            engine, meta = build_from_scenario(scenario, seed=0)
+            arrays = engine.run().as_arrays()
+            assert result.result[k] == meta["engagement"].result.value
+            assert result.ticks[k] == len(arrays["time"]) - 1
+            for t, phase in meta["engagement"].phase_log[1:]:
+                assert result.phase_time(phase)[k] == pytest.approx(t)
+            if engine.interceptor.state.name != "READY":
+                sep = arrays["target_pos"] - arrays["interceptor_pos"]
+                assert result.miss_distance[k] == pytest.approx(
+                    np.hypot(sep[:, 0], sep[:, 1]).min(), abs=1e-3
+                )
+
+        assert list(result.result) == [
+            EngagementResult.HIT.value,
+            EngagementResult.HIT.value,
+            EngagementResult.MISS.value,
+            EngagementResult.PENDING.value,
+        ]
+        assert np.isnan(result.phase_time(Phase.TERMINAL)[2])
+
+    def test_noisy_batch_pk(self):
+        # Sensor noise makes 67 m/s a coin flip for the interceptor
+        scenario = apply_overrides(load_scenario(SCENARIO), {"target.speed": 67.0})
+        result = BatchEngine.from_scenarios([scenario] * 512, seed=3).run()
+        again = BatchEngine.from_scenarios([scenario] * 512, seed=3).run()
+        np.testing.assert_array_equal(result.result, again.result)
+        np.testing.assert_array_equal(result.miss_distance, again.miss_distance)
+        assert np.all(result.miss_distance[result.hit] <= 5.0)
+
+        scalar = []
+        for seed in range(64):
+            engine, meta = build_from_scenario(scenario, seed=seed)
+            engine.run()
+            scalar.append(meta["engagement"].result == EngagementResult.HIT)
+        pk, pk_scalar = result.pk(), float(np.mean(scalar))
+        assert 0.2 < pk < 0.9
+        # Three standard errors of the difference of two binomial estimates
+        tolerance = 3.0 * np.sqrt(pk * (1.0 - pk) * (1 / 512 + 1 / 64))
+        assert abs(pk - pk_scalar) < tolerance
+
+
+class TestEnvelope:
+    def test_envelope_scenario_geometry(self, deterministic):
+        sc = envelope_scenario(deterministic, np.array([200.0, -300.0]), 1000.0, 0.0, 0.0)
+        assert sc["target"]["position"] == pytest.approx([1200.0, -300.0])
+        wp = sc["target"]["waypoints"][0]
+        assert wp[0] < sc["target"]["position"][0]  # inbound
+        assert wp[1] == pytest.approx(-300.0)
+
+    def test_refines_only_near_boundary(self, deterministic):
+        env = compute_envelope(
+            deterministic, max_range=7000.0, min_range=500.0,
+            n_range=5, n_bearing=4, heading_offsets_deg=(0.0, 90.0),
+            seeds_per_cell=1, refine_levels=2, seed=0,
+        )
+        assert env.pk.shape == (2, 17, 17)
+        assert env.miss_distance.shape == env.pk.shape
+        assert not np.isnan(env.pk).any()
+        # Bearing 2*pi duplicates bearing 0
+        np.testing.assert_array_equal(env.pk[:, :, 0], env.pk[:, :, -1])
+        # Close in always hits; a crossing target beyond sensor range is never seen
+        assert np.all(env.pk[:, 0] == 1.0)
+        assert np.all(env.pk[1, -1] == 0.0)
+        # Adaptive: far fewer nodes than the full fine lattice were simulated
+        assert env.simulated.sum() < env.simulated.size / 2
+        assert env.n_engagements == env.simulated[:, :, :-1].sum()
+        x, y = env.grid_xy()
+        assert x.shape == (17, 17)
+
+
+class TestSharedResults:
+    def test_parallel_matches_in_process(self):
+        scenario = load_scenario(SCENARIO)
+        seeds = [0, 1, 2, 3]
+        with run_trials([scenario] * 4, seeds, workers=1, trajectory_length=50) as serial:
+            expected = serial.outcomes()
+            expected_traj = serial.trajectories()
+        with run_trials(
+            [scenario] * 4, seeds, workers=2, trajectory_length=50, chunk_size=1
+        ) as parallel:
+            actual = parallel.outcomes()
+            actual_traj = parallel.trajectories()
+
+        np.testing.assert_array_equal(actual.result, expected.result)
+        np.testing.assert_array_equal(actual.ticks, expected.ticks)
+        np.testing.assert_array_equal(actual.phase_times, expected.phase_times)
+        for col in expected_traj:
+            np.testing.assert_array_equal(actual_traj[col], expected_traj[col])
+
+    def test_row_matches_scalar_run(self):
+        scenario = load_scenario(SCENARIO)
+        engine, meta = build_from_scenario(scenario, seed=5)
+        arrays = engine.run().as_arrays()
+        with run_trials([scenario], [5], workers=1, trajectory_length=20) as res:
+            out = res.outcomes()
+            traj = res.trajectories()
+
+        assert out.result[0] == meta["engagement"].result.value
+        assert out.ticks[0] == len(arrays["time"]) - 1
+        assert out.end_time[0] == arrays["time"][-1]
+        assert traj["time"].shape == (1, 20)
+        assert traj["time"][0, 0] == arrays["time"][0]
+        assert traj["time"][0, -1] == arrays["time"][-1]
+        np.testing.assert_array_equal(traj["target_pos"][0, -1], arrays["target_pos"][-1])
+        for t, phase in meta["engagement"].phase_log:
+            assert out.phase_time(phase)[0] == t
+
+    def test_failed_run_releases_its_buffers(self, monkeypatch):
+        created = []
+        create = SharedResults.create.__func__
+
+        def recording_create(cls, *args, **kwargs):
+            created.append(create(cls, *args, **kwargs))
+            return created[-1]
+
+        monkeypatch.setattr(SharedResults, "create", classmethod(recording_create))
+        broken = {k: v for k, v in load_scenario(SCENARIO).items() if k != "target"}
+        with pytest.raises(KeyError):
+            run_trials([broken], [0], workers=1)
+        (results,) = created
+        for _, name, *_ in results.spec:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+
+@pytest.fixture(scope="module")
+def scenarios():
+    base = load_scenario(SCENARIO)
+    speeds = np.random.default_rng(0).uniform(40.0, 100.0, 64)
+    return [apply_overrides(base, {"target.speed": float(s)}) for s in speeds]
+
+
+class TestPrecision:
+    def test_float32_lanes_agree_with_float64(self, scenarios):
+        report = check_precision(scenarios, seed=0)
+        assert report.ok()
+        assert report.outcome_agreement >= 0.99
+        assert 0.0 < report.pk < 1.0
+        assert report.miss_error[0] < 0.01
+        assert report.memory_ratio < 0.6
+
+    def test_float64_is_the_default(self, scenarios):
+        default = BatchEngine.from_scenarios(scenarios[:8], seed=3).run()
+        explicit = BatchEngine.from_scenarios(scenarios[:8], seed=3, precision="float64").run()
+        np.testing.assert_array_equal(default.result, explicit.result)
+        np.testing.assert_array_equal(default.miss_distance, explicit.miss_distance)
+        with pytest.raises(ValueError, match="precision"):
+            BatchEngine.from_scenarios(scenarios[:1], seed=0, precision="float16")
+
+    def test_float32_archive(self):
+        scenario = load_scenario(SCENARIO)
+        seeds = [0, 1, 2]
+        with run_trials([scenario] * 3, seeds, workers=1, trajectory_length=50) as full:
+            expected = full.outcomes()
+            full_bytes = full.nbytes
+        with run_trials(
+            [scenario] * 3, seeds, workers=1, trajectory_length=50, precision="float32"
+        ) as compact:
+            actual = compact.outcomes()
+            traj = compact.trajectories()
+            # Times stay float64, so the archive shrinks less than the lane state
+            assert compact.nbytes < 0.7 * full_bytes
+
+        assert traj["target_pos"].dtype == np.float32
+        assert traj["time"].dtype == np.float64
+        assert actual.miss_distance.dtype == np.float64
+        np.testing.assert_array_equal(actual.result, expected.result)
+        np.testing.assert_allclose(actual.miss_distance, expected.miss_distance, rtol=1e-6)
@@ -0,0 +1,141 @@
+"""Tests for engine checkpoint / restore / fork."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.core.kernel import NUMBA_AVAILABLE
+from interceptor_sim.core.scenario import build_from_scenario, load_scenario
+from interceptor_sim.engagement.kill_chain import Phase
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+def _engine(seed=0):
+    engine, _ = build_from_scenario(load_scenario(SCENARIO), seed=seed)
+    return engine
+
+
+def _advance(engine, ticks):
+    for _ in range(ticks):
+        engine.step()
+
+
+def _assert_same_history(a, b):
+    assert len(a.states) == len(b.states)
+    for sa, sb in zip(a.states, b.states):
+        assert sa.time == sb.time
+        assert sa.phase == sb.phase
+        np.testing.assert_array_equal(sa.target_pos, sb.target_pos)
+        np.testing.assert_array_equal(sa.interceptor_pos, sb.interceptor_pos)
+
+
+class TestCheckpoint:
+    def test_restore_replays_identically(self):
+        engine = _engine()
+        _advance(engine, 100)  # mid-midcourse, noisy measurements drawn each tick
+        cp = engine.checkpoint()
+        first = engine.run()
+        first_states = list(first.states)
+
+        engine.restore(cp)
+        assert engine.time == cp.time
+        assert len(engine.history.states) == 100
+        second = engine.run()
+        _assert_same_history(type(first)(first_states), second)
+
+    def test_checkpoint_is_reusable(self):
+        engine = _engine()
+        _advance(engine, 50)
+        cp = engine.checkpoint()
+        engine.restore(cp)
+        engine.run()
+        result = engine.engagement.result
+        engine.restore(cp)
+        assert engine.engagement.phase != Phase.COMPLETE
+        engine.run()
+        assert engine.engagement.result == result
+
+
+class TestFork:
+    def test_branches_share_prefix_and_match_parent(self):
+        parent = _engine()
+        _advance(parent, 80)
+        branches = parent.fork(3)
+        prefix = parent.history.states
+        for branch in branches:
+            assert all(a is b for a, b in zip(branch.history.states, prefix))
+            assert branch.engagement is not parent.engagement
+        # No seeds: every branch continues with the parent's random stream
+        reference = _engine()
+        reference.run()
+        for branch in branches:
+            _assert_same_history(reference.history, branch.run())
+        assert len(parent.history.states) == 80  # parent untouched
+
+    def test_launch_now_versus_kill_chain(self):
+        parent = _engine()
+        _advance(parent, 2)  # still before classification
+        fork_time = parent.time
+        now, natural = parent.fork(2)
+        now.engagement.manual_launch(now.time)
+        now.run()
+        natural.run()
+        launch_now = dict((p, t) for t, p in now.engagement.phase_log)[Phase.MIDCOURSE]
+        launch_natural = dict((p, t) for t, p in natural.engagement.phase_log)[Phase.MIDCOURSE]
+        assert launch_now == pytest.approx(fork_time)
+        assert launch_natural > launch_now
+
+    def test_seeds_and_params_per_branch(self):
+        parent = _engine()
+        _advance(parent, 10)
+        a, b = parent.fork(2, seeds=[1, 2], params=[{"engagement.nav_gain": 2.0}, {}])
+        assert a.engagement.nav_gain == 2.0
+        assert b.engagement.nav_gain == parent.engagement.nav_gain
+        assert a.engagement.rng.random() != b.engagement.rng.random()
+        with pytest.raises(AttributeError):
+            parent.fork(1, params=[{"engagement.no_such_gain": 1.0}])
+
+    def test_params_under_shared_config_stay_per_branch(self):
+        parent = _engine()
+        _advance(parent, 10)
+        path = "engagement.surveillance_sensor.range_noise_fraction"
+        original = parent.engagement.surveillance_sensor.range_noise_fraction
+        a, b = parent.fork(2, params=[{path: 0.5}, {path: 0.0}])
+        assert a.engagement.surveillance_sensor.range_noise_fraction == 0.5
+        assert b.engagement.surveillance_sensor.range_noise_fraction == 0.0
+        assert parent.engagement.surveillance_sensor.range_noise_fraction == original
+        # Untouched shared configuration is still shared
+        assert a.interceptor.seeker is parent.interceptor.seeker
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_kernel_branch_matches_object_branch(self):
+        parent = _engine()
+        _advance(parent, 60)
+        obj, kern = parent.fork(2)
+        kern.use_kernel = True
+        _assert_same_history(obj.run(), kern.run())
+
+
+class TestRunUntil:
+    @pytest.mark.parametrize("use_kernel", [False, pytest.param(True, marks=pytest.mark.skipif(
+        not NUMBA_AVAILABLE, reason="numba not installed"))])
+    def test_stops_at_phase_entry_and_resumes(self, use_kernel):
+        reference = _engine(seed=4)
+        reference.run()
+
+        engine = _engine(seed=4)
+        engine.use_kernel = use_kernel
+        assert engine.run_until(Phase.MIDCOURSE)
+        assert engine.engagement.phase == Phase.MIDCOURSE
+        assert engine.history.states[-1].phase == Phase.LAUNCH
+        engine.run()
+        _assert_same_history(reference.history, engine.history)
+
+    def test_reports_runs_that_finish_first(self):
+        reference, engine = _engine(), _engine()
+        reference.max_time = engine.max_time = 1.0
+        reference.run()
+        assert not engine.run_until(Phase.TERMINAL)
+        _assert_same_history(reference.history, engine.history)
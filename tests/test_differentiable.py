@@ -0,0 +1,107 @@
+"""Tests for the differentiable guidance replay and gradient-based tuning."""
+
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.engine import history_miss_distance
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario, load_scenario
+from interceptor_sim.engagement.kill_chain import EngagementResult
+from interceptor_sim.guidance.differentiable import (
+    Dual,
+    atan2,
+    miss_distance_gradient,
+    sin,
+    soft_clip,
+    sqrt,
+    tune_guidance,
+)
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+@pytest.fixture(scope="module")
+def quiet():
+    # Noise-free surveillance, so the scalar engine follows the replay's estimates
+    return apply_overrides(
+        load_scenario(SCENARIO),
+        {
+            "surveillance_sensor.noise.range_noise_fraction": 0.0,
+            "surveillance_sensor.noise.bearing_noise_deg": 0.0,
+            "surveillance_sensor.noise.speed_noise_fraction": 0.0,
+            "surveillance_sensor.noise.heading_noise_deg": 0.0,
+        },
+    )
+
+
+class TestDual:
+    def test_matches_analytic_derivatives(self):
+        x, y = Dual.variable(1.3, 0, 2), Dual.variable(0.7, 1, 2)
+        f = atan2(y, x) * sqrt(x * y) + sin(x) / y - 2.0 / x
+        a, b = 1.3, 0.7
+        dfdx = (-b / (a * a + b * b)) * math.sqrt(a * b) + math.atan2(b, a) * 0.5 * math.sqrt(
+            b / a
+        ) + math.cos(a) / b + 2.0 / (a * a)
+        dfdy = (a / (a * a + b * b)) * math.sqrt(a * b) + math.atan2(b, a) * 0.5 * math.sqrt(
+            a / b
+        ) - math.sin(a) / (b * b)
+        np.testing.assert_allclose(f.grad, [dfdx, dfdy], rtol=1e-12)
+
+    def test_soft_clip_approaches_clip(self):
+        x = np.linspace(-3.0, 3.0, 61)
+        soft = [soft_clip(v, 1.0, 1e-4) for v in x]
+        np.testing.assert_allclose(soft, np.clip(x, -1.0, 1.0), atol=1e-4)
+        assert soft_clip(Dual.variable(0.0, 0, 1), 1.0, 0.05).grad[0] == pytest.approx(1.0)
+
+
+class TestMissDistanceGradient:
+    def test_sharp_replay_matches_scalar_engine(self, quiet):
+        scenario = apply_overrides(quiet, {"target.speed": 80.0})
+        engine, _ = build_from_scenario(scenario, seed=0)
+        engine.run()
+        assert engine.engagement.result == EngagementResult.MISS
+        replay = miss_distance_gradient(scenario, smoothing=1e-9, handover_width=1e-9)
+        expected = history_miss_distance(engine.history.as_arrays())
+        assert replay.miss_distance == pytest.approx(expected, rel=1e-3)
+
+    def test_gradient_matches_finite_differences(self, quiet):
+        scenario = apply_overrides(quiet, {"target.speed": 70.0})
+        result = miss_distance_gradient(scenario)
+        assert set(result.gradient) == {
+            "engagement.nav_gain",
+            "engagement.stern_offset",
+            "engagement.approach_blend_range",
+            "engagement.terminal_handover_range",
+        }
+        engagement = scenario["engagement"]
+        for path, grad in result.gradient.items():
+            key = path.split(".")[1]
+            h = 1e-4 * max(1.0, engagement[key])
+            up, down = (
+                miss_distance_gradient(apply_overrides(scenario, {path: engagement[key] + d}))
+                for d in (h, -h)
+            )
+            slope = (up.miss_distance - down.miss_distance) / (2 * h)
+            assert grad == pytest.approx(slope, rel=1e-4)
+
+    def test_rejects_unsupported_setups(self, quiet):
+        with pytest.raises(ValueError, match="not differentiable"):
+            miss_distance_gradient(quiet, params=("interceptor.max_speed",))
+        lead = apply_overrides(quiet, {"engagement.midcourse_guidance": "predicted_intercept"})
+        with pytest.raises(ValueError, match="command midcourse"):
+            miss_distance_gradient(lead)
+
+
+class TestTuneGuidance:
+    def test_turns_a_miss_into_a_hit(self, quiet):
+        scenario = apply_overrides(quiet, {"target.speed": 75.0})
+        result = tune_guidance(scenario, max_evaluations=30)
+        assert result.evaluations <= 30
+        assert result.history[0] > 50.0
+        assert result.miss_distance < 5.0
+
+        engine, _ = build_from_scenario(apply_overrides(scenario, result.values), seed=0)
+        engine.run()
+        assert engine.engagement.result == EngagementResult.HIT
@@ -1,6 +1,7 @@
 """Tests for Entity base class and Target/Interceptor models."""
 
 import numpy as np
+import pytest
 
 from interceptor_sim.core.entity import Entity
 from interceptor_sim.models.interceptor import Interceptor, InterceptorState
@@ -57,6 +58,40 @@ class TestTarget:
             t.update(0.1)
         assert t.has_reached_final_waypoint
 
+    def test_path_precomputed(self):
+        t = Target(position=(0, 0), speed=10.0, waypoints=[(30, 40), (30, 100)])
+        np.testing.assert_allclose(t.path[:, Target.PATH_S], [0.0, 50.0, 110.0])
+        assert t.path_length == pytest.approx(110.0)
+        assert t.heading == pytest.approx(np.arctan2(40, 30))
+
+    def test_position_at_matches_update(self):
+        t = Target(
+            position=(0, 0), speed=25.0,
+            waypoints=[(100, 0), (100, 0), (100, 100), (0, 150)],
+        )
+        times = np.array([0.0, 2.0, 4.0, 7.5, 20.0])
+        predicted = t.position_at(times)
+        assert predicted.shape == (5, 2)
+        for k in range(1, 201):
+            t.update(0.1)
+            if np.any(np.isclose(k * 0.1, times)):
+                i = int(np.argmin(np.abs(times - k * 0.1)))
+                np.testing.assert_allclose(t.position, predicted[i], atol=1e-9)
+                np.testing.assert_allclose(t.velocity, t.velocity_at(times[i]), atol=1e-9)
+
+    def test_large_step_follows_path(self):
+        """One big step lands on the polyline instead of cutting the corner."""
+        t = Target(position=(0, 0), speed=10.0, waypoints=[(100, 0), (100, 100)])
+        t.update(15.0)
+        np.testing.assert_allclose(t.position, [100.0, 50.0], atol=1e-9)
+        assert t.current_waypoint_idx == 1
+
+    def test_continues_past_final_waypoint(self):
+        t = Target(position=(0, 0), speed=10.0, waypoints=[(0, 50)])
+        t.update(10.0)
+        np.testing.assert_allclose(t.position, [0.0, 100.0], atol=1e-9)
+        assert t.has_reached_final_waypoint
+
 
 class TestInterceptor:
     def test_starts_ready(self):
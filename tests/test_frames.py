@@ -0,0 +1,68 @@
+"""Tests for the binary state-frame format."""
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.core import frames
+from interceptor_sim.core.engine import SimHistory
+from interceptor_sim.core.scenario import build_from_scenario, load_scenario
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+@pytest.fixture(scope="module")
+def history():
+    engine, _ = build_from_scenario(load_scenario(SCENARIO), seed=0)
+    return engine.run()
+
+
+def _assert_same(a: SimHistory, b: SimHistory, atol: float = 0.0) -> None:
+    assert len(a.states) == len(b.states)
+    for sa, sb in zip(a.states, b.states):
+        assert sa.time == sb.time
+        assert sa.phase == sb.phase
+        assert sa.target_active == sb.target_active
+        np.testing.assert_allclose(sb.target_pos, sa.target_pos, rtol=0, atol=atol)
+        np.testing.assert_allclose(sb.interceptor_pos, sa.interceptor_pos, rtol=0, atol=atol)
+        assert sb.interceptor_speed == pytest.approx(sa.interceptor_speed, abs=atol)
+        for name in ("estimated_target_pos", "estimated_target_vel"):
+            va, vb = getattr(sa, name), getattr(sb, name)
+            assert (va is None) == (vb is None)
+            if va is not None:
+                np.testing.assert_allclose(vb, va, rtol=0, atol=atol)
+
+
+class TestStateFrames:
+    def test_lossless_round_trip(self, history):
+        data = history.to_bytes()
+        assert len(data) == frames.HEADER_DTYPE.itemsize + 82 * len(history.states)
+        _assert_same(history, SimHistory.from_bytes(data))
+
+    def test_decode_is_zero_copy(self, history):
+        data = history.to_bytes()
+        records = frames.decode_records(data)
+        assert not records.flags.owndata
+        assert records.dtype == frames.STATE_DTYPE
+        np.testing.assert_array_equal(records["time"], history.times)
+
+    def test_compressed_round_trip(self, history):
+        _assert_same(history, SimHistory.from_bytes(history.to_bytes(compress=True)))
+
+    def test_compact_is_ten_times_smaller_than_pickle(self, history, tmp_path):
+        path = tmp_path / "run.istf"
+        history.dump(path, compact=True, compress=True)
+        assert len(pickle.dumps(history)) > 10 * path.stat().st_size
+        _assert_same(history, SimHistory.load(path), atol=1e-3)
+
+    def test_rejects_bad_blocks(self, history):
+        data = bytearray(history.to_bytes())
+        with pytest.raises(ValueError, match="magic"):
+            frames.decode_records(b"XXXX" + bytes(data[4:]))
+        data[4] = 99  # version
+        with pytest.raises(ValueError, match="version"):
+            frames.decode_records(bytes(data))
+        with pytest.raises(ValueError, match="Truncated"):
+            frames.decode_records(history.to_bytes()[:-10])
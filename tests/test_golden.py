@@ -0,0 +1,45 @@
+"""Golden-trajectory regression tests (regenerate with scripts/golden.py --update)."""
+
+from pathlib import Path
+
+import pytest
+
+from interceptor_sim.core.scenario import load_scenario
+from interceptor_sim.testing.golden import (
+    GOLDEN_MATRIX,
+    compare_arrays,
+    load_golden,
+    run_case,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+SCENARIO = load_scenario(ROOT / "scenarios" / "example_intercept.yaml")
+FIXTURES = ROOT / "tests" / "golden"
+
+
+@pytest.mark.parametrize("use_kernel", [False, True])
+@pytest.mark.parametrize("case", sorted(GOLDEN_MATRIX))
+def test_matches_golden(case, use_kernel):
+    for seed, expected in load_golden(case, FIXTURES).items():
+        actual = run_case(SCENARIO, GOLDEN_MATRIX[case], seed, use_kernel=use_kernel)
+        divergence = compare_arrays(case, seed, expected, actual)
+        assert divergence is None, str(divergence)
+
+
+def test_reports_first_divergence():
+    expected = load_golden("baseline", FIXTURES)[0]
+    actual = {k: v.copy() for k, v in expected.items()}
+    actual["interceptor_pos"][200, 1] += 0.5
+    actual["target_pos"][300, 0] += 0.5
+
+    divergence = compare_arrays("baseline", 0, expected, actual)
+    assert divergence.field == "interceptor_pos"
+    assert divergence.tick == 200
+
+
+def test_reports_length_mismatch():
+    expected = load_golden("baseline", FIXTURES)[0]
+    n = len(expected["time"])
+    actual = {k: (v[:-5] if v.ndim and len(v) == n else v) for k, v in expected.items()}
+    divergence = compare_arrays("baseline", 0, expected, actual)
+    assert divergence.tick == n - 5
@@ -1,11 +1,35 @@
 """Tests for guidance laws."""
 
+from pathlib import Path
+
 import numpy as np
 import pytest
 
+from interceptor_sim.batch.engine import BatchEngine
+from interceptor_sim.core.kernel import supports_engine
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario, load_scenario
+from interceptor_sim.engagement.kill_chain import EngagementResult
+from interceptor_sim.guidance.context import RelativeGeometry
+from interceptor_sim.guidance.intercept_point import (
+    InterceptTimeTable,
+    predicted_intercept_guidance,
+    straight_line_intercept_time,
+)
 from interceptor_sim.guidance.midcourse import command_guidance
 from interceptor_sim.guidance.proportional_nav import proportional_navigation
 from interceptor_sim.guidance.pure_pursuit import pure_pursuit
+from interceptor_sim.guidance.registry import (
+    register_terminal_guidance,
+    unregister_terminal_guidance,
+)
+from interceptor_sim.utils.geometry import (
+    bearing,
+    closing_speed,
+    distance,
+    line_of_sight_rate,
+)
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
 
 
 class TestPurePursuit:
@@ -105,3 +129,134 @@ class TestCommandGuidance:
         )
         # Stern heading should differ from direct heading
         assert heading_full_stern != pytest.approx(heading_direct, abs=0.01)
+
+
+@pytest.fixture(scope="module")
+def table():
+    return InterceptTimeTable.build(
+        80.0, np.radians(25), max_range=4000.0, n_range=9, n_aspect=5, n_ratio=3
+    )
+
+
+class TestPredictedInterceptPoint:
+    def test_straight_line_solution(self):
+        # Stationary target 800 m away at 80 m/s → 10 s
+        t = straight_line_intercept_time(np.array([800.0, 0.0]), np.zeros(2), 80.0)
+        assert t == pytest.approx(10.0)
+        # Faster target flying directly away cannot be caught
+        assert straight_line_intercept_time(
+            np.array([800.0, 0.0]), np.array([100.0, 0.0]), 80.0
+        ) is None
+
+    def test_table_lookup_on_grid(self, table):
+        assert table.lookup(0.0, 0.0, 0.0) == pytest.approx(0.0)
+        # Stationary target: time-to-go ~ range / speed
+        assert table.lookup(2000.0, 0.0, 0.0) == pytest.approx(25.0, abs=0.5)
+        # Head-on closes faster than tail chase
+        assert table.lookup(2000.0, np.pi, 0.5) < table.lookup(2000.0, 0.0, 0.5)
+        out = table.lookup(np.array([1000.0, 2000.0]), np.array([0.0, 0.0]), 0.0)
+        assert out.shape == (2,)
+
+    def test_lookup_beyond_axes_falls_back_to_straight_line(self, table):
+        # Target faster than the interceptor, and a target beyond the table's range
+        assert np.isnan(table.lookup(2000.0, np.pi, 1.5))
+        assert np.isnan(table.lookup(6000.0, 0.0, 0.5))
+        out = table.lookup(np.array([2000.0, 6000.0]), np.pi, 0.5)
+        assert np.isfinite(out[0]) and np.isnan(out[1])
+
+        interceptor_pos = np.zeros(2)
+        target_pos = np.array([6000.0, 0.0])
+        target_vel = np.array([0.0, 30.0])
+        heading = predicted_intercept_guidance(interceptor_pos, target_pos, target_vel, table)
+        tgo = straight_line_intercept_time(target_pos, target_vel, table.max_speed)
+        assert heading == pytest.approx(np.arctan2(30.0 * tgo, 6000.0))
+
+    def test_disk_cache_round_trip(self, tmp_path, table):
+        path = tmp_path / "table.npz"
+        table.save(path)
+        loaded = InterceptTimeTable.load(path)
+        np.testing.assert_array_equal(loaded.tgo, table.tgo)
+        assert loaded.max_speed == table.max_speed
+
+    def test_leads_crossing_target(self, table):
+        interceptor_pos = np.array([0.0, 0.0])
+        target_pos = np.array([2000.0, 0.0])
+        target_vel = np.array([0.0, 30.0])  # moving north
+        heading = predicted_intercept_guidance(interceptor_pos, target_pos, target_vel, table)
+        assert heading > pure_pursuit(interceptor_pos, target_pos)
+        # Aim point lies on the target track ahead of the target
+        assert 0.0 < heading < np.pi / 4
+
+
+class TestRelativeGeometry:
+    def test_matches_geometry_helpers_exactly(self):
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            ipos, tpos = rng.uniform(-5000, 5000, (2, 2))
+            ivel, tvel = rng.uniform(-100, 100, (2, 2))
+            g = RelativeGeometry(ipos, tpos, ivel, tvel)
+            assert g.range == distance(ipos, tpos)
+            assert g.los_angle == bearing(ipos, tpos)
+            assert g.los_rate == line_of_sight_rate(ipos, ivel, tpos, tvel)
+            assert g.closing_speed == closing_speed(ipos, ivel, tpos, tvel)
+
+    def test_co_located_is_degenerate_not_nan(self):
+        pos = np.array([10.0, 10.0])
+        g = RelativeGeometry(pos, pos.copy(), np.array([50.0, 0.0]), np.zeros(2))
+        assert g.range == 0.0
+        assert g.los_rate == 0.0
+        assert g.closing_speed == 0.0
+
+    def test_laws_accept_shared_context(self):
+        ipos, ivel = np.array([0.0, 0.0]), np.array([100.0, 0.0])
+        tpos, tvel = np.array([1000.0, 300.0]), np.array([0.0, 30.0])
+        g = RelativeGeometry(ipos, tpos, ivel, tvel)
+        assert proportional_navigation(None, None, None, None, geometry=g) == (
+            proportional_navigation(ipos, ivel, tpos, tvel)
+        )
+        assert pure_pursuit(None, None, geometry=g) == pure_pursuit(ipos, tpos)
+        assert command_guidance(
+            None, tpos, None, tvel, stern_offset=200.0, approach_blend_range=2000.0, geometry=g
+        ) == command_guidance(
+            None, tpos, ipos, tvel, stern_offset=200.0, approach_blend_range=2000.0
+        )
+
+
+class TestTerminalGuidanceRegistry:
+    def test_custom_law_receives_tick_context(self):
+        scenario = load_scenario(SCENARIO)
+        seen = []
+
+        def law(geometry, manager):
+            seen.append(geometry)
+            assert geometry is manager.geometry
+            return geometry.los_angle
+
+        register_terminal_guidance("test_pursuit", law)
+        try:
+            custom, _ = build_from_scenario(
+                apply_overrides(scenario, {"engagement.terminal_guidance": "test_pursuit"}),
+                seed=3,
+            )
+            assert not supports_engine(custom)
+            with pytest.raises(ValueError):
+                BatchEngine.from_engines([custom])
+            custom.run()
+        finally:
+            unregister_terminal_guidance("test_pursuit")
+
+        builtin, _ = build_from_scenario(
+            apply_overrides(scenario, {"engagement.terminal_guidance": "pure_pursuit"}), seed=3
+        )
+        builtin.run()
+        assert seen
+        assert custom.engagement.result == builtin.engagement.result == EngagementResult.HIT
+        np.testing.assert_array_equal(
+            custom.engagement.interceptor.position, builtin.engagement.interceptor.position
+        )
+        # The law is not consulted on the tick the kill check fires
+        assert seen[-1].range > custom.engagement.interceptor.kill_radius
+
+    def test_builtin_names_are_reserved(self):
+        with pytest.raises(ValueError):
+            register_terminal_guidance("proportional_nav", lambda g, em: 0.0)
@@ -0,0 +1,92 @@
+"""Tests for the array kill-chain kernel."""
+
+import copy
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.core.kernel import engagement_loop_py, run_engine_kernel
+from interceptor_sim.core.scenario import build_from_scenario, load_scenario
+from interceptor_sim.engagement.kill_chain import Phase
+
+SCENARIO = load_scenario(
+    Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+)
+
+
+def _assert_identical(h1, h2):
+    assert len(h1.states) == len(h2.states)
+    for a, b in zip(h1.states, h2.states):
+        assert a.time == b.time
+        assert a.phase == b.phase
+        assert a.target_active == b.target_active
+        assert a.interceptor_speed == b.interceptor_speed
+        np.testing.assert_array_equal(a.target_pos, b.target_pos)
+        np.testing.assert_array_equal(a.interceptor_pos, b.interceptor_pos)
+        if a.estimated_target_pos is None:
+            assert b.estimated_target_pos is None
+        else:
+            np.testing.assert_array_equal(a.estimated_target_pos, b.estimated_target_pos)
+            np.testing.assert_array_equal(a.estimated_target_vel, b.estimated_target_vel)
+
+
+class TestKernel:
+    @pytest.mark.parametrize("variant", ["default", "pure_pursuit", "no_stern", "timeout"])
+    @pytest.mark.parametrize("seed", [1, 7])
+    def test_bit_identical_to_object_path(self, variant, seed):
+        scenario = copy.deepcopy(SCENARIO)
+        if variant == "pure_pursuit":
+            scenario["engagement"]["terminal_guidance"] = "pure_pursuit"
+        elif variant == "no_stern":
+            scenario["engagement"]["stern_offset"] = 0.0
+        elif variant == "timeout":
+            scenario["interceptor"]["max_flight_time"] = 10.0
+
+        ref_engine, ref_meta = build_from_scenario(scenario, seed=seed)
+        ref = ref_engine.run()
+        engine, meta = build_from_scenario(scenario, seed=seed)
+        hist = run_engine_kernel(engine, loop=engagement_loop_py)
+
+        _assert_identical(ref, hist)
+        assert meta["engagement"].result == ref_meta["engagement"].result
+        assert meta["engagement"].phase_log == ref_meta["engagement"].phase_log
+        # RNG streams stay in lockstep
+        assert meta["engagement"].rng.random() == ref_meta["engagement"].rng.random()
+
+    def test_state_written_back(self):
+        ref_engine, _ = build_from_scenario(SCENARIO, seed=3)
+        ref_engine.run()
+        engine, _ = build_from_scenario(SCENARIO, seed=3)
+        run_engine_kernel(engine, loop=engagement_loop_py)
+        assert engine.time == ref_engine.time
+        assert engine.interceptor.state == ref_engine.interceptor.state
+        assert engine.target.active == ref_engine.target.active
+        np.testing.assert_array_equal(engine.interceptor.position, ref_engine.interceptor.position)
+        assert engine.engagement.classification.looks == ref_engine.engagement.classification.looks
+
+    def test_history_stays_columnar(self):
+        ref = build_from_scenario(SCENARIO, seed=4)[0].run()
+        engine, _ = build_from_scenario(SCENARIO, seed=4)
+        hist = run_engine_kernel(engine, loop=engagement_loop_py)
+        assert len(hist) == len(ref.states)
+        expected = ref.as_arrays()
+        for name, column in hist.as_arrays().items():
+            np.testing.assert_array_equal(column, expected[name], err_msg=name)
+        np.testing.assert_array_equal(hist.target_positions, ref.target_positions)
+        assert hist.times == ref.times
+        _assert_identical(ref, hist)
+
+    def test_object_ticks_follow_kernel_block(self):
+        ref = build_from_scenario(SCENARIO, seed=6)[0].run()
+        engine, _ = build_from_scenario(SCENARIO, seed=6)
+        run_engine_kernel(engine, loop=engagement_loop_py, stop_phase=Phase.MIDCOURSE)
+        _assert_identical(ref, engine.run())
+
+    def test_engine_flag(self):
+        scenario = copy.deepcopy(SCENARIO)
+        scenario["simulation"]["use_kernel"] = True
+        engine, _ = build_from_scenario(scenario, seed=5)
+        assert engine.use_kernel
+        ref_engine, _ = build_from_scenario(SCENARIO, seed=5)
+        _assert_identical(ref_engine.run(), engine.run())
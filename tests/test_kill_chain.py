@@ -1,7 +1,11 @@
 """Tests for engagement kill chain state machine."""
 
+from pathlib import Path
+
 import numpy as np
 
+from interceptor_sim.core.kernel import supports_engine
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario, load_scenario
 from interceptor_sim.engagement.classification import ClassificationState
 from interceptor_sim.engagement.detection import TrackState
 from interceptor_sim.engagement.kill_chain import (
@@ -9,7 +13,8 @@ from interceptor_sim.engagement.kill_chain import (
     EngagementResult,
     Phase,
 )
-from interceptor_sim.models.interceptor import Interceptor
+from interceptor_sim.guidance.intercept_point import InterceptTimeTable
+from interceptor_sim.models.interceptor import Interceptor, InterceptorState
 from interceptor_sim.models.sensor import Sensor
 from interceptor_sim.models.target import Target
 
@@ -140,6 +145,53 @@ class TestEngagementManager:
                 break
         assert entered_terminal
 
+    def test_predicted_intercept_midcourse(self):
+        target, interceptor, em = self._make_engagement(seed=1)
+        em.midcourse_guidance = "predicted_intercept"
+        em.intercept_table = InterceptTimeTable.build(
+            100.0, interceptor.max_turn_rate, max_range=4000.0, n_range=9, n_aspect=5, n_ratio=3
+        )
+        dt = 0.1
+        for i in range(2000):
+            target.update(dt)
+            interceptor.update(dt)
+            em.step(i * dt, dt)
+            if em.phase == Phase.COMPLETE:
+                break
+        assert em.result == EngagementResult.HIT
+
+    def test_predicted_intercept_table_loads_on_first_use(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("INTERCEPTOR_SIM_CACHE", str(tmp_path))
+        target, interceptor, em = self._make_engagement(seed=1)
+        em = EngagementManager(
+            target=target,
+            interceptor=interceptor,
+            surveillance_sensor=em.surveillance_sensor,
+            sensor_position=em.sensor_position,
+            midcourse_guidance="predicted_intercept",
+        )
+        assert em.intercept_table is None
+        assert not any(tmp_path.iterdir())
+
+    def test_manual_launch_skips_classification(self):
+        target, interceptor, em = self._make_engagement()
+        assert em.manual_launch(0.0)
+        em.step(0.1, 0.1)
+        assert em.phase == Phase.MIDCOURSE
+        assert interceptor.speed == interceptor.max_speed
+        assert not em.manual_launch(0.2)  # already committed
+
+    def test_abort_disarms_interceptor(self):
+        target, interceptor, em = self._make_engagement()
+        em.manual_launch(0.0)
+        em.step(0.0, 0.1)
+        assert em.abort(0.1)
+        assert em.phase == Phase.COMPLETE
+        assert em.result == EngagementResult.ABORTED
+        assert not interceptor.active
+        assert interceptor.state == InterceptorState.MISSED
+        assert not em.abort(0.2)
+
     def test_estimated_position_stored(self):
         """During midcourse, estimated_target_pos should be populated."""
         target, interceptor, em = self._make_engagement(seed=1)
@@ -161,3 +213,50 @@ class TestEngagementManager:
         np.testing.assert_allclose(
             em.estimated_target_pos, target.position, atol=1.0
         )
+
+
+class TestSensorNetworkEngagement:
+    SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+    def _scenario(self):
+        base = load_scenario(self.SCENARIO)
+        extra = [
+            {**base["surveillance_sensor"], "position": pos}
+            for pos in ([2000.0, -1500.0], [1500.0, 2000.0], [-500.0, 1500.0])
+        ]
+        return apply_overrides(base, {"surveillance_sensors": extra})
+
+    def test_single_sensor_has_no_network(self):
+        engine, meta = build_from_scenario(load_scenario(self.SCENARIO), seed=0)
+        assert meta["sensor_network"] is None
+        assert supports_engine(engine)
+
+    def test_scenario_builds_network(self):
+        engine, meta = build_from_scenario(self._scenario(), seed=0)
+        net = meta["sensor_network"]
+        assert len(net) == 4
+        assert engine.engagement.sensor_network is net
+        np.testing.assert_allclose(meta["sensor_position"], [0.0, 0.0])
+        assert not supports_engine(engine)
+
+    def test_network_only_scenario(self):
+        scenario = self._scenario()
+        scenario["surveillance_sensors"].insert(0, scenario.pop("surveillance_sensor"))
+        _, meta = build_from_scenario(scenario, seed=0)
+        assert len(meta["sensor_network"]) == 4
+
+    def test_fused_engagement_tracks_more_accurately(self):
+        def midcourse_error(scenario, seed):
+            engine, _ = build_from_scenario(scenario, seed=seed)
+            em = engine.engagement
+            errors = []
+            while engine.step() and em.phase != Phase.COMPLETE:
+                if em.phase == Phase.MIDCOURSE and em.estimated_target_pos is not None:
+                    errors.append(np.linalg.norm(em.estimated_target_pos - engine.target.position))
+            return np.mean(errors)
+
+        single = load_scenario(self.SCENARIO)
+        fused = self._scenario()
+        err_single = np.mean([midcourse_error(single, s) for s in range(3)])
+        err_fused = np.mean([midcourse_error(fused, s) for s in range(3)])
+        assert err_fused < 0.75 * err_single
@@ -0,0 +1,80 @@
+"""Tests for multi-fidelity (coarse-dt screening, fine-dt refinement) runs."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.multifidelity import run_multifidelity
+from interceptor_sim.core.scenario import apply_overrides, load_scenario
+from interceptor_sim.engagement.kill_chain import EngagementResult
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+@pytest.fixture(scope="module")
+def scenarios():
+    base = load_scenario(SCENARIO)
+    speeds = np.random.default_rng(0).uniform(20.0, 120.0, 64)
+    return [apply_overrides(base, {"target.speed": float(s)}) for s in speeds]
+
+
+@pytest.fixture(scope="module")
+def audited(scenarios):
+    return run_multifidelity(scenarios, fine_dt=0.1, audit_fraction=1.0, seed=0)
+
+
+class TestMultiFidelity:
+    def test_refines_hits_and_near_misses_only(self, audited, scenarios):
+        coarse = audited.coarse
+        assert np.all(audited.refined[coarse.hit])
+        clear = ~audited.refined
+        kill_radius = scenarios[0]["interceptor"]["kill_radius"]
+        misses = clear & (coarse.result == EngagementResult.MISS.value)
+        assert np.all(coarse.miss_distance[misses] > kill_radius)
+        assert 0 < audited.refined.sum() < len(scenarios)
+
+    def test_combined_outcomes_take_fine_runs_where_refined(self, audited):
+        outcomes, coarse = audited.outcomes, audited.coarse
+        clear = ~audited.refined
+        np.testing.assert_array_equal(outcomes.result[clear], coarse.result[clear])
+        # Fine runs take more ticks than the coarse runs they replace
+        assert np.all(outcomes.ticks[audited.refined] > coarse.ticks[audited.refined])
+
+    def test_full_audit_makes_corrected_pk_exact(self, scenarios, audited):
+        reference = run_multifidelity(scenarios, fine_dt=0.1, margin=1e9, seed=0)
+        assert reference.refined.all()
+        assert audited.pk_corrected() == pytest.approx(reference.pk())
+        assert not audited.bias_detected
+        assert audited.speedup() > 1.0
+
+    def test_bias_interval_covers_zero_at_intermediate_pk(self):
+        base = apply_overrides(
+            load_scenario(SCENARIO), {"surveillance_sensor.noise.bearing_noise_deg": 2.0}
+        )
+        speeds = np.random.default_rng(1).uniform(40.0, 100.0, 128)
+        noisy = [apply_overrides(base, {"target.speed": float(s)}) for s in speeds]
+        result = run_multifidelity(noisy, fine_dt=0.1, audit_fraction=1.0, seed=2)
+        reference = run_multifidelity(noisy, fine_dt=0.1, margin=1e9, seed=2)
+        assert 0.2 < reference.pk() < 0.8
+        assert result.accepted_fraction > 0.3
+        low, high = result.bias_interval()
+        assert low <= 0.0 <= high
+        assert not result.bias_detected
+        assert result.pk_corrected() == pytest.approx(reference.pk())
+
+    def test_bias_check_flags_an_unsafe_margin(self):
+        # Slow targets: always hit at fine dt, often missed by a few metres at coarse dt
+        scenario = apply_overrides(load_scenario(SCENARIO), {"target.speed": 30.0})
+        result = run_multifidelity(
+            scenario, n_trials=32, fine_dt=0.1, margin=-1e9, audit_fraction=1.0, seed=0
+        )
+        assert result.bias() > 0.3
+        assert result.bias_detected
+        assert result.pk_corrected() == 1.0
+
+    def test_validation(self, scenarios):
+        with pytest.raises(ValueError, match="n_trials"):
+            run_multifidelity(scenarios[0])
+        with pytest.raises(ValueError, match="fine_dt"):
+            run_multifidelity(scenarios, coarse_dt=0.1, fine_dt=0.5)
@@ -0,0 +1,161 @@
+"""Tests for quasi-Monte Carlo studies."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.qmc import (
+    SOBOL_MAX_DIMS,
+    QmcNoise,
+    UncertainInput,
+    _overrides,
+    normal_ppf,
+    run_qmc,
+    sobol_points,
+    uncertain_inputs,
+)
+from interceptor_sim.core.kernel import supports_engine
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario, load_scenario
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+INPUTS = [
+    UncertainInput("target.speed", low=20.0, high=90.0),
+    UncertainInput("target.position[0]", std=800.0),
+    UncertainInput("target.position[1]", std=800.0),
+]
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    return load_scenario(SCENARIO)
+
+
+class TestSobol:
+    def test_unscrambled_leading_points(self):
+        cell = 2.0**-33
+        x = sobol_points(4, 3, scramble=False) - cell
+        expected = [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5], [0.25, 0.75, 0.75], [0.75, 0.25, 0.25]]
+        np.testing.assert_array_equal(x, expected)
+
+    def test_scrambled_points_stay_stratified(self):
+        x = sobol_points(256, SOBOL_MAX_DIMS, rng=np.random.default_rng(0))
+        assert np.all((x > 0.0) & (x < 1.0))
+        for j in range(SOBOL_MAX_DIMS):
+            np.testing.assert_array_equal(np.sort(np.floor(x[:, j] * 256)), np.arange(256))
+        # Every 1/16 x 1/16 square of a two-dimensional projection holds one point
+        counts = np.histogram2d(x[:, 3], x[:, 40], bins=16, range=[[0, 1], [0, 1]])[0]
+        assert np.all(counts == 1)
+
+    def test_scrambles_differ(self):
+        rng = np.random.default_rng(1)
+        assert not np.array_equal(sobol_points(8, 2, rng=rng), sobol_points(8, 2, rng=rng))
+
+    def test_dimension_limit(self):
+        with pytest.raises(ValueError, match="dimensions"):
+            sobol_points(4, SOBOL_MAX_DIMS + 1)
+
+    def test_integration_error_beats_monte_carlo(self):
+        rng = np.random.default_rng(2)
+
+        def f(u):
+            return np.prod(1.0 + 0.5 * (u - 0.5), axis=1)
+
+        qmc = [f(sobol_points(1024, 6, rng=rng)).mean() - 1.0 for _ in range(20)]
+        mc = [f(rng.random((1024, 6))).mean() - 1.0 for _ in range(20)]
+        assert np.sqrt(np.mean(np.square(qmc))) < 0.1 * np.sqrt(np.mean(np.square(mc)))
+
+
+class TestNormalPpf:
+    def test_known_quantiles(self):
+        u = np.array([0.5, 0.975, 0.025, 0.8413447460685429, 1e-10])
+        expected = [0.0, 1.959963984540054, -1.959963984540054, 1.0, -6.361340902404056]
+        np.testing.assert_allclose(normal_ppf(u), expected, rtol=2e-9, atol=1e-12)
+
+    def test_monotone_and_antisymmetric(self):
+        u = np.linspace(1e-9, 1.0 - 1e-9, 10001)
+        z = normal_ppf(u)
+        assert np.all(np.diff(z) > 0.0)
+        np.testing.assert_allclose(z, -z[::-1], atol=1e-12)
+
+
+class TestInputs:
+    def test_requires_one_distribution(self):
+        with pytest.raises(ValueError):
+            UncertainInput("target.speed")
+        with pytest.raises(ValueError):
+            UncertainInput("target.speed", std=1.0, low=0.0, high=1.0)
+
+    def test_values_and_overrides(self, scenario):
+        u = np.array([0.5, 0.975])
+        np.testing.assert_allclose(INPUTS[0].values(u, scenario), [55.0, 88.25])
+        np.testing.assert_allclose(INPUTS[1].values(u, scenario), 3000.0 + 800.0 * normal_ppf(u))
+        overrides = _overrides(scenario, INPUTS, [40.0, 3100.0, 900.0])
+        assert overrides == {"target.speed": 40.0, "target.position": [3100.0, 900.0]}
+        assert scenario["target"]["position"] == [3000.0, 1000.0]
+
+    def test_scenario_section(self, scenario):
+        section = {"target.speed": {"std": 3.0}, "target.position[1]": {"low": 0, "high": 1}}
+        declared = apply_overrides(scenario, {"uncertainty": section})
+        assert uncertain_inputs(declared) == [
+            UncertainInput("target.speed", std=3.0),
+            UncertainInput("target.position[1]", low=0, high=1),
+        ]
+        with pytest.raises(ValueError, match="no value"):
+            UncertainInput("target.altitude", std=1.0).values(np.array([0.5]), scenario)
+
+
+class TestQmcNoise:
+    def test_leading_normals_then_generator(self):
+        noise = QmcNoise([1.0, 2.0, 3.0], np.random.default_rng(0))
+        assert noise.normal(10.0, 2.0) == 12.0
+        np.testing.assert_array_equal(noise.standard_normal(1), [2.0])
+        tail = noise.standard_normal(3)
+        reference = np.random.default_rng(0)
+        np.testing.assert_array_equal(tail, [3.0, *reference.standard_normal(2)])
+        assert noise.random() == reference.random()
+
+    def test_kernel_falls_back_to_python(self, scenario):
+        engine, _ = build_from_scenario(scenario, seed=0)
+        assert supports_engine(engine)
+        engine.engagement.rng = QmcNoise([], engine.engagement.rng)
+        assert not supports_engine(engine)
+
+
+class TestRunQmc:
+    def test_sobol_reduces_standard_error(self, scenario):
+        sobol = run_qmc(scenario, 128, 6, inputs=INPUTS, seed=1)
+        plain = run_qmc(scenario, 128, 6, inputs=INPUTS, method="random", seed=1)
+        assert len(sobol.outcomes) == 768
+        assert sobol.values.shape == (6, 128, 3)
+        assert sobol.pk().std_error < plain.pk().std_error
+        assert sobol.mean_miss_distance().std_error < plain.mean_miss_distance().std_error
+        assert abs(sobol.pk().mean - plain.pk().mean) < 3 * plain.pk().std_error
+
+    def test_noise_dims_on_python_engine(self, scenario):
+        noisy = apply_overrides(scenario, {"surveillance_sensor.noise.bearing_noise_deg": 3.0})
+        a = run_qmc(noisy, 8, 2, inputs=INPUTS[:1], noise_dims=8, seed=3)
+        b = run_qmc(noisy, 8, 2, inputs=INPUTS[:1], noise_dims=8, seed=3)
+        np.testing.assert_array_equal(a.outcomes.miss_distance, b.outcomes.miss_distance)
+        assert a.pk().replicates.shape == (2,)
+
+    def test_noise_only(self, scenario):
+        result = run_qmc(scenario, 8, 2, inputs=[], noise_dims=4, seed=2)
+        assert result.values.shape == (2, 8, 0)
+        assert len(result.outcomes) == 16
+        assert result.pk().replicates.shape == (2,)
+        # The example scenario declares no uncertainty section
+        declared = run_qmc(scenario, 8, 2, noise_dims=4, seed=2)
+        np.testing.assert_array_equal(
+            declared.outcomes.miss_distance, result.outcomes.miss_distance
+        )
+
+    def test_rejects_invalid_setups(self, scenario):
+        with pytest.raises(ValueError, match="power-of-two"):
+            run_qmc(scenario, 100, inputs=INPUTS)
+        with pytest.raises(ValueError, match="nothing to sample"):
+            run_qmc(scenario, 8)
+        counter = apply_overrides(scenario, {"simulation.counter_rng": True})
+        with pytest.raises(ValueError, match="sequential"):
+            run_qmc(counter, 8, noise_dims=4)
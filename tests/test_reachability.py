@@ -0,0 +1,138 @@
+"""Tests for the intercept reachability check and early termination."""
+
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.engine import BatchEngine
+from interceptor_sim.core.kernel import engagement_loop_py, run_engine_kernel
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario, load_scenario
+from interceptor_sim.engagement.kill_chain import EngagementResult, Phase
+from interceptor_sim.engagement.reachability import (
+    DIRECTION_OFFSETS,
+    check_due,
+    intercept_reachable,
+    min_advance,
+    remaining_moves,
+)
+from interceptor_sim.models.target import Target
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    return apply_overrides(load_scenario(SCENARIO), {"engagement.early_termination": True})
+
+
+def _advance(headings, offset):
+    """Displacement along direction *offset* (relative to heading 0) per unit step."""
+    return np.cumsum(np.cos(np.asarray(headings) - offset))
+
+
+class TestMinAdvance:
+    @pytest.mark.parametrize("offset", list(DIRECTION_OFFSETS) + [0.3, -2.9])
+    def test_closed_form_matches_turning_away(self, offset):
+        turn = math.radians(25) * 0.1
+        k = np.arange(1, 200)
+        # Turning away from the direction as fast as possible is the worst case
+        headings = [offset + min(abs(offset) + j * turn, math.pi) for j in k]
+        expected = _advance(headings, offset)
+        np.testing.assert_allclose(min_advance(1.0, turn, offset, k), expected, atol=1e-9)
+
+    def test_bounds_random_turn_sequences(self):
+        rng = np.random.default_rng(0)
+        turn = 0.05
+        k = np.arange(1, 150)
+        for offset in DIRECTION_OFFSETS:
+            bound = min_advance(2.0, turn, offset, k)
+            for _ in range(20):
+                headings = np.cumsum(rng.uniform(-turn, turn, k.size))
+                assert np.all(2.0 * _advance(headings, offset) >= bound - 1e-9)
+
+
+class TestInterceptReachable:
+    def test_target_ahead_is_reachable_and_escaping_target_is_not(self):
+        path = Target(position=[500.0, 0.0], speed=20.0, waypoints=[[5000.0, 0.0]]).path
+        args = dict(
+            heading=np.zeros(2),
+            speed=np.full(2, 80.0),
+            turn_rate=np.full(2, math.radians(25)),
+            dt=np.full(2, 0.1),
+            kill_radius=np.full(2, 5.0),
+            moves=remaining_moves(np.zeros(2), 30.0, 0.1),
+            paths=np.stack([path, path]),
+            path_distance=np.zeros(2),
+        )
+        reachable = intercept_reachable(
+            np.zeros((2, 2)), target_speed=np.array([20.0, 150.0]), **args
+        )
+        assert reachable.tolist() == [True, False]
+
+    def test_check_cadence(self):
+        assert check_due(1.0, 0.1)
+        assert check_due(0.9999999, 0.1)
+        assert not check_due(0.5, 0.1)
+
+
+class TestEarlyTermination:
+    def test_fast_target_ends_unreachable(self, scenario):
+        fast = apply_overrides(scenario, {"target.speed": 90.0})
+        engine, meta = build_from_scenario(fast, seed=1)
+        engine.run()
+        ref_engine, ref_meta = build_from_scenario(
+            apply_overrides(fast, {"engagement.early_termination": False}), seed=1
+        )
+        ref_engine.run()
+
+        assert meta["engagement"].result == EngagementResult.UNREACHABLE
+        assert ref_meta["engagement"].result == EngagementResult.MISS
+        assert meta["engagement"].phase == Phase.COMPLETE
+        assert len(engine.history.states) < len(ref_engine.history.states) / 2
+        # Same trajectory up to the early end
+        for a, b in zip(engine.history.states[:-1], ref_engine.history.states):
+            np.testing.assert_array_equal(a.interceptor_pos, b.interceptor_pos)
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_hits_unchanged(self, scenario, seed):
+        engine, meta = build_from_scenario(scenario, seed=seed)
+        engine.run()
+        ref_engine, ref_meta = build_from_scenario(
+            apply_overrides(scenario, {"engagement.early_termination": False}), seed=seed
+        )
+        ref_engine.run()
+        assert meta["engagement"].result == ref_meta["engagement"].result
+        assert meta["engagement"].phase_log == ref_meta["engagement"].phase_log
+
+    @pytest.mark.parametrize("speed", [30.0, 90.0])
+    def test_kernel_matches_object_path(self, scenario, speed):
+        variant = apply_overrides(scenario, {"target.speed": speed})
+        ref_engine, ref_meta = build_from_scenario(variant, seed=4)
+        ref = ref_engine.run().as_arrays()
+        engine, meta = build_from_scenario(variant, seed=4)
+        hist = run_engine_kernel(engine, loop=engagement_loop_py).as_arrays()
+
+        assert meta["engagement"].result == ref_meta["engagement"].result
+        assert meta["engagement"].phase_log == ref_meta["engagement"].phase_log
+        for key in ref:
+            np.testing.assert_array_equal(hist[key], ref[key])
+
+    def test_batch_matches_scalar(self, scenario):
+        deterministic = apply_overrides(
+            scenario,
+            {
+                "surveillance_sensor.pd_at_max_range": 1.0,
+                "surveillance_sensor.classification_accuracy": 1.0,
+                "surveillance_sensor.noise": {},
+            },
+        )
+        scenarios = [apply_overrides(deterministic, {"target.speed": s}) for s in (30, 70, 120)]
+        result = BatchEngine.from_scenarios(scenarios, seed=0).run()
+        for k, variant in enumerate(scenarios):
+            engine, meta = build_from_scenario(variant, seed=0)
+            engine.run()
+            assert result.result[k] == meta["engagement"].result.value
+            assert result.ticks[k] == len(engine.history.states) - 1
+        assert list(result.result[1:]) == [EngagementResult.UNREACHABLE.value] * 2
@@ -0,0 +1,57 @@
+"""Tests for the scenario generator and load-test runner."""
+
+import numpy as np
+
+from interceptor_sim.core.scenario import build_from_scenario, load_scenario
+from interceptor_sim.testing.load_test import run_load_test
+from interceptor_sim.testing.scenario_gen import (
+    FAMILIES,
+    generate_corpus,
+    generate_scenario,
+    write_corpus,
+)
+
+
+class TestScenarioGenerator:
+    def test_reproducible(self):
+        a = generate_scenario(np.random.default_rng(3))
+        b = generate_scenario(np.random.default_rng(3))
+        assert a == b
+
+    def test_every_family_builds(self):
+        for family, scenario in generate_corpus(2, seed=1, max_time=20.0):
+            engine, meta = build_from_scenario(scenario, seed=0)
+            assert meta["target"].waypoints, family
+            np.testing.assert_allclose(meta["target"].waypoints[-1], [0.0, 0.0])
+            assert engine.max_time == 20.0
+
+    def test_family_ranges(self):
+        rng = np.random.default_rng(0)
+        long_wp = generate_scenario(rng, FAMILIES["long_waypoints"])
+        assert len(long_wp["target"]["waypoints"]) >= 100
+        tiny = generate_scenario(rng, FAMILIES["tiny_dt"])
+        assert tiny["simulation"]["dt"] <= 0.01
+        noisy = generate_scenario(rng, FAMILIES["extreme_noise"])
+        assert noisy["surveillance_sensor"]["noise"]["bearing_noise_deg"] >= 5.0
+
+    def test_write_corpus_round_trip(self, tmp_path):
+        corpus = list(generate_corpus(1, seed=2, families=["nominal"]))
+        (path,) = write_corpus(tmp_path, corpus)
+        assert load_scenario(path) == corpus[0][1]
+
+
+class TestLoadTest:
+    def test_report(self):
+        corpus = list(
+            generate_corpus(2, seed=4, families=["nominal"], max_time=30.0, dt=(0.2, 0.2))
+        )
+        report = run_load_test(corpus, seeds=(0, 1))
+        summary = report.summary()
+        assert summary["engagements"] == 4
+        assert summary["p50_ms"] <= summary["p99_ms"] <= summary["max_ms"]
+        assert "nominal" in report.format()
+        # Ticks match the batch engine's count (initial state excluded)
+        for record, (_, scenario) in zip(report.records[::2], corpus):
+            engine, _ = build_from_scenario(scenario, seed=0)
+            engine.run()
+            assert record.ticks == len(engine.history.states) - 1
@@ -0,0 +1,80 @@
+"""Tests for Sobol sensitivity analysis."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.qmc import UncertainInput
+from interceptor_sim.batch.sensitivity import _estimates, _run, saltelli_matrices, sobol_indices
+from interceptor_sim.core.scenario import apply_overrides, load_scenario
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+class TestSaltelli:
+    def test_matrix_structure(self):
+        a, b, ab = saltelli_matrices(16, 3, np.random.default_rng(0))
+        assert a.shape == b.shape == (16, 3) and ab.shape == (3, 16, 3)
+        for i in range(3):
+            np.testing.assert_array_equal(ab[i, :, i], b[:, i])
+            others = [j for j in range(3) if j != i]
+            np.testing.assert_array_equal(ab[i][:, others], a[:, others])
+
+    def test_parameter_limit(self):
+        with pytest.raises(ValueError, match="parameters"):
+            saltelli_matrices(8, 33)
+
+    @pytest.mark.parametrize(
+        "f, first, total",
+        [
+            # Additive: variances 1/12 and 4/12 of 5/12
+            (lambda x: x[..., 0] + 2.0 * x[..., 1], [0.2, 0.8, 0.0], [0.2, 0.8, 0.0]),
+            # Pure interaction: no first-order effects, all variance shared
+            (lambda x: (x[..., 0] - 0.5) * (x[..., 1] - 0.5), [0.0, 0.0, 0.0], [1.0, 1.0, 0.0]),
+        ],
+    )
+    def test_estimators_on_known_functions(self, f, first, total):
+        a, b, ab = saltelli_matrices(4096, 3, np.random.default_rng(1))
+        s1, st = _estimates(f(a), f(b), f(ab))
+        np.testing.assert_allclose(s1, first, atol=0.03)
+        np.testing.assert_allclose(st, total, atol=0.03)
+
+
+@pytest.fixture(scope="module")
+def indices():
+    inputs = [
+        UncertainInput("target.speed", low=20.0, high=80.0),
+        UncertainInput("surveillance_sensor.noise.bearing_noise_deg", low=0.0, high=3.0),
+        UncertainInput("target.rcs", low=0.01, high=1.0),  # not used by the models
+    ]
+    return sobol_indices(load_scenario(SCENARIO), inputs, n_samples=64, n_bootstrap=200, seed=0)
+
+
+class TestSobolIndices:
+    def test_shapes_and_cost(self, indices):
+        assert indices.n_runs == 64 * 5
+        assert indices.first_order.shape == indices.total.shape == (3,)
+        assert indices.total_ci.shape == (3, 2)
+        assert np.all(indices.total_ci[:, 0] <= indices.total_ci[:, 1])
+
+    def test_ranks_target_speed_first(self, indices):
+        assert indices.ranking()[0] == "target.speed"
+        assert "target.speed" in indices.table().splitlines()[1]
+
+    def test_unused_parameter_has_zero_index_with_common_random_numbers(self, indices):
+        assert indices.total[2] == 0.0
+        assert indices.first_order[2] == 0.0
+
+    def test_scalar_runs_without_common_random_numbers_draw_fresh_noise(self):
+        # A second radar keeps the runs off the batch engine
+        networked = apply_overrides(
+            load_scenario(SCENARIO),
+            {"surveillance_sensors": [{"position": [1500.0, 500.0], "max_range": 6000.0}]},
+        )
+        result = _run([networked] * 6, np.arange(6), np.random.default_rng(0))
+        assert len(np.unique(result.end_time)) > 1
+
+    def test_requires_inputs(self):
+        with pytest.raises(ValueError):
+            sobol_indices(load_scenario(SCENARIO), [])
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from interceptor_sim.models.sensor import Sensor, SensorMeasurement
+from interceptor_sim.models.sensor_network import SensorNetwork
 
 
 class TestSensor:
@@ -133,3 +134,132 @@ class TestSensorMeasurement:
         assert m.measured_speed == pytest.approx(30.0)
         assert m.measured_heading == pytest.approx(np.pi / 4)
         np.testing.assert_allclose(m.estimated_position, target_pos, atol=1e-10)
+
+
+class TestCoverageMap:
+    def _sensor(self):
+        return Sensor(
+            max_range=2000.0, field_of_regard=np.radians(90), boresight=0.0, pd_at_max_range=0.3
+        )
+
+    def test_pd_at_matches_scalar(self):
+        s = self._sensor()
+        sensor_pos = np.array([10.0, -20.0])
+        pts = np.random.default_rng(0).uniform(-2500, 2500, size=(200, 2))
+        expected = [
+            s.detection_probability(np.linalg.norm(p - sensor_pos))
+            if s.in_field_of_regard(sensor_pos, p) else 0.0
+            for p in pts
+        ]
+        np.testing.assert_allclose(s.pd_at(sensor_pos, pts), expected, atol=1e-12)
+
+    def test_lookup_interpolates_inside_coverage(self):
+        s = self._sensor()
+        cov = s.coverage_map(np.array([0.0, 0.0]), resolution=20.0)
+        # Points well inside the sector (away from range / FoR edges)
+        rng = np.random.default_rng(1)
+        r = rng.uniform(100, 1900, 500)
+        a = rng.uniform(-0.7, 0.7, 500)
+        pts = np.stack([r * np.cos(a), r * np.sin(a)], axis=1)
+        np.testing.assert_allclose(cov.lookup(pts), s.pd_at(np.zeros(2), pts), atol=1e-3)
+        # Behind the sensor and beyond max range: no coverage
+        assert cov.lookup(np.array([-500.0, 0.0])) == pytest.approx(0.0)
+        assert cov.lookup(np.array([5000.0, 0.0])) == 0.0
+
+    def test_cache_invalidated_on_parameter_change(self):
+        s = self._sensor()
+        pos = np.array([0.0, 0.0])
+        cov = s.coverage_map(pos)
+        assert s.coverage_map(pos) is cov
+        s.pd_at_max_range = 0.5
+        rebuilt = s.coverage_map(pos)
+        assert rebuilt is not cov
+        assert rebuilt.lookup(np.array([1999.0, 0.0])) > cov.lookup(np.array([1999.0, 0.0]))
+
+
+def _noisy_sensor(**kwargs):
+    return Sensor(
+        max_range=5000.0,
+        range_noise_fraction=0.015,
+        bearing_noise_deg=2.0,
+        speed_noise_fraction=0.02,
+        heading_noise_deg=3.0,
+        **kwargs,
+    )
+
+
+class TestSensorNetwork:
+    def test_requires_matching_positions(self):
+        with pytest.raises(ValueError):
+            SensorNetwork([], [])
+        with pytest.raises(ValueError):
+            SensorNetwork([_noisy_sensor()], [(0, 0), (1, 1)])
+
+    def test_noise_free_fusion_is_exact(self):
+        s = Sensor(max_range=5000.0)
+        net = SensorNetwork([s, s, s], [(0, 0), (1000, -500), (-800, 2000)])
+        m = net.measure(np.array([3000.0, 1000.0]), 30.0, 0.5, rng=np.random.default_rng(0))
+        np.testing.assert_allclose(m.estimated_position, [3000.0, 1000.0], atol=1e-6)
+        expected_vel = 30.0 * np.array([np.cos(0.5), np.sin(0.5)])
+        np.testing.assert_allclose(m.estimated_velocity, expected_vel)
+        assert m.n_sensors == 3
+        assert m.true_range == pytest.approx(np.hypot(3000.0, 1000.0))
+
+    def test_fusion_reduces_error_as_reported(self):
+        """Error shrinks ~1/sqrt(K) and matches the fused covariance."""
+        rng = np.random.default_rng(3)
+        tgt = np.array([3000.0, 1000.0])
+        rms = {}
+        for k in (1, 16):
+            net = SensorNetwork([_noisy_sensor()] * k, np.zeros((k, 2)))
+            ms = [net.measure(tgt, 30.0, 1.0, rng=rng) for _ in range(1000)]
+            err = np.array([m.estimated_position for m in ms]) - tgt
+            rms[k] = np.sqrt(np.mean(np.sum(err**2, axis=1)))
+            predicted = np.sqrt(np.mean([np.trace(m.position_covariance) for m in ms]))
+            assert rms[k] == pytest.approx(predicted, rel=0.1)
+        assert rms[16] == pytest.approx(rms[1] / 4, rel=0.15)
+
+    def test_precise_sensor_dominates(self):
+        coarse = Sensor(max_range=5000.0, range_noise_fraction=0.1, bearing_noise_deg=10.0)
+        fine = Sensor(max_range=5000.0, range_noise_fraction=0.001, bearing_noise_deg=0.1)
+        net = SensorNetwork([coarse, fine], [(0, 0), (0, 0)])
+        tgt = np.array([2000.0, 0.0])
+        rng = np.random.default_rng(0)
+        err = [
+            np.linalg.norm(net.measure(tgt, 30.0, 0.0, rng=rng).estimated_position - tgt)
+            for _ in range(200)
+        ]
+        assert np.mean(err) < 5.0
+
+    def test_only_covering_sensors_fused(self):
+        near = Sensor(max_range=1000.0)
+        far = Sensor(max_range=1000.0)
+        net = SensorNetwork([near, far], [(0, 0), (5000, 0)])
+        m = net.measure(np.array([500.0, 0.0]), 10.0, 0.0)
+        assert m.n_sensors == 1
+        # Out of every sensor's coverage: falls back to all sensors
+        assert net.measure(np.array([2500.0, 2500.0]), 10.0, 0.0).n_sensors == 2
+
+    def test_detection_probabilities_match_sensor(self):
+        sectored = Sensor(max_range=1000.0, field_of_regard=np.radians(60), boresight=0.0)
+        omni = Sensor(max_range=2000.0, pd_at_max_range=0.5)
+        net = SensorNetwork([sectored, omni], [(0, 0), (100, 100)])
+        for tgt in ([500.0, 0.0], [0.0, 500.0], [1500.0, 300.0]):
+            expected = [
+                sectored.pd_at(np.array([0.0, 0.0]), np.array(tgt)),
+                omni.pd_at(np.array([100.0, 100.0]), np.array(tgt)),
+            ]
+            np.testing.assert_allclose(net.detection_probabilities(tgt), expected)
+
+    def test_detect_any(self):
+        blind = Sensor(max_range=100.0)
+        sure = Sensor(max_range=5000.0, pd_at_max_range=1.0)
+        net = SensorNetwork([blind, sure], [(0, 0), (0, 0)])
+        assert net.try_detect(np.array([3000.0, 0.0]), rng=np.random.default_rng(0))
+        assert not SensorNetwork([blind], [(0, 0)]).try_detect(np.array([3000.0, 0.0]))
+
+    def test_classifies_with_best_sensor(self):
+        poor = Sensor(1000.0, classification_accuracy=0.0)
+        good = Sensor(1000.0, classification_accuracy=1.0)
+        net = SensorNetwork([poor, good], [(0, 0), (0, 0)])
+        assert all(net.try_classify(rng=np.random.default_rng(i)) for i in range(10))
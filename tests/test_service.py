@@ -0,0 +1,189 @@
+"""Tests for the real-time simulation service."""
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+
+from interceptor_sim.core.scenario import apply_overrides, load_scenario
+from interceptor_sim.engagement.kill_chain import Phase
+from interceptor_sim.service.protocol import (
+    KIND_FRAME,
+    KIND_JSON,
+    OP_BINARY,
+    OP_TEXT,
+    TICK_DTYPE,
+    decode_ticks,
+    dumps,
+    pack_message,
+    read_message,
+    read_websocket_message,
+    websocket_accept,
+    websocket_frame,
+)
+from interceptor_sim.service.server import SimulationService
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+async def _unix_request(reader, writer, cmd):
+    """Send a command and return its reply, collecting frames received meanwhile."""
+    writer.write(pack_message(KIND_JSON, dumps(cmd)))
+    frames = []
+    while True:
+        kind, payload = await read_message(reader)
+        if kind == KIND_FRAME:
+            frames.append(payload)
+            continue
+        msg = json.loads(payload)
+        if msg.get("op") == cmd["op"]:
+            return msg, frames
+
+
+class TestProtocol:
+    def test_websocket_accept_rfc_example(self):
+        assert websocket_accept("dGhlIHNhbXBsZSBub25jZQ==") == "s3pPLMBiTxaQ9kYGzzhZRbK+xOo="
+
+    def test_tick_frames_decode_zero_copy(self):
+        rec = np.zeros(3, dtype=TICK_DTYPE)
+        rec["tick"] = [0, 1, 2]
+        rec["phase"] = Phase.TRACK.value
+        ticks = decode_ticks(rec.tobytes())
+        assert TICK_DTYPE.itemsize == 8 + 82
+        np.testing.assert_array_equal(ticks["tick"], [0, 1, 2])
+        assert not ticks.flags.owndata
+
+
+class TestService:
+    def test_unix_session_commands_and_metrics(self, tmp_path):
+        scenario = load_scenario(SCENARIO)
+        path = tmp_path / "sim.sock"
+        if len(str(path)) > 100:  # AF_UNIX path limit
+            path = Path("/tmp") / f"interceptor_sim_test_{os.getpid()}.sock"
+
+        async def scenario_run():
+            service = SimulationService()
+            await service.serve_unix(path)
+            reader, writer = await asyncio.open_unix_connection(str(path))
+            try:
+                reply, frames = await _unix_request(
+                    reader, writer, {"op": "create", "scenario": scenario, "speed": 100.0,
+                                     "seed": 0}
+                )
+                assert reply["ok"]
+                sid = reply["session"]
+
+                # Manual launch and a new route take effect on the next tick
+                for cmd in (
+                    {"op": "launch", "session": sid},
+                    {"op": "waypoints", "session": sid, "waypoints": [[0.0, 3000.0]]},
+                ):
+                    _, received = await _unix_request(reader, writer, cmd)
+                    frames.extend(received)
+                while len(frames) < 20:
+                    kind, payload = await read_message(reader)
+                    if kind == KIND_FRAME:
+                        frames.append(payload)
+                _, received = await _unix_request(reader, writer, {"op": "abort", "session": sid})
+                frames.extend(received)
+                while True:
+                    kind, payload = await read_message(reader)
+                    if kind == KIND_FRAME:
+                        frames.append(payload)
+                    elif json.loads(payload).get("event") == "complete":
+                        complete = json.loads(payload)
+                        break
+                status, _ = await _unix_request(reader, writer, {"op": "status"})
+                bad, _ = await _unix_request(reader, writer, {"op": "launch", "session": 99})
+            finally:
+                writer.close()
+                await service.close()
+            return frames, complete, status, bad
+
+        frames, complete, status, bad = asyncio.run(scenario_run())
+        ticks = decode_ticks(b"".join(frames))
+        np.testing.assert_array_equal(ticks["tick"], np.arange(len(ticks)))
+        assert ticks["session"][0] == 1
+        # Launched by command long before the target could be classified
+        assert Phase.MIDCOURSE.value in ticks["phase"][:5]
+        assert ticks["time"][-1] < 10.0
+        assert complete["result"] == "ABORTED"
+        metrics = status["sessions"][0]["metrics"]
+        assert metrics["ticks"] == len(ticks)
+        for key in ("late_ticks", "jitter_ms", "max_lateness_ms", "cpu_time_s"):
+            assert key in metrics
+        assert not bad["ok"]
+
+    def test_websocket_stream(self):
+        scenario = apply_overrides(load_scenario(SCENARIO), {"simulation.max_time": 1.0})
+
+        async def scenario_run():
+            service = SimulationService()
+            server = await service.serve_websocket(port=0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(
+                b"GET / HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n"
+                b"Connection: Upgrade\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n"
+                b"Sec-WebSocket-Version: 13\r\n\r\n"
+            )
+            response = await reader.readuntil(b"\r\n\r\n")
+            cmd = {"op": "create", "scenario": scenario, "speed": 200.0}
+            writer.write(websocket_frame(OP_TEXT, dumps(cmd), mask=b"\x01\x02\x03\x04"))
+            frames, messages = [], []
+            try:
+                while True:
+                    opcode, payload = await read_websocket_message(reader)
+                    if opcode == OP_BINARY:
+                        frames.append(payload)
+                    else:
+                        messages.append(json.loads(payload))
+                        if messages[-1].get("event") == "complete":
+                            break
+            finally:
+                writer.close()
+                await service.close()
+            return response, frames, messages
+
+        response, frames, messages = asyncio.run(scenario_run())
+        assert b"101 Switching Protocols" in response
+        assert b"s3pPLMBiTxaQ9kYGzzhZRbK+xOo=" in response
+        assert messages[0]["ok"] and messages[0]["session"] == 1
+        ticks = decode_ticks(b"".join(frames))
+        assert 10 <= len(ticks) <= 11  # max_time 1.0 s at dt 0.1 (float accumulation)
+        assert messages[-1]["metrics"]["ticks"] == len(ticks)
+        assert messages[-1]["time"] >= 1.0
+
+    def test_failed_and_finished_sessions_are_reported_then_reaped(self, caplog):
+        scenario = apply_overrides(load_scenario(SCENARIO), {"simulation.max_time": 0.5})
+
+        async def scenario_run():
+            service = SimulationService(retain_finished=0.05)
+            done = service.create_session(scenario, speed=100.0)
+            broken = service.create_session(scenario, speed=100.0)
+
+            def fail():
+                raise RuntimeError("engine exploded")
+
+            broken.engine.step = fail
+            queue = broken.subscribe()
+            complete = json.loads((await queue.get())[1])
+            while not done.finished:
+                await asyncio.sleep(0.01)
+            reported = service.status()
+            await asyncio.sleep(0.2)
+            remaining = dict(service.sessions)
+            await service.close()
+            return complete, reported, remaining
+
+        with caplog.at_level(logging.ERROR, logger="interceptor_sim.service.session"):
+            complete, reported, remaining = asyncio.run(scenario_run())
+        assert complete["event"] == "complete"
+        assert complete["finished"]
+        assert complete["error"] == "RuntimeError: engine exploded"
+        assert "session 2 failed" in caplog.text
+        assert [s["error"] for s in reported] == [None, "RuntimeError: engine exploded"]
+        assert remaining == {}
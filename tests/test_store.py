@@ -0,0 +1,137 @@
+"""Tests for the SQLite results store."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.engine import N_PHASES, BatchEngine, BatchResult
+from interceptor_sim.batch.store import ResultsStore, scenario_hash
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario, load_scenario
+from interceptor_sim.engagement.kill_chain import EngagementResult, Phase
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    return load_scenario(SCENARIO)
+
+
+def _outcomes(results, miss):
+    n = len(results)
+    return BatchResult(
+        result=np.array(results, dtype=np.int8),
+        miss_distance=np.array(miss, dtype=np.float64),
+        end_time=np.full(n, 40.0),
+        ticks=np.full(n, 400),
+        phase_times=np.tile(np.arange(N_PHASES, dtype=np.float64), (n, 1)),
+    )
+
+
+HIT, MISS = EngagementResult.HIT.value, EngagementResult.MISS.value
+
+
+class TestResultsStore:
+    def test_scenario_hash_ignores_key_order(self, scenario):
+        reordered = dict(reversed(list(scenario.items())))
+        assert scenario_hash(reordered) == scenario_hash(scenario)
+        assert scenario_hash(apply_overrides(scenario, {"engagement.nav_gain": 3.0})) != (
+            scenario_hash(scenario)
+        )
+
+    def test_records_scalar_runs(self, scenario, tmp_path):
+        seeds = [1, 2, 3]
+        engines = []
+        for seed in seeds:
+            engine, _ = build_from_scenario(scenario, seed=seed)
+            engine.run()
+            engines.append(engine)
+        outcomes = BatchResult.from_runs(engines)
+
+        with ResultsStore(tmp_path / "runs.db", version="test") as store:
+            store.add_runs(scenario, seeds, outcomes, params={"engagement.nav_gain": 4.0})
+            runs = store.runs(scenario=scenario, params=["engagement.nav_gain"])
+
+        np.testing.assert_array_equal(runs["seed"], seeds)
+        np.testing.assert_array_equal(runs["result"], outcomes.result)
+        np.testing.assert_allclose(runs["miss_distance"], outcomes.miss_distance)
+        np.testing.assert_allclose(runs["engagement.nav_gain"], 4.0)
+        first = engines[0].engagement.phase_log
+        launch = next(t for t, phase in first if phase == Phase.LAUNCH)
+        assert runs["phase_times"][0, Phase.LAUNCH.value - 1] == launch
+        assert runs["phase_times"][0, Phase.SEARCH.value - 1] == 0.0
+
+    def test_pk_by_parameter(self, scenario):
+        store = ResultsStore(":memory:", version="test")
+        store.add_runs(scenario, [0, 1, 2, 3], _outcomes([HIT, HIT, MISS, HIT], [1, 2, 30, 3]),
+                       params={"engagement.nav_gain": 3.0, "engagement.stern_offset": 0.0})
+        store.add_runs(scenario, [0, 1], _outcomes([MISS, HIT], [20, 2]),
+                       params={"engagement.nav_gain": 5.0, "engagement.stern_offset": 0.0})
+        # Same config again accumulates
+        store.add_runs(scenario, [4, 5], _outcomes([MISS, MISS], [np.nan, 40]),
+                       params={"engagement.nav_gain": 3.0, "engagement.stern_offset": 0.0})
+        store.add_runs(scenario, [0], _outcomes([HIT], [1]),
+                       params={"engagement.nav_gain": 3.0, "engagement.stern_offset": 200.0})
+
+        table = store.pk_by("engagement.nav_gain", scenario=scenario)
+        np.testing.assert_array_equal(table["value"], [3.0, 5.0])
+        np.testing.assert_array_equal(table["n"], [7, 2])
+        np.testing.assert_allclose(table["pk"], [4 / 7, 1 / 2])
+        np.testing.assert_allclose(table["mean_miss"], [np.mean([1, 2, 30, 3, 40, 1]), 11.0])
+
+        fixed = store.pk_by(
+            "engagement.nav_gain", scenario=scenario, where={"engagement.stern_offset": 0}
+        )
+        np.testing.assert_array_equal(fixed["n"], [6, 2])
+        runs = store.runs(scenario=scenario, where={"engagement.nav_gain": 3})
+        assert len(runs["seed"]) == 7
+        assert np.isnan(runs["miss_distance"]).sum() == 1
+
+        configs = store.configs(scenario=scenario, where={"engagement.stern_offset": 0})
+        assert configs["params"][1] == {"engagement.nav_gain": 5.0, "engagement.stern_offset": 0.0}
+        np.testing.assert_array_equal(configs["n"], [6, 2])
+        np.testing.assert_array_equal(configs["hits"], [3, 1])
+        np.testing.assert_array_equal(configs["n_miss"], [5, 2])
+        np.testing.assert_allclose(configs["miss_sum"], [76.0, 22.0])
+        np.testing.assert_allclose(configs["miss_sumsq"], [1 + 4 + 900 + 9 + 1600, 404.0])
+
+    def test_per_run_params_and_strings(self, scenario):
+        store = ResultsStore(":memory:", version="test")
+        laws = ["pure_pursuit", "pure_pursuit", "proportional_nav", "proportional_nav"]
+        params = [{"engagement.terminal_guidance": law} for law in laws]
+        store.add_runs(scenario, range(4), _outcomes([MISS, HIT, HIT, HIT], [9, 1, 1, 1]), params)
+        table = store.pk_by("engagement.terminal_guidance")
+        assert table["value"].tolist() == ["proportional_nav", "pure_pursuit"]
+        np.testing.assert_allclose(table["pk"], [1.0, 0.5])
+        with pytest.raises(ValueError):
+            store.add_runs(scenario, range(4), _outcomes([HIT] * 4, [1] * 4), params[:2])
+
+    def test_separates_scenarios_and_versions(self, scenario, tmp_path):
+        other = apply_overrides(scenario, {"target.speed": 45.0})
+        path = tmp_path / "runs.db"
+        with ResultsStore(path, version="v1") as store:
+            store.add_runs(scenario, [0, 1], _outcomes([HIT, HIT], [1, 1]), {"x": 1})
+            store.add_runs(other, [0], _outcomes([MISS], [50]), {"x": 1})
+            mode = store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+        with ResultsStore(path, version="v2") as store:
+            store.add_runs(scenario, [0, 1], _outcomes([MISS, MISS], [9, 9]), {"x": 1})
+            assert store.pk_by("x", scenario=scenario)["pk"].tolist() == [0.5]
+            assert store.pk_by("x", scenario=scenario, code_version="v1")["pk"].tolist() == [1.0]
+            assert store.pk_by("x", scenario=other)["n"].tolist() == [1]
+            listed = {s["hash"]: s["n_runs"] for s in store.scenarios()}
+            assert listed == {scenario_hash(scenario): 4, scenario_hash(other): 1}
+            assert store.scenario(scenario_hash(other))["target"]["speed"] == 45.0
+
+    def test_batch_engine_outcomes(self, scenario):
+        scenarios = [apply_overrides(scenario, {"engagement.nav_gain": g}) for g in (3.0, 4.0)]
+        outcomes = BatchEngine.from_scenarios(scenarios * 4, seed=0).run()
+        store = ResultsStore(":memory:", version="test")
+        store.add_runs(
+            scenario, range(8), outcomes, params=[{"engagement.nav_gain": g} for g in (3, 4) * 4]
+        )
+        table = store.pk_by("engagement.nav_gain")
+        np.testing.assert_array_equal(table["n"], [4, 4])
+        assert table["hits"].sum() == outcomes.hit.sum()
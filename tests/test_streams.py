@@ -0,0 +1,213 @@
+"""Tests for counter-based random streams."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.engine import BatchEngine, phase_times_from_log
+from interceptor_sim.core.kernel import supports_engine
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario, load_scenario
+from interceptor_sim.core.streams import (
+    Quantity,
+    RandomStreams,
+    philox4x64,
+    philox4x64_numpy,
+    stream_words,
+    tick_index,
+    words_to_normal,
+    words_to_uniform,
+)
+from interceptor_sim.engagement.kill_chain import Phase
+from interceptor_sim.models.sensor import Sensor
+from interceptor_sim.models.sensor_network import SensorNetwork
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    return apply_overrides(load_scenario(SCENARIO), {"simulation.counter_rng": True})
+
+
+class TestPhilox:
+    def test_matches_numpy_bit_generator(self):
+        rng = np.random.default_rng(0)
+        counters = rng.integers(0, 2**63, size=(20, 4), dtype=np.uint64)
+        keys = rng.integers(0, 2**63, size=(20, 2), dtype=np.uint64)
+        words = philox4x64(counters, keys)
+        np.testing.assert_array_equal(words, philox4x64_numpy(counters, keys))
+        for c, k, w in zip(counters, keys, words):
+            # The bit generator increments its counter before the first block
+            previous = c.copy()
+            previous[0] -= np.uint64(1)
+            raw = np.random.Philox(counter=previous, key=k).random_raw(4)
+            np.testing.assert_array_equal(raw, w)
+
+    def test_broadcasts_key(self):
+        counters = np.arange(12, dtype=np.uint64).reshape(3, 4)
+        key = np.array([7, 9], dtype=np.uint64)
+        expected = np.stack([philox4x64(c, key) for c in counters])
+        np.testing.assert_array_equal(philox4x64(counters, key), expected)
+
+    def test_tick_index(self):
+        assert tick_index(0.30000000000000004, 0.1) == 3
+        np.testing.assert_array_equal(tick_index(np.array([0.0, 0.1, 2.9999999]), 0.1), [0, 1, 30])
+
+
+class TestCounterStream:
+    def test_scalar_draws_match_vectorized(self):
+        streams = RandomStreams(seed=42, trial=3)
+        words = stream_words(streams.key[None], 17, Quantity.MEASUREMENT, 2, n_blocks=2)[0]
+        s = streams.stream(17, Quantity.MEASUREMENT, 2)
+        assert s.words(8) == words.tolist()
+        np.testing.assert_array_equal(s.standard_normal(5), words_to_normal(words)[:5])
+        assert s.standard_normal() == words_to_normal(words)[5]
+        u = streams.stream(17, Quantity.MEASUREMENT, 2)
+        assert u.random() == words_to_uniform(words)[0]
+        np.testing.assert_array_equal(u.random((2, 3)), words_to_uniform(words)[1:7].reshape(2, 3))
+
+    def test_streams_are_random_access(self):
+        streams = RandomStreams(seed=1, trial=0)
+        first = streams.stream(5, Quantity.DETECTION).random(3)
+        streams.stream(4, Quantity.DETECTION).random(100)
+        streams.stream(5, Quantity.CLASSIFICATION).random()
+        np.testing.assert_array_equal(streams.stream(5, Quantity.DETECTION).random(3), first)
+        assert not np.array_equal(streams.stream(6, Quantity.DETECTION).random(3), first)
+        other_trial = RandomStreams(seed=1, trial=1).stream(5, Quantity.DETECTION).random(3)
+        assert not np.array_equal(other_trial, first)
+
+    def test_normals_are_standard(self):
+        key = RandomStreams(seed=5).key[None]
+        z = words_to_normal(stream_words(key, 0, Quantity.MEASUREMENT, n_blocks=25_000))
+        assert abs(z.mean()) < 0.01
+        assert z.std() == pytest.approx(1.0, abs=0.01)
+
+    def test_sensor_words_match_per_sensor_streams(self):
+        streams = RandomStreams(seed=9, trial=2)
+        ids = np.array([0, 5, 3])
+        words = streams.sensor_words(11, Quantity.MEASUREMENT, ids, n_blocks=2)
+        for row, k in zip(words, ids):
+            assert row.tolist() == streams.stream(11, Quantity.MEASUREMENT, int(k)).words(8)
+
+    def test_added_sensor_leaves_first_sensor_noise_unchanged(self):
+        noisy = Sensor(max_range=5000.0, range_noise_fraction=0.02, bearing_noise_deg=2.0)
+        remote = Sensor(max_range=100.0, range_noise_fraction=0.02, bearing_noise_deg=2.0)
+        one = SensorNetwork([noisy], [(0.0, 0.0)])
+        two = SensorNetwork([noisy, remote], [(0.0, 0.0), (9000.0, 0.0)])
+        streams = RandomStreams(seed=8)
+        target = np.array([2500.0, 700.0])
+        a = one.measure(target, 30.0, 0.2, rng=streams.stream(3, Quantity.MEASUREMENT))
+        b = two.measure(target, 30.0, 0.2, rng=streams.stream(3, Quantity.MEASUREMENT))
+        assert b.n_sensors == 1
+        np.testing.assert_array_equal(a.estimated_position, b.estimated_position)
+
+
+class TestCounterRngEngagements:
+    def test_inserted_sensor_leaves_other_sensors_noise_unchanged(self, scenario):
+        second = {
+            "id": 1,
+            "position": [1500.0, 500.0],
+            "max_range": 6000.0,
+            "classification_accuracy": 0.5,
+            "noise": {"range_noise_fraction": 0.03, "bearing_noise_deg": 3.0},
+        }
+        # Never covers the target, so it only changes the draw order
+        remote = {"id": 2, "position": [90000.0, 0.0], "max_range": 100.0}
+        histories = []
+        for extra in ([second], [remote, second]):
+            engine, _ = build_from_scenario(
+                apply_overrides(scenario, {"surveillance_sensors": extra}), seed=4
+            )
+            assert engine.engagement.sensor_network is not None
+            engine.run()
+            histories.append(engine.history.as_arrays())
+        for key, expected in histories[0].items():
+            np.testing.assert_array_equal(histories[1][key], expected)
+
+    def test_network_draws_are_per_sensor_streams(self, scenario):
+        extra = [
+            {"id": 4, "position": [1500.0, 500.0], "max_range": 6000.0},
+            {"id": 9, "position": [0.0, 900.0], "max_range": 6000.0},
+        ]
+        engine, _ = build_from_scenario(
+            apply_overrides(scenario, {"surveillance_sensors": extra}), seed=6
+        )
+        em = engine.engagement
+        em._tick = 12
+        streams = em.streams
+        u = em._draws(Quantity.DETECTION)
+        z = em._draws(Quantity.MEASUREMENT)
+        assert z.shape == (3, 2, 2)
+        for k, sensor_id in enumerate((0, 4, 9)):
+            assert u[k] == streams.stream(12, Quantity.DETECTION, sensor_id).random()
+            np.testing.assert_array_equal(
+                z[k], streams.stream(12, Quantity.MEASUREMENT, sensor_id).standard_normal((2, 2))
+            )
+
+    def test_sensor_id_keys_batch_lanes(self, scenario):
+        scenarios = [apply_overrides(scenario, {"surveillance_sensor.id": k}) for k in (0, 7)]
+        result = BatchEngine.from_scenarios(scenarios, seed=5).run()
+        for i, variant in enumerate(scenarios):
+            engine, meta = build_from_scenario(variant, seed=5, trial=i)
+            engine.run()
+            assert result.result[i] == meta["engagement"].result.value
+            assert result.ticks[i] == len(engine.history.states) - 1
+        # The sensor id is part of the counter, so it changes the noise
+        estimates = []
+        for variant in scenarios:
+            engine, _ = build_from_scenario(variant, seed=5, trial=0)
+            engine.run()
+            estimates.append(engine.history.as_arrays()["estimated_target_pos"])
+        assert not np.array_equal(estimates[0], estimates[1], equal_nan=True)
+
+    def test_reproducible_per_trial(self, scenario):
+        runs = []
+        for trial in (0, 0, 1):
+            engine, _ = build_from_scenario(scenario, seed=3, trial=trial)
+            engine.run()
+            runs.append(engine.history.as_arrays())
+        for key in runs[0]:
+            np.testing.assert_array_equal(runs[0][key], runs[1][key])
+        assert not np.array_equal(
+            runs[0]["estimated_target_pos"], runs[2]["estimated_target_pos"], equal_nan=True
+        )
+
+    def test_kernel_falls_back_to_python(self, scenario):
+        engine, _ = build_from_scenario(apply_overrides(scenario, {"simulation.use_kernel": True}))
+        assert not supports_engine(engine)
+        assert supports_engine(engine, allow_streams=True)
+
+    def test_fork_with_seeds_reseeds_streams(self, scenario):
+        engine, _ = build_from_scenario(scenario, seed=2, trial=4)
+        engine.run_until(Phase.MIDCOURSE)
+        same, reseeded = engine.fork(2, seeds=[2, 9])
+        assert same.engagement.streams.trial == reseeded.engagement.streams.trial == 4
+        assert reseeded.engagement.streams.seed == 9
+        ref, _ = build_from_scenario(scenario, seed=2, trial=4)
+        ref.run()
+        same.run()
+        for key, expected in ref.history.as_arrays().items():
+            np.testing.assert_array_equal(same.history.as_arrays()[key], expected)
+
+    def test_batch_lanes_match_scalar_trials(self, scenario):
+        scenarios = [
+            apply_overrides(scenario, {"target.speed": speed, "target.position": [x, 3000.0]})
+            for speed in (20.0, 35.0)
+            for x in (-2000.0, 0.0, 2500.0)
+        ]
+        result = BatchEngine.from_scenarios(scenarios, seed=11).run()
+        for i, variant in enumerate(scenarios):
+            engine, meta = build_from_scenario(variant, seed=11, trial=i)
+            engine.run()
+            assert result.result[i] == meta["engagement"].result.value
+            assert result.ticks[i] == len(engine.history.states) - 1
+            np.testing.assert_array_equal(
+                result.phase_times[i], phase_times_from_log(meta["engagement"].phase_log)
+            )
+
+    def test_batch_rejects_mixed_random_sources(self, scenario):
+        plain = apply_overrides(scenario, {"simulation.counter_rng": False})
+        engines = [build_from_scenario(sc, seed=0)[0] for sc in (scenario, plain)]
+        with pytest.raises(ValueError, match="counter-based"):
+            BatchEngine.from_engines(engines)
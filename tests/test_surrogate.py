@@ -0,0 +1,156 @@
+"""Tests for the Gaussian-process surrogate of Pk and miss distance."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.engine import BatchResult
+from interceptor_sim.batch.qmc import UncertainInput
+from interceptor_sim.batch.store import ResultsStore
+from interceptor_sim.batch.surrogate import GaussianProcess, Surrogate, TrainingSet
+from interceptor_sim.core.scenario import apply_overrides, load_scenario
+from interceptor_sim.engagement.kill_chain import EngagementResult, Phase
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+
+INPUTS = [
+    UncertainInput("target.speed", low=20.0, high=90.0),
+    UncertainInput("target.position[0]", low=1500.0, high=5000.0),
+]
+
+
+def _outcomes(hit, miss):
+    n = len(hit)
+    result = np.where(hit, EngagementResult.HIT.value, EngagementResult.MISS.value)
+    return BatchResult(
+        result=result.astype(np.int8),
+        miss_distance=np.asarray(miss, dtype=np.float64),
+        end_time=np.zeros(n),
+        ticks=np.zeros(n, dtype=np.int64),
+        phase_times=np.full((n, len(Phase)), np.nan),
+    )
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    return apply_overrides(
+        load_scenario(SCENARIO), {"surveillance_sensor.noise.bearing_noise_deg": 2.0}
+    )
+
+
+@pytest.fixture(scope="module")
+def refined(scenario):
+    store = ResultsStore(":memory:", version="test")
+    surrogate = Surrogate(scenario, INPUTS, store=store, trials_per_point=16, seed=0)
+    history = surrogate.refine(rounds=6, points_per_round=6)
+    return surrogate, store, history
+
+
+class TestGaussianProcess:
+    def test_interpolates_smooth_function(self):
+        x = np.random.default_rng(0).random((40, 2))
+        y = np.sin(3.0 * x[:, 0]) + x[:, 1] ** 2
+        gp = GaussianProcess().fit(x, y, np.full(40, 1e-6))
+        test = np.random.default_rng(1).random((50, 2))
+        mean, std = gp.predict(test)
+        np.testing.assert_allclose(mean, np.sin(3.0 * test[:, 0]) + test[:, 1] ** 2, atol=0.02)
+        assert np.all(std < 0.05)
+
+    def test_uncertainty_grows_away_from_data(self):
+        x = np.linspace(0.0, 0.5, 6)[:, None]
+        gp = GaussianProcess().fit(x, np.cos(4.0 * x[:, 0]), np.full(6, 1e-4))
+        _, std = gp.predict(np.array([[0.25], [1.0]]))
+        assert std[1] > 5.0 * std[0]
+
+
+class TestTrainingSet:
+    def test_groups_runs_by_configuration(self):
+        x = np.array([[1.0, 2.0], [1.0, 2.0], [3.0, 4.0], [1.0, 2.0]])
+        data = TrainingSet.from_runs(
+            x, _outcomes([True, False, True, True], [1.0, 3.0, np.nan, 5.0])
+        )
+        np.testing.assert_array_equal(data.x, [[1.0, 2.0], [3.0, 4.0]])
+        np.testing.assert_array_equal(data.n, [3, 1])
+        np.testing.assert_array_equal(data.hits, [2, 1])
+        np.testing.assert_array_equal(data.n_miss, [3, 0])
+        assert data.miss_mean[0] == pytest.approx(3.0)
+        assert data.miss_var[0] == pytest.approx(4.0)
+
+    def test_merge_pools_shared_configurations(self):
+        x = np.array([[1.0], [1.0], [1.0], [2.0]])
+        miss = np.array([1.0, 2.0, 6.0, 4.0])
+        hit = np.array([True, False, True, False])
+        whole = TrainingSet.from_runs(x, _outcomes(hit, miss))
+        merged = TrainingSet.from_runs(x[:2], _outcomes(hit[:2], miss[:2])).merged(
+            TrainingSet.from_runs(x[2:], _outcomes(hit[2:], miss[2:]))
+        )
+        for field in ("x", "n", "hits", "n_miss", "miss_mean", "miss_var"):
+            np.testing.assert_allclose(getattr(merged, field), getattr(whole, field))
+
+
+class TestSurrogate:
+    def test_refine_reduces_uncertainty(self, refined):
+        surrogate, _, history = refined
+        assert surrogate.simulated_runs == 6 * 6 * 16
+        assert history[-1] < history[0]
+
+    def test_predicts_clear_regimes(self, refined):
+        surrogate, _, _ = refined
+        slow = surrogate.query({"target.speed": 35.0})
+        fast = surrogate.query({"target.speed": 88.0, "target.position[0]": 3000.0})
+        assert slow.pk > 0.9 and fast.pk < 0.2
+        assert fast.miss_distance > slow.miss_distance
+        assert 0.0 <= slow.pk_std < 0.2
+
+    def test_reload_from_store_gives_same_model(self, refined, scenario):
+        surrogate, store, _ = refined
+        reloaded = Surrogate(scenario, INPUTS, store=store)
+        data = reloaded.load_store()
+        np.testing.assert_array_equal(data.n, surrogate.data.n)
+        query = {"target.speed": 60.0, "target.position[0]": 2500.0}
+        assert reloaded.query(query).pk == pytest.approx(surrogate.query(query).pk)
+
+    def test_load_store_skips_other_campaigns(self, scenario):
+        store = ResultsStore(":memory:", version="test")
+        surrogate = Surrogate(scenario, INPUTS, store=store)
+        surrogate.add(
+            np.array([[40.0, 2000.0], [40.0, 2000.0], [80.0, 4000.0]]),
+            _outcomes([True, False, False], [1.0, 20.0, 60.0]),
+        )
+        # Only the modelled inputs, partly at nominal values: used
+        store.add_runs(scenario, [0], _outcomes([True], [2.0]), {"target.speed": 70.0})
+        # Other parameters, other list components or other code: skipped
+        foreign = [
+            {"target.speed": 40.0, "engagement.nav_gain": 5.0},
+            {"target.position": [2000.0, 0.0]},
+        ]
+        store.add_runs(scenario, [0, 1], _outcomes([False, False], [90.0, 90.0]), foreign)
+        store.version = "other"
+        store.add_runs(scenario, [0], _outcomes([False], [90.0]), {"target.speed": 40.0})
+        store.version = "test"
+
+        data = Surrogate(scenario, INPUTS, store=store).load_store()
+        np.testing.assert_array_equal(data.x, [[40.0, 2000.0], [70.0, 3000.0], [80.0, 4000.0]])
+        np.testing.assert_array_equal(data.n, [2, 1, 1])
+        np.testing.assert_array_equal(data.hits, [1, 1, 0])
+        np.testing.assert_allclose(data.miss_mean, [10.5, 2.0, 60.0])
+        np.testing.assert_allclose(data.miss_var[0], np.var([1.0, 20.0], ddof=1))
+        other = Surrogate(scenario, INPUTS, store=store).load_store(code_version="other")
+        np.testing.assert_array_equal(other.x, [[40.0, 3000.0]])
+
+    def test_uncertain_query_triggers_simulation(self, scenario):
+        surrogate = Surrogate(scenario, INPUTS[:1], trials_per_point=8, seed=1)
+        surrogate.simulate(np.array([[30.0], [90.0]]))
+        before = surrogate.simulated_runs
+        surrogate.query({"target.speed": 60.0}, max_pk_std=0.01)
+        assert surrogate.simulated_runs > before
+        assert np.any(surrogate.data.x[:, 0] == 60.0)
+
+    def test_rejects_unknown_inputs_and_missing_ranges(self, scenario):
+        surrogate = Surrogate(scenario, INPUTS[:1], seed=0)
+        surrogate.simulate(np.array([[40.0]]))
+        with pytest.raises(KeyError):
+            surrogate.query({"engagement.nav_gain": 4.0})
+        with pytest.raises(ValueError, match="ranges"):
+            Surrogate(scenario, [UncertainInput("target.speed", std=2.0)])
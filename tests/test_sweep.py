@@ -0,0 +1,101 @@
+"""Tests for prefix-sharing parameter sweeps."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from interceptor_sim.batch.engine import BatchResult
+from interceptor_sim.batch.sweep import first_affected_phase, run_sweep
+from interceptor_sim.core.scenario import apply_overrides, build_from_scenario, load_scenario
+from interceptor_sim.engagement.kill_chain import Phase
+
+SCENARIO = Path(__file__).resolve().parent.parent / "scenarios" / "example_intercept.yaml"
+FIELDS = ("result", "miss_distance", "end_time", "ticks", "phase_times")
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    return load_scenario(SCENARIO)
+
+
+def _independent(scenario, cells, seeds):
+    engines = []
+    for cell in cells:
+        for seed in seeds:
+            engine, _ = build_from_scenario(apply_overrides(scenario, cell), seed=seed)
+            engine.run()
+            engines.append(engine)
+    return BatchResult.from_runs(engines)
+
+
+def _assert_same(a, b):
+    for field in FIELDS:
+        np.testing.assert_array_equal(getattr(a, field), getattr(b, field))
+
+
+class TestRunSweep:
+    def test_phase_table(self):
+        assert first_affected_phase(["engagement.nav_gain"]) == Phase.TERMINAL
+        assert first_affected_phase(
+            ["engagement.nav_gain", "engagement.terminal_handover_range"]
+        ) == Phase.MIDCOURSE
+        assert first_affected_phase(["target.speed", "engagement.nav_gain"]) == Phase.SEARCH
+        assert first_affected_phase(["interceptor.kill_radius"]) == Phase.TERMINAL
+        assert first_affected_phase(["interceptor.kill_radius"], True) == Phase.MIDCOURSE
+
+    def test_terminal_sweep_matches_independent_runs(self, scenario):
+        cells = [
+            {"engagement.nav_gain": gain, "engagement.terminal_guidance": law}
+            for gain in (2.0, 5.0)
+            for law in ("proportional_nav", "pure_pursuit")
+        ]
+        seeds = [0, 1, 2]
+        sweep = run_sweep(scenario, cells, seeds)
+        assert sweep.fork_phase == Phase.TERMINAL
+        _assert_same(sweep.outcomes, _independent(scenario, cells, seeds))
+        assert sweep.simulated_ticks < 0.7 * sweep.total_ticks
+        assert sweep.pk().shape == (4,)
+        assert len(sweep.cell(1)) == 3
+
+    def test_partial_and_constant_overrides(self, scenario):
+        # The handover range is swept (absent = scenario default); stern_offset is constant
+        cells = [
+            {"engagement.terminal_handover_range": 50.0, "engagement.stern_offset": 100.0},
+            {"engagement.stern_offset": 100.0},
+        ]
+        sweep = run_sweep(scenario, cells, [3, 4])
+        assert sweep.fork_phase == Phase.MIDCOURSE
+        _assert_same(sweep.outcomes, _independent(scenario, cells, [3, 4]))
+        assert 0 < sweep.simulated_ticks < sweep.total_ticks
+
+    def test_kill_radius_sweep_with_early_termination(self, scenario):
+        # The midcourse reachability check reads the kill radius
+        early = apply_overrides(
+            scenario,
+            {
+                "engagement.early_termination": True,
+                "target.speed": 90.0,
+                "engagement.terminal_handover_range": 20.0,
+            },
+        )
+        cells = [{"interceptor.kill_radius": r} for r in (5.0, 300.0, 1500.0)]
+        sweep = run_sweep(early, cells, [1, 2])
+        assert sweep.fork_phase == Phase.MIDCOURSE
+        expected = _independent(early, cells, [1, 2])
+        _assert_same(sweep.outcomes, expected)
+        assert len(set(expected.result)) > 1
+
+    def test_unknown_fields_disable_sharing(self, scenario):
+        cells = [{"target.speed": 30.0}, {"target.speed": 40.0}]
+        sweep = run_sweep(scenario, cells, [0])
+        assert sweep.fork_phase == Phase.SEARCH
+        assert sweep.simulated_ticks == sweep.total_ticks
+        _assert_same(sweep.outcomes, _independent(scenario, cells, [0]))
+
+    def test_runs_ending_before_the_fork(self, scenario):
+        short = apply_overrides(scenario, {"simulation.max_time": 2.0})
+        cells = [{"engagement.nav_gain": 3.0}, {"engagement.nav_gain": 4.0}]
+        sweep = run_sweep(short, cells, [0])
+        _assert_same(sweep.outcomes, _independent(short, cells, [0]))
+        assert sweep.simulated_ticks * 2 == sweep.total_ticks